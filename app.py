@@ -3,6 +3,9 @@ from flask         import Flask
 from flask_cors    import CORS
 
 from view import create_endpoints
+from service.store.outbox_worker import start_outbox_worker, OUTBOX_PARTITIONS
+from service.store.product_counter import start_product_counter_flusher, COUNTER_FLUSH_SECONDS
+from service.admin.image_sweeper import start_image_sweeper, IMAGE_SWEEP_SECONDS
 
 #admin
 from model import OrderDao, OrderDetailDao, EnquiryDao
@@ -35,6 +38,7 @@ from service import (
     SenderService,
     EventService,
     ProductListService,
+    HomeFeedService,
     StoreOrderService,
     CategoryListService,
     SellerShopService,
@@ -112,6 +116,7 @@ def create_app(test_config=None):
     services.cart_item_service     = CartItemService(cart_item_dao)
     services.store_order_service   = StoreOrderService(store_order_dao)
     services.product_list_service  = ProductListService()
+    services.home_feed_service     = HomeFeedService()
     services.category_list_service = CategoryListService()
 
     services.event_list_service           = EventListService()
@@ -139,4 +144,13 @@ def create_app(test_config=None):
     # presentation Layer
     create_endpoints(app, services, database)
 
+    # 결제 후속 작업(outbox) 워커, 설정에서 OUTBOX_PARTITIONS = 0 이면 실행하지 않는다.
+    start_outbox_worker(database, app.config.get('OUTBOX_PARTITIONS', OUTBOX_PARTITIONS))
+
+    # 북마크 수, 판매량 증감값을 모아서 반영하는 스레드, 설정에서 COUNTER_FLUSH_SECONDS = 0 이면 실행하지 않는다.
+    start_product_counter_flusher(database, app.config.get('COUNTER_FLUSH_SECONDS', COUNTER_FLUSH_SECONDS))
+
+    # 참조되지 않는 상품, 기획전 이미지를 지우는 스레드, 설정에서 IMAGE_SWEEP_SECONDS = 0 이면 실행하지 않는다.
+    start_image_sweeper(app, database, app.config.get('IMAGE_SWEEP_SECONDS', IMAGE_SWEEP_SECONDS))
+
     return app
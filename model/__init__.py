@@ -16,6 +16,7 @@ from .admin.seller_info_dao    import SellerInfoDao
 
 from .admin.product_create_dao import ProductCreateDao
 from .admin.product_manage_dao import ProductManageDao
+from .admin.image_sweep_dao    import ImageSweepDao
 from .admin.event_dao         import EventDao
 from .admin.order_dao         import OrderDao, OrderDetailDao
 
@@ -30,3 +31,5 @@ from .store.bookmark_dao import BookmarkDao
 from .store.event_list_dao import EventListDao
 from .store.seller_shop_dao import SellerShopDao
 from .store.product_enquiry_dao import ProductEnquiryDao
+from .store.outbox_dao import OutboxDao
+from .store.product_counter_dao import ProductCounterDao
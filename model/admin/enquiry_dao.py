@@ -1,4 +1,6 @@
 import pymysql
+from utils.cursor import keyset_sql, paginate
+from utils.total_count import get_total_count
 from utils.custom_exceptions import EnquiryDoesNotExist, AnswerCreateFail
 
 
@@ -58,14 +60,19 @@ class EnquiryDao:
                             "seller_name": "나는셀러9"
                         }
                     ],
-                    "total_count": 2
+                    "total_count": 2,
+                    "is_estimated_count": false,
+                    "next_cursor": "Wzk5XQ"
                 }
 
             History:
                 2020-12-28(이성보): 초기 생성 및 조회 기능 작성
                 2020-12-29(이성보): q&a 검색조건별 조회 작성
                 2020-12-30(이성보): 조회된 q&a 총 갯수 반환기능 작성
+                2026-10-18(agent): 커서 페이지네이션 추가 (cursor 가 있으면 page 대신 사용)
+                2026-10-18(agent): 전체 개수 캐싱, 첫 페이지에서만 조회 (이후 페이지는 캐시에 없으면 null)
             Raises:
+                400, {'message': 'invalid_cursor', 'error_message': '잘못된 커서입니다.'} : 잘못된 커서
                 404, {'message': 'q&a not exist', 'errorMessage': 'q&a does not exist'} : q&a 정보 조회 실패
         """
 
@@ -141,16 +148,36 @@ class EnquiryDao:
 
         sql += extra_sql
         total_count_sql += extra_sql
-        sql += ' ORDER BY enquiry.id DESC LIMIT %(page)s, %(length)s;'
+
+        # 다음 페이지 여부를 알 수 있도록 length + 1 개 조회, 커서가 있으면 OFFSET 대신 커서 이후만 조회
+        data['fetch_limit'] = data['length'] + 1
+        if data.get('cursor'):
+            keyset_condition, params = keyset_sql(['enquiry.id'], data['cursor'])
+            data.update(params)
+            sql += ' AND ' + keyset_condition + ' ORDER BY enquiry.id DESC LIMIT %(fetch_limit)s;'
+        else:
+            sql += ' ORDER BY enquiry.id DESC LIMIT %(page)s, %(fetch_limit)s;'
 
         with connection.cursor(pymysql.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             enquiries = cursor.fetchall()
             if not enquiries:
                 raise EnquiryDoesNotExist('q&a does not exist')
-            cursor.execute(total_count_sql, data)
-            count = cursor.fetchone()
-            return {'enquiries': enquiries, 'total_count': count['total_count']}
+            enquiries, next_cursor = paginate(enquiries, data['length'], ['id'])
+
+        # 전체 개수는 첫 페이지에서만 조회하고 이후 페이지는 캐시에 있을 때만 반환
+        count = get_total_count(
+            connection,
+            total_count_sql,
+            data,
+            load=not data.get('cursor') and data['page'] == 0
+        )
+        return {
+            'enquiries': enquiries,
+            'total_count': count['total_count'],
+            'is_estimated_count': count['is_estimated'],
+            'next_cursor': next_cursor
+        }
 
     def get_answer_detail(self, connection, data):
 
@@ -5,7 +5,6 @@ from utils.custom_exceptions import (
     CategoryDoesNotExist,
     CreateEventDenied,
     CreateButtunDenied,
-    InsertProductIntoButtonDenied,
     InsertProductIntoEventDenied
 )
 
@@ -23,6 +22,7 @@ class EventDao:
             2021-01-02(강두연): 기획전 추가 기능 작성
             2021-01-04(강두연): 기획전 수정 관련기능 작성
             2021-01-05(강두연): 기획전 수정 관련기능 추가, 기획전 관련 INSERT 메소드에서 논리삭제 복구 기능 추가
+            2026-10-18(agent): 기획전 버튼, 상품 일괄 저장 메소드 추가
     """
 
     def get_events_list(self, connection, data):
@@ -697,245 +697,6 @@ class EventDao:
                 raise CreateEventDenied('unable to create event')
             return result
 
-    def create_or_update_button(self, connection, data):
-        """ 기획전 버튼 생성
-
-            Args:
-                connection: 데이터베이스 연결 객체
-                data : 비지니스 레이어에서 넘겨 받은 딕셔너리
-
-            Returns:
-                return 27 (생성된 버튼 프라이머리키 아이디)
-
-            History:
-                2021-01-02(강두연): 초기 작성
-                2021-01-04(강두연): 논리 삭제된 버튼과 동일한 이름과 이벤트 아이디의 버튼을 만드려고하면 로우를 생성하지않고 논리삭제 값을 바꿔주게 수정
-                2021-01-05(강두연): 사용중인 버튼중에 이름이 같은 버튼이 이미 존재하면 에러 반환
-
-            Raises:
-                400, {'message': 'unable to create button',
-                      'errorMessage': 'unable to create button'} : 버튼 생성 실패
-
-                400, {'message': 'unable to create button',
-                      'errorMessage': 'button name must be unique in an event'} : 버튼 이름 중복
-        """
-        check_sql = """
-            SELECT
-                id
-            FROM 
-                event_buttons
-            WHERE
-                `name` = %(button_name)s
-                AND is_deleted = 1
-                AND event_id = %(event_id)s;
-        """
-
-        duplicate_check_sql = """
-            SELECT
-                EXISTS (
-                    SELECT
-                        *
-                    FROM
-                        event_buttons
-                    WHERE
-                        `name` = %(button_name)s
-                        AND is_deleted = 0
-                        AND event_id = %(event_id)s
-                ) AS duplicate_button;
-        """
-
-        sql = """
-            INSERT INTO event_buttons (
-                `name`
-                , order_index
-                , event_id) 
-            VALUES (
-                %(button_name)s
-                , %(button_index)s
-                , %(event_id)s)
-        """
-
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(duplicate_check_sql, data)
-            duplicate_check = cursor.fetchone()
-            if duplicate_check['duplicate_button']:
-                raise CreateButtunDenied('button name must be unique in an event')
-
-            cursor.execute(check_sql, data)
-            check = cursor.fetchone()
-            if check:
-                check['button_index'] = data['button_index']
-                sql = """
-                    UPDATE
-                        event_buttons
-                    SET
-                        is_deleted = 0
-                        order_index = %(button_index)s
-                    WHERE id = %(id)s
-                """
-                cursor.execute(sql, check)
-                return check['id']
-
-            cursor.execute(sql, data)
-            result = cursor.lastrowid
-            if not result:
-                raise CreateButtunDenied('unable to create button')
-            return result
-
-    def insert_product_into_button(self, connection, data):
-        """ 기획전 버튼에 상품 연결
-
-            Args:
-                connection: 데이터베이스 연결 객체
-                data : 비지니스 레이어에서 넘겨 받은 딕셔너리
-
-            Returns:
-                return 27 (연결된 기획전 상품 프라이머리키 아이디)
-
-            History:
-                2021-01-02(강두연): 초기 작성
-
-            Raises:
-                400, {'message': 'unable to insert product into button',
-                      'errorMessage': 'unable to insert product into button'} : 상품 연결 실패
-        """
-
-        check_sql = """
-            SELECT
-                id
-            FROM
-                events_products
-            WHERE
-                event_id = %(event_id)s
-                AND product_id = %(product_id)s
-                AND event_button_id = %(button_id)s
-                AND is_deleted = 1;
-        """
-
-        duplicate_check_sql = """
-            SELECT
-                EXISTS (
-                    SELECT
-                        *
-                    FROM
-                        events_products
-                    WHERE
-                        event_id = %(event_id)s
-                        AND product_id = %(product_id)s
-                        AND is_deleted = 0
-                ) AS duplicate_event_product;
-        """
-
-        sql = """
-            INSERT INTO events_products (
-                event_id
-                , product_id
-                , event_button_id) 
-            VALUES (
-                %(event_id)s
-                , %(product_id)s
-                , %(button_id)s);
-        """
-
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(duplicate_check_sql, data)
-            duplicate_check = cursor.fetchone()
-            if duplicate_check['duplicate_event_product']:
-                raise InsertProductIntoButtonDenied('product is already included')
-            cursor.execute(check_sql, data)
-            check = cursor.fetchone()
-            if check:
-                cursor.execute("""
-                    UPDATE
-                        events_products
-                    SET
-                        is_deleted = 0
-                    WHERE
-                        id = %(id)s
-                """, check)
-                return
-            cursor.execute(sql, data)
-            result = cursor.lastrowid
-            if not result:
-                raise InsertProductIntoButtonDenied('unable to insert product into button')
-            return result
-
-    def insert_product_into_event(self, connection, data):
-        """ 기획전에 상품 연결 (버튼형 x)
-
-            Args:
-                connection: 데이터베이스 연결 객체
-                data : 비지니스 레이어에서 넘겨 받은 딕셔너리
-
-            Returns:
-                return 27 (연결된 기획전 상품 프라이머리키 아이디)
-
-            History:
-                2021-01-02(강두연): 초기 작성
-                2021-01-04(강두연): 논리삭제된 같은 기획전, 상품 아이디를 가진 로우가 있을경우 복구 작성
-                2021-01-05(강두연): 같은 기획전 내에 중복상품있는지 체크 추가
-
-            Raises:
-                400, {'message': 'unable to insert product into event',
-                      'errorMessage': 'unable to insert product into event'} : 상품 연결 실패
-        """
-        check_sql = """
-            SELECT
-                id
-            FROM
-                events_products
-            WHERE
-                event_id = %(event_id)s
-                AND product_id = %(product_id)s
-                AND is_deleted = 1;
-        """
-
-        duplicate_check_sql = """
-            SELECT
-                EXISTS (
-                    SELECT
-                        *
-                    FROM
-                        events_products
-                    WHERE
-                        event_id = %(event_id)s
-                        AND product_id = %(product_id)s
-                        AND is_deleted = 0
-                ) AS duplicate_event_product;
-        """
-
-        sql = """
-            INSERT INTO events_products (
-                event_id
-                , product_id) 
-            VALUES (
-                %(event_id)s
-                , %(product_id)s);
-        """
-
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(duplicate_check_sql, data)
-            duplicate_check = cursor.fetchone()
-            if duplicate_check['duplicate_event_product']:
-                raise InsertProductIntoEventDenied('product is already included')
-            cursor.execute(check_sql, data)
-            check = cursor.fetchone()
-            if check:
-                cursor.execute("""
-                    UPDATE
-                        events_products
-                    SET
-                        is_deleted = 0
-                    WHERE
-                        id = %(id)s
-                """, check)
-                return
-            cursor.execute(sql, data)
-            result = cursor.lastrowid
-            if not result:
-                raise InsertProductIntoEventDenied('unable to insert product into event')
-            return result
-
     def delete_buttons_by_event(self, connection, data):
         """ 이벤트 아이디로 버튼 삭제
 
@@ -1126,56 +887,274 @@ class EventDao:
         with connection.cursor(pymysql.cursors.DictCursor) as cursor:
             cursor.execute(sql, button)
 
-    def move_button_products(self, connection, product):
-        """ 버튼형 기획전 상품 종속 버튼 변경
+    def get_event_button_rows(self, connection, data):
+        """ 기획전의 버튼 전체 조회 (논리삭제된 버튼 포함)
+
+            Args:
+                connection: 데이터베이스 연결 객체
+                data : 비지니스 레이어에서 넘겨 받은 딕셔너리 (event_id)
+
+            Returns:
+                return [
+                    {'id': 4, 'name': '1번 버튼', 'order_index': 1, 'is_deleted': 0},
+                    ...
+                ]
+
+            History:
+                2026-10-18(agent): 작성
+
+            Notes:
+                같은 이름의 버튼이 여러개이면 사용중인 버튼이 뒤에 오도록 정렬한다.
+        """
+        sql = """
+            SELECT
+                id
+                , `name`
+                , order_index
+                , is_deleted
+            FROM
+                event_buttons
+            WHERE
+                event_id = %(event_id)s
+            ORDER BY
+                is_deleted DESC
+                , id;
+        """
+
+        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(sql, data)
+            return cursor.fetchall()
+
+    def insert_event_buttons(self, connection, buttons):
+        """ 기획전 버튼 일괄 생성
 
             Args:
                 connection: 데이터베이스 연결 객체
-                product : 비지니스 레이어에서 넘겨 받은 상품에대한 정보를 담고있는 딕셔너리
+                buttons : [{'event_id': 1, 'button_name': '1번 버튼', 'button_index': 1}, ...]
 
             Returns:
                 None
 
             History:
-                2021-01-05(강두연): 작성
+                2026-10-18(agent): 작성
+
+            Raises:
+                400, {'message': 'unable to create button',
+                      'errorMessage': 'unable to create button'} : 버튼 생성 실패
+
+            Notes:
+                VALUES 가 플레이스홀더로만 이루어져 있으므로 executemany 는 INSERT 한번(여러 행)으로 실행된다.
+        """
+        sql = """
+            INSERT INTO event_buttons (
+                `name`
+                , order_index
+                , event_id)
+            VALUES (
+                %(button_name)s
+                , %(button_index)s
+                , %(event_id)s)
+        """
+
+        if not buttons:
+            return
+
+        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            result = cursor.executemany(sql, buttons)
+            if result != len(buttons):
+                raise CreateButtunDenied('unable to create button')
+
+    def restore_event_buttons(self, connection, buttons):
+        """ 기획전 버튼 일괄 복구 및 순서 변경
+
+            Args:
+                connection: 데이터베이스 연결 객체
+                buttons : [(버튼 아이디, 순서), ...]
+
+            Returns:
+                None
+
+            History:
+                2026-10-18(agent): 작성
         """
+        if not buttons:
+            return
 
         sql = """
             UPDATE
-                events_products
+                event_buttons
+            SET
+                is_deleted = 0
+                , order_index = CASE id {case_sql} END
+            WHERE
+                id IN %s;
+        """.format(case_sql=" ".join("WHEN %s THEN %s" for _ in buttons))
+
+        params = [value for button in buttons for value in button] + [[button_id for button_id, _ in buttons]]
+
+        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(sql, params)
+
+    def delete_event_buttons(self, connection, button_ids):
+        """ 기획전 버튼 일괄 논리삭제
+
+            Args:
+                connection: 데이터베이스 연결 객체
+                button_ids : 삭제할 버튼 아이디 리스트
+
+            Returns:
+                None
+
+            History:
+                2026-10-18(agent): 작성
+        """
+        if not button_ids:
+            return
+
+        sql = """
+            UPDATE
+                event_buttons
             SET
-                event_button_id = %(button_id)s
+                is_deleted = 1
+            WHERE
+                id IN %s;
+        """
+
+        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(sql, [list(button_ids)])
+
+    def get_event_product_rows(self, connection, data):
+        """ 기획전 상품 연결 전체 조회 (논리삭제된 연결 포함)
+
+            Args:
+                connection: 데이터베이스 연결 객체
+                data : 비지니스 레이어에서 넘겨 받은 딕셔너리 (event_id)
+
+            Returns:
+                return [
+                    {'id': 10, 'product_id': 40, 'event_button_id': 4, 'is_deleted': 0},
+                    ...
+                ]
+
+            History:
+                2026-10-18(agent): 작성
+
+            Notes:
+                같은 상품의 연결이 여러개이면 사용중인 연결이 뒤에 오도록 정렬한다.
+        """
+        sql = """
+            SELECT
+                id
+                , product_id
+                , event_button_id
+                , is_deleted
+            FROM
+                events_products
             WHERE
                 event_id = %(event_id)s
-                AND product_id = %(product_id)s
-                AND is_deleted = 0;
+            ORDER BY
+                is_deleted DESC
+                , id;
         """
 
         with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, product)
+            cursor.execute(sql, data)
+            return cursor.fetchall()
 
-    def delete_event_product(self, connection, product):
-        """ 기획전 상품 논리삭제
+    def insert_event_products(self, connection, products):
+        """ 기획전(버튼)에 상품 일괄 연결
 
             Args:
                 connection: 데이터베이스 연결 객체
-                product : 비지니스 레이어에서 넘겨 받은 상품에대한 정보를 담고있는 딕셔너리
+                products : [{'event_id': 1, 'product_id': 40, 'button_id': 4 (버튼형이 아니면 None)}, ...]
 
             Returns:
                 None
 
             History:
-                2021-01-05(강두연): 작성
+                2026-10-18(agent): 작성
+
+            Raises:
+                400, {'message': 'unable to insert product into event',
+                      'errorMessage': 'unable to insert product into event'} : 상품 연결 실패
+
+            Notes:
+                VALUES 가 플레이스홀더로만 이루어져 있으므로 executemany 는 INSERT 한번(여러 행)으로 실행된다.
         """
+        sql = """
+            INSERT INTO events_products (
+                event_id
+                , product_id
+                , event_button_id)
+            VALUES (
+                %(event_id)s
+                , %(product_id)s
+                , %(button_id)s)
+        """
+
+        if not products:
+            return
+
+        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            result = cursor.executemany(sql, products)
+            if result != len(products):
+                raise InsertProductIntoEventDenied('unable to insert product into event')
+
+    def update_event_product_buttons(self, connection, products):
+        """ 기획전 상품 연결 일괄 복구 및 종속 버튼 변경
+
+            Args:
+                connection: 데이터베이스 연결 객체
+                products : [(기획전 상품 아이디, 버튼 아이디 (버튼형이 아니면 None)), ...]
+
+            Returns:
+                None
+
+            History:
+                2026-10-18(agent): 작성
+        """
+        if not products:
+            return
+
+        sql = """
+            UPDATE
+                events_products
+            SET
+                is_deleted = 0
+                , event_button_id = CASE id {case_sql} END
+            WHERE
+                id IN %s;
+        """.format(case_sql=" ".join("WHEN %s THEN %s" for _ in products))
+
+        params = [value for product in products for value in product] + [[row_id for row_id, _ in products]]
+
+        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(sql, params)
+
+    def delete_event_products(self, connection, event_product_ids):
+        """ 기획전 상품 연결 일괄 논리삭제
+
+            Args:
+                connection: 데이터베이스 연결 객체
+                event_product_ids : 삭제할 기획전 상품 아이디(events_products.id) 리스트
+
+            Returns:
+                None
+
+            History:
+                2026-10-18(agent): 작성
+        """
+        if not event_product_ids:
+            return
+
         sql = """
             UPDATE
                 events_products
             SET
                 is_deleted = 1
             WHERE
-                product_id = %(product_id)s
-                AND event_id = %(event_id)s
+                id IN %s;
         """
 
         with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, product)
+            cursor.execute(sql, [list(event_product_ids)])
@@ -0,0 +1,82 @@
+import traceback
+
+from utils.custom_exceptions import ServerError
+
+
+class ImageSweepDao:
+    """ Persistence Layer
+
+        내용 주소 경로 이미지 정리(service.admin.image_sweeper)에 필요한 참조 조회, 네임드 락
+
+        이미지 경로를 저장하는 컬럼:
+            product_images.image_url : 내용 주소 경로 (예: productImages/3f/3f1c...)
+            events.banner_image      : S3_BUCKET_URL + 내용 주소 경로
+            events.detail_image      : S3_BUCKET_URL + 내용 주소 경로
+
+        Attributes: None
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def get_sweep_lock_dao(self, connection, name):
+        """ MySQL 네임드 락을 기다리지 않고 잡는다. (잡으면 True)
+
+            여러 프로세스 중 하나만 정리 작업을 실행한다. 커넥션이 끊기면 락도 풀린다.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT GET_LOCK(%s, 0);", name)
+            return cursor.fetchone()[0] == 1
+
+    def release_sweep_lock_dao(self, connection, name):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT RELEASE_LOCK(%s);", name)
+
+    def get_referenced_image_urls_dao(self, connection, urls):
+        """ urls 중 상품 이미지, 기획전 배너/상세 이미지에서 참조하는 값 조회
+
+            삭제 처리(is_deleted = 1)된 행도 참조로 본다. (복구될 수 있다)
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                urls       : ['productImages/3f/3f1c...', 'https://...events/banners/ab/ab12...png', ...]
+
+            Author: agent
+
+            Returns: {'productImages/3f/3f1c...', ...}
+
+            Raises:
+                500, {'message: server_error', 'errorMessage': 'server_error'} : 서버 에러 발생
+
+            History:
+                2026-10-18(agent): 초기 생성
+        """
+
+        sql = """
+        SELECT image_url
+        FROM product_images
+        WHERE image_url IN %(urls)s
+        UNION
+        SELECT banner_image
+        FROM `events`
+        WHERE banner_image IN %(urls)s
+        UNION
+        SELECT detail_image
+        FROM `events`
+        WHERE detail_image IN %(urls)s;
+        """
+
+        if not urls:
+            return set()
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, {'urls': list(urls)})
+                return {row[0] for row in cursor.fetchall()}
+
+        except Exception:
+            traceback.print_exc()
+            raise ServerError('server_error')
@@ -1,11 +1,15 @@
 import pymysql
-import pandas as pd
+from utils.cursor import keyset_sql, paginate
+from utils.total_count import get_total_count
 from utils.custom_exceptions import (OrderDoesNotExist,
                                      UnableToUpdate,
                                      DoesNotOrderDetail,
                                      DeniedUpdate,
                                      )
 
+EXPORT_CHUNK_SIZE = 1000
+
+
 class OrderDao:
     """ Persistence Layer
 
@@ -18,10 +22,32 @@ class OrderDao:
             2020-12-30(김민서): 1차 수정
             2020-12-31(김민서): 2차 수정
             2020-01-05(김민서): get_order_list_dao - sql문 정리
+            2026-10-18(agent): get_order_list_dao - 커서 페이지네이션 추가, 전체 개수 캐싱
+            2026-10-18(agent): get_order_export_dao - 엑셀 다운로드를 서버 사이드 커서로 나눠서 조회
     """
 
 
-    def get_order_list_dao(self, connection, data):
+    def _build_order_list_sql(self, data):
+        """ 주문 리스트 조회, 엑셀 다운로드에서 같이 사용하는 쿼리 조각 생성
+
+            Args:
+                data : 비지니스 레이어에서 넘겨 받은 data 객체
+
+            Returns:
+                {
+                    'select_sql'      : SELECT 컬럼,
+                    'extra_sql'       : FROM ~ WHERE 필터,
+                    'order_sql'       : ORDER BY,
+                    'total_count_sql' : COUNT 쿼리,
+                    'cursor_columns'  : 커서 컬럼,
+                    'cursor_keys'     : 커서 키,
+                    'descending'      : 내림차순 여부
+                }
+
+            History:
+                2026-10-18(agent): get_order_list_dao 에서 분리
+        """
+
         # 카운트 sql
         total_count_sql = """
                     SELECT COUNT(*) AS total_count
@@ -104,9 +130,11 @@ class OrderDao:
                 , order_items.quantity AS 수량
             """
 
-        # 1.6 엑셀 API 가 아닌 경우 id값 추가
+        # 1.6 엑셀 API 가 아닌 경우 id값 추가 (상품 준비 상태가 아니면 커서용 수정일도 추가)
         if 'page' in data:
             sql += ", order_items.id"
+            if status != 1:
+                sql += ", order_items.updated_at AS cursor_updated_at"
 
         # 2.0 필터링 조건 추가
         # 2.1 엑셀 API 인 경우
@@ -141,44 +169,118 @@ class OrderDao:
         if data['attributes']:
             extra_sql += " AND sellers.seller_attribute_type_id IN %(attributes)s"
 
-        # 2.6 정렬 조건
+        total_count_sql += extra_sql
+
+        # 2.6 정렬 조건 (같은 수정일은 id 순서로 정렬해서 커서가 항상 같은 위치를 가리키도록 한다)
+        descending = data['order_by'] == 'recent'
+        direction = " DESC" if descending else " ASC"
         if data['status'] == 1:
-            if data['order_by'] == 'recent':
-                extra_sql += " ORDER BY order_items.id DESC"
-            else:
-                extra_sql += " ORDER BY order_items.id ASC"
+            cursor_columns = ['order_items.id']
+            cursor_keys = ['id']
+            order_sql = " ORDER BY order_items.id" + direction
         else:
-            if data['order_by'] == 'recent':
-                extra_sql += " ORDER BY order_items.updated_at DESC"
-            else:
-                extra_sql += " ORDER BY order_items.updated_at ASC"
+            cursor_columns = ['order_items.updated_at', 'order_items.id']
+            cursor_keys = ['cursor_updated_at', 'id']
+            order_sql = " ORDER BY order_items.updated_at" + direction + ", order_items.id" + direction
+
+        return {
+            'select_sql': sql,
+            'extra_sql': extra_sql,
+            'order_sql': order_sql,
+            'total_count_sql': total_count_sql,
+            'cursor_columns': cursor_columns,
+            'cursor_keys': cursor_keys,
+            'descending': descending
+        }
 
-        total_count_sql += extra_sql
-        sql += extra_sql
-        excel_sql = sql
+    def get_order_list_dao(self, connection, data):
+        """ 주문 리스트 조회
 
-        # 3.0 페이지 조건
-        if 'page' and 'length' in data:
-            sql += " LIMIT %(page)s, %(length)s;"
-        elif not data['ids']:
-            excel_sql += " LIMIT 0, 1000;"
+            Args:
+                connection : 데이터베이스 연결 객체
+                data       : 비지니스 레이어에서 넘겨 받은 data 객체
 
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            # 엑셀 API 인 경우
-            if 'ids' in data:
-                cursor.execute(excel_sql, data)
-                result = pd.DataFrame(cursor.fetchall())
-                return result
+            Returns:
+                {'total_count': 2, 'is_estimated_count': False, 'order_lists': [...], 'next_cursor': 'WzRd'}
 
-            # 주문 리스트 조회 API 인 경우
+            Raises:
+                400, {'message': 'order_does_not_exist', 'errorMessage': '주문 내역이 없습니다.'} : 주문 리스트 없음
+
+            History:
+                2020-12-29(김민서): 초기 생성
+                2026-10-18(agent): 커서 페이지네이션 추가, 전체 개수 캐싱
+                2026-10-18(agent): 엑셀 다운로드를 get_order_export_dao 로 분리
+        """
+
+        query = self._build_order_list_sql(data)
+        sql = query['select_sql'] + query['extra_sql']
+
+        # 다음 페이지 여부를 알 수 있도록 length + 1 개 조회, 커서가 있으면 OFFSET 대신 커서 이후의 주문만 조회
+        data['fetch_limit'] = data['length'] + 1
+        if data.get('cursor'):
+            keyset_condition, params = keyset_sql(query['cursor_columns'], data['cursor'], query['descending'])
+            data.update(params)
+            sql += " AND " + keyset_condition + query['order_sql'] + " LIMIT %(fetch_limit)s;"
+        else:
+            sql += query['order_sql'] + " LIMIT %(page)s, %(fetch_limit)s;"
+
+        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             list = cursor.fetchall()
             if not list:
                 raise OrderDoesNotExist('주문 내역이 없습니다.')
-            cursor.execute(total_count_sql, data)
-            count = cursor.fetchone()
+            list, next_cursor = paginate(list, data['length'], query['cursor_keys'])
+            for row in list:
+                row.pop('cursor_updated_at', None)
+
+        # 전체 개수는 첫 페이지에서만 조회하고 이후 페이지는 캐시에 있을 때만 반환
+        count = get_total_count(
+            connection,
+            query['total_count_sql'],
+            data,
+            load=not data.get('cursor') and data['page'] == 0
+        )
+
+        return {
+            'total_count': count['total_count'],
+            'is_estimated_count': count['is_estimated'],
+            'order_lists': list,
+            'next_cursor': next_cursor
+        }
+
+    def get_order_export_dao(self, connection, data, chunk_size=EXPORT_CHUNK_SIZE):
+        """ 엑셀 다운로드용 주문 리스트를 나눠서 조회
+
+            서버 사이드 커서(SSCursor)로 조회하므로 전체 결과를 메모리에 올리지 않고 chunk_size 개씩 읽는다.
+            쿼리는 호출할 때 바로 실행되므로 쿼리 에러는 응답을 보내기 전에 발생한다.
+
+            Args:
+                connection : 엑셀 다운로드 전용 데이터베이스 연결 객체 (다 읽을 때까지 다른 쿼리에 사용할 수 없다)
+                data       : 비지니스 레이어에서 넘겨 받은 data 객체
+                chunk_size : 한번에 읽을 행 수
+
+            Returns:
+                (컬럼 이름 리스트, 행 튜플 리스트를 chunk_size 개씩 돌려주는 generator)
+
+            History:
+                2026-10-18(agent): 초기 생성 (pandas DataFrame 과 LIMIT 0, 1000 제거)
+        """
+
+        query = self._build_order_list_sql(data)
+        sql = query['select_sql'] + query['extra_sql'] + query['order_sql'] + ";"
+
+        cursor = connection.cursor(pymysql.cursors.SSCursor)
+        cursor.execute(sql, data)
+        columns = [description[0] for description in cursor.description]
+
+        def chunks():
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield rows
 
-            return {'total_count': count['total_count'], 'order_lists': list}
+        return columns, chunks()
 
 
     def update_order_status_dao(self, connection, data):
@@ -167,6 +167,7 @@ class ProductCreateDao:
             History:
                 2020-12-29(심원두): 초기 생성
                 2020-12-31(심원두): Docstring 수정
+                2026-10-18(agent): 축소본 가로 크기(variant_widths) 기록 추가
 
             Raises:
                 500, {'message': 'product image create denied',
@@ -178,10 +179,12 @@ class ProductCreateDao:
             `image_url`
             , `product_id`
             , `order_index`
+            , `variant_widths`
         ) VALUES (
             %(image_url)s
             ,%(product_id)s
             ,%(order_index)s
+            ,%(variant_widths)s
         );
         """
         
@@ -1,5 +1,7 @@
 import pymysql
 
+from utils.cursor            import keyset_sql
+from utils.total_count       import get_total_count
 from utils.custom_exceptions import (
     ProductNotExist,
     ProductImageNotExist,
@@ -98,10 +100,13 @@ class ProductManageDao:
     
             Returns:
                 return result (상품 총 갯수)
+                    {'total_count': 951, 'is_estimated': False}
+                    total_count 는 data['load_count'] 가 False 이고 캐시에 없으면 None
     
             History:
                 2020-12-31(심원두): 초기 생성
                 2021-01-03(심원두): 상품 리스트 총 갯수 취득 기능 작성
+                2026-10-18(agent): 필터 별 캐싱, 예상 개수 사용 (utils.total_count)
             
             Raises: -
         """
@@ -124,10 +129,7 @@ class ProductManageDao:
         """
         sql += self.__generate_where_sql(data)
         
-        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, data)
-            result = cursor.fetchone()
-            return result
+        return get_total_count(connection, sql, data, load=data.get('load_count', True))
     
     def search_products(self, connection, data):
         """상품 리스트 검색
@@ -138,14 +140,16 @@ class ProductManageDao:
             
             Author: 심원두
             
-            Returns: result (상품 정보 리스트)
+            Returns: result (상품 정보 리스트, 다음 페이지 여부 확인을 위해 limit + 1 개까지 조회)
             
             History:
                 2020-12-31(심원두): 초기 생성
                 2021-01-03(심원두): 쿼리 수정
                  -seller_attribute_type 검색 조건을 완전 일치 검색에서 IN 으로 수정
+                2026-10-18(agent): 커서 페이지네이션 추가 (cursor 가 있으면 OFFSET 대신 사용)
             Raises:
-                -
+                400, {'message': 'invalid_cursor',
+                      'error_message': '잘못된 커서입니다.'}: 잘못된 커서
         """
         
         sql = """
@@ -178,7 +182,15 @@ class ProductManageDao:
         
         sql     += self.__generate_where_sql(data)
         order_by = "\nORDER BY product.id DESC"
-        limit    = "\nLIMIT %(offset)s, %(limit)s;"
+        limit    = "\nLIMIT %(offset)s, %(fetch_limit)s;"
+        
+        data['fetch_limit'] = data['limit'] + 1
+        
+        if data.get('cursor'):
+            keyset_condition, params = keyset_sql(['product.id'], data['cursor'])
+            data.update(params)
+            sql  += "\nAND " + keyset_condition
+            limit = "\nLIMIT %(fetch_limit)s;"
         
         sql += order_by + limit
         
@@ -1,6 +1,8 @@
 import pymysql
 from datetime                import datetime
 
+from utils.cursor            import keyset_sql, paginate
+from utils.total_count       import get_total_count
 from utils.custom_exceptions import (
     UserUpdateDenied,
     UserCreateDenied,
@@ -162,45 +164,65 @@ class SellerDao:
                 AND account.permission_type_id = 2 
             """
 
-        filter_sql = ' ORDER BY `account`.id DESC LIMIT %(offset)s, %(limit)s'
-
         if data['account_id']:
-            sql += ' AND account.id = %(account_id)s '
+            extra_sql += ' AND account.id = %(account_id)s '
         if data['username']:
-            sql += ' AND account.username = %(username)s	'
+            extra_sql += ' AND account.username = %(username)s	'
         if data['seller_english_name']:
-            sql += ' AND seller.english_name = %(seller_english_name)s'
+            extra_sql += ' AND seller.english_name = %(seller_english_name)s'
         if data['seller_name']:
-            sql += ' AND seller.name = %(seller_name)s'
+            extra_sql += ' AND seller.name = %(seller_name)s'
         if data['contact_name']:
-            sql += ' AND seller.contact_name = %(contact_name)s'
+            extra_sql += ' AND seller.contact_name = %(contact_name)s'
         if data['seller_status_type_name']:
-            sql += ' AND seller_status_type.name = %(seller_status_type_name)s'
+            extra_sql += ' AND seller_status_type.name = %(seller_status_type_name)s'
         if data['contact_phone']:
-            sql += ' AND seller.contact_phone = %(contact_phone)s'
+            extra_sql += ' AND seller.contact_phone = %(contact_phone)s'
         if data['contact_email']:
-            sql += ' AND seller.contact_email = %(contact_email)s'
+            extra_sql += ' AND seller.contact_email = %(contact_email)s'
         if data['seller_attribute_type_name']:
-            sql += ' AND seller_attribute_type.name = %(seller_attribute_type_name)s'
+            extra_sql += ' AND seller_attribute_type.name = %(seller_attribute_type_name)s'
         if data['start_date'] and data['end_date']:
-            sql += """
+            extra_sql += """
                         AND seller.updated_at 
-                        BETWEEN CONCAT(%(start_date)s, "00:00:00") 
-                        AND CONCAT(%(end_date)s, "23:59:59")
+                        BETWEEN CONCAT(%(start_date)s, " 00:00:00") 
+                        AND CONCAT(%(end_date)s, " 23:59:59")
                    """
 
-        sql += extra_sql + filter_sql
         total_count_sql += extra_sql
 
+        # 다음 페이지 여부를 알 수 있도록 limit + 1 개 조회, 커서가 있으면 OFFSET 대신 커서 이후만 조회
+        data['fetch_limit'] = data['limit'] + 1
+        if data.get('cursor'):
+            keyset_condition, params = keyset_sql(['`account`.id'], data['cursor'])
+            data.update(params)
+            filter_sql = ' AND ' + keyset_condition + ' ORDER BY `account`.id DESC LIMIT %(fetch_limit)s'
+        else:
+            filter_sql = ' ORDER BY `account`.id DESC LIMIT %(offset)s, %(fetch_limit)s'
+
+        sql += extra_sql + filter_sql
+
         with connection.cursor(pymysql.cursors.DictCursor) as cursor:
             cursor.execute(sql, data)
             sellers = cursor.fetchall()
             if not sellers:
                 raise SellerNotExist('seller does not exist')
-            cursor.execute(total_count_sql, data)
-            count = cursor.fetchone()
+            sellers, next_cursor = paginate(sellers, data['limit'], ['account_id'])
+
+        # 전체 개수는 첫 페이지에서만 조회하고 이후 페이지는 캐시에 있을 때만 반환
+        count = get_total_count(
+            connection,
+            total_count_sql,
+            data,
+            load=not data.get('cursor') and data['offset'] == 0
+        )
 
-            return {'seller_list':sellers, 'total_count':count['total_count']}
+        return {
+            'seller_list': sellers,
+            'total_count': count['total_count'],
+            'is_estimated_count': count['is_estimated'],
+            'next_cursor': next_cursor
+        }
 
 
     def get_seller_list(self, connection, offset):
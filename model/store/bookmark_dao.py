@@ -1,3 +1,5 @@
+import traceback
+
 from utils.custom_exceptions import DatabaseError, DataManipulationFail
 
 
@@ -11,6 +13,7 @@ class BookmarkDao:
         History:
             2020-01-02(김민구) 초기 생성
             2020-01-07(김민구): 상품 존재 유무 체크 추가
+            2026-10-18(agent): 여러 상품 일괄 추가/삭제, 계정 별 북마크 목록 조회 추가
     """
 
     def get_product_exist(self, connection, data):
@@ -176,44 +179,212 @@ class BookmarkDao:
         except Exception:
             raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
 
-    def update_bookmark_volume_count(self, connection, data):
-        """ 상품 북마크 수 업데이트
+    def get_existing_product_ids_dao(self, connection, data):
+        """ 상품 아이디 중 삭제되지 않은 상품 아이디 조회
 
-        Args:
-            connection : 데이터베이스 연결 객체
-            data       : 서비스에서 넘겨 받은 dict ( product_id, account_id, count )
+            Args:
+                connection : 데이터베이스 연결 객체
+                data       : 서비스에서 넘겨 받은 dict ( product_ids )
 
-        Returns:
-            None
+            Author: agent
 
-        Raises:
-            500, {'message': 'database_error', 'errorMessage': '서버에 알 수 없는 에러가 발생했습니다.'}           : 데이터베이스 에러
-            500, {'message': 'data_manipulation_fail', 'error_message': '북마크 추가 혹은 삭제를 실패하였습니다.'} : 데이터 조작 에러
+            Returns: {1, 2, 3}
 
-        History:
-            2021-01-02(김민구): 초기 생성
+            Raises:
+                500, {'message': 'database_error', 'errorMessage': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
+
+            History:
+                2026-10-18(agent): 초기 생성
+        """
+
+        sql = """
+            SELECT
+                id
+            FROM
+                products
+            WHERE
+                id IN %(product_ids)s
+                AND is_deleted = 0;
+        """
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, {'product_ids': tuple(data['product_ids'])})
+                return {row[0] for row in cursor.fetchall()}
+
+        except Exception:
+            traceback.print_exc()
+            raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
+
+    def get_bookmarked_product_ids_dao(self, connection, data):
+        """ 상품 아이디 중 해당 유저가 북마크 한 상품 아이디 조회
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                data       : 서비스에서 넘겨 받은 dict ( account_id, product_ids )
+
+            Author: agent
+
+            Returns: {1, 3}
+
+            Raises:
+                500, {'message': 'database_error', 'errorMessage': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
+
+            History:
+                2026-10-18(agent): 초기 생성
+        """
 
-        Notes:
-            bookmark_count는 unsigned가 걸려있음
-            만약 0인 상태에서 -1이 연산된다면 데이터 입력이 실패하게 된다.
-            이 때 에러를 발생시키지 않고 success로 넘긴다.
-            데이터베이스의 unsigned error 번호는 1690이므로 1690에 대한 에러가 뜬다면 None을 리턴시킨다.
+        sql = """
+            SELECT
+                product_id
+            FROM
+                bookmarks
+            WHERE
+                account_id = %(account_id)s
+                AND product_id IN %(product_ids)s
+                AND is_deleted = 0;
+        """
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, {'account_id': data['account_id'], 'product_ids': tuple(data['product_ids'])})
+                return {row[0] for row in cursor.fetchall()}
+
+        except Exception:
+            traceback.print_exc()
+            raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
+
+    def create_bookmarks_dao(self, connection, data):
+        """ 상품 여러개 북마크 일괄 추가
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                data       : 서비스에서 넘겨 받은 dict ( account_id, product_ids )
+
+            Author: agent
+
+            Returns: None
+
+            Raises:
+                500, {'message': 'database_error', 'errorMessage': '서버에 알 수 없는 에러가 발생했습니다.'}   : 데이터베이스 에러
+                500, {'message': 'data_manipulation_fail', 'error_message': '북마크 추가를 실패하였습니다.'} : 데이터 조작 에러
+
+            History:
+                2026-10-18(agent): 초기 생성
+
+            Notes:
+                VALUES 가 플레이스홀더로만 이루어져 있으므로 executemany 는 INSERT 한번(여러 행)으로 실행된다.
+        """
+
+        sql = """
+            INSERT INTO bookmarks (
+                account_id,
+                product_id
+            ) VALUES (
+                %(account_id)s,
+                %(product_id)s
+            );
+        """
+
+        rows = [{'account_id': data['account_id'], 'product_id': product_id} for product_id in data['product_ids']]
+
+        try:
+            with connection.cursor() as cursor:
+                result = cursor.executemany(sql, rows)
+                if result != len(rows):
+                    raise DataManipulationFail('북마크 추가를 실패하였습니다.')
+
+        except DataManipulationFail as e:
+            raise e
+
+        except Exception:
+            traceback.print_exc()
+            raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
+
+    def delete_bookmarks_dao(self, connection, data):
+        """ 상품 여러개 북마크 일괄 삭제
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                data       : 서비스에서 넘겨 받은 dict ( account_id, product_ids )
+
+            Author: agent
+
+            Returns: None
+
+            Raises:
+                500, {'message': 'database_error', 'errorMessage': '서버에 알 수 없는 에러가 발생했습니다.'}   : 데이터베이스 에러
+                500, {'message': 'data_manipulation_fail', 'error_message': '북마크 삭제를 실패하였습니다.'} : 데이터 조작 에러
+
+            History:
+                2026-10-18(agent): 초기 생성
         """
 
         sql = """
             UPDATE
-                bookmark_volumes
-            SET 
-                bookmark_count = bookmark_count + %(count)s
+                bookmarks
+            SET
+                is_deleted = 1
             WHERE
-                product_id = %(product_id)s
+                account_id = %(account_id)s
+                AND product_id IN %(product_ids)s
+                AND is_deleted = 0;
+        """
+
+        try:
+            with connection.cursor() as cursor:
+                result = cursor.execute(sql, {'account_id': data['account_id'], 'product_ids': tuple(data['product_ids'])})
+                if result < len(data['product_ids']):
+                    raise DataManipulationFail('북마크 삭제를 실패하였습니다.')
+
+        except DataManipulationFail as e:
+            raise e
+
+        except Exception:
+            traceback.print_exc()
+            raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
+
+    def get_account_bookmarks_dao(self, connection, data):
+        """ 해당 유저의 북마크 전체를 최근에 추가한 순서로 조회
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                data       : 서비스에서 넘겨 받은 dict ( account_id )
+
+            Author: agent
+
+            Returns: [(bookmark_id, product_id), ...] bookmark_id 내림차순
+
+            Raises:
+                500, {'message': 'database_error', 'errorMessage': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
+
+            History:
+                2026-10-18(agent): 초기 생성
+
+            Notes:
+                같은 상품을 삭제 후 다시 북마크 하면 행이 새로 추가되므로 상품 별로 가장 최근 행만 조회한다.
+        """
+
+        sql = """
+            SELECT
+                MAX(id) AS bookmark_id
+                , product_id
+            FROM
+                bookmarks
+            WHERE
+                account_id = %(account_id)s
+                AND is_deleted = 0
+            GROUP BY
+                product_id
+            ORDER BY
+                bookmark_id DESC;
         """
 
         try:
             with connection.cursor() as cursor:
                 cursor.execute(sql, data)
+                return [tuple(row) for row in cursor.fetchall()]
 
-        except Exception as e:
-            if '1690' in e.__str__():
-                return None
+        except Exception:
+            traceback.print_exc()
             raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
@@ -220,3 +220,92 @@ class CartItemDao:
         except Exception:
             traceback.print_exc()
             raise ServerError('server_error')
+
+    def get_cart_items_dao(self, connection, data):
+        """계정의 장바구니 상품 전체 조회 (장바구니 가격, 현재 재고 기준)
+
+        상품 가격은 결제와 같이 장바구니에 담을 때의 가격으로 계산하고,
+        현재 상품 가격(current_price)이 그 가격과 다르면 price_changed 가 1 이다.
+        재고가 주문 수량보다 적거나 판매하지 않는 상품이면 soldout 이 1 이다.
+        결제한 장바구니 상품은 결제 트랜잭션에서 논리 삭제되므로 is_deleted 로 제외한다.
+
+        Args:
+            connection: 데이터베이스 연결 객체
+            data      : 서비스 레이어에서 넘겨 받아 조회할 data (user_id)
+
+        Author: agent
+
+        Returns:
+            [
+                {
+                    "cart_id": 23,
+                    "product_id": 1,
+                    "product_name": "성보의하루1",
+                    "seller_name": "나는셀러9",
+                    "image_url": "https://...",
+                    "stock_id": 1,
+                    "color": "Black",
+                    "size": "Free",
+                    "quantity": 2,
+                    "original_price": 10000.0,
+                    "discount_rate": 0.1,
+                    "price": 9000.0,
+                    "total_price": 18000.0,
+                    "current_price": 8000.0,
+                    "price_changed": 1,
+                    "soldout": 0
+                }
+            ]
+
+        Raises:
+            500, {'message: server_error',
+            'errorMessage': 'server_error'} :서버 에러 발생
+
+        History:
+            2026-10-18(agent): 초기 생성
+            2026-10-18(agent): 결제와 같은 장바구니 가격으로 계산, 현재 가격과 다르면 price_changed 표시
+        """
+
+        sql = """
+        SELECT
+        ct.id AS cart_id
+        , ct.product_id
+        , pd.name AS product_name
+        , se.name AS seller_name
+        , pi.image_url
+        , ct.stock_id
+        , co.name AS color
+        , sz.name AS size
+        , ct.quantity
+        , ct.original_price
+        , ct.sale AS discount_rate
+        , IF(ct.discounted_price > 0, ct.discounted_price, ct.original_price) AS price
+        , IF(ct.discounted_price > 0, ct.discounted_price, ct.original_price) * ct.quantity AS total_price
+        , IF(pd.discount_rate > 0, pd.discounted_price, pd.origin_price) AS current_price
+        , IF(pd.discount_rate > 0, pd.discounted_price, pd.origin_price)
+            <> IF(ct.discounted_price > 0, ct.discounted_price, ct.original_price) AS price_changed
+        , (st.remain < ct.quantity OR pd.is_deleted = 1 OR pd.is_display = 0) AS soldout
+        FROM cart_items AS ct
+        INNER JOIN products AS pd ON pd.id = ct.product_id
+        INNER JOIN sellers AS se ON se.account_id = pd.seller_id
+        INNER JOIN stocks AS st ON st.id = ct.stock_id
+        INNER JOIN colors AS co ON co.id = st.color_id
+        INNER JOIN sizes AS sz ON sz.id = st.size_id
+        LEFT JOIN product_images AS pi
+            ON pi.product_id = ct.product_id
+            AND pi.order_index = 1
+            AND pi.is_deleted = 0
+        WHERE ct.user_id = %(user_id)s
+        AND ct.is_deleted = 0
+        ORDER BY ct.id DESC
+        ;
+        """
+
+        try:
+            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+                cursor.execute(sql, data)
+                return cursor.fetchall()
+
+        except Exception:
+            traceback.print_exc()
+            raise ServerError('server_error')
@@ -254,6 +254,7 @@ class EventListDao:
 
             History:
                 2021-01-01(김민구): 초기 생성
+                2026-10-18(agent): 대표 이미지 축소본 가로 크기(image_variant_widths) 추가
 
             Notes:
                 해당 버튼 기획전의 상품 리스트를 반환
@@ -263,6 +264,7 @@ class EventListDao:
             SELECT 
                 product.id AS product_id
                 , product_image.image_url
+                , product_image.variant_widths AS image_variant_widths
                 , seller.`name` AS seller_name
                 , product.`name` AS product_name
                 , product.origin_price
@@ -324,6 +326,7 @@ class EventListDao:
 
             History:
                 2021-01-01(김민구): 초기 생성
+                2026-10-18(agent): 대표 이미지 축소본 가로 크기(image_variant_widths) 추가
 
             Notes:
                 해당 기획전의 상품 리스트를 반환
@@ -333,6 +336,7 @@ class EventListDao:
             SELECT 
                 product.id AS product_id
                 , product_image.image_url
+                , product_image.variant_widths AS image_variant_widths
                 , seller.`name` AS seller_name
                 , product.`name` AS product_name
                 , product.origin_price
@@ -0,0 +1,157 @@
+import traceback
+import pymysql
+
+from utils.custom_exceptions import ServerError
+
+
+class OutboxDao:
+    """ Persistence Layer
+
+        결제 뒤에 해도 되는 쓰기 작업(outbox_jobs 테이블) 저장, 조회, 완료 처리
+
+        테이블:
+            CREATE TABLE outbox_jobs (
+                id           BIGINT       NOT NULL AUTO_INCREMENT PRIMARY KEY,
+                account_id   INT          NOT NULL,
+                job_type     VARCHAR(50)  NOT NULL,
+                payload      JSON         NOT NULL,
+                attempts     INT          NOT NULL DEFAULT 0,
+                is_failed    TINYINT      NOT NULL DEFAULT 0,
+                last_error   VARCHAR(500) NULL,
+                available_at DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                created_at   DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                updated_at   DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                INDEX outbox_jobs_account_idx (is_failed, account_id, id)
+            );
+
+        Attributes: None
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def insert_jobs_dao(self, connection, jobs):
+        """ 작업 여러개 추가 (요청 트랜잭션 안에서 실행되므로 주문과 함께 commit, rollback 된다)
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                jobs       : [{'account_id': 1, 'job_type': 'customer_information', 'payload': '{...}'}, ...]
+
+            Author: agent
+
+            Returns: None
+
+            Raises:
+                500, {'message: server_error', 'errorMessage': 'server_error'} : 서버 에러 발생
+
+            History:
+                2026-10-18(agent): 초기 생성
+        """
+
+        sql = """
+        INSERT INTO outbox_jobs (
+            account_id
+            , job_type
+            , payload
+        ) VALUES (
+            %(account_id)s
+            , %(job_type)s
+            , %(payload)s
+        );
+        """
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.executemany(sql, jobs)
+
+        except Exception:
+            traceback.print_exc()
+            raise ServerError('server_error')
+
+    def get_partition_lock_dao(self, connection, name):
+        """ 파티션 이름으로 MySQL 네임드 락을 기다리지 않고 잡는다. (잡으면 True)
+
+            여러 프로세스의 워커 중 하나만 같은 파티션을 처리해서 계정 별 작업 순서를 지킨다.
+            커넥션이 끊기면 락도 풀린다.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT GET_LOCK(%s, 0);", name)
+            return cursor.fetchone()[0] == 1
+
+    def release_partition_lock_dao(self, connection, name):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT RELEASE_LOCK(%s);", name)
+
+    def get_pending_jobs_dao(self, connection, data):
+        """ 파티션의 실행할 작업 조회
+
+            같은 계정에 재시도를 기다리는 이전 작업이 있으면 이후 작업은 조회하지 않는다. (계정 별 순서 보장)
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                data       : {'partition': 0, 'partitions': 2, 'limit': 50}
+
+            Author: agent
+
+            Returns: [{'id': 1, 'account_id': 3, 'job_type': 'customer_information', 'payload': '{...}', 'attempts': 0}]
+
+            History:
+                2026-10-18(agent): 초기 생성
+        """
+
+        sql = """
+        SELECT
+            job.id
+            , job.account_id
+            , job.job_type
+            , job.payload
+            , job.attempts
+        FROM outbox_jobs AS job
+        WHERE job.is_failed = 0
+        AND MOD(job.account_id, %(partitions)s) = %(partition)s
+        AND job.available_at <= NOW()
+        AND NOT EXISTS (
+            SELECT 1
+            FROM outbox_jobs AS waiting
+            WHERE waiting.is_failed = 0
+            AND waiting.account_id = job.account_id
+            AND waiting.id < job.id
+            AND waiting.available_at > NOW()
+        )
+        ORDER BY job.id
+        LIMIT %(limit)s;
+        """
+
+        with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(sql, data)
+            return cursor.fetchall()
+
+    def delete_job_dao(self, connection, job_id):
+        """ 완료된 작업 삭제 (작업 내용과 같은 트랜잭션에서 commit 한다) """
+
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM outbox_jobs WHERE id = %s;", job_id)
+
+    def retry_job_dao(self, connection, data):
+        """ 실패한 작업을 delay_seconds 뒤에 다시 실행하도록 하거나 is_failed=1 로 더 이상 실행하지 않는다.
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                data       : {'id': 1, 'delay_seconds': 20, 'is_failed': 0, 'last_error': '...'}
+        """
+
+        sql = """
+        UPDATE outbox_jobs
+        SET
+            attempts = attempts + 1
+            , is_failed = %(is_failed)s
+            , last_error = %(last_error)s
+            , available_at = NOW() + INTERVAL %(delay_seconds)s SECOND
+        WHERE id = %(id)s;
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, data)
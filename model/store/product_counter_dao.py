@@ -0,0 +1,83 @@
+import traceback
+
+from utils.custom_exceptions import DatabaseError
+
+
+class ProductCounterDao:
+    """ Persistence Layer
+
+        상품 북마크 수(bookmark_volumes), 판매량(product_sales_volumes) 일괄 반영
+
+        Attributes: None
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def update_bookmark_counts_dao(self, connection, deltas):
+        """ 상품 별 북마크 수 증감값을 한번에 반영
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                deltas     : [(product_id, 증감값), ...] product_id 순으로 정렬된 리스트
+
+            Author: agent
+
+            Returns: None
+
+            Raises:
+                500, {'message': 'database_error', 'errorMessage': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
+
+            History:
+                2026-10-18(agent): 초기 생성
+
+            Notes:
+                bookmark_count 는 unsigned 이므로 0 밑으로 내려가지 않도록 GREATEST 로 계산한다.
+        """
+
+        self._update_counts(connection, 'bookmark_volumes', 'bookmark_count', deltas)
+
+    def update_sales_counts_dao(self, connection, deltas):
+        """ 상품 별 판매량 증가값을 한번에 반영
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                deltas     : [(product_id, 증가값), ...] product_id 순으로 정렬된 리스트
+
+            Author: agent
+
+            Returns: None
+
+            Raises:
+                500, {'message': 'database_error', 'errorMessage': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
+
+            History:
+                2026-10-18(agent): 초기 생성
+        """
+
+        self._update_counts(connection, 'product_sales_volumes', 'sales_count', deltas)
+
+    def _update_counts(self, connection, table, column, deltas):
+        case_sql = " ".join("WHEN %s THEN %s" for _ in deltas)
+        sql = """
+            UPDATE
+                {table}
+            SET
+                {column} = GREATEST(CAST({column} AS SIGNED) + (CASE product_id {case_sql} END), 0)
+            WHERE
+                product_id IN %s
+            ORDER BY
+                product_id
+        """.format(table=table, column=column, case_sql=case_sql)
+
+        params = [value for delta in deltas for value in delta] + [[product_id for product_id, _ in deltas]]
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+
+        except Exception:
+            traceback.print_exc()
+            raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
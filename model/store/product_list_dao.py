@@ -1,3 +1,6 @@
+import json
+import traceback
+
 import pymysql
 
 from utils.custom_exceptions import DatabaseError
@@ -15,42 +18,109 @@ class ProductListDao:
             2020-12-31(김민구): 에러 문구 변경
     """
 
-    def get_search_products_dao(self, connection, data):
-        """ 상품 검색 및 정렬
+    def get_search_documents_dao(self, connection, data):
+        """ 검색 색인용 상품 조회
 
-            검색키워드로 상품이름과 셀러이름을 검색하고
-            검색 결과를 추천순, 판매순, 최신순으로 정렬한다.
+            검색 색인을 만들 때 사용한다. data 에 product_ids 가 있으면 해당 상품들만 조회한다.
 
             Args:
                 connection : 데이터베이스 연결 객체
-                data       : 서비스에서 넘겨 받은 data
+                data       : 서비스에서 넘겨 받은 data ( product_ids 선택 )
+
+            Author: agent
+
+            Returns: [
+                        {
+                            "product_id": 999,
+                            "product_name": "성보의하루999",
+                            "seller_name": "나는셀러4",
+                            "bookmark_count": 0,
+                            "sales_count": 32
+                        }
+                    ]
+
+            Raises:
+                500, {'message': 'database_error', 'error_message': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
+
+            History:
+                2026-10-18(agent): 초기 생성 (LIKE 검색을 검색 색인으로 대체)
+        """
+
+        sql = """
+        SELECT
+            product.id AS product_id
+            , product.name AS product_name
+            , seller.name AS seller_name
+            , bookmark.bookmark_count
+            , product_sales_volume.sales_count
+        FROM
+            products AS product
+        INNER JOIN sellers AS seller
+            ON seller.account_id = product.seller_id
+        INNER JOIN product_sales_volumes AS product_sales_volume
+            ON product_sales_volume.product_id = product.id
+        INNER JOIN bookmark_volumes AS bookmark
+            ON bookmark.product_id = product.id
+        WHERE
+            product.is_deleted = 0
+        """
+
+        try:
+            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+                if data.get('product_ids'):
+                    sql += """
+            AND product.id IN %(product_ids)s
+        """
+                    cursor.execute(sql, {'product_ids': tuple(data['product_ids'])})
+                else:
+                    cursor.execute(sql)
+                return cursor.fetchall()
+
+        except Exception:
+            traceback.print_exc()
+            raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
+
+    def get_search_products_by_ids_dao(self, connection, data):
+        """ 검색 결과 상품 정보 조회
+
+            검색 색인에서 찾은 상품 아이디들의 목록 정보를 한번에 조회한다.
+            정렬은 서비스에서 색인 순서대로 한다.
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                data       : 서비스에서 넘겨 받은 data ( product_ids )
 
             Author: 김기용
-            
-            Returns: {
-                        "bookmark_count": 0,
-                        "discounted_price": 9000.0,
-                        "image": "https://img.freepik.com",
-                        "name": "성보의하루999",
-                        "origin_price": 10000.0,
-                        "product_id": 999,
-                        "sales_count": 32,
-                        "seller_id": 4,
-                        "seller_name": "나는셀러4"
+
+            Returns: [
+                        {
+                            "bookmark_count": 0,
+                            "discounted_price": 9000.0,
+                            "image": "https://img.freepik.com",
+                            "product_name": "성보의하루999",
+                            "origin_price": 10000.0,
+                            "product_id": 999,
+                            "sales_count": 32,
+                            "seller_id": 4,
+                            "seller_name": "나는셀러4"
                         }
+                    ]
 
             Raises:
                 500, {'message': 'database_error', 'error_message': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
 
             History:
-                2020-12-31(김기용): 초기 생성
+                2020-12-31(김기용): 초기 생성 (get_search_products_dao)
                 2021-01-01(김기용): 1차 수정: 정렬기능추가
                 2021-01-02(김기용): 2차 수정: 북마크 정렬기능 추가
+                2026-10-18(agent): 검색 색인에서 찾은 아이디로만 조회하도록 수정, 대표 이미지 조인 조건 수정
+                2026-10-18(agent): 대표 이미지 축소본 가로 크기(image_variant_widths) 추가
         """
 
         sql = """
-        SELECT DISTINCT
+        SELECT
             product_image.image_url AS image
+            , product_image.variant_widths AS image_variant_widths
             , product.name AS product_name
             , product.seller_id AS seller_id
             , seller.name AS seller_name
@@ -62,7 +132,7 @@ class ProductListDao:
         FROM
             products AS product
         INNER JOIN product_images AS product_image
-            ON product_id = product_image.product_id
+            ON product_image.product_id = product.id
             AND product_image.order_index = 1
         INNER JOIN sellers AS seller
             ON seller.account_id = product.seller_id
@@ -71,23 +141,17 @@ class ProductListDao:
         INNER JOIN bookmark_volumes AS bookmark
             ON bookmark.product_id = product.id
         WHERE
-            product.name LIKE %(search)s
-            AND product.is_deleted=0
-        ORDER BY
-             (CASE WHEN %(sort_type)s=1 THEN bookmark_count END) DESC
-            , (CASE WHEN %(sort_type)s=2 THEN sales_count END) DESC
-            , (CASE WHEN %(sort_type)s=3 THEN product.id END) DESC
-        LIMIT %(limit)s;
-
+            product.id IN %(product_ids)s
+            AND product.is_deleted = 0;
         """
 
         try:
             with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                data['search'] = '%%' + data['search'] + '%%' 
-                cursor.execute(sql, data)
-                result = cursor.fetchall()
-                return result
+                cursor.execute(sql, {'product_ids': tuple(data['product_ids'])})
+                return cursor.fetchall()
+
         except Exception:
+            traceback.print_exc()
             raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
 
     def get_product_list(self, connection, data):
@@ -121,11 +185,13 @@ class ProductListDao:
             History:
                 2020-12-30(김민구): 초기 생성
                 2020-12-31(김민구): 에러 문구 변경 / 이벤트에 대한 상품을 반환하는 작업으로 수정
+                2026-10-18(agent): 대표 이미지 축소본 가로 크기(image_variant_widths) 추가
         """
 
         sql = """
             SELECT 
                 product_image.image_url
+                , product_image.variant_widths AS image_variant_widths
                 , product.seller_id AS seller_id
                 , seller.`name` AS seller_name
                 , product.id AS product_id
@@ -211,234 +277,196 @@ class ProductListDao:
         except Exception:
             raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
 
-    def get_product_image_dao(self, connection, data):
-        """ 상품 이미지들을 조회한다.
+    def get_active_events_dao(self, connection):
+        """ 진행중인 기획전 전체 조회 (홈 화면 페이지 순서)
+
+            get_event 의 LIMIT offset, 1 을 페이지마다 실행하지 않도록 한번에 조회한다.
 
             Args:
                 connection : 데이터베이스 연결 객체
-                offset     : 서비스에서 넘겨 받은 int
 
-            Author: 김기용
+            Author: agent
 
             Returns:
-                {
-                    image_id: 1,
-                    images_url: www.example.com
-                }
+                [
+                    {
+                        event_id: 1,
+                        event_banner_image: 'url'
+                    }
+                ]
 
             Raises:
                 500, {'message': 'database_error', 'error_message': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
 
             History:
-                2020-01-00(김기용): 초기 생성
+                2026-10-18(agent): 초기 생성
         """
 
         sql = """
-        SELECT DISTINCT
-            product_image.id AS image_id
-            , product_image.image_url AS image_url
-        FROM
-            product_images AS product_image
-        WHERE
-            product_id = %(product_id)s
-
+            SELECT
+                id AS event_id
+                , banner_image AS event_banner_image
+            FROM
+                events
+            WHERE
+                end_date > now()
+                AND is_display = 1
+                AND is_deleted = 0
+            ORDER BY
+                id ASC
         """
+
         try:
             with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(sql, data)
-                images = cursor.fetchall()
-                return images 
+                cursor.execute(sql)
+                return cursor.fetchall()
 
         except Exception:
             traceback.print_exc()
             raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
 
-    def get_product_color_dao(self, connection, data):
-        """ 상품 컬러들을 조회한다.
+    def get_product_detail_bundle_dao(self, connection, data):
+        """ 상품 상세정보, 이미지, 컬러, 사이즈 한번에 조회
 
-            상품이 여러 컬러들을 가질 수 있게 되고
-            컬러도 여러 상품들을 가질 수 있게 됨으로
-            중복이 발생한다. 그래서 DISTINCT를 사용
+            계정과 상관없는 상품 상세 정보를 하나의 쿼리로 조회한다.
+            이미지, 컬러, 사이즈는 JSON_ARRAYAGG 로 묶어서 가져오므로 재고 행 수만큼 결과가 늘어나지 않는다.
 
             Args:
                 connection : 데이터베이스 연결 객체
-                data     : 서비스에서 넘겨 받은 data
+                data       : 서비스에서 넘겨 받은 data ( product_id )
 
-            Author: 김기용
+            Author: agent
 
             Returns:
                 {
-                    color_id: 1,
-                    color_name: black
+                    "product_id": 1,
+                    "product_name": "성보의하루1",
+                    "detail_information": "html====================",
+                    "seller_id": 7,
+                    "seller_name": "나는셀러7",
+                    "origin_price": 10000.0,
+                    "discount_rate": 0.1,
+                    "discounted_price": 9000.0,
+                    "sales_count": 40,
+                    "bookmark_count": 0,
+                    "images": [{"image_id": 1, "image_url": "https://..."}],
+                    "colors": [{"color_id": 1, "color_name": "Black"}],
+                    "sizes": [{"size_id": 1, "size_name": "Free"}]
                 }
+                상품이 없으면 None
 
             Raises:
                 500, {'message': 'database_error', 'error_message': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
 
             History:
-                2020-01-00(김기용): 초기 생성
+                2026-10-18(agent): 초기 생성
         """
 
         sql = """
-            SELECT DISTINCT
-                color.name AS color_name
-                , color.id AS color_id
+            SELECT
+                product.id AS product_id
+                , product.name AS product_name
+                , product.detail_information
+                , product.seller_id AS seller_id
+                , seller.name AS seller_name
+                , product.origin_price
+                , product.discount_rate
+                , product.discounted_price
+                , product_sales_volume.sales_count
+                , bookmark.bookmark_count
+                , (
+                    SELECT
+                        JSON_ARRAYAGG(JSON_OBJECT('image_id', product_image.id, 'image_url', product_image.image_url))
+                    FROM
+                        product_images AS product_image
+                    WHERE
+                        product_image.product_id = product.id
+                ) AS images
+                , (
+                    SELECT
+                        JSON_ARRAYAGG(JSON_OBJECT('color_id', color.id, 'color_name', color.name))
+                    FROM
+                        colors AS color
+                    WHERE
+                        color.id IN (SELECT color_id FROM stocks WHERE stocks.product_id = product.id)
+                ) AS colors
+                , (
+                    SELECT
+                        JSON_ARRAYAGG(JSON_OBJECT('size_id', size.id, 'size_name', size.name))
+                    FROM
+                        sizes AS size
+                    WHERE
+                        size.id IN (SELECT size_id FROM stocks WHERE stocks.product_id = product.id)
+                ) AS sizes
             FROM
-                stocks
-            INNER JOIN colors as color
-                ON stocks.color_id = color.id
-            WHERE product_id = %(product_id)s
-            ;
+                products AS product
+            INNER JOIN sellers AS seller
+                ON product.seller_id = seller.account_id
+            INNER JOIN product_sales_volumes AS product_sales_volume
+                ON product_sales_volume.product_id = product.id
+            INNER JOIN bookmark_volumes AS bookmark
+                ON bookmark.product_id = product.id
+            WHERE
+                product.id = %(product_id)s
+                AND product.is_deleted = 0
+                AND EXISTS(SELECT id FROM stocks WHERE stocks.product_id = product.id);
         """
+
         try:
             with connection.cursor(pymysql.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
-                color = cursor.fetchall()
-                return color
+                result = cursor.fetchone()
+                if not result:
+                    return None
+
+                for key in ('images', 'colors', 'sizes'):
+                    result[key] = json.loads(result[key]) if result[key] else []
+                result['images'].sort(key=lambda image: image['image_id'])
+                return result
 
         except Exception:
             traceback.print_exc()
             raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
 
-    def get_product_size_dao(self, connection, data):
-        """ 상품 사이즈를 조회한다.
-
-            상품이 여러 사이즈들을 가질 수 있게 되고
-            사이즈도 여러 상품들을 가질 수 있게 됨으로
-            중복이 발생한다. 그래서 DISTINCT 를 사용
+    def get_product_bookmarked_dao(self, connection, data):
+        """ 해당 계정의 상품 북마크 여부 조회
 
             Args:
                 connection : 데이터베이스 연결 객체
-                data     : 서비스에서 넘겨 받은 data
+                data       : 서비스에서 넘겨 받은 data ( product_id, account_id )
 
-            Author: 김기용
+            Author: agent
 
             Returns:
-                {
-                    size_id: 1,
-                    size_name: black
-                }
-
-            Raises:
-                500, {'message': 'database_error', 'error_message': '서버에 알 수 없는 에러가 발생했습니다.'}
-
-            History:
-                2020-01-00(김기용): 초기 생성
-        """
-        
-        sql = """
-            SELECT DISTINCT
-                size.id AS size_id
-                ,size.name AS size_name
-            FROM
-                stocks
-            INNER JOIN sizes as size
-                ON stocks.size_id = size.id
-            WHERE product_id = %(product_id)s
-            ;
-        """
-
-        try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(sql, data)
-                sizes = cursor.fetchall()
-                return sizes
-
-        except Exception:
-            traceback.print_exc()
-            raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
-
-    def get_product_detail_dao(self, connection, data):
-        """ 상품 상세정보
-
-            Args:
-                connection : 데이터베이스 연결 객체
-                data       : 서비스에서 넘겨 받은 data
-
-            Author: 김기용
-            
-            Returns: 
-                {
-                "bookmark_count": 0,
-                "detail_information": "html====================",
-                "discount_rate": 0.1,
-                "discounted_price": 9000.0,
-                "id": 1,
-                "name": "성보의하루1",
-                "origin_price": 10000.0,
-                "sales_count": 40,
-                "seller_id": 7,
-                "seller_name": "나는셀러7"
-                }
+                1 : 북마크 함
+                0 : 북마크 하지 않음
 
             Raises:
                 500, {'message': 'database_error', 'error_message': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
 
             History:
-                2020-12-31(김기용): 초기 생성
-                2021-01-01(김기용): 1차 수정: 구현 완료
-                2021-01-02(김기용): 2차 수정: 북마크 개수 추가
-                2021-01-03(김기용): 3차 수정: 유저별 북마크 확인기능 추가
-                2021-01-05(김기용): 4차 수정: 비회원 로그인 북마크 반환값 추가
+                2026-10-18(agent): 초기 생성
         """
 
         sql = """
-            SELECT 
-                product.id AS product_id
-                , product.name AS product_name
-                , product.detail_information
-                , product.seller_id AS seller_id
-                , seller.name AS seller_name
-                , product.origin_price
-                , product.discount_rate
-                , product.discounted_price
-                , product_sales_volume.sales_count
-                , bookmark.bookmark_count
-                                        
-        """
-
-        sql_with_account = """
-                , EXISTS(
-                            SELECT
-                                id
-                            FROM
-                                bookmarks
-                            WHERE
-                                account_id = %(account_id)s
-                                AND product_id= %(product_id)s
-                                AND is_deleted =0
-                            ) AS is_bookmarked
-                """
-
-        sql_without_account = """
+            SELECT
+                EXISTS(
+                    SELECT
+                        id
                     FROM
-                        products AS product
-                    INNER JOIN stocks AS stock
-                        ON stock.product_id = product.id
-                    INNER JOIN sellers AS seller
-                        ON product.seller_id = seller.account_id
-                    INNER JOIN product_sales_volumes AS product_sales_volume
-                        ON product_sales_volume.product_id = product.id
-                    INNER JOIN bookmark_volumes AS bookmark
-                        ON bookmark.product_id = product.id
+                        bookmarks
                     WHERE
-                        product.id = %(product_id)s
-                        AND product.is_deleted = 0
-                        ;
+                        account_id = %(account_id)s
+                        AND product_id = %(product_id)s
+                        AND is_deleted = 0
+                );
         """
+
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                if 'account_id' not in data:
-                    sql += sql_without_account
-                    cursor.execute(sql, data)
-                    result = cursor.fetchone()
-                    result['is_bookmarked'] = 0
-                    return result
-                query = sql + sql_with_account + sql_without_account
-                cursor.execute(query, data)
-                result = cursor.fetchone()
-                return result
+            with connection.cursor() as cursor:
+                cursor.execute(sql, data)
+                return cursor.fetchone()[0]
 
         except Exception:
+            traceback.print_exc()
             raise DatabaseError('서버에 알 수 없는 에러가 발생했습니다.')
-
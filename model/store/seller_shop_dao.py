@@ -1,6 +1,7 @@
 import traceback
 import pymysql
 
+from utils.cursor import keyset_sql
 from utils.custom_exceptions import (
     SellerNotExist,
     ServerError,
@@ -115,10 +116,12 @@ class SellerShopDao:
 
         History:
             2021-01-02(고수희): 초기 생성
+            2026-10-18(agent): 대표 이미지 축소본 가로 크기(image_variant_widths) 추가
         """
         sql = """
         SELECT 
         pi.image_url AS image
+        , pi.variant_widths AS image_variant_widths
         , pd.seller_id AS seller_id
         , se.name AS seller_name
         , pd.id AS product_id
@@ -221,7 +224,7 @@ class SellerShopDao:
 
         Author: 고수희
 
-        Returns:
+        Returns: 다음 페이지가 있는지 알 수 있도록 limit + 1 개까지 조회한다. (서비스에서 limit 개로 자른다)
              [
                     {
                         "discount_rate": 0.1,
@@ -250,11 +253,14 @@ class SellerShopDao:
 
         History:
             2021-01-02(고수희): 초기 생성
+            2026-10-18(agent): 커서 페이지네이션 추가 (cursor 가 있으면 OFFSET 대신 사용)
+            2026-10-18(agent): 대표 이미지 축소본 가로 크기(image_variant_widths) 추가
         """
 
         sql = """
         SELECT 
         pi.image_url AS image
+        , pi.variant_widths AS image_variant_widths
         , pd.seller_id AS seller_id
         , se.name AS seller_name
         , pd.id AS product_id
@@ -262,13 +268,25 @@ class SellerShopDao:
         , pd.origin_price AS origin_price
         , pd.discount_rate AS discount_rate
         , pd.discounted_price AS discounted_price
-        , psv.sales_count AS product_sales_count
+        , COALESCE(psv.sales_count, 0) AS product_sales_count
         FROM products AS pd
         INNER JOIN product_images AS pi ON pi.product_id = pd.id AND pi.order_index = 1
         INNER JOIN sellers AS se ON se.account_id = pd.seller_id
         LEFT JOIN product_sales_volumes AS psv ON psv.product_id = pd.id
         """
 
+        # 최신순: 상품 아이디, 인기순: 판매량 + 상품 아이디 순서로 커서를 만든다.
+        if data['type'] == "latest":
+            columns = ['pd.id']
+        else:
+            columns = ['COALESCE(psv.sales_count, 0)', 'pd.id']
+
+        keyset_condition = None
+        if data.get('cursor'):
+            keyset_condition, params = keyset_sql(columns, data['cursor'])
+            data.update(params)
+
+        data['fetch_limit'] = data['limit'] + 1
 
         try:
             # 특정 카테고리를 선택한 경우 : sql에 포함
@@ -284,25 +302,33 @@ class SellerShopDao:
         WHERE pd.seller_id = %(seller_id)s
                 """
 
-            # 최신순 정렬일 경우
-            if data['type'] == "latest":
+            sql += """
+        AND pd.is_deleted = 0"""
+
+            # 커서가 있으면 OFFSET 대신 커서 이후의 상품만 조회
+            if keyset_condition:
                 sql += """
-        AND pd.is_deleted = 0
-        ORDER BY pd.id DESC
-        LIMIT %(limit)s
+        AND """ + keyset_condition
+                limit = """
+        LIMIT %(fetch_limit)s
+        ;
+                """
+            else:
+                limit = """
+        LIMIT %(fetch_limit)s
         OFFSET %(offset)s
         ;
                 """
 
+            # 최신순 정렬일 경우
+            if data['type'] == "latest":
+                sql += """
+        ORDER BY pd.id DESC""" + limit
+
             # 인기순 정렬일 경우
             else:
                 sql += """
-        AND pd.is_deleted = 0
-        ORDER BY product_sales_count DESC
-        LIMIT %(limit)s
-        OFFSET %(offset)s
-        ;
-                """
+        ORDER BY product_sales_count DESC, pd.id DESC""" + limit
 
             with connection.cursor(pymysql.cursors.DictCursor) as cursor:
                 cursor.execute(sql, data)
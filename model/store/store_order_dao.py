@@ -4,17 +4,19 @@ import pymysql
 from utils.custom_exceptions import (
     OrderNotExist,
     OrderCreateDenied,
-    ProductNotExist,
-    CheckoutDenied,
-    NotEnoughProduct,
     DeleteDenied,
     DeliveryMemoCreateDenied,
     OrderItemCreateDenied,
     ServerError,
     OrderHistoryCreateDenied,
-    ProductRemainUpdateDenied,
+    StockLockTimeout,
+    StockReservationConflict,
 )
 
+# MySQL 에러 코드
+LOCK_WAIT_TIMEOUT = 1205
+DEADLOCK = 1213
+
 
 class StoreOrderDao:
     """ Persistence Layer
@@ -25,6 +27,8 @@ class StoreOrderDao:
 
         History:
             2020-12-30(고수희): 초기 생성
+            2026-10-18(agent): 조건부 재고 차감(reserve_stocks_dao) 추가, order_product_soldout_dao 제거
+            2026-10-18(agent): 장바구니 결제용 일괄 추가/삭제 추가
     """
 
     def get_store_order_dao(self, connection, data):
@@ -72,67 +76,6 @@ class StoreOrderDao:
             traceback.print_exc()
             raise ServerError('server_error')
 
-    def order_product_soldout_dao(self, connection, data):
-        """상품 결제 시점에 해당 상품이 품절되었는지 여부 체크
-
-        Args:
-            connection  : 데이터베이스 연결 객체
-            data        : 서비스 레이어에서 넘겨 받아 조회할 data
-
-        Author: 고수희
-
-        Returns:
-            {'soldOut': true}: 상품이 품절됨
-            {'soldOut': false}: 상품이 품절되지 않음
-
-        Raises:
-            400, {'message': 'product does not exist',
-            'errorMessage': 'product_does_not_exist'} : 상품을 조회할 수 없음
-            500, {'message: server_error',
-            'errorMessage': 'server_error'} :서버 에러 발생
-
-        History:
-            2020-12-30(고수희): 초기 생성
-        """
-        sql = """
-        SELECT st.remain as remain
-        FROM products as pd
-        INNER JOIN stocks as st ON st.id = pd.id
-        WHERE pd.id = %s
-        ;
-        """
-
-        try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(sql, data['product_id'])
-                result = cursor.fetchone()
-                if not result:
-                    raise ProductNotExist('product_does_not_exist')
-
-                # 상품 재고가 주문량을 소화할 수 있는지 체크
-                if result['remain'] < data['quantity']:
-                    raise NotEnoughProduct('Not as many in stock as quantity')
-
-                # 상품 재고가 0인지 확인하여, 상품이 품절되었는지 체크
-                if result['remain'] <= 0:
-                    raise CheckoutDenied('unable_to_checkout')
-
-        except ProductNotExist as e:
-            traceback.print_exc()
-            raise e
-
-        except NotEnoughProduct as e:
-            traceback.print_exc()
-            raise e
-
-        except CheckoutDenied as e:
-            traceback.print_exc()
-            raise e
-
-        except Exception:
-            traceback.print_exc()
-            raise ServerError('server_error')
-
     def post_delivery_type_dao(self, connection, data):
         """배송 정보 추가 (배송 메모가 직접 입력일 경우)
 
@@ -361,31 +304,151 @@ class StoreOrderDao:
             traceback.print_exc()
             raise ServerError('server error')
 
-    def patch_product_remain_dao(self, connection, data):
-        """상품 재고 감소 처리
+    def get_checkout_cart_items_dao(self, connection, data):
+        """장바구니 결제 대상 상품 조회
 
         Args:
             connection: 데이터베이스 연결 객체
-            data      : 서비스 레이어에서 넘겨 받아 추가할 data
+            data      : 서비스 레이어에서 넘겨 받아 조회할 data (cart_ids, user_id)
 
-        Author: 고수희
+        Author: agent
+
+        Returns: [{'cart_id': 3, 'product_id': 1, 'stock_id': 2, 'quantity': 1, ...}, ...] (cart_id 순)
+
+        Raises:
+            500, {'message: server_error',
+            'errorMessage': 'server_error'} :서버 에러 발생
+
+        History:
+            2026-10-18(agent): 초기 생성
+        """
+
+        sql = """
+        SELECT
+        id AS cart_id
+        , product_id
+        , stock_id
+        , quantity
+        , sale
+        , original_price
+        , discounted_price
+        FROM cart_items
+        WHERE id IN %(cart_ids)s
+        AND user_id = %(user_id)s
+        AND is_deleted = 0
+        ORDER BY id
+        ;
+        """
+
+        try:
+            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+                cursor.execute(sql, data)
+                return cursor.fetchall()
+
+        except Exception:
+            traceback.print_exc()
+            raise ServerError('server_error')
+
+    def post_store_order_items_dao(self, connection, data, items):
+        """주문 상품 여러개 추가
+
+        VALUES 에 값만 있는 INSERT 라서 executemany 가 한번의 multi-row INSERT 로 실행한다.
+
+        Args:
+            connection: 데이터베이스 연결 객체
+            data      : 서비스 레이어에서 넘겨 받은 data (order_id, order_item_status_type_id)
+            items     : 주문 상품 리스트 (order_detail_number 포함)
+
+        Author: agent
 
         Returns: None
 
         Raises:
-            400, {'message': 'product remain update denied',
-            'errorMessage': 'unable_to_update'} : 상품 재고 업데이트 실패
+            400, {'message': 'order item create denied',
+            'errorMessage': 'unable_to_create'} : 주문 상품 추가 실패
             500, {'message: server_error',
             'errorMessage': 'server_error'} :서버 에러 발생
 
         History:
-            2020-12-31(고수희): 초기 생성
+            2026-10-18(agent): 초기 생성
         """
 
         sql = """
-        UPDATE stocks
-        SET  remain = remain - %(quantity)s
-        WHERE id = %(stock_id)s
+          INSERT INTO order_items (
+              product_id
+              , stock_id
+              , quantity
+              , order_id
+              , cart_id
+              , order_detail_number
+              , order_item_status_type_id
+              , original_price
+              , discounted_price
+              , sale
+          ) VALUES (
+              %(product_id)s
+              , %(stock_id)s
+              , %(quantity)s
+              , %(order_id)s
+              , %(cart_id)s
+              , %(order_detail_number)s
+              , %(order_item_status_type_id)s
+              , %(original_price)s
+              , %(discounted_price)s
+              , %(sale)s
+          );
+          """
+
+        rows = [dict(item, order_id=data['order_id'],
+                     order_item_status_type_id=data['order_item_status_type_id']) for item in items]
+
+        try:
+            with connection.cursor() as cursor:
+                affected_row = cursor.executemany(sql, rows)
+                if affected_row != len(rows):
+                    raise OrderItemCreateDenied('unable_to_create')
+
+        except OrderItemCreateDenied as e:
+            traceback.print_exc()
+            raise e
+
+        except Exception:
+            traceback.print_exc()
+            raise ServerError('server error')
+
+    def post_store_order_items_history_dao(self, connection, data):
+        """주문의 모든 주문 상품 정보 이력 추가
+
+        Args:
+            connection: 데이터베이스 연결 객체
+            data      : 서비스 레이어에서 넘겨 받은 data (order_id, order_item_status_type_id, user_id)
+
+        Author: agent
+
+        Returns: None
+
+        Raises:
+            400, {'message': 'order history create denied',
+            'errorMessage': 'unable_to_create'} : 주문 상품 정보 이력 추가 실패
+            500, {'message: server_error',
+            'errorMessage': 'server_error'} :서버 에러 발생
+
+        History:
+            2026-10-18(agent): 초기 생성
+        """
+
+        sql = """
+        INSERT INTO order_item_histories (
+            order_item_id
+            , order_item_status_type_id
+            , updater_id
+        )
+        SELECT
+            id
+            , %(order_item_status_type_id)s
+            , %(user_id)s
+        FROM order_items
+        WHERE order_id = %(order_id)s
         ;
         """
 
@@ -393,9 +456,9 @@ class StoreOrderDao:
             with connection.cursor() as cursor:
                 affected_row = cursor.execute(sql, data)
                 if affected_row == 0:
-                    raise ProductRemainUpdateDenied('unable_to_update')
+                    raise OrderHistoryCreateDenied('unable_to_create')
 
-        except ProductRemainUpdateDenied as e:
+        except OrderHistoryCreateDenied as e:
             traceback.print_exc()
             raise e
 
@@ -403,6 +466,98 @@ class StoreOrderDao:
             traceback.print_exc()
             raise ServerError('server error')
 
+    def reserve_stocks_dao(self, connection, items):
+        """주문 수량만큼 재고 차감 (재고가 충분한 경우에만)
+
+        여러 재고를 한 문장으로 차감한다. 재고가 주문 수량보다 적은 행은 차감되지 않으므로
+        반환값(차감된 행 수)이 items 개수보다 적으면 재고가 부족하거나 없는 재고가 있는 것이다.
+        items 는 stock_id 순으로 정렬되어 있어야 한다. (모든 주문이 같은 순서로 락을 잡아 데드락을 피한다)
+
+        Args:
+            connection: 데이터베이스 연결 객체
+            items     : [{'stock_id': 1, 'quantity': 2}, ...] stock_id 가 중복되지 않는 리스트
+
+        Author: 고수희
+
+        Returns: 차감된 재고 행 수
+
+        Raises:
+            409, {'message': 'stock lock timeout',
+            'errorMessage': 'lock_wait_timeout'} : 재고 행 락 대기 시간 초과 (문장만 롤백됨)
+            409, {'message': 'stock reservation conflict',
+            'errorMessage': 'deadlock'} : 데드락 (트랜잭션 전체가 롤백됨)
+            500, {'message: server_error',
+            'errorMessage': 'server_error'} :서버 에러 발생
+
+        History:
+            2020-12-31(고수희): 초기 생성 (patch_product_remain_dao)
+            2026-10-18(agent): 재고가 충분할 때만 차감, 여러 재고를 한번에 차감
+        """
+
+        case_sql = " ".join("WHEN %s THEN %s" for _ in items)
+        sql = """
+        UPDATE stocks
+        SET remain = remain - (CASE id {case_sql} END)
+        WHERE id IN %s
+        AND remain >= (CASE id {case_sql} END)
+        ORDER BY id
+        ;
+        """.format(case_sql=case_sql)
+
+        quantities = [value for item in items for value in (item['stock_id'], item['quantity'])]
+        params = quantities + [[item['stock_id'] for item in items]] + quantities
+
+        try:
+            with connection.cursor() as cursor:
+                return cursor.execute(sql, params)
+
+        except pymysql.err.OperationalError as e:
+            traceback.print_exc()
+            if e.args[0] == LOCK_WAIT_TIMEOUT:
+                raise StockLockTimeout('lock_wait_timeout')
+            if e.args[0] == DEADLOCK:
+                raise StockReservationConflict('deadlock')
+            raise ServerError('server_error')
+
+        except Exception:
+            traceback.print_exc()
+            raise ServerError('server_error')
+
+    def get_stocks_remain_dao(self, connection, stock_ids):
+        """재고 차감 실패 원인 확인용 재고 조회
+
+        Args:
+            connection: 데이터베이스 연결 객체
+            stock_ids : 재고 아이디 리스트
+
+        Author: agent
+
+        Returns: [{'id': 1, 'remain': 3}, ...] (존재하는 재고만)
+
+        Raises:
+            500, {'message: server_error',
+            'errorMessage': 'server_error'} :서버 에러 발생
+
+        History:
+            2026-10-18(agent): 초기 생성
+        """
+
+        sql = """
+        SELECT id, remain
+        FROM stocks
+        WHERE id IN %s
+        ;
+        """
+
+        try:
+            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+                cursor.execute(sql, [list(stock_ids)])
+                return cursor.fetchall()
+
+        except Exception:
+            traceback.print_exc()
+            raise ServerError('server_error')
+
     def patch_is_delete_cart_item_dao(self, connection, data):
         """장바구니 상품 논리 삭제 처리
 
@@ -443,6 +598,50 @@ class StoreOrderDao:
             traceback.print_exc()
             raise ServerError('server_error')
 
+    def patch_is_delete_cart_items_dao(self, connection, data):
+        """결제한 장바구니 상품 여러개 논리 삭제 처리
+
+        Args:
+            connection: 데이터베이스 연결 객체
+            data      : 서비스 레이어에서 넘겨 받은 data (cart_ids, user_id)
+
+        Author: agent
+
+        Returns: None
+
+        Raises:
+            400, {'message': 'invalid_delete_command_access',
+            'errorMessage': 'unable_to_delete'} : 이미 삭제(결제)된 장바구니 상품이 있음
+            500, {'message: server_error',
+            'errorMessage': 'server_error'} :서버 에러 발생
+
+        History:
+            2026-10-18(agent): 초기 생성
+        """
+
+        sql = """
+        UPDATE cart_items
+        SET is_deleted = 1
+        WHERE id IN %(cart_ids)s
+        AND user_id = %(user_id)s
+        AND is_deleted = 0;
+        """
+
+        try:
+            with connection.cursor() as cursor:
+                affected_row = cursor.execute(sql, data)
+                # 같은 장바구니를 동시에 결제하면 나중 요청은 먼저 요청이 commit 된 뒤 0 개가 삭제된다.
+                if affected_row != len(data['cart_ids']):
+                    raise DeleteDenied('unable_to_delete')
+
+        except DeleteDenied as e:
+            traceback.print_exc()
+            raise e
+
+        except Exception:
+            traceback.print_exc()
+            raise ServerError('server_error')
+
     def patch_customer_information_dao(self, connection, data):
         """주문자 정보 추가 및 수정
         주문자 정보 조회 시 주문자 정보가 있으면 수정, 없으면 추가함
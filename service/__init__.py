@@ -19,6 +19,7 @@ from .admin.product_manage_service import ProductManageService
 
 from .store.user_service import UserService
 from .store.product_list_service import ProductListService
+from .store.home_feed_service import HomeFeedService
 from .store.category_list_service import CategoryListService
 from .store.destination_service import DestinationService
 from .store.cart_item_service import CartItemService
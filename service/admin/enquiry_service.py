@@ -60,16 +60,21 @@ class EnquiryService:
                             "seller_name": "나는셀러9"
                         }
                     ],
-                    "total_count": 2
+                    "total_count": 2,
+                    "is_estimated_count": false,
+                    "next_cursor": "Wzk5XQ"
                 }
 
             Raises:
                 400, {'message': 'key error',
                 'errorMessage': 'key_error'} : 잘못 입력된 키값
+                400, {'message': 'invalid_cursor',
+                'error_message': '잘못된 커서입니다.'} : 잘못된 커서
 
             History:
                 2020-12-28(이성보): 초기 생성
                 2020-12-29(이성보): 검색 조건에 맞게 변형로직 작성
+                2026-10-18(agent): 커서 페이지네이션 추가 (next_cursor 를 다음 요청의 cursor 로 보내면 page 대신 사용)
         """
         try:
             data['page'] = (data['page'] - 1) * data['length']
@@ -1,8 +1,19 @@
-import datetime
+import io
+import os
 
 from werkzeug.utils import secure_filename
-from utils.custom_exceptions import ButtonProductDoesNotMatch, EventDoesNotExist
-from utils.amazon_s3 import S3FileManager, GenerateFilePath
+from service.store.home_feed_service import HOME_FEED_CACHE_NAME
+from utils.cache import get_cache
+from utils.connection import on_commit
+from utils.response_cache import invalidate_response_tags
+from utils.custom_exceptions import (
+    ButtonProductDoesNotMatch,
+    EventDoesNotExist,
+    CreateButtunDenied,
+    InsertProductIntoButtonDenied,
+    InsertProductIntoEventDenied
+)
+from utils.amazon_s3 import GenerateFilePath, get_upload_manager
 
 from config import S3_BUCKET_URL
 
@@ -23,6 +34,11 @@ class EventService:
                 2020-12-31(강두연): 기획전 상품추가 페이지 상품 리스트 불러오기 서비스 생성
                 2021-01-02(강두연): 기획전 등록 서비스 생성
                 2021-01-02(강두연): 기획전 삭제 서비스 생성
+                2026-10-18(agent): 기획전 변경이 commit 되면 홈 화면 캐시 무효화
+                2026-10-18(agent): 기획전 변경이 commit 되면 기획전 응답 캐시 무효화
+                2026-10-18(agent): 기획전 버튼, 상품을 일괄 저장하고 수정 시 바뀐 행만 갱신
+                2026-10-18(agent): 기획전 이미지를 트랜잭션 전에 내용 해시 경로로 동시에 업로드
+                2026-10-18(agent): 저장소에 이미 있는 기획전 이미지는 업로드 생략
     """
     def __init__(self, event_dao):
         self.event_dao = event_dao
@@ -407,60 +423,33 @@ class EventService:
 
             History:
                     2021-01-02(강두연): 초기 작성
+                    2026-10-18(agent): 버튼, 상품 일괄 저장
+                    2026-10-18(agent): 배너, 상세 이미지 동시 업로드
+                    2026-10-18(agent): 이미 있는 이미지는 업로드 생략
         """
         try:
-            banner_file_path = GenerateFilePath().generate_file_path(
-                4,
-                today=datetime.date.today().isoformat().replace('-', '/')
-            )
-
-            secured_banner_file_name = secure_filename(data['banner_image'].filename)
-
-            detail_file_path = GenerateFilePath().generate_file_path(
-                5,
-                today=datetime.date.today().isoformat().replace('-', '/')
-            )
-
-            secured_detail_file_name = secure_filename(data['detail_image'].filename)
-
-            # save to AMAZON S3
-            data['banner_image'] = S3_BUCKET_URL + S3FileManager().file_upload(
-                data['banner_image'],
-                banner_file_path + secured_banner_file_name
-            )
-
-            data['detail_image'] = S3_BUCKET_URL + S3FileManager().file_upload(
-                data['detail_image'],
-                detail_file_path + secured_detail_file_name
-            )
+            # 트랜잭션 시작 전에 배너, 상세 이미지를 동시에 업로드 (이미 있는 이미지는 생략)
+            self._upload_event_images(data, [('banner_image', 4), ('detail_image', 5)])
 
             data['start_datetime'] += ':00'
             data['end_datetime'] += ':00'
 
             data['event_id'] = self.event_dao.create_event(connection, data)
+            self._invalidate_home_feed(connection)
 
             if buttons:
-                button_product_matched = False
+                button_ids = self._save_event_buttons(connection, data['event_id'], buttons, new_event=True)
 
-                for button in buttons:
-                    button['event_id'] = data['event_id']
-                    button_id = self.event_dao.create_or_update_button(connection, button)
-                    if products:
-                        for product in products:
-                            if product['button_name'] == button['button_name']:
-                                product['button_id'] = button_id
-                                product['event_id'] = data['event_id']
-                                button_product_matched = True
-                                self.event_dao.insert_product_into_button(connection, product)
-
-                if products and not button_product_matched:
-                    raise ButtonProductDoesNotMatch('there are product and button objects but no buttons are matched')
+                if products:
+                    wanted = self._match_products_to_buttons(products, button_ids, skip_unmatched=True)
+                    if not wanted:
+                        raise ButtonProductDoesNotMatch('there are product and button objects but no buttons are matched')
+                    self._save_event_products(connection, data['event_id'], wanted, new_event=True)
 
             else:
                 if products:
-                    for product in products:
-                        product['event_id'] = data['event_id']
-                        self.event_dao.insert_product_into_event(connection, product)
+                    wanted = self._products_without_buttons(products)
+                    self._save_event_products(connection, data['event_id'], wanted, new_event=True)
 
             return data['event_id']
 
@@ -493,6 +482,7 @@ class EventService:
 
             self.event_dao.delete_event_products_by_event(connection, data)
             self.event_dao.delete_event(connection, data)
+            self._invalidate_home_feed(connection)
 
         except Exception as e:
             raise e
@@ -545,97 +535,188 @@ class EventService:
                     2021-01-04(강두연): 초기 작성
                     2021-01-05(강두연): 로직 수정
                     2021-01-06(강두연): 버튼관련 로직 수정
+                    2026-10-18(agent): 기존 버튼, 상품과 비교해서 바뀐 행만 갱신
+                    2026-10-18(agent): 변경된 이미지 동시 업로드
+                    2026-10-18(agent): 이미 있는 이미지는 업로드 생략
         """
         try:
-            # 배너 이미지 변경하면 업로드
+            # 변경된 이미지만 트랜잭션 시작 전에 동시에 업로드 (이미 있는 이미지는 생략)
+            image_fields = []
             if data['banner_image_uploaded']:
-                file_path = GenerateFilePath().generate_file_path(
-                    4,
-                    today=datetime.date.today().isoformat().replace('-', '/')
-                )
-                secured_file_name = secure_filename(data['banner_image'].filename)
-                data['banner_image'] = S3_BUCKET_URL + S3FileManager().file_upload(
-                    data['banner_image'],
-                    file_path + secured_file_name
-                )
-
-            # 상세 이미지 변경하면 업로드
+                image_fields.append(('banner_image', 4))
             if data['detail_image_uploaded']:
-                file_path = GenerateFilePath().generate_file_path(
-                    5,
-                    today=datetime.date.today().isoformat().replace('-', '/')
-                )
-                secured_file_name = secure_filename(data['detail_image'].filename)
-                data['detail_image'] = S3_BUCKET_URL + S3FileManager().file_upload(
-                    data['detail_image'],
-                    file_path + secured_file_name
-                )
+                image_fields.append(('detail_image', 5))
+            if image_fields:
+                self._upload_event_images(data, image_fields)
 
             data['start_datetime'] += ':00'
             data['end_datetime'] += ':00'
 
             self.event_dao.update_event_detail(connection, data)
+            self._invalidate_home_feed(connection)
 
-            # 버튼형이면 버튼 데이터 업데이트
+            # 버튼형이면 바뀐 버튼만 생성, 복구, 삭제
             if data['event_kind_id'] == 2:
-                # 전체 버튼 논리삭제
-                self.event_dao.delete_buttons_by_event(connection, data)
+                button_ids = self._save_event_buttons(connection, data['event_id'], buttons)
+                wanted = self._match_products_to_buttons(products or [], button_ids)
+            else:
+                wanted = self._products_without_buttons(products or [])
 
-                for button in buttons:
-                    button['event_id'] = data['event_id']
-                    # 생성하기전에 같은 이름, 이벤트 아이디를 가진 논리삭제된 버튼이 있으면 복구한 후 update 함
-                    button['id'] = self.event_dao.create_or_update_button(connection, button)
-
-                    if products:
-                        # 상품 데이터가 있으면 버튼아이디를 상품에 버튼에 관한 키 벨류 추가 (매핑)
-                        for product in products:
-                            if product['button_name'] == button['button_name']:
-                                product['product_matched'] = 1
-                                product['button_id'] = button['id']
-
-            if not products:
-                # 상품 데이터가 없으면 기존의 상품을 삭제하고 종료
-                self.event_dao.delete_event_products_by_event(connection, data)
-                return
-
-            # 상품 데이터가 있으면 정보 갱신
-            if products:
-                # 기존의 상품들 불러오기
-                exist_products = self.event_dao.get_event_products(connection, data)
-
-                for product in products:
-                    product['event_id'] = data['event_id']
-
-                    # 새로 받아온 등록할 각 상품 마다 기존에 기획전에 존재하는 상품인지 표기
-                    product['exist'] = False
-                    for exist_product in exist_products:
-                        if product['product_id'] == exist_product['product_id']:
-                            product['exist'] = True     # 이미 존재하는 상품인지 표기
-                            exist_products.remove(exist_product)    # exist_products 리스트에는 삭제처리해야하는 상품들만 남게 됨
-
-                    # 기획전이 버튼형일 때
-                    if data['event_kind_id'] == 2:
-                        if 'product_matched' not in product:
-                            # 버튼정보를 갱신하면서 버튼과 상품이 매핑이 되어야 하는데 안되었을 경우 예외처리
-                            raise ButtonProductDoesNotMatch('product is not mapped into any button')
-
-                        if product['exist']:
-                            # 버튼형이고 상품이 기존에 존재했더라면 종속되는 버튼이 바뀌는 경우만 고려
-                            if product['button_id'] != exist_product['event_button_id']:
-                                self.event_dao.move_button_products(connection, product)
-                        else:
-                            # 기존에 존재하지않다면 버튼에 상품 추가
-                            self.event_dao.insert_product_into_button(connection, product)
-
-                    # 버튼형이 아닐 때
-                    else:
-                        if not product['exist']:
-                            # 상품이 기존에 존재하는 상품이면 업데이트 할 내역이 없기 때문에 존재하지 않는 경우만 고려
-                            self.event_dao.insert_product_into_event(connection, product)
-
-                # 삭제처리 해야하는 상품들 삭제처리
-                for product_to_remove in exist_products:
-                    self.event_dao.delete_event_product(connection, product_to_remove)
+            # 상품 데이터가 없으면 기존의 상품이 모두 삭제된다.
+            self._save_event_products(connection, data['event_id'], wanted)
 
         except Exception as e:
             raise e
+
+    def _upload_event_images(self, data, image_fields):
+        """ [(이미지 키, 저장 경로 종류), ...] 의 이미지를 내용 해시 경로에 업로드하고 data 의 이미지를 URL 로 바꾼다.
+
+            같은 이미지가 이미 저장소에 있으면 업로드하지 않는다.
+            요청이 실패해도 올린 파일은 지우지 않는다. (다른 기획전이 함께 참조할 수 있다, 정리는 service.admin.image_sweeper)
+        """
+
+        files = []
+        for field, path_type in image_fields:
+            file = data[field]
+            file.seek(0)
+            content = file.read()
+            extension = os.path.splitext(secure_filename(file.filename))[1].lower()
+            files.append((io.BytesIO(content), GenerateFilePath().generate_content_key(path_type, content, extension)))
+
+        get_upload_manager().put_many(files, skip_existing=True)
+
+        for (field, _), (_, key) in zip(image_fields, files):
+            data[field] = S3_BUCKET_URL + key
+
+    def _save_event_buttons(self, connection, event_id, buttons, new_event=False):
+        """ 기획전 버튼을 요청받은 버튼 목록과 같게 저장하고 {버튼 이름: 버튼 아이디} 를 반환한다.
+
+            기존 버튼과 이름으로 비교해서 새 버튼은 한번에 INSERT 하고, 논리삭제되었거나 순서가 바뀐 버튼만 복구하고,
+            목록에 없는 버튼만 논리삭제한다.
+
+            Raises:
+                400, {'message': 'unable to create button',
+                      'errorMessage': 'button name must be unique in an event'} : 버튼 이름 중복
+        """
+
+        names = [button['button_name'] for button in buttons]
+        if len(set(names)) != len(names):
+            raise CreateButtunDenied('button name must be unique in an event')
+
+        existing = dict()
+        if not new_event:
+            # 같은 이름이면 사용중인 버튼이 뒤에 오므로 사용중인 버튼이 남는다.
+            for row in self.event_dao.get_event_button_rows(connection, {'event_id': event_id}):
+                existing[row['name']] = row
+
+        button_ids = dict()
+        to_insert = []
+        to_restore = []
+        for button in buttons:
+            row = existing.pop(button['button_name'], None)
+            if row is None:
+                to_insert.append({
+                    'event_id': event_id,
+                    'button_name': button['button_name'],
+                    'button_index': button['button_index']
+                })
+                continue
+
+            button_ids[row['name']] = row['id']
+            if row['is_deleted'] or row['order_index'] != int(button['button_index']):
+                to_restore.append((row['id'], button['button_index']))
+
+        self.event_dao.delete_event_buttons(
+            connection,
+            [row['id'] for row in existing.values() if not row['is_deleted']]
+        )
+        self.event_dao.restore_event_buttons(connection, to_restore)
+
+        if to_insert:
+            self.event_dao.insert_event_buttons(connection, to_insert)
+            inserted = {button['button_name'] for button in to_insert}
+            for row in self.event_dao.get_event_button_rows(connection, {'event_id': event_id}):
+                if not row['is_deleted'] and row['name'] in inserted:
+                    button_ids[row['name']] = row['id']
+
+        return button_ids
+
+    def _match_products_to_buttons(self, products, button_ids, skip_unmatched=False):
+        """ 상품의 button_name 으로 버튼 아이디를 찾아 {상품 아이디: 버튼 아이디} 를 반환한다.
+
+            skip_unmatched 가 False 이면 버튼을 찾지 못한 상품이 있을 때 에러를 반환한다.
+
+            Raises:
+                400, {'message': 'although there are product and button objects, no buttons are matched',
+                      'errorMessage': 'product is not mapped into any button'} : 상품에 매치된 버튼이 없음
+
+                400, {'message': 'unable to insert product into button',
+                      'errorMessage': 'product is already included'} : 중복 상품
+        """
+
+        wanted = dict()
+        for product in products:
+            button_id = button_ids.get(product['button_name'])
+            if button_id is None:
+                if skip_unmatched:
+                    continue
+                raise ButtonProductDoesNotMatch('product is not mapped into any button')
+
+            product_id = int(product['product_id'])
+            if product_id in wanted:
+                raise InsertProductIntoButtonDenied('product is already included')
+            wanted[product_id] = button_id
+        return wanted
+
+    def _products_without_buttons(self, products):
+        """ 버튼형이 아닌 기획전의 {상품 아이디: None} 를 반환한다.
+
+            Raises:
+                400, {'message': 'unable to insert product into event',
+                      'errorMessage': 'product is already included'} : 중복 상품
+        """
+
+        wanted = dict()
+        for product in products:
+            product_id = int(product['product_id'])
+            if product_id in wanted:
+                raise InsertProductIntoEventDenied('product is already included')
+            wanted[product_id] = None
+        return wanted
+
+    def _save_event_products(self, connection, event_id, wanted, new_event=False):
+        """ 기획전 상품을 {상품 아이디: 버튼 아이디} 와 같게 저장한다.
+
+            기존 연결과 상품 아이디로 비교해서 새 상품은 한번에 INSERT 하고, 논리삭제되었거나 버튼이 바뀐 연결만 갱신하고,
+            목록에 없는 상품만 논리삭제한다.
+        """
+
+        existing = dict()
+        if not new_event:
+            # 같은 상품이면 사용중인 연결이 뒤에 오므로 사용중인 연결이 남는다.
+            for row in self.event_dao.get_event_product_rows(connection, {'event_id': event_id}):
+                existing[row['product_id']] = row
+
+        to_insert = []
+        to_update = []
+        for product_id, button_id in wanted.items():
+            row = existing.pop(product_id, None)
+            if row is None:
+                to_insert.append({'event_id': event_id, 'product_id': product_id, 'button_id': button_id})
+            elif row['is_deleted'] or row['event_button_id'] != button_id:
+                to_update.append((row['id'], button_id))
+
+        self.event_dao.delete_event_products(
+            connection,
+            [row['id'] for row in existing.values() if not row['is_deleted']]
+        )
+        self.event_dao.update_event_product_buttons(connection, to_update)
+        self.event_dao.insert_event_products(connection, to_insert)
+
+    @staticmethod
+    def _invalidate_home_feed(connection):
+        def invalidate():
+            get_cache(HOME_FEED_CACHE_NAME).clear()
+            invalidate_response_tags(['events'])
+
+        on_commit(connection, invalidate)
@@ -0,0 +1,164 @@
+""" 참조되지 않는 내용 주소 경로 이미지 정리
+
+상품, 기획전 이미지는 내용 해시 경로에 저장하고 같은 내용이면 여러 행이 한 파일을 참조한다. (utils.amazon_s3)
+그래서 요청이 실패해도 올린 파일을 지우지 않고, 이 정리 작업이 참조 여부를 확인한 뒤 지운다.
+
+처리 규칙:
+    1. IMAGE_SWEEP_SECONDS 마다 내용 주소 경로(GenerateFilePath.CONTENT_PATHS) 아래의 파일을 확인한다.
+       여러 프로세스가 떠 있어도 MySQL 네임드 락으로 한 프로세스만 정리한다.
+    2. 수정된 지 IMAGE_SWEEP_GRACE_SECONDS 가 지나지 않은 파일은 지우지 않는다.
+       업로드 후 아직 commit 되지 않은 요청의 파일, 이미 있는 파일을 참조하려고 수정 시각을 갱신한(touch) 요청의 파일이다.
+    3. 축소본(원본 경로 + '_<가로>w.<확장자>')은 원본과 함께 판단한다. 원본이 참조되거나 최근에 수정되었으면 지우지 않는다.
+    4. product_images, events 에서 참조하지 않는 파일만 지운다. 삭제 처리된 행도 참조로 본다.
+    5. 지우기 직전에 원본의 수정 시각을 다시 확인해서 그 사이 갱신된 파일은 지우지 않는다.
+
+기본적인 사용 예시:
+    start_image_sweeper(app, database, app.config.get('IMAGE_SWEEP_SECONDS', IMAGE_SWEEP_SECONDS))  # create_app
+"""
+import re
+import threading
+import time
+import traceback
+
+from config import S3_BUCKET_URL
+from model import ImageSweepDao
+from utils.amazon_s3 import GenerateFilePath, get_upload_manager
+from utils.connection import get_connection
+
+IMAGE_SWEEP_SECONDS = 6 * 60 * 60
+IMAGE_SWEEP_GRACE_SECONDS = 24 * 60 * 60
+IMAGE_SWEEP_BATCH_SIZE = 500
+
+# 그룹 1: 원본 경로 (축소본이면 접미사를 뗀 경로)
+CONTENT_KEY_PATTERN = re.compile(
+    r'^((?:{})([0-9a-f]{{2}})/\2[0-9a-f]{{62}}(?:\.[0-9a-z]+)?)(?:_\d+w\.[0-9a-z]+)?$'.format(
+        '|'.join(re.escape(prefix) for prefix in GenerateFilePath.CONTENT_PATHS.values())
+    )
+)
+
+
+def content_origin(key):
+    """ 내용 주소 경로의 원본 경로를 반환한다. (축소본이면 접미사를 뗀 경로, 내용 주소 경로가 아니면 None) """
+
+    match = CONTENT_KEY_PATTERN.match(key)
+    return match.group(1) if match else None
+
+
+class ImageSweeper:
+    """ 참조되지 않는 이미지 정리
+
+        Attributes:
+            app       : 저장소 설정(get_upload_manager)에 사용할 Flask 앱
+            database  : 참조 조회에 사용할 데이터베이스 설정
+            grace     : 이 시간(초) 안에 수정된 파일은 지우지 않는다.
+            sweep_dao : ImageSweepDao 클래스
+            storage   : 파일 저장소 (없으면 업로드 매니저의 저장소)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self, app, database, grace=IMAGE_SWEEP_GRACE_SECONDS, storage=None):
+        self.app = app
+        self.database = database
+        self.grace = grace
+        self.sweep_dao = ImageSweepDao()
+        self.storage = storage
+        self._thread = None
+        self._stop = threading.Event()
+
+    def start(self, interval):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, args=(interval,), name='image-sweeper', daemon=True)
+        self._thread.start()
+
+    def sweep(self):
+        """ 참조되지 않는 파일을 지우고 지운 파일 수를 반환한다. (다른 프로세스가 정리 중이면 0) """
+
+        if self.storage is None:
+            with self.app.app_context():
+                self.storage = get_upload_manager().storage
+
+        lock_name = 'image_sweep:{}'.format(self.database['name'])
+        connection = get_connection(self.database)
+        try:
+            if not self.sweep_dao.get_sweep_lock_dao(connection, lock_name):
+                return 0
+
+            try:
+                deleted = 0
+                for prefix in GenerateFilePath.CONTENT_PATHS.values():
+                    deleted += self._sweep_prefix(connection, prefix)
+                return deleted
+            finally:
+                self.sweep_dao.release_sweep_lock_dao(connection, lock_name)
+        finally:
+            connection.close()
+
+    def _sweep_prefix(self, connection, prefix):
+        cutoff = time.time() - self.grace
+        deleted = 0
+
+        # {원본 경로: [지울 후보 경로, ...]}
+        groups = {}
+        for key, modified in self.storage.list_keys(prefix):
+            origin = content_origin(key)
+            if origin is None or modified > cutoff:
+                continue
+            groups.setdefault(origin, []).append(key)
+            if len(groups) >= IMAGE_SWEEP_BATCH_SIZE:
+                deleted += self._sweep_groups(connection, groups, cutoff)
+                groups = {}
+
+        if groups:
+            deleted += self._sweep_groups(connection, groups, cutoff)
+        return deleted
+
+    def _sweep_groups(self, connection, groups, cutoff):
+        urls = [url for origin in groups for url in (origin, S3_BUCKET_URL + origin)]
+        referenced = self.sweep_dao.get_referenced_image_urls_dao(connection, urls)
+        connection.commit()
+
+        keys = []
+        for origin, candidates in groups.items():
+            if origin in referenced or S3_BUCKET_URL + origin in referenced:
+                continue
+
+            # 원본이 최근에 올라왔거나 수정 시각이 갱신되었으면 곧 참조될 수 있으므로 남겨 둔다.
+            modified = self.storage.modified_at(origin)
+            if modified is not None and modified > cutoff:
+                continue
+
+            # 원본이 없으면 같은 이미지를 올리는 요청이 축소본부터 다시 올리는 중일 수 있다.
+            if modified is None:
+                candidates = [key for key in candidates if (self.storage.modified_at(key) or cutoff + 1) <= cutoff]
+            keys.extend(candidates)
+
+        if keys:
+            self.storage.delete_many(keys)
+        return len(keys)
+
+    def _run(self, interval):
+        while not self._stop.wait(interval):
+            try:
+                self.sweep()
+            except Exception:
+                traceback.print_exc()
+
+
+_sweeper = None
+_sweeper_lock = threading.Lock()
+
+
+def start_image_sweeper(app, database, interval=IMAGE_SWEEP_SECONDS):
+    """ interval 초마다 참조되지 않는 이미지를 지우는 스레드를 시작한다. (interval 이 0 이면 시작하지 않는다) """
+
+    global _sweeper
+    with _sweeper_lock:
+        if _sweeper is None and interval > 0:
+            _sweeper = ImageSweeper(app, database, app.config.get('IMAGE_SWEEP_GRACE_SECONDS', IMAGE_SWEEP_GRACE_SECONDS))
+            _sweeper.start(interval)
+        return _sweeper
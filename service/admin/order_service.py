@@ -1,6 +1,4 @@
-from flask import send_file
-from io import BytesIO
-import pandas as pd
+from utils.export import csv_stream, xlsx_stream
 from utils.custom_exceptions import (OrderFilterNotExist,
                                      NoPermission,
                                      DateInputDoesNotExist,
@@ -176,13 +174,23 @@ class OrderService:
 
 
     def create_excel_service(self, connection, data):
+        """ 주문 리스트 엑셀(xlsx) 또는 CSV 파일 스트림 생성
+
+            Args:
+                connection : 엑셀 다운로드 전용 데이터베이스 연결 객체
+                data       : 뷰에서 넘겨 받은 data 객체 (format: 'xlsx' 또는 'csv')
+
+            Returns:
+                파일 내용을 바이트 chunk 로 돌려주는 generator
+
+            History:
+                2026-10-18(agent): pandas 대신 서버 사이드 커서로 읽은 행을 바로 파일로 변환
+        """
+
         try:
-            df = self.admin_order_dao.get_order_list_dao(connection, data)
-            output = BytesIO()
-            writer = pd.ExcelWriter(output, engine='xlsxwriter')
-            df.to_excel(writer, sheet_name=data['sheet_name'], index=False)
-            writer.save()
-            output.seek(0)
-            return send_file(output, attachment_filename=data['file_name'], as_attachment=True)
+            columns, chunks = self.admin_order_dao.get_order_export_dao(connection, data)
+            if data['format'] == 'csv':
+                return csv_stream(columns, chunks)
+            return xlsx_stream(columns, chunks, data['sheet_name'])
         except KeyError:
-            raise KeyError('key Error')
\ No newline at end of file
+            raise KeyError('key Error')
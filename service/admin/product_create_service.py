@@ -1,21 +1,18 @@
 import io
-import uuid
-
-from PIL                     import Image
 
 from config                  import S3_BUCKET_URL
 from model                   import ProductCreateDao
-from utils.amazon_s3         import S3FileManager, GenerateFilePath
+from service.store.product_search_engine import get_product_search_engine
+from utils.connection        import on_commit
+from utils.response_cache    import invalidate_response_tags
+from utils.amazon_s3         import GenerateFilePath, get_upload_manager
+from utils.image_pipeline    import validate_images, transcode_images
+from utils.image_variants    import format_variant_widths
 from utils.custom_exceptions import (
     RequiredFieldException,
-    NotValidFileException,
-    FileSizeException,
-    FileExtensionException,
     CompareQuantityCheck,
     ComparePriceCheck,
-    DateCompareException,
-    FileScaleException,
-    FileUploadFailException
+    DateCompareException
 )
 
 
@@ -31,6 +28,9 @@ class ProductCreateService:
             2020-12-29(심원두): 초기 생성
             2020-12-30(심원두): 예외처리 추가
             2020-01-03(심원두): 이미지 등록 예외 처리 수정, 업로드 시 파일 손상 이슈 수정
+            2026-10-18(agent): 상품 이미지를 트랜잭션 전에 내용 해시 경로로 동시에 업로드
+            2026-10-18(agent): 상품 이미지 헤더 검사 후 프로세스 풀에서 축소본 생성
+            2026-10-18(agent): 저장소에 이미 있는 상품 이미지는 변환, 업로드 생략
     """
     
     def __init__(self):
@@ -83,6 +83,8 @@ class ProductCreateService:
                 2020-12-29(심원두): 초기 생성
                 2020-12-30(심원두): 예외처리 구현
                 2020-01-03(심원두): 예외처리 추가/수정
+                2026-10-18(agent): commit 후 상품 검색 색인에 반영
+                2026-10-18(agent): commit 후 셀러 샵 응답 캐시 무효화
         """
         
         try:
@@ -139,7 +141,13 @@ class ProductCreateService:
             
             print(type(data['detail_information']), data['detail_information'])
             
-            return self.create_product_dao.insert_product(connection, data)
+            product_id = self.create_product_dao.insert_product(connection, data)
+            on_commit(connection, lambda: get_product_search_engine().mark_dirty(product_id))
+
+            # 셀러 샵 상품 목록 응답 캐시 무효화
+            seller_id = data['seller_id']
+            on_commit(connection, lambda: invalidate_response_tags([('seller', seller_id)]))
+            return product_id
         
         except KeyError as e:
             raise e
@@ -187,37 +195,92 @@ class ProductCreateService:
         except Exception as e:
             raise e
     
-    def create_product_images_service(self, connection, seller_id, product_id, product_code, product_images):
-        """ 상품 이미지 등록
+    def upload_product_images_service(self, product_images):
+        """ 상품 이미지 검사 및 내용 주소 경로 업로드
             
             Args:
-                'connection'     : 데이터베이스 연결 객체
-                'seller_id'      : View 에서 넘겨 받은 셀러 아이디
-                'product_id'     : View 에서 넘겨 받은 상품 아이디
                 'product_images' : View 에서 넘겨 받은 이미지 파일
             
-            Author: 심원두
+            Author: agent
             
             Returns:
-                0: 상품 이미지 테이블 등록 실패
-                1: 상품 이미지 테이블 등록 성공
+                ['productImages/3f/3f1c...', ...] : 이미지 별 원본 경로 (product_images 와 같은 순서)
+                                                   축소본 경로는 원본 경로 + variant_suffix
 
             Raises:
                 413, {'message': 'invalid file',
                       'errorMessage': 'invalid_file'}: 파일 이름이 공백, 혹은 파일을 정상적으로 받지 못함
                 
                 413, {'message': 'file size too large',
-                      'errorMessage': 'file_size_too_large'}: 파일 사이즈 정책 위반 (4메가 이상인 경우)
+                      'errorMessage': 'file_size_too_large'}: 파일 사이즈 정책 위반 (4메가 초과인 경우)
                 
                 413, {'message': 'file scale too small, 640 * 720 at least',
-                      'errorMessage': 'file_scale_at_least_640*720'}: 파일 스케일 정책 위반 (680*720 미만인 경우)
+                      'errorMessage': 'file_scale_at_least_640*720'}: 파일 스케일 정책 위반 (640*720 미만인 경우)
 
-                413, {'message': 'only allowed jpg type',
+                413, {'message': 'file scale too large, 6000 * 6000 at most',
+                      'errorMessage': 'file_scale_at_most_6000*6000'}: 파일 스케일 정책 위반 (6000*6000 초과인 경우)
+
+                400, {'message': 'only allowed jpg type',
                       'errorMessage': 'only_allowed_jpg_type'}: 파일 확장자 정책 위반 (JPG, JPEG 아닌 경우)
                 
                 500, {'message': 'image_file_upload_to_amazon_fail',
                       'errorMessage': 'image_file_upload_fail'}: 이미지 업로드 실패
+            
+            History:
+                2026-10-18(agent): create_product_images_service 에서 분리, 트랜잭션 시작 전 동시 업로드
+                2026-10-18(agent): 헤더만 읽어서 검사한 뒤 utils.image_pipeline 에서 원본 + 축소본 생성
+                2026-10-18(agent): 저장소에 이미 있는 이미지는 변환/업로드 생략
+                2026-10-18(agent): 요청이 실패해도 올린 파일을 지우지 않음. 정리는 service.admin.image_sweeper 에서 처리
+            
+            Notes:
+                상품 등록 트랜잭션을 시작하기 전(첫 DAO 호출 전)에 호출해야 업로드 동안 DB 커넥션을 잡지 않는다.
+                축소본을 먼저 올리고 원본을 마지막에 올리므로 원본이 있으면 축소본도 모두 있다.
+                요청이 실패해도 올린 파일은 지우지 않는다. 같은 내용의 파일을 다른 상품이 이미 참조하고 있을 수 있다.
+                참조되지 않는 파일은 service.admin.image_sweeper 가 지운다.
+        """
+        
+        try:
+            originals      = validate_images(product_images)
+            keys           = [GenerateFilePath().generate_content_key(3, data) for data in originals]
+            upload_manager = get_upload_manager()
+            
+            # 저장소에 없는 이미지만 (같은 요청 안의 중복도 한번만) 변환해서 올린다.
+            # 이미 있는 이미지는 수정 시각을 갱신해서 정리 작업이 지우지 않도록 한다.
+            unique_keys = list(dict.fromkeys(keys))
+            found       = dict(zip(unique_keys, upload_manager.touch_many(unique_keys)))
+            
+            missing = {}
+            for key, data in zip(keys, originals):
+                if not found[key]:
+                    missing.setdefault(key, data)
+            
+            variants = []
+            for key, image_variants in zip(missing, transcode_images(list(missing.values()))):
+                variants.extend((io.BytesIO(encoded), key + suffix) for suffix, encoded in image_variants)
+            
+            upload_manager.put_many(variants)
+            upload_manager.put_many([(io.BytesIO(data), key) for key, data in missing.items()])
+            
+            return keys
+        
+        except Exception as e:
+            raise e
+    
+    def create_product_images_service(self, connection, product_id, image_keys):
+        """ 상품 이미지 등록
+            
+            Args:
+                'connection' : 데이터베이스 연결 객체
+                'product_id' : View 에서 넘겨 받은 상품 아이디
+                'image_keys' : upload_product_images_service 에서 업로드한 이미지 별 저장 경로 리스트
+            
+            Author: 심원두
+            
+            Returns:
+                0: 상품 이미지 테이블 등록 실패
+                1: 상품 이미지 테이블 등록 성공
 
+            Raises:
                 500, {'message': 'product image create denied',
                       'errorMessage': 'unable_to_create_product_image'}: 상품 이미지 등록 실패
             
@@ -226,57 +289,17 @@ class ProductCreateService:
                 2021-01-03(심원두): 이미지 업로드 예외 처리 수정, 파일 손상 이슈 수정
                 2021-01-05(심원두): S3 에 이미지 업로드 처리를, 예외처리 처리 후에 하도록 수정.
                 2021-01-06(심원두): 인덱스가 0부터 들어가는 오류 수정
+                2026-10-18(agent): 검사, 업로드를 upload_product_images_service 로 분리. 내용 해시 경로를 그대로 저장
+                2026-10-18(agent): 축소본 가로 크기 기록
         """
         
         try:
-            image_buffer   = []
-            
-            for product_image in product_images:
-                if not product_image or not product_image.filename:
-                    raise NotValidFileException('invalid_file')
-                
-                image  = Image.open(product_image, 'r')
-                buffer = io.BytesIO()
-                
-                image.save(buffer, image.format)
-                
-                product_image.seek(0, 2)
-                if product_image.tell() > (1024 * 1024 * 4):
-                    FileSizeException('file_size_too_large')
-                
-                buffer.seek(0)
-                
-                width, height, = image.size
-                if width < 640 or height < 720:
-                    raise FileScaleException('file_scale_at_least_640*720')
-                
-                if image.format != "JPEG":
-                    raise FileExtensionException('only_allowed_jpg_type')
-                
-                image_buffer.append(buffer)
-            
-            for index, buffer in enumerate(image_buffer):
-                file_path = GenerateFilePath().generate_file_path(
-                    3,
-                    seller_id  = seller_id,
-                    product_id = product_id
-                )
-                
-                file_name = file_path + product_code + "-" + str(uuid.uuid4())
-                
-                url = S3FileManager().file_upload(
-                    buffer,
-                    file_name
-                )
-                
-                if not url:
-                    S3FileManager().file_delete(file_name)
-                    raise FileUploadFailException('image file upload to amazon fail')
-                
+            for index, image_key in enumerate(image_keys):
                 data = {
-                    'image_url'  : url,
-                    'product_id' : product_id,
-                    'order_index': index + 1
+                    'image_url'      : image_key,
+                    'product_id'     : product_id,
+                    'order_index'    : index + 1,
+                    'variant_widths' : format_variant_widths()
                 }
                 
                 self.create_product_dao.insert_product_image(connection, data)
@@ -1,5 +1,6 @@
 from config                  import S3_BUCKET_URL
 from model                   import ProductManageDao, ProductCreateDao
+from utils.cursor            import paginate
 from utils.custom_exceptions import (
     DateCompareException,
     LookUpDateFieldRequiredCheck,
@@ -50,7 +51,9 @@ class ProductManageService:
                             "updated_at": "2021-01-02 04:11:04"
                         }, ...
                     ],
-                    "total_count": 951
+                    "total_count": 951,
+                    "is_estimated_count": false,
+                    "next_cursor": "WzExMjFd"
             
             Raises:
                 400, {'message': 'key error',
@@ -64,6 +67,13 @@ class ProductManageService:
                 
                 400, {'message': 'invalid seller attribute type',
                       'errorMessage': 'invalid_seller_attribute_type'}: 셀러 타입 유효성 체크 에러
+                
+                400, {'message': 'invalid_cursor',
+                      'error_message': '잘못된 커서입니다.'}: 잘못된 커서
+            
+            History:
+                2026-10-18(agent): 커서 페이지네이션 추가 (cursor 가 있으면 page_number 대신 사용)
+                2026-10-18(agent): 전체 개수는 첫 페이지에서만 조회 (이후 페이지는 캐시에 없으면 None)
         """
         
         try:
@@ -89,18 +99,25 @@ class ProductManageService:
             data['limit']       = int(data['limit'])
             data['offset']      = (data['page_number'] * data['limit']) - data['limit']
             
+            # 전체 개수는 첫 페이지에서만 조회하고 이후 페이지는 캐시에 있을 때만 반환
+            data['load_count']  = not data.get('cursor') and data['page_number'] == 1
+            
             total_count  = self.product_manage_dao.get_total_products_count(
                                 connection,
                                 data
-                            )['total_count']
+                            )
             
             product_list = self.product_manage_dao.search_products(
                                 connection,
                                 data
                             )
             
+            product_list, next_cursor = paginate(product_list, data['limit'], ['product_id'])
+            
             result = {
-                'total_count'  : total_count,
+                'total_count'        : total_count['total_count'],
+                'is_estimated_count' : total_count['is_estimated'],
+                'next_cursor'        : next_cursor,
                 'product_list' : [
                     {
                         'updated_at'            : product['updated_at'],
@@ -77,8 +77,9 @@ class SellerService:
 
     def seller_search_service(self, connection, data, page, page_view):
 
-        data['limit'] = int(page) * int(page_view)
-        data['offset'] = data['limit'] - int(page_view)
+        # LIMIT offset, limit 의 limit 은 가져올 개수이므로 페이지 크기를 넣는다.
+        data['limit'] = int(page_view)
+        data['offset'] = (int(page) - 1) * data['limit']
         seller_info = self.seller_dao.get_seller_search(connection, data)
 
         return seller_info
@@ -0,0 +1,45 @@
+""" 상품 리스트 북마크 여부(is_bookmarked) 표시
+
+상품 리스트 한 페이지의 상품 아이디로 로그인한 계정의 북마크 여부를 IN 쿼리 한번에 조회해서
+각 상품에 is_bookmarked (1 또는 0) 를 붙여준다. 상품마다 따로 조회하지 않으므로 페이지 크기와 상관없이 쿼리는 한번이다.
+
+처리 규칙:
+    1. 로그인하지 않았으면(account_id 가 None) 조회하지 않고 모두 0 이다.
+    2. 캐시된 리스트를 수정하지 않도록 상품 dict 를 복사해서 반환한다.
+    3. 상품이 없다는 안내 문구(str) 처럼 리스트가 아니면 그대로 반환한다.
+
+북마크 여부는 다른 워커 프로세스에서 바뀌어도 바로 보여야 하므로 계정 별 북마크 캐시를 쓰지 않고 매번 조회한다.
+
+기본적인 사용 예시:
+    product_list = annotate_bookmarks(connection, data.get('account_id'), product_list)
+"""
+from model import BookmarkDao
+
+_bookmark_dao = BookmarkDao()
+
+
+def annotate_bookmarks(connection, account_id, products):
+    """ 상품 리스트에 is_bookmarked 를 붙인 새 리스트를 반환한다.
+
+        Args:
+            connection : 데이터베이스 연결 객체
+            account_id : 로그인한 계정 아이디 (로그인하지 않았으면 None)
+            products   : product_id 를 가진 상품 dict 리스트
+
+        Returns: [{'product_id': 1, ..., 'is_bookmarked': 1}, ...]
+
+        Raises:
+            500, {'message': 'database_error', 'errorMessage': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
+    """
+
+    if not isinstance(products, (list, tuple)):
+        return products
+
+    bookmarked = set()
+    if account_id is not None and products:
+        bookmarked = _bookmark_dao.get_bookmarked_product_ids_dao(connection, {
+            'account_id': account_id,
+            'product_ids': {product['product_id'] for product in products}
+        })
+
+    return [dict(product, is_bookmarked=int(product['product_id'] in bookmarked)) for product in products]
@@ -1,22 +1,52 @@
-from model import BookmarkDao
-from utils.custom_exceptions import AlreadyExistBookmark, NotExistBookmark, ProductNotExist
+from model import BookmarkDao, ProductListDao
+from utils.cache import get_cache
+from utils.connection import on_commit
+from utils.cursor import decode_cursor, encode_cursor
+from utils.image_variants import select_image_variants
+from utils.custom_exceptions import (
+    AlreadyExistBookmark,
+    NotExistBookmark,
+    ProductNotExist,
+    InvalidBookmarkRequest,
+    InvalidCursor
+)
+from service.store.product_counter import get_product_counters, BOOKMARK_COUNT
+
+# 계정 별 북마크 목록 캐시 (북마크 추가/삭제가 commit 되면 무효화), 크기는 캐시된 북마크 수의 합으로 제한한다.
+BOOKMARK_SET_CACHE_NAME = 'bookmark_set'
+BOOKMARK_SET_CACHE_TTL = 30
+BOOKMARK_SET_CACHE_SIZE = 200000
+
+# 한번에 추가/삭제할 수 있는 최대 상품 수
+MAX_BULK_BOOKMARKS = 100
 
 
 class BookmarkService:
     """ Business Layer
 
         Attributes:
-            bookmark_dao : BookmarkDao 클래스
+            bookmark_dao       : BookmarkDao 클래스
+            product_dao        : ProductListDao 클래스
+            bookmark_set_cache : 계정 아이디 별 북마크 목록 캐시
 
         Author: 김민구
 
         History:
             2020-01-02(김민구): 초기 생성
             2020-01-07(김민구): 상품 존재 유무 체크 추가
+            2026-10-18(agent): 북마크 수를 카운터에 모아서 반영하도록 수정
+            2026-10-18(agent): 여러 상품 일괄 추가/삭제, 내 북마크 목록 조회 추가
     """
 
     def __init__(self):
         self.bookmark_dao = BookmarkDao()
+        self.product_dao = ProductListDao()
+        self.bookmark_set_cache = get_cache(
+            BOOKMARK_SET_CACHE_NAME,
+            maxsize=BOOKMARK_SET_CACHE_SIZE,
+            ttl=BOOKMARK_SET_CACHE_TTL,
+            getsizeof=lambda value: len(value['items']) + 1
+        )
 
     def post_bookmark_logic(self, connection, data):
         """ 상품 북마크 추가
@@ -34,6 +64,7 @@ class BookmarkService:
 
         History:
             2021-01-02(김민구): 초기 생성
+            2026-10-18(agent): 북마크 수를 카운터에 모아서 반영하도록 수정
         """
 
         product_exist = self.bookmark_dao.get_product_exist(connection, data)
@@ -46,8 +77,8 @@ class BookmarkService:
 
         self.bookmark_dao.create_bookmark(connection, data)
 
-        data['count'] = 1
-        self.bookmark_dao.update_bookmark_volume_count(connection, data)
+        # 인기 상품의 bookmark_volumes 행에 락 대기가 몰리지 않도록 commit 뒤에 카운터에 모아서 반영한다.
+        self._on_bookmarks_changed(connection, data['account_id'], [data['product_id']], 1)
 
     def delete_bookmark_logic(self, connection, data):
         """ 상품 북마크 삭제
@@ -66,6 +97,7 @@ class BookmarkService:
         History:
             2021-01-02(김민구): 초기 생성
             2020-01-07(김민구): 상품 존재 유무 체크 추가
+            2026-10-18(agent): 북마크 수를 카운터에 모아서 반영하도록 수정
         """
 
         product_exist = self.bookmark_dao.get_product_exist(connection, data)
@@ -78,5 +110,159 @@ class BookmarkService:
 
         self.bookmark_dao.delete_bookmark(connection, data)
 
-        data['count'] = -1
-        self.bookmark_dao.update_bookmark_volume_count(connection, data)
+        self._on_bookmarks_changed(connection, data['account_id'], [data['product_id']], -1)
+
+    def post_bookmarks_service(self, connection, data):
+        """ 상품 여러개 북마크 일괄 추가
+
+        상품 존재 여부, 북마크 여부를 상품 수와 상관없이 한번씩 조회하고 북마크 하지 않은 상품만 한번에 추가한다.
+        이미 북마크 한 상품은 건너뛰므로 같은 요청을 다시 보내도 결과가 같다.
+
+        Args:
+            connection: 데이터베이스 연결 객체
+            data: view에서 넘겨 받은 dict( product_ids, account_id )
+
+        Author: agent
+
+        Returns:
+            {'product_ids': [새로 북마크 한 상품 아이디, ...]}
+
+        Raises:
+            400, {'message': 'invalid_bookmark_request', 'error_message': '...'}               : 잘못된 상품 아이디 목록
+            400, {'message': 'product does not exist', 'error_message': '해당 상품이 존재하지 않습니다.'} : 존재하지 않는 상품 포함
+
+        History:
+            2026-10-18(agent): 초기 생성
+        """
+
+        product_ids = self._validate_product_ids(data['product_ids'])
+
+        existing = self.bookmark_dao.get_existing_product_ids_dao(connection, {'product_ids': product_ids})
+        if len(existing) != len(product_ids):
+            raise ProductNotExist('해당 상품이 존재하지 않습니다.')
+
+        bookmarked = self.bookmark_dao.get_bookmarked_product_ids_dao(
+            connection,
+            {'account_id': data['account_id'], 'product_ids': product_ids}
+        )
+        added = [product_id for product_id in product_ids if product_id not in bookmarked]
+
+        if added:
+            self.bookmark_dao.create_bookmarks_dao(connection, {'account_id': data['account_id'], 'product_ids': added})
+            self._on_bookmarks_changed(connection, data['account_id'], added, 1)
+
+        return {'product_ids': added}
+
+    def delete_bookmarks_service(self, connection, data):
+        """ 상품 여러개 북마크 일괄 삭제
+
+        북마크 한 상품만 한번에 삭제하고 북마크 하지 않은 상품은 건너뛴다.
+
+        Args:
+            connection: 데이터베이스 연결 객체
+            data: view에서 넘겨 받은 dict( product_ids, account_id )
+
+        Author: agent
+
+        Returns:
+            {'product_ids': [북마크를 삭제한 상품 아이디, ...]}
+
+        Raises:
+            400, {'message': 'invalid_bookmark_request', 'error_message': '...'} : 잘못된 상품 아이디 목록
+
+        History:
+            2026-10-18(agent): 초기 생성
+        """
+
+        product_ids = self._validate_product_ids(data['product_ids'])
+
+        bookmarked = self.bookmark_dao.get_bookmarked_product_ids_dao(
+            connection,
+            {'account_id': data['account_id'], 'product_ids': product_ids}
+        )
+        removed = [product_id for product_id in product_ids if product_id in bookmarked]
+
+        if removed:
+            self.bookmark_dao.delete_bookmarks_dao(connection, {'account_id': data['account_id'], 'product_ids': removed})
+            self._on_bookmarks_changed(connection, data['account_id'], removed, -1)
+
+        return {'product_ids': removed}
+
+    def get_bookmark_list_service(self, connection, data):
+        """ 내 북마크 상품 목록 조회 (최근에 북마크 한 순서)
+
+        Args:
+            connection: 데이터베이스 연결 객체
+            data: view에서 넘겨 받은 dict( account_id, limit, cursor )
+
+        Author: agent
+
+        Returns:
+            {
+                'result': [{'product_id': 1, 'product_name': '성보의 하루', 'bookmark_count': 3, ...}],
+                'next_cursor': 다음 페이지 커서 또는 None
+            }
+
+        Raises:
+            400, {'message': 'invalid_cursor', 'error_message': '잘못된 커서입니다.'} : 잘못된 커서
+
+        History:
+            2026-10-18(agent): 초기 생성
+            2026-10-18(agent): 요청한 크기의 대표 이미지 축소본 경로로 변경
+
+        Notes:
+            북마크 목록은 계정 별 캐시에서 자르고 상품 정보는 페이지의 상품만 한번에 조회한다.
+            삭제된 상품은 상품 정보 조회에서 빠지므로 페이지가 limit 보다 짧을 수 있다.
+        """
+
+        items = self._get_bookmark_set(connection, data['account_id'])['items']
+
+        if data.get('cursor'):
+            after = decode_cursor(data['cursor'])
+            if len(after) != 1 or not isinstance(after[0], int):
+                raise InvalidCursor('잘못된 커서입니다.')
+            items = [item for item in items if item[0] < after[0]]
+
+        page = items[:data['limit']]
+        next_cursor = encode_cursor([page[-1][0]]) if len(items) > data['limit'] else None
+
+        if not page:
+            return {'result': [], 'next_cursor': None}
+
+        rows = self.product_dao.get_search_products_by_ids_dao(
+            connection,
+            {'product_ids': [product_id for _, product_id in page]}
+        )
+        rows = select_image_variants(get_product_counters().overlay(rows), data.get('image_size'), data.get('image_format'))
+        rows_by_id = {row['product_id']: row for row in rows}
+        return {
+            'result': [rows_by_id[product_id] for _, product_id in page if product_id in rows_by_id],
+            'next_cursor': next_cursor
+        }
+
+    def _get_bookmark_set(self, connection, account_id):
+        def load():
+            items = self.bookmark_dao.get_account_bookmarks_dao(connection, {'account_id': account_id})
+            return {'items': items}
+
+        return self.bookmark_set_cache.get_or_load(account_id, load)
+
+    def _on_bookmarks_changed(self, connection, account_id, product_ids, delta):
+        """ commit 되면 북마크 수를 카운터에 모아서 반영하고 계정의 북마크 목록 캐시를 지운다. """
+
+        def apply():
+            counters = get_product_counters()
+            for product_id in product_ids:
+                counters.add(BOOKMARK_COUNT, product_id, delta)
+            self.bookmark_set_cache.delete(account_id)
+
+        on_commit(connection, apply)
+
+    @staticmethod
+    def _validate_product_ids(product_ids):
+        if (not isinstance(product_ids, list) or not product_ids or len(product_ids) > MAX_BULK_BOOKMARKS
+                or not all(isinstance(product_id, int) and not isinstance(product_id, bool) for product_id in product_ids)):
+            raise InvalidBookmarkRequest(
+                '상품 아이디는 1개 이상 {}개 이하의 정수 목록이어야 합니다.'.format(MAX_BULK_BOOKMARKS)
+            )
+        return sorted(set(product_ids))
@@ -1,21 +1,106 @@
 import traceback
+
+from utils.cache import get_cache
+from utils.connection import on_commit
 from utils.custom_exceptions import CustomerPermissionDenied, CartItemCreateDenied
 
+# 계정 별 장바구니 요약 캐시 (장바구니 담기, 결제가 commit 되면 무효화)
+CART_SUMMARY_CACHE_NAME = 'cart_summary'
+CART_SUMMARY_CACHE_TTL = 10
+CART_SUMMARY_CACHE_SIZE = 10000
+
 
 class CartItemService:
     """ Business Layer
 
         Attributes:
-            cart_item_dao: CartItemDao 클래스
+            cart_item_dao      : CartItemDao 클래스
+            cart_summary_cache : 계정 아이디 별 장바구니 요약 캐시
 
         Author: 고수희
 
         History:
             2020-12-28(고수희): 초기 생성
+            2026-10-18(agent): 장바구니 전체 요약 조회, 계정 별 캐시 추가
     """
 
     def __init__(self, cart_item_dao):
         self.cart_item_dao = cart_item_dao
+        self.cart_summary_cache = get_cache(
+            CART_SUMMARY_CACHE_NAME,
+            maxsize=CART_SUMMARY_CACHE_SIZE,
+            ttl=CART_SUMMARY_CACHE_TTL
+        )
+
+    def get_cart_summary_service(self, connection, data):
+        """ GET 메소드: 계정의 장바구니 상품 전체와 합계 조회
+
+        Args:
+            connection: 데이터베이스 연결 객체
+            data      : View 에서 넘겨받은 dict 객체 (user_id, user_permission)
+
+        Author: agent
+
+        Returns:
+            {
+                'cart_items'          : 장바구니 상품 리스트 (상품 별 가격, 합계, 품절 여부, 가격 변경 여부),
+                'total_count'         : 장바구니 상품 수,
+                'soldout_count'       : 품절 상품 수,
+                'price_changed_count' : 담은 뒤 가격이 바뀐 상품 수,
+                'total_price'         : 품절 상품을 제외한 결제 예정 금액 (결제와 같이 장바구니 가격 기준)
+            }
+
+        Raises:
+            400, {'message': 'key error',
+            'errorMessage': 'key_error'} : 잘못 입력된 키값
+            403, {'message': 'customer permission denied',
+            'errorMessage': 'customer_permission_denied'} : 사용자 권한이 없음
+
+        History:
+            2026-10-18(agent): 초기 생성
+            2026-10-18(agent): 결제와 같은 장바구니 가격으로 합계 계산, 가격이 바뀐 상품 수 추가
+        """
+        try:
+            # 사용자의 권한 체크
+            if data['user_permission'] != 3:
+                raise CustomerPermissionDenied('customer_permission_denied')
+
+            return self.cart_summary_cache.get_or_load(
+                data['user_id'],
+                lambda: self._load_cart_summary(connection, data)
+            )
+
+        except CustomerPermissionDenied as e:
+            traceback.print_exc()
+            raise e
+
+        except KeyError:
+            traceback.print_exc()
+            raise KeyError('key_error')
+
+    def _load_cart_summary(self, connection, data):
+        cart_items = self.cart_item_dao.get_cart_items_dao(connection, data)
+
+        total_price = 0
+        soldout_count = 0
+        price_changed_count = 0
+        for item in cart_items:
+            item['soldout'] = bool(item['soldout'])
+            item['price_changed'] = bool(item['price_changed'])
+            if item['price_changed']:
+                price_changed_count += 1
+            if item['soldout']:
+                soldout_count += 1
+            else:
+                total_price += item['total_price']
+
+        return {
+            'cart_items': cart_items,
+            'total_count': len(cart_items),
+            'soldout_count': soldout_count,
+            'price_changed_count': price_changed_count,
+            'total_price': total_price
+        }
 
     def get_cart_item_service(self, connection, data):
         """ GET 메소드: 장바구니 상품 조회, 조회 시 상품 품절 여부 체크
@@ -76,6 +161,7 @@ class CartItemService:
         History:
             2020-12-28(고수희): 초기 생성
             2021-01-02(고수희): 권한 체크 수정
+            2026-10-18(agent): commit 후 장바구니 요약 캐시 무효화
         """
 
         try:
@@ -87,7 +173,11 @@ class CartItemService:
             sold_out = self.cart_item_dao.product_soldout_dao(connection, data)
             if sold_out['soldout'] is True:
                 raise CartItemCreateDenied('unable_to_create')
-            return self.cart_item_dao.post_cart_item_dao(connection, data)
+            cart_id = self.cart_item_dao.post_cart_item_dao(connection, data)
+
+            # 장바구니 요약 캐시 무효화
+            on_commit(connection, lambda: self.cart_summary_cache.delete(data['user_id']))
+            return cart_id
 
         except CustomerPermissionDenied as e:
             traceback.print_exc()
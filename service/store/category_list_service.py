@@ -1,4 +1,11 @@
+import hashlib
+import json
+
 from model import CategoryListDao
+from utils.cache import get_cache
+
+CATEGORY_CACHE_NAME = 'category_tree'
+CATEGORY_CACHE_TTL = 60 * 10
 
 
 class CategoryListService:
@@ -6,16 +13,51 @@ class CategoryListService:
 
         Attributes:
             category_list_dao : CategoryListDao 클래스
+            cache             : 완성된 카테고리 트리를 담는 캐시
 
         Author: 김민구
 
         History:
             2020-12-30(김민구): 초기 생성
             2020-12-31(김민구): category_list_dao를 import 해서 사용하는 방법으로 수정
+            2026-10-18(agent): 카테고리 트리 캐시 추가
     """
 
     def __init__(self):
         self.category_list_dao = CategoryListDao()
+        self.cache = get_cache(CATEGORY_CACHE_NAME, maxsize=1, ttl=CATEGORY_CACHE_TTL)
+
+    def cached_category_list_logic(self, connection):
+        """ 캐시된 카테고리 트리와 ETag 조회
+
+            캐시에 없을 때만 데이터베이스를 조회해 트리를 만든다.
+
+            Args:
+                connection : 데이터베이스 연결 객체
+
+            Author: agent
+
+            Returns:
+                {
+                    'result': category_list_logic 의 반환값,
+                    'etag': '카테고리 트리 내용의 해시값'
+                }
+
+            History:
+                2026-10-18(agent): 초기 생성
+        """
+
+        def load():
+            result = self.category_list_logic(connection)
+            body = json.dumps(result, sort_keys=True, ensure_ascii=False).encode('utf-8')
+            return {'result': result, 'etag': hashlib.md5(body).hexdigest()}
+
+        return self.cache.get_or_load('tree', load)
+
+    def invalidate_category_cache(self):
+        """ 카테고리 수정 시 호출. 다른 레이어에서는 get_cache(CATEGORY_CACHE_NAME).clear() 로 무효화 할 수 있다. """
+
+        self.cache.clear()
 
     def category_list_logic(self, connection):
         """ 3가지 카테고리 조회
@@ -52,29 +94,38 @@ class CategoryListService:
             History:
                 2020-12-30(김민구): 초기 생성
                 2020-12-31(김민구): docs 수정
+                2026-10-18(agent): 부모 아이디 인덱스로 한번에 트리를 구성하도록 수정
+
+            Notes:
+                하위 카테고리를 부모 아이디 별로 한번만 묶어두고 조립하므로 각 레벨을 한번씩만 순회한다.
         """
 
         first_category_list = self.category_list_dao.get_first_category_list(connection)
         second_category_list = self.category_list_dao.get_second_category_list(connection)
         third_category_list = self.category_list_dao.get_third_category_list(connection)
+
+        sub_categories_by_main = dict()
+        for third in third_category_list:
+            sub_categories_by_main.setdefault(third['main_category_id'], []).append({
+                'id': third['id'],
+                'name': third['name'],
+                'main_category_id': third['main_category_id']
+            })
+
+        main_categories_by_menu = dict()
+        for second in second_category_list:
+            main_categories_by_menu.setdefault(second['menu_id'], []).append({
+                'id': second['id'],
+                'name': second['name'],
+                'menu_id': second['menu_id'],
+                'sub_categories': sub_categories_by_main.get(second['id'], [])
+            })
+
         result = [
             {
                 'id': first['id'],
                 'name': first['name'],
-                'main_categories': [
-                    {
-                        'id': second['id'],
-                        'name': second['name'],
-                        'menu_id': second['menu_id'],
-                        'sub_categories': [
-                            {
-                                'id': third['id'],
-                                'name': third['name'],
-                                'main_category_id': third['main_category_id']
-                            } for third in third_category_list if third['main_category_id'] == second['id']
-                        ]
-                    } for second in second_category_list if second['menu_id'] == first['id']
-                ]
+                'main_categories': main_categories_by_menu.get(first['id'], [])
             } for first in first_category_list]
 
         return result
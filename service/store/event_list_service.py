@@ -1,4 +1,6 @@
 from model import EventListDao
+from service.store.bookmark_annotator import annotate_bookmarks
+from utils.image_variants import select_image_variants
 
 
 class EventListService:
@@ -130,7 +132,8 @@ class EventListService:
                         "product_id": 249,
                         "product_name": "성보의하루249",
                         "sales_count": 94,
-                        "seller_name": "나는셀러2"
+                        "seller_name": "나는셀러2",
+                        "is_bookmarked": 0
                     }
                 ]
             Raises:
@@ -138,6 +141,8 @@ class EventListService:
 
             History:
                 2021-01-01(김민구): 초기 생성
+                2026-10-18(agent): 로그인한 계정의 북마크 여부(is_bookmarked) 추가
+                2026-10-18(agent): 요청한 크기의 대표 이미지 축소본 경로로 변경
 
             Notes:
                 먼저 해당 기획전에 버튼이 있는지 조회
@@ -148,8 +153,9 @@ class EventListService:
         is_button = self.event_list_dao.is_event_has_button(connection, data['event_id'])
 
         if is_button:
-            event_button_products = self.event_list_dao.get_event_button_product_list(connection, data)
-            return event_button_products
+            products = self.event_list_dao.get_event_button_product_list(connection, data)
         else:
-            event_products = self.event_list_dao.get_event_product_list(connection, data)
-            return event_products
+            products = self.event_list_dao.get_event_product_list(connection, data)
+
+        products = annotate_bookmarks(connection, data.get('account_id'), products)
+        return select_image_variants(products, data.get('image_size'), data.get('image_format'))
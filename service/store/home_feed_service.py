@@ -0,0 +1,91 @@
+from model import ProductListDao
+from service.store.bookmark_annotator import annotate_bookmarks
+from service.store.category_list_service import CategoryListService
+from service.store.product_counter import get_product_counters
+from utils.cache import get_cache
+from utils.image_variants import select_image_variants
+
+# 홈 화면 페이지 캐시 (기획전 등록/수정/삭제가 commit 되면 어드민 서비스에서 clear() 한다)
+# 기획전 종료, 상품 가격 변경처럼 기획전 수정을 거치지 않는 변경은 최대 HOME_FEED_CACHE_TTL 초 늦게 반영된다.
+HOME_FEED_CACHE_NAME = 'home_feed'
+HOME_FEED_CACHE_TTL = 60
+HOME_FEED_CACHE_SIZE = 1000
+
+EVENTS_KEY = 'events'
+
+
+class HomeFeedService:
+    """ Business Layer
+
+        홈 화면 한 페이지(기획전 배너 + 기획전 상품)와 첫 페이지의 카테고리 트리를 한번에 조회한다.
+
+        Attributes:
+            product_dao           : ProductListDao 클래스
+            category_list_service : CategoryListService 클래스 (카테고리 트리 캐시 공유)
+            cache                 : 진행중인 기획전 목록과 (offset, limit) 별 페이지 캐시
+            counters              : 반영 전 북마크 수, 판매량 증감값 (프로세스에서 하나)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self):
+        self.product_dao = ProductListDao()
+        self.category_list_service = CategoryListService()
+        self.cache = get_cache(HOME_FEED_CACHE_NAME, maxsize=HOME_FEED_CACHE_SIZE, ttl=HOME_FEED_CACHE_TTL)
+        self.counters = get_product_counters()
+
+    def home_feed_service(self, connection, data):
+        """ 홈 화면 페이지 조회
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                data       : View 에서 넘겨받은 dict (offset, limit, account_id, image_size, image_format)
+
+            Author: agent
+
+            Returns:
+                {
+                    'event': {'event_id': 1, 'event_banner_image': 'url'} (기획전이 없으면 None),
+                    'product_list': [{'product_id': 1, 'sales_count': 30, 'is_bookmarked': 0, ...}],
+                    'has_next': 다음 기획전 페이지가 있는지 여부,
+                    'categories': 카테고리 트리 (offset 이 0 일 때만)
+                }
+
+            Raises:
+                500, {'message': 'database_error', 'error_message': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
+
+            History:
+                2026-10-18(agent): 초기 생성
+                2026-10-18(agent): 요청한 크기의 대표 이미지 축소본 경로로 변경
+
+            Notes:
+                계정과 상관없는 페이지는 캐시에서 꺼내고, 반영 전 판매량과 북마크 여부만 요청마다 더한다.
+        """
+
+        events = self.cache.get_or_load(EVENTS_KEY, lambda: self.product_dao.get_active_events_dao(connection))
+
+        # 기획전 범위 밖의 offset 은 페이지 캐시에 넣지 않는다.
+        if not 0 <= data['offset'] < len(events):
+            page = {'event': None, 'product_list': [], 'has_next': False}
+        else:
+            page = self.cache.get_or_load(
+                (data['offset'], data['limit']),
+                lambda: self._build_page(connection, events[data['offset']], data['offset'] + 1 < len(events), data['limit'])
+            )
+
+        product_list = annotate_bookmarks(connection, data.get('account_id'), self.counters.overlay(page['product_list']))
+        result = {
+            'event': page['event'],
+            'product_list': select_image_variants(product_list, data.get('image_size'), data.get('image_format')),
+            'has_next': page['has_next']
+        }
+        if data['offset'] == 0:
+            result['categories'] = self.category_list_service.cached_category_list_logic(connection)['result']
+        return result
+
+    def _build_page(self, connection, event, has_next, limit):
+        product_list = self.product_dao.get_product_list(connection, {'event_id': event['event_id'], 'limit': limit})
+        return {'event': event, 'product_list': product_list, 'has_next': has_next}
@@ -0,0 +1,193 @@
+""" 결제 후속 작업 큐 (outbox)
+
+주문 상품 이력 추가, 주문자 정보 저장처럼 응답에 영향이 없는 쓰기는
+결제 트랜잭션 안에서 outbox_jobs 테이블에 작업으로만 저장하고, 워커 스레드가 commit 이후에 실행한다.
+작업 저장은 주문과 같은 트랜잭션이므로 주문이 rollback 되면 작업도 없어지고, 주문이 commit 되면 작업은 유실되지 않는다.
+
+처리 규칙:
+    1. account_id % partitions 로 파티션을 나누고 파티션마다 워커 스레드가 하나씩 실행한다.
+       여러 프로세스가 떠 있어도 MySQL 네임드 락으로 파티션 하나는 한 워커만 처리하므로 계정 별 순서가 지켜진다.
+    2. 작업 하나와 작업 삭제를 같은 트랜잭션으로 commit 한다.
+    3. 실패하면 OUTBOX_RETRY_SECONDS * 2^시도횟수 초 뒤에 다시 실행하고, 그동안 같은 계정의 이후 작업은 실행하지 않는다.
+       OUTBOX_MAX_ATTEMPTS 번 실패하면 is_failed=1 로 남기고 더 이상 실행하지 않는다.
+    4. 작업을 저장한 요청이 commit 되면 워커를 바로 깨우고, 그 외에는 OUTBOX_POLL_SECONDS 마다 확인한다.
+
+기본적인 사용 예시:
+    start_outbox_worker(database)  # create_app 에서 한번 호출
+
+    enqueue_jobs(connection, [
+        {'account_id': 3, 'job_type': 'customer_information', 'payload': {...}}
+    ])
+"""
+import json
+import threading
+import traceback
+
+from model import OutboxDao, StoreOrderDao
+from utils.connection import get_connection, on_commit
+
+OUTBOX_PARTITIONS = 2
+OUTBOX_BATCH_SIZE = 50
+OUTBOX_POLL_SECONDS = 5
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_RETRY_SECONDS = 10
+
+
+class OutboxWorker:
+    """ outbox 작업 실행 워커
+
+        Attributes:
+            database        : 작업을 실행할 데이터베이스 설정
+            partitions      : 파티션(워커 스레드) 수
+            outbox_dao      : OutboxDao 클래스
+            store_order_dao : StoreOrderDao 클래스
+            handlers        : {job_type: 작업 실행 함수(connection, payload)}
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self, database, partitions=OUTBOX_PARTITIONS):
+        self.database = database
+        self.partitions = partitions
+        self.outbox_dao = OutboxDao()
+        self.store_order_dao = StoreOrderDao()
+        self.handlers = {
+            'order_item_history': self.store_order_dao.post_store_order_item_history_dao,
+            'order_items_history': self.store_order_dao.post_store_order_items_history_dao,
+            'customer_information': self.store_order_dao.patch_customer_information_dao
+        }
+        self._events = [threading.Event() for _ in range(partitions)]
+        self._threads = []
+        self._stats_lock = threading.Lock()
+        self._stats = {'processed': 0, 'retried': 0, 'failed': 0, 'errors': 0}
+
+    def start(self):
+        if self._threads:
+            return
+
+        for partition in range(self.partitions):
+            thread = threading.Thread(
+                target=self._run,
+                args=(partition,),
+                name='outbox-worker-{}'.format(partition),
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def wake(self):
+        for event in self._events:
+            event.set()
+
+    def stats(self):
+        with self._stats_lock:
+            return dict(self._stats, partitions=self.partitions, running=len(self._threads))
+
+    def _run(self, partition):
+        event = self._events[partition]
+        while True:
+            event.wait(OUTBOX_POLL_SECONDS)
+            event.clear()
+            try:
+                # 한번에 BATCH 만큼 가득 처리했으면 남은 작업이 있을 수 있으므로 바로 다시 조회한다.
+                while self._process(partition):
+                    pass
+            except Exception:
+                traceback.print_exc()
+                self._count('errors')
+
+    def _process(self, partition):
+        lock_name = 'outbox_jobs:{}:{}'.format(self.database['name'], partition)
+        connection = get_connection(self.database)
+        try:
+            if not self.outbox_dao.get_partition_lock_dao(connection, lock_name):
+                return False
+
+            try:
+                jobs = self.outbox_dao.get_pending_jobs_dao(connection, {
+                    'partition': partition,
+                    'partitions': self.partitions,
+                    'limit': OUTBOX_BATCH_SIZE
+                })
+                connection.commit()
+
+                blocked = set()
+                for job in jobs:
+                    if job['account_id'] in blocked:
+                        continue
+                    if not self._execute(connection, job):
+                        blocked.add(job['account_id'])
+
+                return len(jobs) == OUTBOX_BATCH_SIZE
+            finally:
+                self.outbox_dao.release_partition_lock_dao(connection, lock_name)
+        finally:
+            connection.close()
+
+    def _execute(self, connection, job):
+        try:
+            self.handlers[job['job_type']](connection, json.loads(job['payload']))
+            self.outbox_dao.delete_job_dao(connection, job['id'])
+            connection.commit()
+            self._count('processed')
+            return True
+
+        except Exception as e:
+            traceback.print_exc()
+            connection.rollback()
+
+            is_failed = job['attempts'] + 1 >= OUTBOX_MAX_ATTEMPTS
+            self.outbox_dao.retry_job_dao(connection, {
+                'id': job['id'],
+                'is_failed': int(is_failed),
+                'last_error': '{}: {}'.format(type(e).__name__, e)[:500],
+                'delay_seconds': OUTBOX_RETRY_SECONDS * 2 ** job['attempts']
+            })
+            connection.commit()
+            self._count('failed' if is_failed else 'retried')
+            return is_failed
+
+    def _count(self, name):
+        with self._stats_lock:
+            self._stats[name] += 1
+
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def start_outbox_worker(database, partitions=OUTBOX_PARTITIONS):
+    """ 프로세스에서 하나만 사용하는 outbox 워커를 시작한다. (partitions 가 0 이면 시작하지 않는다) """
+
+    global _worker
+    with _worker_lock:
+        if _worker is None and partitions > 0:
+            _worker = OutboxWorker(database, partitions)
+            _worker.start()
+        return _worker
+
+
+def wake_outbox_worker():
+    if _worker is not None:
+        _worker.wake()
+
+
+def get_outbox_stats():
+    return _worker.stats() if _worker is not None else None
+
+
+def enqueue_jobs(connection, jobs):
+    """ 요청 트랜잭션에 작업을 추가하고, commit 되면 워커를 깨운다.
+
+        Args:
+            connection : 데이터베이스 연결 객체
+            jobs       : [{'account_id': 3, 'job_type': 'customer_information', 'payload': dict}, ...]
+    """
+
+    OutboxDao().insert_jobs_dao(connection, [
+        dict(job, payload=json.dumps(job['payload'], default=str)) for job in jobs
+    ])
+    on_commit(connection, wake_outbox_worker)
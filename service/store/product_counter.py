@@ -0,0 +1,207 @@
+""" 상품 북마크 수, 판매량 카운터
+
+북마크를 누를 때마다 bookmark_volumes 의 같은 행을 UPDATE 하면 인기 상품 행에 락 대기가 몰린다.
+증감값은 프로세스 메모리에 상품 별로 합쳐 두고 COUNTER_FLUSH_SECONDS 마다 종류 별 UPDATE 한번으로 반영한다.
+
+처리 규칙:
+    1. 서비스는 트랜잭션이 commit 된 뒤에 add() 한다. (utils.connection.on_commit)
+    2. 조회 결과에는 overlay() 로 아직 반영되지 않은 증감값을 더해서 내려준다.
+       반영 중인 값도 commit 될 때까지 더하므로 flush 도중에도 숫자가 비지 않는다.
+    3. 반영이 끝나면 add_flush_listener 로 등록된 함수에 반영된 상품 아이디를 넘겨준다. (캐시 무효화 등)
+    4. 반영에 실패하면 증감값을 다시 합쳐 두고 다음 주기에 반영한다.
+
+증감값은 프로세스 메모리에 있으므로 프로세스가 비정상 종료되면 최대 COUNTER_FLUSH_SECONDS 동안의 증감값이 유실될 수 있다.
+(정상 종료 시에는 atexit 에서 한번 더 반영한다)
+다른 워커 프로세스의 반영 전 증감값은 overlay 에 포함되지 않으므로 숫자는 최대 COUNTER_FLUSH_SECONDS 만큼 늦을 수 있다.
+
+기본적인 사용 예시:
+    start_product_counter_flusher(database, app.config.get('COUNTER_FLUSH_SECONDS', COUNTER_FLUSH_SECONDS))  # create_app
+
+    on_commit(connection, lambda: get_product_counters().add(BOOKMARK_COUNT, product_id, 1))
+    product_list = get_product_counters().overlay(product_list)
+"""
+import atexit
+import threading
+import traceback
+
+from model import ProductCounterDao
+from utils.connection import get_connection
+
+BOOKMARK_COUNT = 'bookmark_count'
+SALES_COUNT = 'sales_count'
+
+COUNTER_FLUSH_SECONDS = 5
+COUNTER_FLUSH_CHUNK_SIZE = 500
+
+
+class ProductCounters:
+    """ 상품 카운터 증감값 누적과 일괄 반영
+
+        Attributes:
+            counter_dao : ProductCounterDao 클래스
+            database    : 반영에 사용할 데이터베이스 설정 (start 에서 설정)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self):
+        self.counter_dao = ProductCounterDao()
+        self.database = None
+        self.interval = COUNTER_FLUSH_SECONDS
+        self._writers = {
+            BOOKMARK_COUNT: self.counter_dao.update_bookmark_counts_dao,
+            SALES_COUNT: self.counter_dao.update_sales_counts_dao
+        }
+        self._pending = {field: dict() for field in self._writers}
+        self._flushing = {field: dict() for field in self._writers}
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._stats = {'added': 0, 'flushes': 0, 'flushed_rows': 0, 'flush_errors': 0}
+
+    def add(self, field, product_id, delta):
+        if not delta:
+            return
+
+        with self._lock:
+            pending = self._pending[field]
+            pending[product_id] = pending.get(product_id, 0) + delta
+            self._stats['added'] += 1
+
+    def delta(self, field, product_id):
+        """ 아직 반영되지 않은 증감값 """
+
+        with self._lock:
+            return self._pending[field].get(product_id, 0) + self._flushing[field].get(product_id, 0)
+
+    def overlay(self, rows):
+        """ 조회 결과(product_id 와 카운터 컬럼을 가진 dict 리스트)에 반영 전 증감값을 더한 리스트를 반환한다.
+
+            증감값이 있는 행만 복사하므로 캐시된 행을 수정하지 않는다.
+        """
+
+        result = []
+        for row in rows:
+            changed = None
+            for field in self._writers:
+                if field not in row:
+                    continue
+                delta = self.delta(field, row['product_id'])
+                if delta:
+                    changed = changed or dict(row)
+                    changed[field] = max((row[field] or 0) + delta, 0)
+            result.append(changed or row)
+        return result
+
+    def overlay_one(self, row):
+        return self.overlay([row])[0]
+
+    def add_flush_listener(self, listener):
+        """ listener(field, product_ids) 를 반영이 commit 될 때마다 호출한다. """
+
+        with self._lock:
+            self._listeners.append(listener)
+
+    def start(self, database, interval=COUNTER_FLUSH_SECONDS):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self.database = database
+            self.interval = interval
+            self._thread = threading.Thread(target=self._run, name='product-counter-flusher', daemon=True)
+            self._thread.start()
+        atexit.register(self.flush)
+
+    def flush(self):
+        """ 누적된 증감값을 데이터베이스에 반영한다. """
+
+        if self.database is None:
+            return
+
+        with self._flush_lock:
+            with self._lock:
+                for field in self._writers:
+                    self._flushing[field], self._pending[field] = self._pending[field], dict()
+                flushing = {field: dict(deltas) for field, deltas in self._flushing.items() if deltas}
+
+            if not flushing:
+                return
+
+            connection = None
+            try:
+                # 커넥션을 받지 못해도 아래에서 증감값을 다시 합쳐 둔다.
+                connection = get_connection(self.database)
+                for field, deltas in flushing.items():
+                    deltas = sorted(item for item in deltas.items() if item[1])
+                    for start in range(0, len(deltas), COUNTER_FLUSH_CHUNK_SIZE):
+                        self._writers[field](connection, deltas[start:start + COUNTER_FLUSH_CHUNK_SIZE])
+                connection.commit()
+
+            except Exception:
+                traceback.print_exc()
+                if connection is not None:
+                    connection.rollback()
+                with self._lock:
+                    # 반영하지 못한 증감값은 다음 주기에 다시 반영한다.
+                    for field, deltas in self._flushing.items():
+                        pending = self._pending[field]
+                        for product_id, delta in deltas.items():
+                            pending[product_id] = pending.get(product_id, 0) + delta
+                        self._flushing[field] = dict()
+                    self._stats['flush_errors'] += 1
+                return
+
+            finally:
+                if connection is not None:
+                    connection.close()
+
+            with self._lock:
+                self._flushing = {field: dict() for field in self._writers}
+                self._stats['flushes'] += 1
+                self._stats['flushed_rows'] += sum(len(deltas) for deltas in flushing.values())
+                listeners = list(self._listeners)
+
+            for field, deltas in flushing.items():
+                for listener in listeners:
+                    try:
+                        listener(field, list(deltas))
+                    except Exception:
+                        traceback.print_exc()
+
+    def stats(self):
+        with self._lock:
+            return dict(
+                self._stats,
+                pending_products=sum(len(deltas) for deltas in self._pending.values())
+            )
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception:
+                traceback.print_exc()
+
+
+_counters = ProductCounters()
+
+
+def get_product_counters():
+    """ 프로세스에서 하나만 사용하는 상품 카운터를 반환한다. """
+
+    return _counters
+
+
+def start_product_counter_flusher(database, interval=COUNTER_FLUSH_SECONDS):
+    """ 증감값을 interval 초마다 반영하는 스레드를 시작한다. (interval 이 0 이면 시작하지 않는다)
+
+        시작하지 않으면 증감값은 메모리에만 쌓이고 데이터베이스에 반영되지 않는다. (스크립트, 테스트용)
+    """
+
+    if interval > 0:
+        _counters.start(database, interval)
@@ -1,21 +1,61 @@
 from model import ProductListDao
+from service.store.bookmark_annotator import annotate_bookmarks
+from service.store.product_counter import get_product_counters
+from service.store.product_search_engine import get_product_search_engine
+from utils.cache import get_cache
+from utils.custom_exceptions import ProductNotExist
+from utils.image_variants import select_image_variants
+from utils.response_cache import invalidate_response_tags
+from utils.search_index import normalize
+
+PRODUCT_DETAIL_CACHE_NAME = 'product_detail'
+PRODUCT_DETAIL_CACHE_TTL = 30
+PRODUCT_DETAIL_CACHE_SIZE = 5000
+
+# 검색 결과 캐시는 항목 개수가 아닌 결과에 담긴 상품 수의 합으로 크기를 제한한다.
+PRODUCT_SEARCH_CACHE_NAME = 'product_search'
+PRODUCT_SEARCH_CACHE_TTL = 30
+PRODUCT_SEARCH_CACHE_SIZE = 50000
 
 
 class ProductListService:
     """ Business Layer
 
         Attributes:
-            product_dao : ProductListDao 클래스
+            product_dao          : ProductListDao 클래스
+            product_detail_cache : 상품 아이디 별 계정과 상관없는 상품 상세정보 캐시
+            search_engine        : 상품 검색 엔진 (프로세스에서 하나)
+            product_search_cache : (검색어, 정렬, 개수, 커서, 색인 버전) 별 검색 결과 캐시
+            counters             : 반영 전 북마크 수, 판매량 증감값 (프로세스에서 하나)
 
         Author: 김민구
 
         History:
             2020-12-30(김민구): 초기 생성
             2020-12-31(김민구): 수정 (product_dao를 import 해서 사용하는 방법으로 수정)
+            2026-10-18(agent): 상품 상세정보 캐시 추가
+            2026-10-18(agent): 상품 검색을 검색 엔진으로 변경
+            2026-10-18(agent): 검색 결과 캐시, 자동완성 추가
+            2026-10-18(agent): 반영 전 북마크 수, 판매량을 조회 결과에 더하도록 수정
+            2026-10-18(agent): 상품 리스트, 검색 결과에 로그인한 계정의 북마크 여부 추가
     """
 
     def __init__(self):
         self.product_dao = ProductListDao()
+        self.product_detail_cache = get_cache(
+            PRODUCT_DETAIL_CACHE_NAME,
+            maxsize=PRODUCT_DETAIL_CACHE_SIZE,
+            ttl=PRODUCT_DETAIL_CACHE_TTL
+        )
+        self.search_engine = get_product_search_engine()
+        self.product_search_cache = get_cache(
+            PRODUCT_SEARCH_CACHE_NAME,
+            maxsize=PRODUCT_SEARCH_CACHE_SIZE,
+            ttl=PRODUCT_SEARCH_CACHE_TTL,
+            getsizeof=lambda value: len(value['result']) + 1
+        )
+        self.counters = get_product_counters()
+        self.counters.add_flush_listener(self._on_counters_flushed)
 
     def product_list_logic(self, connection, data):
         """ 상품 리스트와 이벤트 배너 조회
@@ -42,7 +82,8 @@ class ProductListService:
                             'origin_price': 10000.0,
                             'discount_rate': 0.1,
                             'discounted_price': 9000.0,
-                            'sales_count': 30
+                            'sales_count': 30,
+                            'is_bookmarked': 0
                         },
                 ]
 
@@ -52,6 +93,8 @@ class ProductListService:
             History:
                 2020-12-30(김민구): 초기 생성
                 2020-12-31(김민구): 에러 문구 변경 / 이벤트에 해당하는 상품리스트를 반환하는 작업으로 수정
+                2026-10-18(agent): 로그인한 계정의 북마크 여부(is_bookmarked) 추가
+                2026-10-18(agent): 요청한 크기의 대표 이미지 축소본 경로로 변경
         """
 
         event = self.product_dao.get_event(connection, data)
@@ -61,6 +104,8 @@ class ProductListService:
 
         data['event_id'] = event['event_id']
         product_list = self.product_dao.get_product_list(connection, data)
+        product_list = annotate_bookmarks(connection, data.get('account_id'), self.counters.overlay(product_list))
+        product_list = select_image_variants(product_list, data.get('image_size'), data.get('image_format'))
         return {'event': event, 'product_list': product_list}
     
     def product_search_service(self, connection, data):
@@ -68,28 +113,78 @@ class ProductListService:
 
             Args:
                 connection: 데이터베이스 연결 객체
-                data      : 쿼리스트링이 담긴 변수
+                data      : 쿼리스트링이 담긴 변수 ( search, limit, sort_type, cursor, account_id )
 
             Author: 김기용
 
             Returns: {
-                        "bookmark_count": 0,
-                        "discounted_price": 9000.0,
-                        "image": "https://img.freepik.com",
-                        "name": "성보의하루999",
-                        "origin_price": 10000.0,
-                        "product_id": 999,
-                        "sales_count": 32,
-                        "seller_id": 4,
-                        "seller_name": "나는셀러4"
-                        }
-            Raises: None
+                        "result": [
+                            {
+                                "bookmark_count": 0,
+                                "discounted_price": 9000.0,
+                                "image": "https://img.freepik.com",
+                                "product_name": "성보의하루999",
+                                "origin_price": 10000.0,
+                                "product_id": 999,
+                                "sales_count": 32,
+                                "seller_id": 4,
+                                "seller_name": "나는셀러4",
+                                "is_bookmarked": 0
+                            }
+                        ],
+                        "next_cursor": "WzMyLDk5OV0"
+                    }
+
+            Raises:
+                400, {'message': 'invalid_cursor', 'error_message': '잘못된 커서입니다.'} : 잘못된 커서
 
             History:
                 2020-12-31(김기용): 초기 생성
+                2026-10-18(agent): LIKE 검색을 검색 엔진(역색인)으로 변경, 커서 페이지네이션 추가
+                2026-10-18(agent): 검색 결과 캐시 추가
+                2026-10-18(agent): 반영 전 북마크 수, 판매량을 더하도록 수정
+                2026-10-18(agent): 로그인한 계정의 북마크 여부(is_bookmarked) 추가
+                2026-10-18(agent): 요청한 크기의 대표 이미지 축소본 경로로 변경
+
+            Notes:
+                색인을 먼저 갱신한 뒤 색인 버전을 캐시 키에 넣으므로 상품이 추가되면 새 결과를 조회한다.
+                가격 등 색인에 없는 값은 최대 PRODUCT_SEARCH_CACHE_TTL 초 동안 이전 값이 내려갈 수 있다.
+                북마크 수, 판매량은 반영되면 색인을 갱신하므로(_on_counters_flushed) 캐시된 이전 값이 내려가지 않는다.
 
         """
-        return self.product_dao.get_search_products_dao(connection, data)
+        self.search_engine.refresh(connection)
+        cache_key = (
+            normalize(data['search']),
+            data['sort_type'],
+            data['limit'],
+            data.get('cursor'),
+            self.search_engine.version
+        )
+        result = self.product_search_cache.get_or_load(
+            cache_key,
+            lambda: self.search_engine.search(connection, data)
+        )
+        products = annotate_bookmarks(connection, data.get('account_id'), self.counters.overlay(result['result']))
+        products = select_image_variants(products, data.get('image_size'), data.get('image_format'))
+        return dict(result, result=products)
+
+    def product_autocomplete_service(self, connection, data):
+        """ 상품 검색어 자동완성 서비스
+
+            Args:
+                connection: 데이터베이스 연결 객체 (색인을 갱신할 때만 사용)
+                data      : 쿼리스트링이 담긴 변수 ( q, limit )
+
+            Author: agent
+
+            Returns: ['성보의 하루', '성보의 하루2', '성보셀러']
+
+            Raises: None
+
+            History:
+                2026-10-18(agent): 초기 생성
+        """
+        return self.search_engine.autocomplete(connection, data)
     
     def product_detail_service(self, connection, data):
         """ 상품상세정보 조회 서비스
@@ -102,22 +197,51 @@ class ProductListService:
 
             Returns: 상제 제품 정보
             Raises: 
+                400, {'message': 'product does not exist', 'error_message': '해당 상품이 존재하지 않습니다.'} : 상품 없음
 
             History:
                 2020-12-31(김기용): 초기 생성
                 2020-01-05(김기용): 누락된여러개의 size 와 color 값을 추가
+                2026-10-18(agent): 상세정보를 한번의 쿼리로 조회하고 상품 아이디 별로 캐싱,
+                                   요청마다 북마크 여부만 조회하도록 수정
+                2026-10-18(agent): 반영 전 북마크 수, 판매량을 더하도록 수정
+
+            Notes:
+                캐시에는 계정과 상관없는 정보만 담고 is_bookmarked 는 요청마다 조회한다.
+                북마크 수, 판매량이 반영되면 캐시를 지우므로(_on_counters_flushed) 반영 전 증감값만 더하면 된다.
         """
         
         try:
-
-            images = self.product_dao.get_product_image_dao(connection, data)
-            sizes = self.product_dao.get_product_size_dao(connection, data)
-            colors = self.product_dao.get_product_color_dao(connection, data)
-            product = self.product_dao.get_product_detail_dao(connection, data)
-            product['colors'] = colors
-            product['sizes'] = sizes
-            product['images'] = images
+            cache_key = str(data['product_id'])
+            product = self.product_detail_cache.get_or_load(
+                cache_key,
+                lambda: self.product_dao.get_product_detail_bundle_dao(connection, data)
+            )
+
+            if not product:
+                self.product_detail_cache.delete(cache_key)
+                raise ProductNotExist('해당 상품이 존재하지 않습니다.')
+
+            # 캐시된 객체를 수정하지 않도록 복사해서 사용한다.
+            product = dict(self.counters.overlay_one(product))
+            product['is_bookmarked'] = 0
+            if 'account_id' in data:
+                product['is_bookmarked'] = self.product_dao.get_product_bookmarked_dao(connection, data)
             return product
 
         except KeyError:
             raise KeyError('키값이 일치 하지 않습니다.')
+
+    def invalidate_product_detail_cache(self, product_id):
+        """ 상품 수정 시 호출. 다른 레이어에서는 get_cache(PRODUCT_DETAIL_CACHE_NAME).delete(str(product_id)) 로 무효화 할 수 있다. """
+
+        self.product_detail_cache.delete(str(product_id))
+        invalidate_response_tags([('product', int(product_id))])
+
+    def _on_counters_flushed(self, field, product_ids):
+        """ 북마크 수, 판매량이 데이터베이스에 반영되면 이전 값이 캐시된 상세정보, 응답을 지우고 검색 색인을 갱신한다. """
+
+        self.product_detail_cache.delete_many([str(product_id) for product_id in product_ids])
+        invalidate_response_tags([('product', product_id) for product_id in product_ids])
+        for product_id in product_ids:
+            self.search_engine.mark_dirty(product_id)
@@ -0,0 +1,234 @@
+""" 상품 검색 엔진
+
+상품명, 셀러명으로 만든 프로세스 내 n-gram 역색인(utils.search_index)으로 상품을 검색하고
+sort_type(1: 추천순, 2: 판매순, 3: 최신순) 순서로 정렬해 커서 페이지네이션으로 내려준다.
+같은 문서들로 상품명, 셀러명 자동완성 트라이(판매량 가중치)도 함께 관리한다.
+
+색인 갱신 규칙:
+    1. 처음 검색할 때와 SEARCH_INDEX_REFRESH_SECONDS 가 지날 때마다 전체를 다시 색인한다.
+    2. 상품이 등록/수정되면 mark_dirty(product_id) 로 표시하고 다음 검색 때 해당 상품만 다시 색인한다.
+       (트랜잭션이 commit 된 뒤 반영되도록 utils.connection.on_commit 으로 등록한다.)
+    3. 색인이 바뀔 때마다 version 이 증가한다. 검색 결과 캐시는 version 을 키에 포함해서 오래된 결과를 쓰지 않는다.
+
+기본적인 사용 예시:
+    engine = get_product_search_engine()
+    engine.search(connection, {'search': '하루', 'limit': 30, 'sort_type': '2', 'cursor': None})
+    engine.autocomplete(connection, {'q': '성보', 'limit': 10})
+
+    on_commit(connection, lambda: get_product_search_engine().mark_dirty(product_id))
+"""
+import heapq
+import threading
+import time
+
+from model import ProductListDao
+from utils.cursor import encode_cursor, decode_cursor
+from utils.custom_exceptions import InvalidCursor
+from utils.search_index import InvertedIndex, PrefixTrie
+
+SEARCH_INDEX_REFRESH_SECONDS = 300
+AUTOCOMPLETE_TOP_K = 10
+
+SORT_FIELDS = {
+    '1': 'bookmark_count',
+    '2': 'sales_count',
+    '3': None
+}
+
+
+class ProductSearchEngine:
+    """ 상품 검색 색인과 정렬
+
+        Attributes:
+            product_dao      : ProductListDao 클래스
+            index            : 상품 검색 역색인
+            trie             : 상품명, 셀러명 자동완성 트라이
+            refresh_seconds  : 전체 재색인 주기(초)
+            loaded_at        : 마지막 전체 색인 시각
+            version          : 색인이 바뀔 때마다 1씩 증가
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+            2026-10-18(agent): 자동완성 트라이, 색인 버전, 통계 추가
+
+        Notes:
+            정렬에 사용하는 추천수, 판매량은 색인 시점의 값이다. (최대 refresh_seconds 동안 순서가 늦게 반영될 수 있다)
+            응답에 담기는 값은 매번 데이터베이스에서 조회한 값이다.
+    """
+
+    def __init__(self, refresh_seconds=SEARCH_INDEX_REFRESH_SECONDS):
+        self.product_dao = ProductListDao()
+        self.index = InvertedIndex()
+        self.trie = PrefixTrie(top_k=AUTOCOMPLETE_TOP_K)
+        self.refresh_seconds = refresh_seconds
+        self.loaded_at = None
+        self.version = 0
+        self._dirty = set()
+        self._dirty_lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._autocomplete_requests = 0
+        self._autocomplete_empty = 0
+
+    def mark_dirty(self, product_id):
+        with self._dirty_lock:
+            self._dirty.add(int(product_id))
+
+    def refresh(self, connection):
+        """ 필요하면 전체 또는 변경된 상품만 다시 색인한다. """
+
+        if self.loaded_at is None or time.monotonic() - self.loaded_at > self.refresh_seconds:
+            # 색인이 한번도 만들어지지 않았으면 기다리고, 이미 있으면 다른 요청이 재색인하는 동안 기존 색인을 사용한다.
+            if self._build_lock.acquire(blocking=self.loaded_at is None):
+                try:
+                    if self.loaded_at is None or time.monotonic() - self.loaded_at > self.refresh_seconds:
+                        self._rebuild(connection)
+                finally:
+                    self._build_lock.release()
+
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+
+        if dirty:
+            try:
+                rows = self.product_dao.get_search_documents_dao(connection, {'product_ids': dirty})
+            except Exception:
+                # 조회하지 못한 상품은 다음 요청에서 다시 색인한다.
+                with self._dirty_lock:
+                    self._dirty |= dirty
+                raise
+
+            with self._build_lock:
+                for row in rows:
+                    self._add_suggestions(self.trie, self.index.fields(row['product_id']), -1)
+                    fields = self._fields(row)
+                    self.index.add(row['product_id'], self._texts(row), fields)
+                    self._add_suggestions(self.trie, fields, 1)
+                for product_id in dirty - {row['product_id'] for row in rows}:
+                    self._add_suggestions(self.trie, self.index.fields(product_id), -1)
+                    self.index.remove(product_id)
+                self.version += 1
+
+    def search(self, connection, data):
+        """ 검색어에 해당하는 상품을 정렬해서 limit 개 반환한다.
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                data       : search, limit, sort_type, cursor(선택)
+
+            Returns:
+                {'result': 상품 리스트, 'next_cursor': 다음 페이지 커서 또는 None}
+
+            Raises:
+                400, {'message': 'invalid_cursor', 'error_message': '잘못된 커서입니다.'} : 잘못된 커서
+        """
+
+        self.refresh(connection)
+
+        sort_field = SORT_FIELDS[data['sort_type']]
+        sort_key = self._sort_key(sort_field)
+
+        product_ids = self.index.search(data['search'])
+
+        if data.get('cursor'):
+            after = decode_cursor(data['cursor'])
+            if len(after) != (2 if sort_field else 1) or not all(isinstance(value, int) for value in after):
+                raise InvalidCursor('잘못된 커서입니다.')
+            after = tuple(after)
+            product_ids = [product_id for product_id in product_ids if sort_key(product_id) < after]
+
+        ranked = heapq.nlargest(data['limit'] + 1, product_ids, key=sort_key)
+        page = ranked[:data['limit']]
+        next_cursor = encode_cursor(list(sort_key(page[-1]))) if len(ranked) > data['limit'] else None
+
+        if not page:
+            return {'result': [], 'next_cursor': None}
+
+        rows = self.product_dao.get_search_products_by_ids_dao(connection, {'product_ids': page})
+        rows_by_id = {row['product_id']: row for row in rows}
+        return {
+            'result': [rows_by_id[product_id] for product_id in page if product_id in rows_by_id],
+            'next_cursor': next_cursor
+        }
+
+    def autocomplete(self, connection, data):
+        """ 접두어로 시작하는 상품명, 셀러명을 판매량 순으로 limit 개 반환한다. """
+
+        self.refresh(connection)
+        suggestions = self.trie.suggest(data['q'], data['limit'])
+
+        with self._stats_lock:
+            self._autocomplete_requests += 1
+            self._autocomplete_empty += int(not suggestions)
+        return suggestions
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                'documents': len(self.index),
+                'tokens': len(self.index.postings),
+                'version': self.version,
+                'autocomplete_requests': self._autocomplete_requests,
+                'autocomplete_empty': self._autocomplete_empty
+            }
+
+    def _rebuild(self, connection):
+        rows = self.product_dao.get_search_documents_dao(connection, dict())
+        documents = [(row['product_id'], self._texts(row), self._fields(row)) for row in rows]
+
+        trie = PrefixTrie(top_k=AUTOCOMPLETE_TOP_K)
+        for product_id, texts, fields in documents:
+            self._add_suggestions(trie, fields, 1)
+
+        self.index.replace_all(documents)
+        self.trie = trie
+        self.version += 1
+        self.loaded_at = time.monotonic()
+
+    def _sort_key(self, sort_field):
+        if sort_field is None:
+            return lambda product_id: (product_id,)
+
+        def sort_key(product_id):
+            fields = self.index.fields(product_id) or dict()
+            return fields.get(sort_field) or 0, product_id
+        return sort_key
+
+    @staticmethod
+    def _texts(row):
+        return [row['product_name'], row['seller_name']]
+
+    @staticmethod
+    def _fields(row):
+        return {
+            'bookmark_count': row['bookmark_count'],
+            'sales_count': row['sales_count'],
+            'names': (row['product_name'], row['seller_name'])
+        }
+
+    @staticmethod
+    def _add_suggestions(trie, fields, sign):
+        """ 상품 하나가 자동완성 가중치에 기여하는 만큼(판매량 + 1) 더하거나(sign=1) 뺀다(sign=-1). """
+
+        if not fields:
+            return
+
+        weight = (fields['sales_count'] or 0) + 1
+        for name in fields['names']:
+            trie.add(name, sign * weight, name)
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_product_search_engine():
+    """ 프로세스에서 하나만 사용하는 상품 검색 엔진을 반환한다. """
+
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = ProductSearchEngine()
+        return _engine
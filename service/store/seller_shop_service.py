@@ -1,5 +1,9 @@
 import traceback
 
+from service.store.bookmark_annotator import annotate_bookmarks
+from utils.cursor import paginate
+from utils.image_variants import select_image_variants
+
 
 class SellerShopService:
     """ Business Layer
@@ -11,6 +15,7 @@ class SellerShopService:
 
         History:
             2021-01-01(고수희): 초기 생성
+            2026-10-18(agent): 상품 리스트에 로그인한 계정의 북마크 여부 추가
     """
 
     def __init__(self, seller_shop_dao):
@@ -67,10 +72,14 @@ class SellerShopService:
 
         History:
             2021-01-02(고수희): 초기 생성
+            2026-10-18(agent): 로그인한 계정의 북마크 여부(is_bookmarked) 추가
+            2026-10-18(agent): 요청한 크기의 대표 이미지 축소본 경로로 변경
         """
         try:
             # 셀러 상품 검색
-            return self.seller_shop_dao.get_seller_product_search_dao(connection, data)
+            product_list = self.seller_shop_dao.get_seller_product_search_dao(connection, data)
+            product_list = annotate_bookmarks(connection, data.get('account_id'), product_list)
+            return select_image_variants(product_list, data.get('image_size'), data.get('image_format'))
 
         except KeyError:
             traceback.print_exc()
@@ -122,20 +131,35 @@ class SellerShopService:
         Author: 고수희
 
         Returns:
-            return (): 조회한 상품 정보 리스트 출력
+            {'product_list': 조회한 상품 정보 리스트, 'next_cursor': 다음 페이지 커서(마지막 페이지면 None)}
 
         Raises:
             400, {'message': 'key error',
             'errorMessage': 'key_error'} : 잘못 입력된 키값
+            400, {'message': 'invalid_cursor',
+            'error_message': '잘못된 커서입니다.'} : 잘못된 커서
             500, {'message': 'server error',
             'errorMessage': 'server_error'}': 서버 에러
 
         History:
             2021-01-02(고수희): 초기 생성
+            2026-10-18(agent): 커서 페이지네이션 추가
+            2026-10-18(agent): 로그인한 계정의 북마크 여부(is_bookmarked) 추가
+            2026-10-18(agent): 요청한 크기의 대표 이미지 축소본 경로로 변경
         """
         try:
             # 셀러 상품 조회
-            return self.seller_shop_dao.get_seller_product_list_dao(connection, data)
+            product_list = self.seller_shop_dao.get_seller_product_list_dao(connection, data)
+
+            # 상품이 없는 경우 안내 문구를 그대로 반환
+            if isinstance(product_list, str):
+                return {'product_list': product_list, 'next_cursor': None}
+
+            keys = ['product_id'] if data['type'] == "latest" else ['product_sales_count', 'product_id']
+            product_list, next_cursor = paginate(product_list, data['limit'], keys)
+            product_list = annotate_bookmarks(connection, data.get('account_id'), product_list)
+            product_list = select_image_variants(product_list, data.get('image_size'), data.get('image_format'))
+            return {'product_list': product_list, 'next_cursor': next_cursor}
 
         except KeyError:
             traceback.print_exc()
@@ -0,0 +1,148 @@
+""" 결제 시 재고 차감
+
+재고 확인(SELECT)과 차감(UPDATE)을 따로 하면 동시에 들어온 주문이 같은 재고를 보고 모두 통과해서 초과 판매된다.
+재고가 충분할 때만 차감하는 UPDATE 한 문장으로 확인과 차감을 함께 처리한다.
+
+처리 규칙:
+    1. 같은 재고는 수량을 합치고, 여러 재고는 stock_id 순서로 한 문장에서 차감한다.
+       (모든 주문이 같은 순서로 행 락을 잡으므로 여러 상품을 주문해도 서로 데드락이 생기지 않는다)
+    2. 차감된 행 수가 재고 수보다 적으면 없는 재고인지, 재고 부족인지 확인해서 에러를 낸다.
+       (에러 응답이면 요청 트랜잭션이 롤백되므로 먼저 차감된 재고도 원래대로 돌아간다)
+    3. 락 대기 시간 초과는 문장만 롤백되므로 LOCK_RETRIES 번까지 다시 시도한다.
+       데드락은 트랜잭션 전체가 롤백되므로 다시 시도하지 않고 409 를 반환한다.
+    4. 재고 행 락은 commit 할 때까지 유지되므로 서비스는 차감을 트랜잭션의 마지막 쓰기로 실행한다.
+
+시도 횟수, 재고 부족, 재시도, 데드락, 차감 문장 소요 시간을 집계하며 /admin/stats 에서 확인할 수 있다.
+
+기본적인 사용 예시:
+    get_stock_reservation().reserve(connection, [{'stock_id': 3, 'quantity': 2}])
+"""
+import threading
+import time
+
+from model import StoreOrderDao
+from utils.custom_exceptions import (
+    CheckoutDenied,
+    NotEnoughProduct,
+    ProductNotExist,
+    StockLockTimeout,
+    StockReservationConflict
+)
+
+LOCK_RETRIES = 2
+LOCK_RETRY_WAIT_SECONDS = 0.05
+
+
+class StockReservation:
+    """ 조건부 재고 차감과 경합 통계
+
+        Attributes:
+            store_order_dao : StoreOrderDao 클래스
+            lock_retries    : 락 대기 시간 초과 시 재시도 횟수
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self, lock_retries=LOCK_RETRIES):
+        self.store_order_dao = StoreOrderDao()
+        self.lock_retries = lock_retries
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'stocks': 0,
+            'reserved': 0,
+            'not_enough': 0,
+            'not_exist': 0,
+            'lock_wait_retries': 0,
+            'lock_wait_failures': 0,
+            'deadlocks': 0,
+            'update_seconds': 0.0,
+            'max_update_seconds': 0.0
+        }
+
+    def reserve(self, connection, items):
+        """ 주문 수량만큼 재고를 차감한다.
+
+            Args:
+                connection : 데이터베이스 연결 객체
+                items      : [{'stock_id': 3, 'quantity': 2}, ...]
+
+            Raises:
+                400, {'message': 'unable_to_checkout', 'errorMessage': 'unable_to_checkout'} : 주문 수량이 0 이하
+                400, {'message': 'product does not exist', 'errorMessage': 'product_does_not_exist'} : 없는 재고
+                400, {'message': 'Not Enough Product', 'errorMessage': 'Not as many in stock as quantity'} : 재고 부족
+                409, {'message': 'stock lock timeout', 'errorMessage': 'lock_wait_timeout'} : 재시도 후에도 락 대기 시간 초과
+                409, {'message': 'stock reservation conflict', 'errorMessage': 'deadlock'} : 데드락
+        """
+
+        quantities = dict()
+        for item in items:
+            if item['quantity'] <= 0:
+                raise CheckoutDenied('unable_to_checkout')
+            quantities[item['stock_id']] = quantities.get(item['stock_id'], 0) + item['quantity']
+        items = [{'stock_id': stock_id, 'quantity': quantities[stock_id]} for stock_id in sorted(quantities)]
+
+        self._count('requests')
+        self._count('stocks', len(items))
+
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            try:
+                reserved = self.store_order_dao.reserve_stocks_dao(connection, items)
+                self._record_time(time.monotonic() - started)
+                break
+            except StockLockTimeout:
+                self._record_time(time.monotonic() - started)
+                if attempt >= self.lock_retries:
+                    self._count('lock_wait_failures')
+                    raise
+                attempt += 1
+                self._count('lock_wait_retries')
+                time.sleep(LOCK_RETRY_WAIT_SECONDS * attempt)
+            except StockReservationConflict:
+                self._record_time(time.monotonic() - started)
+                self._count('deadlocks')
+                raise
+
+        if reserved == len(items):
+            self._count('reserved')
+            return
+
+        stocks = self.store_order_dao.get_stocks_remain_dao(connection, list(quantities))
+        if len(stocks) < len(items):
+            self._count('not_exist')
+            raise ProductNotExist('product_does_not_exist')
+
+        self._count('not_enough')
+        raise NotEnoughProduct('Not as many in stock as quantity')
+
+    def stats(self):
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _count(self, name, value=1):
+        with self._stats_lock:
+            self._stats[name] += value
+
+    def _record_time(self, seconds):
+        with self._stats_lock:
+            self._stats['update_seconds'] += seconds
+            self._stats['max_update_seconds'] = max(self._stats['max_update_seconds'], seconds)
+
+
+_reservation = None
+_reservation_lock = threading.Lock()
+
+
+def get_stock_reservation():
+    """ 프로세스에서 하나만 사용하는 재고 차감 객체를 반환한다. """
+
+    global _reservation
+    with _reservation_lock:
+        if _reservation is None:
+            _reservation = StockReservation()
+        return _reservation
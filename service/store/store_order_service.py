@@ -1,5 +1,15 @@
 import traceback
-from utils.custom_exceptions import CustomerPermissionDenied, CheckoutDenied
+
+from service.store.cart_item_service import CART_SUMMARY_CACHE_NAME
+from service.store.outbox_worker import enqueue_jobs
+from service.store.product_counter import get_product_counters, SALES_COUNT
+from service.store.stock_reservation import get_stock_reservation
+from utils.cache import get_cache
+from utils.connection import on_commit
+from utils.custom_exceptions import CustomerPermissionDenied, CheckoutDenied, CartItemNotExist
+
+# 장바구니 결제 한번에 주문할 수 있는 최대 상품 수
+MAX_CHECKOUT_ITEMS = 50
 
 
 class StoreOrderService:
@@ -12,6 +22,11 @@ class StoreOrderService:
 
         History:
             2020-12-30(고수희): 초기 생성
+            2026-10-18(agent): 재고 확인과 차감을 조건부 차감 한번으로 변경
+            2026-10-18(agent): 장바구니 여러 상품 결제 추가
+            2026-10-18(agent): 응답과 상관없는 후속 쓰기를 outbox 작업으로 분리
+            2026-10-18(agent): 결제 commit 후 장바구니 요약 캐시 무효화
+            2026-10-18(agent): 결제 commit 후 상품 판매량 증가
     """
 
     def __init__(self, store_order_dao):
@@ -81,17 +96,24 @@ class StoreOrderService:
             'errorMessage': 'unable_to_create'} : 주문 상품 추가 실패
             400, {'message': 'order history create denied',
             'errorMessage': 'unable_to_create'} : 주문 상품 정보 이력 추가 실패
-            400, {'message': 'product remain update denied',
-            'errorMessage': 'unable_to_update'} : 상품 재고 업데이트 실패
+            400, {'message': 'Not Enough Product',
+            'errorMessage': 'Not as many in stock as quantity'} : 재고 부족
             400, {'message': 'invalid_delete_command_access',
             'errorMessage': 'unable_to_delete'} : 논리삭제 실패
             403, {'message': 'customer permissions denied',
             'errorMessage': 'customer_permission_denied'} : 사용자 권한이 없음
+            409, {'message': 'stock lock timeout',
+            'errorMessage': 'lock_wait_timeout'} : 재고 행 락 대기 시간 초과
+            409, {'message': 'stock reservation conflict',
+            'errorMessage': 'deadlock'} : 재고 차감 중 데드락
             500, {'message: server_error',
             'errorMessage': 'server_error'} :서버 에러 발생
 
         History:
             2020-12-30(고수희): 초기 생성
+            2026-10-18(agent): 재고 확인(SELECT) 후 차감하던 것을 재고가 충분할 때만 차감하는 UPDATE 로 변경
+            2026-10-18(agent): 주문 상품 이력, 주문자 정보를 outbox 작업으로 분리
+            2026-10-18(agent): 결제 commit 후 상품 판매량 증가
         """
 
         try:
@@ -103,9 +125,6 @@ class StoreOrderService:
             if data['sold_out'] is True:
                 raise CheckoutDenied('unable_to_checkout')
 
-            # 상품 품절 여부 체크
-            self.store_order_dao.order_product_soldout_dao(connection, data)
-
             # 배송 정보 추가 (배송 메모가 직접 입력일 경우)
             if data['delivery_memo_type_id'] == 5:
                 custom_memo = self.store_order_dao.post_delivery_type_dao(connection, data)
@@ -120,17 +139,155 @@ class StoreOrderService:
             order_item = self.store_order_dao.post_store_order_item_dao(connection, data)
             data['order_item_id'] = order_item
 
-            # 주문 상품 정보 이력 추가
-            self.store_order_dao.post_store_order_item_history_dao(connection, data)
+            # 장바구니 상품 논리 삭제 처리 (같은 장바구니의 중복 결제를 막으므로 요청 안에서 처리)
+            self.store_order_dao.patch_is_delete_cart_item_dao(connection, data)
 
-            # 주문한 상품 수량 만큼 재고 감소 처리
-            self.store_order_dao.patch_product_remain_dao(connection, data)
+            # 주문 상품 정보 이력 추가, 주문자 정보 추가/수정은 commit 후 outbox 워커가 처리
+            enqueue_jobs(connection, [
+                {
+                    'account_id': data['user_id'],
+                    'job_type': 'order_item_history',
+                    'payload': {
+                        'order_item_id': order_item,
+                        'order_item_status_type_id': data['order_item_status_type_id'],
+                        'user_id': data['user_id']
+                    }
+                },
+                self._customer_information_job(data)
+            ])
+
+            # 재고가 충분할 때만 주문한 상품 수량 만큼 재고 감소 (품절, 재고 부족이면 에러 후 전체 롤백)
+            # 재고 행 락은 commit 까지 유지되므로 마지막 쓰기로 실행해서 락을 잡는 시간을 줄인다.
+            get_stock_reservation().reserve(connection, [
+                {'stock_id': data['stock_id'], 'quantity': data['quantity']}
+            ])
+
+            # 장바구니 요약 캐시 무효화
+            self._invalidate_cart_summary(connection, data)
+
+            # 상품 판매량 증가 (commit 후 카운터에 모아서 반영)
+            self._count_sales(connection, [data])
 
-            # 장바구니 상품 논리 삭제 처리
-            self.store_order_dao.patch_is_delete_cart_item_dao(connection, data)
+            return order
+
+        except CustomerPermissionDenied as e:
+            traceback.print_exc()
+            raise e
+
+        except KeyError:
+            traceback.print_exc()
+            raise KeyError('key_error')
 
-            # 주문자 정보가 없으면 주문자 정보 추가, 있으면 수정
-            self.store_order_dao.patch_customer_information_dao(connection, data)
+    def post_cart_order_service(self, connection, data):
+        """ POST 메소드: 장바구니 여러 상품 결제
+
+        장바구니 상품 N 개를 주문 하나로 결제한다.
+        주문 상품, 이력, 장바구니 삭제, 재고 차감을 모두 일괄 처리하므로 상품 수와 상관없이 쿼리 수가 일정하다.
+        가격은 장바구니에 담긴 값으로 계산한다.
+
+        Args:
+            connection: 데이터베이스 연결 객체
+            data      : View 에서 넘겨받은 dict 객체 (cart_ids, 주문자/배송지 정보)
+
+        Author: agent
+
+        Returns:
+            return (): 추가완료 된 order_id 반환
+
+        Raises:
+            400, {'message': 'key error',
+            'errorMessage': 'key_error'} : 잘못 입력된 키값
+            400, {'message': 'unable_to_checkout',
+            'errorMessage': 'unable_to_checkout'} : 장바구니 아이디가 없거나 너무 많음
+            400, {'message': 'cart items not exist',
+            'errorMessage': 'cart_item_does_not_exist'} : 결제할 수 없는 장바구니 상품이 있음
+            400, {'message': 'order item create denied',
+            'errorMessage': 'unable_to_create'} : 주문 상품 추가 실패
+            400, {'message': 'Not Enough Product',
+            'errorMessage': 'Not as many in stock as quantity'} : 재고 부족
+            400, {'message': 'invalid_delete_command_access',
+            'errorMessage': 'unable_to_delete'} : 이미 결제된 장바구니 상품이 있음
+            403, {'message': 'customer permissions denied',
+            'errorMessage': 'customer_permission_denied'} : 사용자 권한이 없음
+            409, {'message': 'stock lock timeout',
+            'errorMessage': 'lock_wait_timeout'} : 재고 행 락 대기 시간 초과
+            500, {'message: server_error',
+            'errorMessage': 'server_error'} :서버 에러 발생
+
+        History:
+            2026-10-18(agent): 초기 생성
+            2026-10-18(agent): 주문 상품 이력, 주문자 정보를 outbox 작업으로 분리
+            2026-10-18(agent): 결제 commit 후 상품 판매량 증가
+        """
+
+        try:
+            # 사용자 권한 체크
+            if data['user_permission'] != 3:
+                raise CustomerPermissionDenied('customer_permission_denied')
+
+            # 장바구니 아이디 체크 (중복 제거)
+            cart_ids = data['cart_ids']
+            if (not cart_ids or len(cart_ids) > MAX_CHECKOUT_ITEMS
+                    or not all(isinstance(cart_id, int) and not isinstance(cart_id, bool) for cart_id in cart_ids)):
+                raise CheckoutDenied('unable_to_checkout')
+            data['cart_ids'] = sorted(set(cart_ids))
+
+            # 결제할 장바구니 상품 조회 (다른 사용자의 상품이거나 이미 결제된 상품이 있으면 에러)
+            items = self.store_order_dao.get_checkout_cart_items_dao(connection, data)
+            if len(items) != len(data['cart_ids']):
+                raise CartItemNotExist('cart_item_does_not_exist')
+
+            # 총 가격 계산, 할인가가 있으면 할인가가 상품 가격이 됨 (상품 가격 * 수량의 합)
+            data['total_price'] = sum(
+                (item['discounted_price'] if item['discounted_price'] > 0 else item['original_price'])
+                * int(item['quantity'])
+                for item in items
+            )
+
+            # 배송 정보 추가 (배송 메모가 직접 입력일 경우)
+            if data['delivery_memo_type_id'] == 5:
+                data['delivery_memo_type_id'] = self.store_order_dao.post_delivery_type_dao(connection, data)
+
+            # 주문 정보 추가 (주문자 정보, 배송지 정보, 기타 배송 정보)
+            order = self.store_order_dao.post_store_order_dao(connection, data)
+            data['order_id'] = order
+            data['order_item_status_type_id'] = 1
+
+            # 주문 상세 번호: B + 주문번호 앞부분 + 주문 상품 순번 3자리
+            order_number = self.store_order_dao.get_store_order_dao(connection, data)['order_number']
+            for index, item in enumerate(items, 1):
+                item['order_detail_number'] = 'B{}{:03d}'.format(order_number[:-3], index)
+
+            # 주문 상품 일괄 추가
+            self.store_order_dao.post_store_order_items_dao(connection, data, items)
+
+            # 장바구니 상품 일괄 논리 삭제 처리 (같은 장바구니의 중복 결제를 막으므로 요청 안에서 처리)
+            self.store_order_dao.patch_is_delete_cart_items_dao(connection, data)
+
+            # 주문 상품 정보 이력 일괄 추가, 주문자 정보 추가/수정은 commit 후 outbox 워커가 처리
+            enqueue_jobs(connection, [
+                {
+                    'account_id': data['user_id'],
+                    'job_type': 'order_items_history',
+                    'payload': {
+                        'order_id': order,
+                        'order_item_status_type_id': data['order_item_status_type_id'],
+                        'user_id': data['user_id']
+                    }
+                },
+                self._customer_information_job(data)
+            ])
+
+            # 재고가 충분할 때만 모든 재고를 한번에 차감 (마지막 쓰기로 실행해서 재고 행 락을 잡는 시간을 줄인다)
+            get_stock_reservation().reserve(connection, [
+                {'stock_id': item['stock_id'], 'quantity': int(item['quantity'])} for item in items
+            ])
+
+            # 장바구니 요약 캐시 무효화
+            self._invalidate_cart_summary(connection, data)
+
+            # 상품 판매량 증가 (commit 후 카운터에 모아서 반영)
+            self._count_sales(connection, items)
 
             return order
 
@@ -141,3 +298,34 @@ class StoreOrderService:
         except KeyError:
             traceback.print_exc()
             raise KeyError('key_error')
+
+    @staticmethod
+    def _invalidate_cart_summary(connection, data):
+        user_id = data['user_id']
+        on_commit(connection, lambda: get_cache(CART_SUMMARY_CACHE_NAME).delete(user_id))
+
+    @staticmethod
+    def _count_sales(connection, items):
+        sales = [(item['product_id'], int(item['quantity'])) for item in items]
+
+        def add_sales():
+            counters = get_product_counters()
+            for product_id, quantity in sales:
+                counters.add(SALES_COUNT, product_id, quantity)
+
+        on_commit(connection, add_sales)
+
+    @staticmethod
+    def _customer_information_job(data):
+        """ 주문자 정보 추가/수정 outbox 작업 """
+
+        return {
+            'account_id': data['user_id'],
+            'job_type': 'customer_information',
+            'payload': {
+                'user_id': data['user_id'],
+                'sender_name': data['sender_name'],
+                'sender_email': data['sender_email'],
+                'sender_phone': data['sender_phone']
+            }
+        }
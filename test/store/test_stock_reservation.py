@@ -0,0 +1,149 @@
+from unittest import mock, TestCase
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+import pymysql
+
+from model import StoreOrderDao
+from service.store.stock_reservation import StockReservation
+from utils.custom_exceptions import (
+    CheckoutDenied,
+    NotEnoughProduct,
+    ProductNotExist,
+    StockLockTimeout,
+    StockReservationConflict
+)
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, sql, params):
+        self.connection.executed.append((sql, params))
+        if self.connection.error is not None:
+            raise self.connection.error
+        return self.connection.rowcount
+
+
+class FakeConnection:
+    def __init__(self, rowcount=0, error=None):
+        self.rowcount = rowcount
+        self.error = error
+        self.executed = []
+
+    def cursor(self, *args):
+        return FakeCursor(self)
+
+
+class TestReserveStocksDao(TestCase):
+    """ Test
+
+        Target: model/store/store_order_dao (reserve_stocks_dao)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def setUp(self):
+        self.dao = StoreOrderDao()
+
+    def test_single_case_update(self):
+        """ 여러 재고를 CASE 로 한 문장에서 차감하고, 재고가 충분한 행만 차감한다. """
+
+        connection = FakeConnection(rowcount=2)
+        items = [{'stock_id': 3, 'quantity': 2}, {'stock_id': 7, 'quantity': 1}]
+
+        self.assertEqual(self.dao.reserve_stocks_dao(connection, items), 2)
+        self.assertEqual(len(connection.executed), 1)
+
+        sql, params = connection.executed[0]
+        self.assertEqual(sql.count('CASE id WHEN %s THEN %s WHEN %s THEN %s END'), 2)
+        self.assertIn('WHERE id IN %s', sql)
+        self.assertIn('AND remain >=', sql)
+        self.assertIn('ORDER BY id', sql)
+        self.assertEqual(params, [3, 2, 7, 1, [3, 7], 3, 2, 7, 1])
+
+    def test_lock_errors(self):
+        connection = FakeConnection(error=pymysql.err.OperationalError(1205, 'Lock wait timeout exceeded'))
+        with self.assertRaises(StockLockTimeout):
+            self.dao.reserve_stocks_dao(connection, [{'stock_id': 1, 'quantity': 1}])
+
+        connection = FakeConnection(error=pymysql.err.OperationalError(1213, 'Deadlock found'))
+        with self.assertRaises(StockReservationConflict):
+            self.dao.reserve_stocks_dao(connection, [{'stock_id': 1, 'quantity': 1}])
+
+
+class TestStockReservation(TestCase):
+    """ Test
+
+        Target: service/store/stock_reservation
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def setUp(self):
+        self.reservation = StockReservation(lock_retries=1)
+        self.dao = mock.Mock()
+        self.reservation.store_order_dao = self.dao
+
+    def test_merges_and_sorts_items(self):
+        self.dao.reserve_stocks_dao.return_value = 2
+
+        self.reservation.reserve('connection', [
+            {'stock_id': 7, 'quantity': 1},
+            {'stock_id': 3, 'quantity': 2},
+            {'stock_id': 7, 'quantity': 4}
+        ])
+
+        self.dao.reserve_stocks_dao.assert_called_once_with('connection', [
+            {'stock_id': 3, 'quantity': 2},
+            {'stock_id': 7, 'quantity': 5}
+        ])
+        self.dao.get_stocks_remain_dao.assert_not_called()
+        self.assertEqual(self.reservation.stats()['reserved'], 1)
+
+    def test_rejects_non_positive_quantity(self):
+        with self.assertRaises(CheckoutDenied):
+            self.reservation.reserve('connection', [{'stock_id': 3, 'quantity': 0}])
+        self.dao.reserve_stocks_dao.assert_not_called()
+
+    def test_not_enough_and_not_exist(self):
+        self.dao.reserve_stocks_dao.return_value = 1
+        self.dao.get_stocks_remain_dao.return_value = [{'id': 3, 'remain': 5}, {'id': 7, 'remain': 0}]
+        with self.assertRaises(NotEnoughProduct):
+            self.reservation.reserve('connection', [{'stock_id': 3, 'quantity': 1}, {'stock_id': 7, 'quantity': 1}])
+
+        self.dao.get_stocks_remain_dao.return_value = [{'id': 3, 'remain': 5}]
+        with self.assertRaises(ProductNotExist):
+            self.reservation.reserve('connection', [{'stock_id': 3, 'quantity': 1}, {'stock_id': 7, 'quantity': 1}])
+
+    @mock.patch('service.store.stock_reservation.LOCK_RETRY_WAIT_SECONDS', 0)
+    def test_retries_lock_wait_timeout(self):
+        self.dao.reserve_stocks_dao.side_effect = [StockLockTimeout('lock_wait_timeout'), 1]
+        self.reservation.reserve('connection', [{'stock_id': 3, 'quantity': 1}])
+        self.assertEqual(self.dao.reserve_stocks_dao.call_count, 2)
+
+        self.dao.reserve_stocks_dao.side_effect = StockLockTimeout('lock_wait_timeout')
+        with self.assertRaises(StockLockTimeout):
+            self.reservation.reserve('connection', [{'stock_id': 3, 'quantity': 1}])
+        self.assertEqual(self.reservation.stats()['lock_wait_failures'], 1)
+
+    def test_deadlock_is_not_retried(self):
+        self.dao.reserve_stocks_dao.side_effect = StockReservationConflict('deadlock')
+        with self.assertRaises(StockReservationConflict):
+            self.reservation.reserve('connection', [{'stock_id': 3, 'quantity': 1}])
+        self.assertEqual(self.dao.reserve_stocks_dao.call_count, 1)
@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from utils.cursor import encode_cursor, decode_cursor, keyset_sql, paginate
+from utils.custom_exceptions import InvalidCursor
+
+
+class TestCursor(TestCase):
+    """ Test
+
+        Target: utils/cursor
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def test_round_trip(self):
+        cursor = encode_cursor([30, 1024, '2021-01-12 10:00:00'])
+        self.assertNotIn('=', cursor)
+        self.assertEqual(decode_cursor(cursor), [30, 1024, '2021-01-12 10:00:00'])
+
+    def test_decode_rejects_invalid_cursor(self):
+        for cursor in ['not-a-cursor!', encode_cursor({'id': 1})[:-2], encode_cursor({'id': 1})]:
+            with self.assertRaises(InvalidCursor):
+                decode_cursor(cursor)
+
+    def test_keyset_sql(self):
+        condition, params = keyset_sql(['sales_count', 'product.id'], encode_cursor([30, 10]))
+        self.assertEqual(
+            condition,
+            '((sales_count < %(cursor_0)s) OR (sales_count = %(cursor_0)s AND product.id < %(cursor_1)s))'
+        )
+        self.assertEqual(params, {'cursor_0': 30, 'cursor_1': 10})
+
+        condition, _ = keyset_sql(['id'], encode_cursor([10]), descending=False)
+        self.assertEqual(condition, '((id > %(cursor_0)s))')
+
+    def test_keyset_sql_rejects_wrong_length(self):
+        with self.assertRaises(InvalidCursor):
+            keyset_sql(['sales_count', 'product.id'], encode_cursor([10]))
+
+    def test_paginate(self):
+        rows = [{'product_id': product_id} for product_id in (5, 4, 3)]
+
+        page, next_cursor = paginate(rows, 2, ['product_id'])
+        self.assertEqual(page, rows[:2])
+        self.assertEqual(decode_cursor(next_cursor), [4])
+
+        page, next_cursor = paginate(rows, 3, ['product_id'])
+        self.assertEqual(page, rows)
+        self.assertIsNone(next_cursor)
@@ -0,0 +1,188 @@
+from io import BytesIO
+from unittest import mock, TestCase
+
+import sys
+import os
+import hashlib
+import shutil
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from config import S3_BUCKET_URL
+from service.admin.image_sweeper import ImageSweeper, content_origin
+from utils.amazon_s3 import GenerateFilePath, LocalFileStorage, UploadManager
+from utils.custom_exceptions import FileUploadFailException
+
+
+class TestLocalFileStorage(TestCase):
+    """ Test
+
+        Target: utils/amazon_s3 (LocalFileStorage, UploadManager)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.storage = LocalFileStorage(self.root)
+        self.manager = UploadManager(self.storage, workers=2)
+
+    def tearDown(self):
+        self.manager.executor.shutdown()
+        shutil.rmtree(self.root)
+
+    def test_content_key(self):
+        digest = hashlib.sha256(b'image').hexdigest()
+
+        self.assertEqual(
+            GenerateFilePath().generate_content_key(3, b'image', '.jpg'),
+            'productImages/{}/{}.jpg'.format(digest[:2], digest)
+        )
+        self.assertEqual(
+            GenerateFilePath().generate_content_key(4, b'image'),
+            'events/banners/{}/{}'.format(digest[:2], digest)
+        )
+
+    def test_upload_exists_delete(self):
+        self.storage.upload(BytesIO(b'image'), 'productImages/ab/abc')
+
+        self.assertTrue(self.storage.exists('productImages/ab/abc'))
+        with open(os.path.join(self.root, 'productImages', 'ab', 'abc'), 'rb') as file:
+            self.assertEqual(file.read(), b'image')
+        self.assertEqual(os.listdir(os.path.join(self.root, 'productImages', 'ab')), ['abc'])
+
+        self.storage.delete_many(['productImages/ab/abc', 'productImages/ab/missing'])
+        self.assertFalse(self.storage.exists('productImages/ab/abc'))
+
+    def test_rejects_keys_outside_root(self):
+        for key in ['../outside', 'productImages/../../outside', '/etc/passwd']:
+            with self.assertRaises(ValueError):
+                self.storage.path(key)
+
+    def test_touch_list_keys_modified_at(self):
+        self.storage.upload(BytesIO(b'a'), 'productImages/ab/a')
+        self.storage.upload(BytesIO(b'b'), 'productImages/cd/b')
+        os.utime(self.storage.path('productImages/ab/a'), (1000, 1000))
+        open(os.path.join(self.root, 'productImages', 'cd', '.upload-tmp'), 'wb').close()
+
+        self.assertEqual([key for key, _ in self.storage.list_keys('productImages/')], ['productImages/ab/a', 'productImages/cd/b'])
+        self.assertEqual(self.storage.modified_at('productImages/ab/a'), 1000)
+        self.assertIsNone(self.storage.modified_at('productImages/ab/missing'))
+        self.assertEqual(list(self.storage.list_keys('events/banners/')), [])
+
+        self.assertTrue(self.storage.touch('productImages/ab/a'))
+        self.assertGreater(self.storage.modified_at('productImages/ab/a'), 1000)
+        self.assertFalse(self.storage.touch('productImages/ab/missing'))
+
+    def test_put_many_skips_and_touches_existing(self):
+        self.storage.upload(BytesIO(b'old'), 'a')
+        os.utime(self.storage.path('a'), (1000, 1000))
+
+        uploaded = self.manager.put_many([(BytesIO(b'new'), 'a'), (BytesIO(b'b'), 'b')], skip_existing=True)
+
+        self.assertEqual(uploaded, ['b'])
+        self.assertEqual(self.manager.touch_many(['a', 'b', 'c']), [True, True, False])
+        self.assertGreater(self.storage.modified_at('a'), 1000)
+        with open(self.storage.path('a'), 'rb') as file:
+            self.assertEqual(file.read(), b'old')
+
+    def test_failed_put_many_keeps_uploaded_files(self):
+        upload = self.storage.upload
+
+        def flaky_upload(file, key):
+            if key == 'broken':
+                raise OSError('disk full')
+            upload(file, key)
+
+        with mock.patch.object(self.storage, 'upload', side_effect=flaky_upload):
+            with self.assertRaises(FileUploadFailException):
+                self.manager.put_many([(BytesIO(b'a'), 'a'), (BytesIO(b'x'), 'broken')])
+
+        self.assertTrue(self.storage.exists('a'))
+
+
+class TestImageSweeper(TestCase):
+    """ Test
+
+        Target: service/admin/image_sweeper (ImageSweeper)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.storage = LocalFileStorage(self.root)
+        self.sweeper = ImageSweeper(None, {'name': 'test'}, grace=60, storage=self.storage)
+        self.sweeper.sweep_dao = mock.Mock()
+        self.sweeper.sweep_dao.get_sweep_lock_dao.return_value = True
+        self.referenced = set()
+        self.sweeper.sweep_dao.get_referenced_image_urls_dao.side_effect = (
+            lambda connection, urls: self.referenced & set(urls)
+        )
+        patcher = mock.patch('service.admin.image_sweeper.get_connection')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def put(self, key, old=True):
+        self.storage.upload(BytesIO(b'image'), key)
+        if old:
+            os.utime(self.storage.path(key), (1000, 1000))
+
+    def key(self, content, path_type=3, extension=''):
+        return GenerateFilePath().generate_content_key(path_type, content, extension)
+
+    def test_content_origin(self):
+        key = self.key(b'a')
+
+        self.assertEqual(content_origin(key), key)
+        self.assertEqual(content_origin(key + '_360w.webp'), key)
+        self.assertEqual(content_origin(self.key(b'a', 4, '.png')), self.key(b'a', 4, '.png'))
+        self.assertIsNone(content_origin('productImages/12/345/image.jpg'))
+        self.assertIsNone(content_origin('sellers/1/profile/' + self.key(b'a')))
+
+    def test_deletes_only_old_unreferenced_files(self):
+        orphan, referenced, fresh = self.key(b'orphan'), self.key(b'referenced'), self.key(b'fresh')
+        banner = self.key(b'banner', 4, '.png')
+        for key in [orphan, orphan + '_360w.webp', referenced, referenced + '_360w.webp', banner]:
+            self.put(key)
+        self.put(fresh, old=False)
+        self.put(fresh + '_360w.webp')
+        self.put('productImages/12/345/legacy.jpg')
+        self.referenced = {referenced, S3_BUCKET_URL + banner}
+
+        self.assertEqual(self.sweeper.sweep(), 2)
+
+        self.assertFalse(self.storage.exists(orphan))
+        self.assertFalse(self.storage.exists(orphan + '_360w.webp'))
+        for key in [referenced, referenced + '_360w.webp', banner, fresh, fresh + '_360w.webp', 'productImages/12/345/legacy.jpg']:
+            self.assertTrue(self.storage.exists(key), key)
+
+    def test_keeps_files_touched_before_delete(self):
+        key = self.key(b'reused')
+        self.put(key)
+        modified_at = self.storage.modified_at
+
+        def touched(path_key):
+            # 참조 확인 뒤 다른 요청이 같은 이미지를 다시 참조하려고 수정 시각을 갱신한 경우
+            self.storage.touch(key)
+            return modified_at(path_key)
+
+        with mock.patch.object(self.storage, 'modified_at', side_effect=touched):
+            self.assertEqual(self.sweeper.sweep(), 0)
+        self.assertTrue(self.storage.exists(key))
+
+    def test_skips_when_another_process_holds_the_lock(self):
+        self.put(self.key(b'orphan'))
+        self.sweeper.sweep_dao.get_sweep_lock_dao.return_value = False
+
+        self.assertEqual(self.sweeper.sweep(), 0)
+        self.assertTrue(self.storage.exists(self.key(b'orphan')))
@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from utils.image_variants import select_image_variants, format_variant_widths, variant_suffix
+
+
+class TestSelectImageVariants(TestCase):
+    """ Test
+
+        Target: utils/image_variants
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def setUp(self):
+        self.products = [
+            {'product_id': 1, 'image': 'productImages/3f/3f1c', 'image_variant_widths': '180,360,720'},
+            {'product_id': 2, 'image_url': 'productImages/9a/9a2b', 'image_variant_widths': '180,360,720'},
+            {'product_id': 3, 'image': 'productImages/1/3/P0000-old', 'image_variant_widths': None}
+        ]
+
+    def test_helpers(self):
+        self.assertEqual(variant_suffix(360, 'webp'), '_360w.webp')
+        self.assertEqual(format_variant_widths((720, 180, 360)), '180,360,720')
+
+    def test_selects_requested_variant(self):
+        result = select_image_variants(self.products, 'small', 'webp')
+
+        self.assertEqual(result[0]['image'], 'productImages/3f/3f1c_180w.webp')
+        self.assertEqual(result[1]['image_url'], 'productImages/9a/9a2b_180w.webp')
+        self.assertEqual(result[2]['image'], 'productImages/1/3/P0000-old')
+        self.assertTrue(all('image_variant_widths' not in product for product in result))
+
+    def test_defaults_and_original(self):
+        self.assertEqual(select_image_variants(self.products, None, None)[0]['image'], 'productImages/3f/3f1c_360w.jpg')
+        self.assertEqual(select_image_variants(self.products, 'original', 'webp')[0]['image'], 'productImages/3f/3f1c')
+
+    def test_missing_width_keeps_original(self):
+        products = [{'product_id': 1, 'image': 'productImages/3f/3f1c', 'image_variant_widths': '180'}]
+        self.assertEqual(select_image_variants(products, 'large', 'jpg')[0]['image'], 'productImages/3f/3f1c')
+
+    def test_does_not_modify_cached_rows(self):
+        select_image_variants(self.products, 'large', 'jpg')
+
+        self.assertEqual(self.products[0]['image'], 'productImages/3f/3f1c')
+        self.assertIn('image_variant_widths', self.products[0])
+
+    def test_non_list_is_returned_as_is(self):
+        self.assertIsNone(select_image_variants(None))
@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from utils.search_index import PrefixTrie
+
+
+class TestPrefixTrie(TestCase):
+    """ Test
+
+        Target: utils/search_index (PrefixTrie)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def setUp(self):
+        self.trie = PrefixTrie(top_k=3)
+        self.trie.add('성보의 하루', 30)
+        self.trie.add('성보셀러', 50)
+        self.trie.add('성수동 원피스', 10)
+        self.trie.add('하루 한잔', 20)
+
+    def test_suggest_orders_by_weight(self):
+        self.assertEqual(self.trie.suggest('성'), ['성보셀러', '성보의 하루', '성수동 원피스'])
+        self.assertEqual(self.trie.suggest('성보'), ['성보셀러', '성보의 하루'])
+        self.assertEqual(self.trie.suggest('성', limit=1), ['성보셀러'])
+
+    def test_suggest_normalizes_prefix(self):
+        self.trie.add('Blue Shirt', 5)
+        self.assertEqual(self.trie.suggest('  BLUE'), ['Blue Shirt'])
+
+    def test_suggest_unknown_or_empty_prefix(self):
+        self.assertEqual(self.trie.suggest('없는'), [])
+        self.assertEqual(self.trie.suggest(''), [])
+
+    def test_weight_is_a_delta(self):
+        """ add 의 weight 는 증감값이고 0 이하가 되면 추천어에서 빠진다. """
+
+        self.trie.add('성수동 원피스', 45)
+        self.assertEqual(self.trie.suggest('성'), ['성수동 원피스', '성보셀러', '성보의 하루'])
+
+        self.trie.add('성보셀러', -50)
+        self.assertEqual(self.trie.suggest('성보'), ['성보의 하루'])
+
+    def test_top_k_limits_each_node(self):
+        self.trie.add('성곽길', 1)
+        self.assertEqual(len(self.trie.suggest('성', limit=10)), 3)
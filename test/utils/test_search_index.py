@@ -0,0 +1,89 @@
+from unittest import mock, TestCase
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from service.store.product_search_engine import ProductSearchEngine
+from utils.search_index import InvertedIndex, normalize, tokenize, query_tokens
+
+
+class TestInvertedIndex(TestCase):
+    """ Test
+
+        Target: utils/search_index (InvertedIndex)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def setUp(self):
+        self.index = InvertedIndex()
+        self.index.add(1, ['성보의 하루', '나는셀러1'], {'sales_count': 30})
+        self.index.add(2, ['하루 한잔 원피스', '둘리샵'], {'sales_count': 10})
+        self.index.add(3, ['Blue Shirt', '둘리샵'], {'sales_count': 5})
+
+    def test_normalize_and_tokenize(self):
+        self.assertEqual(normalize('  Blue   SHIRT '), 'blue shirt')
+        self.assertEqual(tokenize('하루 셀'), {'하', '루', '하루', '셀'})
+        self.assertEqual(query_tokens('하루 셀'), {'하루', '셀'})
+
+    def test_search_matches_like(self):
+        """ LIKE '%검색어%' 와 같이 상품명, 셀러명 중 하나에 포함된 문서를 찾는다. """
+
+        self.assertEqual(self.index.search('하루'), {1, 2})
+        self.assertEqual(self.index.search('둘리'), {2, 3})
+        self.assertEqual(self.index.search('blue'), {3})
+        self.assertEqual(self.index.search('셀'), {1})
+
+    def test_search_checks_original_text(self):
+        """ 토큰이 모두 있어도 원문에 검색어가 연속으로 없으면 결과에서 뺀다. """
+
+        self.assertEqual(self.index.search('루하'), set())
+        self.assertEqual(self.index.search('하루의'), set())
+        self.assertEqual(self.index.search(''), set())
+
+    def test_add_replaces_and_remove(self):
+        self.index.add(1, ['새 상품'], {'sales_count': 1})
+        self.assertEqual(self.index.search('하루'), {2})
+        self.assertEqual(self.index.fields(1), {'sales_count': 1})
+
+        self.index.remove(2)
+        self.assertEqual(self.index.search('하루'), set())
+        self.assertIsNone(self.index.fields(2))
+        self.assertNotIn('원피', self.index.postings)
+
+    def test_replace_all(self):
+        self.index.replace_all([(7, '하루 세트', None)])
+        self.assertEqual(len(self.index), 1)
+        self.assertEqual(self.index.search('하루'), {7})
+        self.assertEqual(self.index.fields(7), {})
+
+
+class TestProductSearchEngine(TestCase):
+    """ Test
+
+        Target: service/store/product_search_engine (ProductSearchEngine.refresh)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def test_refresh_keeps_dirty_products_when_lookup_fails(self):
+        engine = ProductSearchEngine()
+        engine.loaded_at = time.monotonic()
+        engine.product_dao = mock.Mock()
+        engine.product_dao.get_search_documents_dao.side_effect = RuntimeError('connection lost')
+        engine.mark_dirty(1)
+        engine.mark_dirty(2)
+
+        with self.assertRaises(RuntimeError):
+            engine.refresh(None)
+        engine.mark_dirty(3)
+
+        self.assertEqual(engine._dirty, {1, 2, 3})
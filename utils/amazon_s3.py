@@ -1,7 +1,93 @@
+""" 파일 저장소 (Amazon S3, 로컬 파일 시스템)
+
+S3 클라이언트는 프로세스에서 하나만 만들어 재사용한다. (get_s3_client)
+커넥션 풀(S3_MAX_POOL_CONNECTIONS)과 재시도(S3_MAX_ATTEMPTS, standard 모드)를 설정하므로
+업로드 스레드 풀에서 동시에 사용해도 요청마다 인증 정보 확인, 엔드포인트 설정을 다시 하지 않는다.
+
+이미지는 내용의 해시(sha256)로 경로를 만든다. (GenerateFilePath.generate_content_key)
+같은 이미지를 다시 올리면 같은 경로가 되므로 저장소에 이미 있으면 업로드를 건너뛴다.
+업로드는 트랜잭션 시작 전(첫 DAO 호출 전)에 하므로 네트워크 작업 동안 DB 커넥션과 락을 잡지 않는다.
+
+정리 규칙:
+    내용 주소 경로의 파일은 요청 처리 중에는 지우지 않는다. (rollback, 업로드 실패 포함)
+    같은 내용의 이미지를 다른 상품, 기획전이 함께 참조할 수 있기 때문이다.
+    이미 있어서 업로드를 건너뛴 파일은 수정 시각을 갱신한다. (touch)
+    어떤 행에서도 참조하지 않고 수정된 지 오래된 파일은 service.admin.image_sweeper 가 지운다.
+
+저장소 구현 (같은 인터페이스: exists, upload, touch, list_keys, modified_at, delete_many):
+    S3Storage        : Amazon S3 (S3_ENDPOINT_URL 을 설정하면 S3 호환 서버)
+    LocalFileStorage : 로컬 파일 시스템 (테스트, 사내 서버용)
+
+app.config 설정:
+    FILE_STORAGE       : 's3'(기본) 또는 'local'
+    LOCAL_STORAGE_ROOT : FILE_STORAGE 가 'local' 일 때 파일을 저장할 디렉토리
+
+기본적인 사용 예시:
+    upload_manager = get_upload_manager()
+    found = upload_manager.touch_many(keys)
+    upload_manager.put_many([(file, key), ...], skip_existing=True)
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import traceback
+
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
 
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from flask import current_app
 
+from utils.custom_exceptions import FileUploadFailException
+
+UPLOAD_WORKERS = 8
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+
+S3_MAX_POOL_CONNECTIONS = 32
+S3_MAX_ATTEMPTS = 5
+S3_CONNECT_TIMEOUT = 5
+S3_READ_TIMEOUT = 60
+
+# delete_objects 한번에 지울 수 있는 최대 키 개수
+DELETE_BATCH_SIZE = 1000
+
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """ 프로세스에서 하나만 사용하는 S3 클라이언트를 반환한다. 없으면 current_app 설정으로 생성한다.
+
+        boto3 클라이언트는 스레드 안전하므로 여러 스레드에서 함께 사용한다. (세션 생성은 스레드 안전하지 않아 lock 안에서 한다)
+    """
+
+    global _s3_client
+    if _s3_client is not None:
+        return _s3_client
+
+    with _s3_client_lock:
+        if _s3_client is None:
+            config = current_app.config
+            _s3_client = boto3.session.Session().client(
+                's3',
+                aws_access_key_id=config['S3_ACCESS_KEY'],
+                aws_secret_access_key=config['S3_SECRET_KEY'],
+                endpoint_url=config.get('S3_ENDPOINT_URL'),
+                config=Config(
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    retries={'max_attempts': S3_MAX_ATTEMPTS, 'mode': 'standard'},
+                    connect_timeout=S3_CONNECT_TIMEOUT,
+                    read_timeout=S3_READ_TIMEOUT
+                )
+            )
+        return _s3_client
+
 
 class S3FileManager:
     """ Amazon S3 파일 업로드 클래스
@@ -12,13 +98,10 @@ class S3FileManager:
 
         History:
             2020-12-31(심원두): 초기 작성
+            2026-10-18(agent): 프로세스에서 재사용하는 클라이언트 사용
     """
     def __init__(self):
-        self.s3 = boto3.client(
-            's3',
-            aws_access_key_id=current_app.config['S3_ACCESS_KEY'],
-            aws_secret_access_key=current_app.config['S3_SECRET_KEY']
-        )
+        self.s3 = get_s3_client()
 
     def file_upload(self, file, file_name):
         """ Amazon S3 파일 업로드 클래스
@@ -83,7 +166,23 @@ class GenerateFilePath:
             2020-12-31(심원두): 초기 생성
             2021-01-02(강두연): 이벤트 관련 경로 추가
             2021-01-03(심원두): 상품 이미지 경로 수정
+            2026-10-18(agent): 내용 해시 경로(generate_content_key) 추가
     """
+    CONTENT_PATHS = {
+        3: 'productImages/',
+        4: 'events/banners/',
+        5: 'events/details/'
+    }
+
+    def generate_content_key(self, path_type, data, extension=''):
+        """ 파일 내용의 sha256 으로 저장 경로를 만든다. (예: productImages/3f/3f1c...e2)
+
+            같은 내용이면 항상 같은 경로이므로 트랜잭션 결과와 상관없이 최종 경로로 사용할 수 있다.
+        """
+
+        digest = hashlib.sha256(data).hexdigest()
+        return self.CONTENT_PATHS[path_type] + digest[:2] + '/' + digest + extension
+
     def generate_file_path(self, path_type, **kwargs):
         seller_path  = 'sellers/'
         product_path = 'productImages/'
@@ -103,3 +202,284 @@ class GenerateFilePath:
 
         if path_type == 5:
             return event_path + str(kwargs['today']) + '/details/'
+
+
+class S3Storage:
+    """ Amazon S3 저장소
+
+        Attributes:
+            s3              : 프로세스에서 재사용하는 boto3 S3 클라이언트
+            bucket          : 버킷 이름
+            transfer_config : 멀티파트 업로드 설정 (MULTIPART_THRESHOLD 이상이면 멀티파트)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self, s3, bucket):
+        self.s3 = s3
+        self.bucket = bucket
+        self.transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_CHUNK_SIZE,
+            max_concurrency=4
+        )
+
+    def exists(self, key):
+        try:
+            self.s3.head_object(Bucket=self.bucket, Key=key)
+            return True
+
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+
+    def upload(self, file, key):
+        self.s3.upload_fileobj(file, self.bucket, key, Config=self.transfer_config)
+
+    def touch(self, key):
+        """ 파일의 수정 시각을 지금으로 바꾼다. (파일이 없으면 False)
+
+            S3 는 수정 시각만 바꿀 수 없으므로 같은 키로 복사한다. (이미지 크기는 복사 한번 한도 5GB 보다 작다)
+        """
+
+        try:
+            self.s3.copy_object(
+                Bucket=self.bucket,
+                Key=key,
+                CopySource={'Bucket': self.bucket, 'Key': key},
+                MetadataDirective='REPLACE'
+            )
+            return True
+
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+
+    def list_keys(self, prefix):
+        """ prefix 아래의 (키, 수정 시각(epoch 초)) 를 키 순서로 반환하는 제너레이터 """
+
+        paginator = self.s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for item in page.get('Contents', []):
+                yield item['Key'], item['LastModified'].timestamp()
+
+    def modified_at(self, key):
+        """ 파일의 수정 시각(epoch 초), 파일이 없으면 None """
+
+        try:
+            return self.s3.head_object(Bucket=self.bucket, Key=key)['LastModified'].timestamp()
+
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+
+    def delete_many(self, keys):
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            self.s3.delete_objects(
+                Bucket=self.bucket,
+                Delete={'Objects': [{'Key': key} for key in keys[start:start + DELETE_BATCH_SIZE]], 'Quiet': True}
+            )
+
+
+class LocalFileStorage:
+    """ 로컬 파일 시스템 저장소 (S3Storage 와 같은 인터페이스)
+
+        키를 root 아래의 상대 경로로 사용한다. 임시 파일에 쓴 뒤 이름을 바꾸므로 exists 가 참이면 파일이 모두 쓰여진 상태이다.
+
+        Attributes:
+            root : 파일을 저장할 디렉토리
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+
+    def path(self, key):
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(self.root + os.sep):
+            raise ValueError('invalid key: {}'.format(key))
+        return path
+
+    def exists(self, key):
+        return os.path.isfile(self.path(key))
+
+    def upload(self, file, key):
+        self._write(key, lambda target: shutil.copyfileobj(file, target))
+
+    def touch(self, key):
+        try:
+            os.utime(self.path(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def list_keys(self, prefix):
+        directory = self.path(prefix.rstrip('/'))
+        items = []
+        for parent, _, names in os.walk(directory):
+            for name in names:
+                # 쓰는 중인 임시 파일은 제외한다.
+                if name.startswith('.upload-'):
+                    continue
+                path = os.path.join(parent, name)
+                try:
+                    modified = os.path.getmtime(path)
+                except FileNotFoundError:
+                    continue
+                items.append((os.path.relpath(path, self.root).replace(os.sep, '/'), modified))
+        return iter(sorted(items))
+
+    def modified_at(self, key):
+        try:
+            return os.path.getmtime(self.path(key))
+        except FileNotFoundError:
+            return None
+
+    def delete_many(self, keys):
+        for key in keys:
+            try:
+                os.remove(self.path(key))
+            except FileNotFoundError:
+                pass
+
+    def _write(self, key, write):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.upload-')
+        try:
+            with os.fdopen(descriptor, 'wb') as target:
+                write(target)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+class UploadManager:
+    """ 요청 단위 파일 일괄 업로드
+
+        한 요청의 파일들을 스레드 풀에서 동시에 저장소(S3Storage, LocalFileStorage)의 내용 주소 경로
+        (GenerateFilePath.generate_content_key)에 올린다. 이미 있는 파일은 올리지 않을 수 있다. (skip_existing)
+        이미 있어서 올리지 않은 파일은 수정 시각을 갱신해서 정리 작업(service.admin.image_sweeper)이 지우지 않도록 한다.
+        업로드는 트랜잭션 시작 전(첫 DAO 호출 전)에 하므로 네트워크 작업 동안 DB 커넥션과 락을 잡지 않는다.
+
+        Attributes:
+            storage  : 파일 저장소
+            executor : 업로드 스레드 풀
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성 (S3UploadManager)
+            2026-10-18(agent): 저장소 인터페이스 분리, 이미 있는 파일 확인(exists_many, skip_existing) 추가
+            2026-10-18(agent): 요청이 실패해도 파일을 지우지 않음. 이미 있는 파일은 수정 시각 갱신(touch_many)
+
+        Notes:
+            올린 파일은 요청이 실패해도 지우지 않는다. 같은 내용의 파일을 다른 요청이 이미 참조하고 있을 수 있다.
+            (모듈 설명의 정리 규칙 참고)
+    """
+
+    def __init__(self, storage, workers=UPLOAD_WORKERS):
+        self.storage = storage
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='file-upload')
+
+    def touch_many(self, keys):
+        """ 키 별로 저장소에 파일이 있으면 수정 시각을 갱신하고 있었는지 반환한다. (keys 와 같은 순서의 bool 리스트)
+
+            있는 파일을 참조하려는 요청이 정리 작업과 겹쳐도 파일이 지워지지 않도록 exists 대신 사용한다.
+        """
+
+        futures = [self.executor.submit(self.storage.touch, key) for key in keys]
+        try:
+            return [future.result() for future in futures]
+
+        except Exception:
+            traceback.print_exc()
+            raise FileUploadFailException('image file upload to amazon fail')
+
+    def put_many(self, files, skip_existing=False):
+        """ [(파일 객체, 키), ...] 를 동시에 올리고 실제로 올린 키 리스트를 반환한다.
+
+            Args:
+                files         : [(파일 객체, 키), ...] 파일 객체는 FileStorage, BytesIO 등
+                skip_existing : True 이면 저장소에 이미 있는 키는 올리지 않고 수정 시각만 갱신한다.
+
+            Author: agent
+
+            Raises:
+                500, {'message': 'image_file_upload_to_amazon_fail',
+                      'errorMessage': 'image file upload to amazon fail'}: 하나라도 업로드 실패 (올린 파일은 지우지 않는다)
+
+            History:
+                2026-10-18(agent): 초기 생성
+        """
+
+        futures = [(key, self.executor.submit(self._put, file, key, skip_existing)) for file, key in files]
+
+        uploaded = []
+        failed = False
+        for key, future in futures:
+            try:
+                if future.result():
+                    uploaded.append(key)
+            except Exception:
+                traceback.print_exc()
+                failed = True
+
+        if failed:
+            raise FileUploadFailException('image file upload to amazon fail')
+
+        return uploaded
+
+    def _put(self, file, key, skip_existing):
+        if skip_existing and self.storage.touch(key):
+            return False
+
+        if hasattr(file, 'seek'):
+            file.seek(0)
+        self.storage.upload(file, key)
+        return True
+
+
+_upload_manager = None
+_upload_manager_lock = threading.Lock()
+
+
+def get_upload_manager():
+    """ 프로세스에서 하나만 사용하는 업로드 매니저를 반환한다. 없으면 current_app 설정으로 생성한다.
+
+        FILE_STORAGE 가 'local' 이면 LOCAL_STORAGE_ROOT 에 저장하고, 아니면 S3(S3_BUCKET_NAME)에 저장한다.
+    """
+
+    global _upload_manager
+    if _upload_manager is not None:
+        return _upload_manager
+
+    with _upload_manager_lock:
+        if _upload_manager is None:
+            config = current_app.config
+            if config.get('FILE_STORAGE') == 'local':
+                storage = LocalFileStorage(config['LOCAL_STORAGE_ROOT'])
+            else:
+                storage = S3Storage(get_s3_client(), config['S3_BUCKET_NAME'])
+            _upload_manager = UploadManager(storage)
+        return _upload_manager
+
+
+def set_upload_manager(manager):
+    """ 업로드 매니저를 교체한다. (테스트에서 LocalFileStorage 를 사용하는 매니저로 바꿀 때 사용) """
+
+    global _upload_manager
+    with _upload_manager_lock:
+        _upload_manager = manager
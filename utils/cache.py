@@ -0,0 +1,145 @@
+""" 프로세스 내 캐시
+
+여러 스레드에서 안전하게 사용할 수 있는 크기 제한 + TTL 캐시(cachetools.TTLCache)를 이름 별로 관리한다.
+같은 이름으로 get_cache() 를 호출하면 항상 같은 캐시 객체를 반환하므로
+캐시를 직접 들고 있지 않은 레이어(예: 어드민 서비스)에서도 이름으로 무효화 할 수 있다.
+
+기본적인 사용 예시:
+    cache = get_cache('category_tree', maxsize=1, ttl=300)
+    result = cache.get_or_load('tree', lambda: build_tree(connection))
+
+    get_cache('category_tree').clear()  # 무효화
+    get_cache_stats()                   # 모니터링용 hit/miss 통계
+"""
+import threading
+
+from cachetools import TTLCache
+
+DEFAULT_MAXSIZE = 1024
+DEFAULT_TTL = 60
+
+
+class LocalCache:
+    """ 이름이 붙은 스레드 안전 TTL 캐시
+
+        Attributes:
+            name    : 캐시 이름
+            version : clear() 될 때마다 1씩 증가하는 버전
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+
+        Notes:
+            maxsize 를 넘으면 가장 오래 사용하지 않은 값부터 제거한다. (LRU)
+            getsizeof 를 넘기면 maxsize 는 항목 개수가 아닌 getsizeof 합계의 상한이 된다.
+    """
+
+    def __init__(self, name, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL, getsizeof=None):
+        self.name = name
+        self.version = 0
+        self._lock = threading.RLock()
+        self._data = TTLCache(maxsize=maxsize, ttl=ttl, getsizeof=getsizeof)
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._hits += 1
+            return value
+
+    def contains(self, key):
+        """ hit/miss 통계에 포함하지 않고 키가 있는지 확인한다. """
+
+        with self._lock:
+            return key in self._data
+
+    def set(self, key, value):
+        with self._lock:
+            try:
+                self._data[key] = value
+            except ValueError:
+                # 값 하나가 maxsize 보다 큰 경우 캐싱하지 않는다.
+                pass
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_many(self, keys):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.version += 1
+
+    def get_or_load(self, key, loader):
+        """ 캐시에 값이 있으면 반환하고 없으면 loader() 결과를 저장한 뒤 반환한다.
+
+            loader 는 lock 밖에서 실행되므로 동시에 같은 키를 읽는 요청들이 loader 를 중복 실행할 수 있다.
+            대신 loader 가 도는 동안 clear() 된 경우 오래된 결과를 저장하지 않는다.
+        """
+
+        with self._lock:
+            version = self.version
+            try:
+                value = self._data[key]
+                self._hits += 1
+                return value
+            except KeyError:
+                self._misses += 1
+
+        value = loader()
+
+        with self._lock:
+            if version == self.version:
+                try:
+                    self._data[key] = value
+                except ValueError:
+                    pass
+        return value
+
+    def stats(self):
+        with self._lock:
+            return {
+                'name': self.name,
+                'version': self.version,
+                'size': len(self._data),
+                'currsize': self._data.currsize,
+                'maxsize': self._data.maxsize,
+                'ttl': self._data.ttl,
+                'hits': self._hits,
+                'misses': self._misses
+            }
+
+
+_caches = dict()
+_caches_lock = threading.Lock()
+
+
+def get_cache(name, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL, getsizeof=None):
+    """ 이름에 해당하는 캐시를 반환한다. 처음 호출될 때 넘겨준 설정으로 생성된다. """
+
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = LocalCache(name, maxsize, ttl, getsizeof)
+            _caches[name] = cache
+        return cache
+
+
+def get_cache_stats():
+    """ 생성된 모든 캐시의 통계를 리스트로 반환한다. """
+
+    with _caches_lock:
+        caches = list(_caches.values())
+    return [cache.stats() for cache in caches]
@@ -1,15 +1,548 @@
 """ 데이터베이스 커낵션을 생성해 주는 파일
 
-database 를 인자로 받아 connection 객체를 생성한뒤 반환해준다.
+database 를 인자로 받아 커넥션 풀에서 connection 객체를 꺼내 반환해준다.
+반환된 connection 의 close() 는 실제 연결을 끊지 않고 커넥션을 풀로 되돌려 준다.
+풀은 프로세스 전역에서 database 설정 별로 하나씩 생성되며 여러 스레드에서 안전하게 사용할 수 있다.
 
+database 설정에 추가로 넣을 수 있는 풀 관련 값 (선택):
+    port          : 데이터베이스 포트 (기본 3306)
+    pool_size     : 풀이 유지할 수 있는 최대 커넥션 수 (기본 10)
+    pool_timeout  : 커넥션을 빌려오기 위해 기다리는 최대 시간, 초 (기본 10)
+    pool_recycle  : 커넥션 최대 수명, 초. 넘으면 새 커넥션으로 교체 (기본 3600)
+    replicas      : 읽기 전용 복제본 설정 리스트. 예) [{'host': 'replica-1'}, {'host': 'replica-2'}]
+                    빠진 값은 primary 설정을 사용한다. (기본 없음, 모든 요청이 primary 사용)
+    read_your_writes_seconds : 쓰기 요청을 한 계정의 읽기를 primary 로 보내는 시간, 초 (기본 5)
+
+기본적인 사용 예시:
+    connection = get_connection(self.database)
+    try:
+        ...
+    finally:
+        connection.close()  # 풀로 반납
+
+    get_pool_status()  # 모니터링용 풀 통계
+
+뷰에서는 get_request_connection() 을 사용한다. 커넥션 획득, commit/rollback, 반납은
+utils.transaction_handler 가 요청 단위로 처리하므로 뷰에서 try/finally 로 감쌀 필요가 없다.
+    connection = get_request_connection(self.database)
+    result = self.service.some_service(connection, data)
+
+commit 이후에 해야 하는 작업(캐시 무효화 등)은 on_commit(connection, callback) 으로 등록한다.
 """
+import threading
+import time
+import traceback
+
+from collections import deque
+
 import pymysql
 
+from flask import g
+from pymysql.constants import SERVER_STATUS
+
+from utils.custom_exceptions import DatabaseConnectionTimeout
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_POOL_TIMEOUT = 10
+DEFAULT_POOL_RECYCLE = 3600
+DEFAULT_READ_YOUR_WRITES_SECONDS = 5
+
+
+class PooledConnection:
+    """ 풀에서 빌려준 커넥션
+
+        pymysql 커넥션의 모든 속성, 메소드(cursor, commit, rollback 등)를 그대로 위임하고
+        close() 만 풀 반납으로 바꿔준다.
+
+        Attributes:
+            _pool       : 커넥션을 빌려준 ConnectionPool
+            _connection : 실제 pymysql 커넥션
+            _created_at : 실제 커넥션 생성 시각
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self, pool, connection, created_at):
+        self._pool = pool
+        self._connection = connection
+        self._created_at = created_at
+
+    def __getattr__(self, name):
+        if self._connection is None:
+            raise pymysql.err.InterfaceError(0, 'connection already returned to pool')
+        return getattr(self._connection, name)
+
+    @property
+    def open(self):
+        return self._connection is not None and self._connection.open
+
+    def close(self):
+        """ 커넥션을 풀로 반납한다. 두번 이상 호출되어도 한번만 반납된다. """
+
+        if self._connection is None:
+            return
+
+        connection, self._connection = self._connection, None
+        self._pool.release(connection, self._created_at)
+
+    def discard(self):
+        """ 커넥션을 풀로 돌려주지 않고 끊는다.
+
+            서버 사이드 커서로 읽다가 중단한 경우처럼 커넥션 상태를 믿을 수 없을 때 사용한다.
+            (반납하면 남은 결과를 모두 읽어야 다음 쿼리를 실행할 수 있다)
+        """
+
+        if self._connection is None:
+            return
+
+        connection, self._connection = self._connection, None
+        self._pool.discard(connection)
+
+
+class ConnectionPool:
+    """ 스레드 안전한 MySQL 커넥션 풀
+
+        Attributes:
+            database : app.config['DB'] 에 담겨있는 데이터베이스 정보
+            size     : 최대 커넥션 수
+            timeout  : 커넥션 대기 최대 시간(초)
+            recycle  : 커넥션 최대 수명(초)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+
+        Notes:
+            빌려줄 때 ping 으로 죽은 커넥션을 걸러내고, 반납할 때 열려있는 트랜잭션은 rollback,
+            autocommit 은 기본값(False)으로 되돌린다.
+            유휴 커넥션은 가장 최근에 반납된 것부터 재사용한다. (LIFO)
+    """
+
+    def __init__(self, database):
+        self.database = database
+        self.size = int(database.get('pool_size', DEFAULT_POOL_SIZE))
+        self.timeout = float(database.get('pool_timeout', DEFAULT_POOL_TIMEOUT))
+        self.recycle = float(database.get('pool_recycle', DEFAULT_POOL_RECYCLE))
+
+        self._condition = threading.Condition()
+        self._idle = deque()
+        self._opened = 0
+        self._stats = {
+            'checkouts': 0,
+            'created': 0,
+            'recycled': 0,
+            'discarded': 0,
+            'timeouts': 0,
+            'wait_seconds': 0.0
+        }
+
+    def _connect(self):
+        connection = pymysql.connect(host=self.database['host'],
+                                     port=int(self.database.get('port', 3306)),
+                                     user=self.database['user'],
+                                     password=self.database['password'],
+                                     db=self.database['name'],
+                                     charset=self.database['charset'],
+                                     autocommit=False)
+        return connection, time.monotonic()
+
+    def acquire(self):
+        """ 풀에서 커넥션을 빌린다.
+
+            Author: agent
+
+            Returns:
+                PooledConnection 객체
+
+            Raises:
+                503, {'message': 'database_connection_timeout', 'error_message': '서버가 혼잡합니다. 잠시 후 다시 시도해주세요.'}
+                : pool_timeout 안에 커넥션을 얻지 못함
+
+            History:
+                2026-10-18(agent): 초기 생성
+        """
+
+        started = time.monotonic()
+        deadline = started + self.timeout
+        connection = None
+
+        with self._condition:
+            while True:
+                if self._idle:
+                    connection, created_at = self._idle.pop()
+                    break
+
+                if self._opened < self.size:
+                    self._opened += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise DatabaseConnectionTimeout('서버가 혼잡합니다. 잠시 후 다시 시도해주세요.')
+                self._condition.wait(remaining)
+
+            self._stats['checkouts'] += 1
+            self._stats['wait_seconds'] += time.monotonic() - started
+
+        # 네트워크 작업(ping, connect)은 lock 밖에서 수행한다.
+        try:
+            if connection is not None and not self._is_usable(connection, created_at):
+                connection = None
+
+            if connection is None:
+                connection, created_at = self._connect()
+                with self._condition:
+                    self._stats['created'] += 1
+
+        except Exception:
+            self._forget()
+            raise
+
+        return PooledConnection(self, connection, created_at)
+
+    def release(self, connection, created_at):
+        """ 커넥션의 트랜잭션 상태를 초기화한 뒤 풀로 되돌린다.
+
+            Args:
+                connection : 반납할 pymysql 커넥션
+                created_at : 커넥션 생성 시각
+
+            Author: agent
+
+            Returns: None
+
+            History:
+                2026-10-18(agent): 초기 생성
+        """
+
+        try:
+            if not connection.open:
+                raise pymysql.err.InterfaceError(0, 'connection is closed')
+
+            if connection.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+                connection.rollback()
+
+            if connection.get_autocommit():
+                connection.autocommit(False)
+
+        except Exception:
+            self._close_quietly(connection)
+            self._forget(discarded=True)
+            return
+
+        with self._condition:
+            self._idle.append((connection, created_at))
+            self._condition.notify()
+
+    def discard(self, connection):
+        """ 빌려준 커넥션을 끊고 풀의 커넥션 수에서 뺀다. """
+
+        self._close_quietly(connection)
+        self._forget(discarded=True)
+
+    def status(self):
+        """ 모니터링용 풀 통계를 반환한다.
+
+            Author: agent
+
+            Returns:
+                {
+                    'host': 'localhost',
+                    'name': 'brandi',
+                    'size': 10,
+                    'opened': 3,
+                    'idle': 2,
+                    'in_use': 1,
+                    'checkouts': 120,
+                    'created': 3,
+                    'recycled': 0,
+                    'discarded': 0,
+                    'timeouts': 0,
+                    'wait_seconds': 0.012
+                }
+
+            History:
+                2026-10-18(agent): 초기 생성
+        """
+
+        with self._condition:
+            result = {
+                'host': self.database['host'],
+                'name': self.database['name'],
+                'size': self.size,
+                'opened': self._opened,
+                'idle': len(self._idle),
+                'in_use': self._opened - len(self._idle)
+            }
+            result.update(self._stats)
+            return result
+
+    def close_all(self):
+        """ 유휴 커넥션을 모두 닫는다. (빌려간 커넥션은 반납될 때 다시 풀에 들어온다) """
+
+        with self._condition:
+            idle, self._idle = self._idle, deque()
+            self._opened -= len(idle)
+            self._condition.notify_all()
+
+        for connection, _ in idle:
+            self._close_quietly(connection)
+
+    def _is_usable(self, connection, created_at):
+        if time.monotonic() - created_at > self.recycle:
+            self._close_quietly(connection)
+            with self._condition:
+                self._stats['recycled'] += 1
+            return False
+
+        try:
+            connection.ping(reconnect=False)
+            return True
+
+        except Exception:
+            self._close_quietly(connection)
+            with self._condition:
+                self._stats['discarded'] += 1
+            return False
+
+    def _forget(self, discarded=False):
+        with self._condition:
+            self._opened -= 1
+            if discarded:
+                self._stats['discarded'] += 1
+            self._condition.notify()
+
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+_pools = dict()
+_pools_lock = threading.Lock()
+
+
+def _pool_key(database):
+    return (
+        database['host'],
+        int(database.get('port', 3306)),
+        database['user'],
+        database['name']
+    )
+
+
+def get_pool(database):
+    """ database 설정에 해당하는 프로세스 전역 커넥션 풀을 반환한다. 없으면 생성한다. """
+
+    key = _pool_key(database)
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(database)
+            _pools[key] = pool
+        return pool
+
 
 def get_connection(database):
-    connection = pymysql.connect(host=database['host'],
-                                 user=database['user'],
-                                 password=database['password'],
-                                 db=database['name'],
-                                 charset=database['charset'])
+    return get_pool(database).acquire()
+
+
+def get_pool_status():
+    """ 생성된 모든 커넥션 풀의 통계를 리스트로 반환한다. """
+
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [pool.status() for pool in pools]
+
+
+def close_all_pools():
+    """ 모든 풀의 유휴 커넥션을 닫는다. (테스트, 프로세스 종료 시 사용) """
+
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_all()
+
+
+_replica_cursors = dict()
+_recent_writes = dict()
+_routing_lock = threading.Lock()
+
+
+def get_replica_settings(database):
+    """ database['replicas'] 에 정의된 읽기 전용 복제본 설정 리스트를 반환한다.
+
+        복제본 설정에 없는 값(user, password, name, charset 등)은 primary 설정을 그대로 사용한다.
+    """
+
+    return [
+        dict({key: value for key, value in database.items() if key != 'replicas'}, **replica)
+        for replica in database.get('replicas', [])
+    ]
+
+
+def get_replica_connection(database):
+    """ 복제본 풀에서 커넥션을 빌린다. 복제본이 여러개면 돌아가며 사용하고, 모두 실패하면 primary 를 사용한다. """
+
+    replicas = get_replica_settings(database)
+    if not replicas:
+        return get_connection(database)
+
+    key = _pool_key(database)
+    with _routing_lock:
+        start = _replica_cursors.get(key, 0)
+        _replica_cursors[key] = (start + 1) % len(replicas)
+
+    for index in range(len(replicas)):
+        replica = replicas[(start + index) % len(replicas)]
+        try:
+            return get_connection(replica)
+        except Exception:
+            traceback.print_exc()
+
+    return get_connection(database)
+
+
+def record_write(database, account_id):
+    """ 계정의 마지막 쓰기 시각을 기록한다. read_your_writes_seconds 동안 해당 계정의 읽기는 primary 로 보낸다. """
+
+    if account_id is None or not database.get('replicas'):
+        return
+
+    now = time.monotonic()
+    window = float(database.get('read_your_writes_seconds', DEFAULT_READ_YOUR_WRITES_SECONDS))
+    with _routing_lock:
+        _recent_writes[account_id] = now + window
+
+        # 오래된 기록 정리
+        if len(_recent_writes) > 10000:
+            for key in [key for key, expires in _recent_writes.items() if expires < now]:
+                del _recent_writes[key]
+
+
+def is_recent_writer(account_id):
+    if account_id is None:
+        return False
+
+    with _routing_lock:
+        expires = _recent_writes.get(account_id)
+    return expires is not None and expires > time.monotonic()
+
+
+class RequestConnection:
+    """ 요청 단위 지연 커넥션
+
+        뷰에서 get_request_connection() 으로 받아 서비스, DAO 에 넘겨주는 커넥션.
+        DAO 가 처음 cursor() 등을 호출하는 순간 풀에서 실제 커넥션을 빌려오므로
+        캐시 등으로 DB 를 쓰지 않고 끝나는 요청은 커넥션을 전혀 잡지 않는다.
+        commit/rollback/반납은 utils.transaction_handler 에서 요청이 끝날 때 한번만 처리한다.
+
+        Attributes:
+            database    : app.config['DB'] 에 담겨있는 데이터베이스 정보
+            read_only   : 읽기 전용 엔드포인트 여부 (read_only_decorator)
+            account_id  : 요청한 계정 아이디 (로그인 하지 않았으면 None)
+            replica     : 복제본 커넥션 사용 여부
+            acquired_at : 실제 커넥션을 빌려온 시각
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+            2026-10-18(agent): 읽기 전용 요청 복제본 라우팅 추가
+
+        Notes:
+            읽기 전용 요청이면서 최근(read_your_writes_seconds) 쓰기를 한 계정이 아니면 복제본을 사용한다.
+            쓰기 요청, 트랜잭션은 항상 primary 를 사용한다.
+    """
+
+    def __init__(self, database, read_only=False, account_id=None):
+        self.database = database
+        self.read_only = read_only
+        self.account_id = account_id
+        self.replica = False
+        self.acquired_at = None
+        self._connection = None
+        self._after_commit = []
+
+    @property
+    def acquired(self):
+        return self._connection is not None
+
+    def _get(self):
+        if self._connection is None:
+            if self.read_only and self.database.get('replicas') and not is_recent_writer(self.account_id):
+                self._connection = get_replica_connection(self.database)
+                self.replica = True
+            else:
+                self._connection = get_connection(self.database)
+            self.acquired_at = time.monotonic()
+        return self._connection
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
+    def commit(self):
+        if self._connection is not None:
+            self._connection.commit()
+
+    def rollback(self):
+        if self._connection is not None:
+            self._connection.rollback()
+
+    def close(self):
+        """ 요청이 끝날 때 반납되므로 뷰, 서비스에서의 close() 는 무시한다. """
+
+        pass
+
+    def after_commit(self, callback):
+        """ 요청의 트랜잭션이 commit 된 뒤 실행할 함수를 등록한다. rollback 되면 실행하지 않는다. """
+
+        self._after_commit.append(callback)
+
+    def pop_after_commit(self):
+        callbacks, self._after_commit = self._after_commit, []
+        return callbacks
+
+    def release(self):
+        """ 실제 커넥션을 풀로 반납하고 커넥션을 잡고 있던 시간(초)을 반환한다. """
+
+        if self._connection is None:
+            return 0.0
+
+        connection, self._connection = self._connection, None
+        held = time.monotonic() - self.acquired_at
+        connection.close()
+        return held
+
+
+def get_request_connection(database):
+    """ 현재 요청에서 사용할 지연 커넥션을 반환한다. 같은 요청 안에서는 항상 같은 객체를 반환한다. """
+
+    connection = g.get('request_connection')
+    if connection is None:
+        connection = RequestConnection(database, g.get('read_only', False), g.get('account_id'))
+        g.request_connection = connection
     return connection
+
+
+def on_commit(connection, callback):
+    """ connection 의 트랜잭션이 commit 된 뒤 callback 을 실행하도록 등록한다.
+
+        요청 단위 커넥션이 아니면(스크립트, 테스트 등 직접 commit 하는 경우) 바로 실행한다.
+    """
+
+    if isinstance(connection, RequestConnection):
+        connection.after_commit(callback)
+    else:
+        callback()
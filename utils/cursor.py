@@ -0,0 +1,95 @@
+""" 커서(키셋) 페이지네이션 토큰
+
+마지막으로 내려준 행의 정렬 키와 아이디를 클라이언트가 그대로 돌려보낼 수 있는 불투명한 문자열로 바꿔준다.
+OFFSET 대신 커서 이후의 행만 조회하므로 페이지가 깊어져도 조회 비용이 일정하다.
+
+기본적인 사용 예시:
+    next_cursor = encode_cursor([last_row['sales_count'], last_row['product_id']])
+    sales_count, product_id = decode_cursor(request_cursor)
+
+DAO 에서 사용하는 예시:
+    keys = [('product.id', 'product_id')]
+    if data.get('cursor'):
+        condition, params = keyset_sql([column for column, key in keys], data['cursor'])
+        sql += ' AND ' + condition
+        data.update(params)
+    data['fetch_limit'] = data['limit'] + 1
+    sql += ' ORDER BY product.id DESC LIMIT %(fetch_limit)s'
+    rows, next_cursor = paginate(cursor.fetchall(), data['limit'], [key for column, key in keys])
+"""
+import base64
+import json
+
+from utils.custom_exceptions import InvalidCursor
+
+
+def encode_cursor(values):
+    body = json.dumps(values, separators=(',', ':'), default=str).encode('utf-8')
+    return base64.urlsafe_b64encode(body).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        body = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(body.decode('utf-8'))
+
+    except Exception:
+        raise InvalidCursor('잘못된 커서입니다.')
+
+    if not isinstance(values, list):
+        raise InvalidCursor('잘못된 커서입니다.')
+    return values
+
+
+def keyset_sql(columns, cursor, descending=True):
+    """ 커서 이후의 행만 조회하는 WHERE 조건문과 파라미터를 만든다.
+
+        (a, b) < (x, y) 를 a < x OR (a = x AND b < y) 로 풀어서 작성한다.
+        (MySQL 은 행 생성자 비교에 인덱스 범위 검색을 사용하지 못하는 경우가 있다)
+
+        Args:
+            columns    : ORDER BY 순서대로의 컬럼 리스트. 마지막 컬럼은 유일해야 한다. (보통 id)
+            cursor     : 클라이언트가 보낸 커서 문자열
+            descending : 내림차순 정렬이면 True
+
+        Returns:
+            ('(product.id < %(cursor_0)s)', {'cursor_0': 10})
+
+        Raises:
+            400, {'message': 'invalid_cursor', 'error_message': '잘못된 커서입니다.'} : 잘못된 커서
+    """
+
+    values = decode_cursor(cursor)
+    if len(values) != len(columns):
+        raise InvalidCursor('잘못된 커서입니다.')
+
+    operator = '<' if descending else '>'
+    params = {'cursor_{}'.format(index): value for index, value in enumerate(values)}
+
+    conditions = []
+    for index, column in enumerate(columns):
+        terms = ['{} = %(cursor_{})s'.format(columns[prev], prev) for prev in range(index)]
+        terms.append('{} {} %(cursor_{})s'.format(column, operator, index))
+        conditions.append('(' + ' AND '.join(terms) + ')')
+
+    return '(' + ' OR '.join(conditions) + ')', params
+
+
+def paginate(rows, limit, keys):
+    """ limit + 1 개까지 조회한 rows 를 limit 개로 자르고 다음 페이지 커서를 만든다.
+
+        Args:
+            rows  : limit + 1 개까지 조회한 결과
+            limit : 페이지 크기
+            keys  : 커서에 담을 정렬 키 (rows 의 키 이름, keyset_sql 의 columns 와 같은 순서)
+
+        Returns:
+            (limit 개 이하의 rows, 다음 페이지 커서 또는 마지막 페이지면 None)
+    """
+
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, encode_cursor([rows[-1][key] for key in keys])
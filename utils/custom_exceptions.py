@@ -156,6 +156,21 @@ class DatabaseError(CustomUserError):
         super().__init__(status_code, message, error_message)
 
 
+class DatabaseConnectionTimeout(CustomUserError):
+    """ 커넥션 풀에서 제한 시간 안에 커넥션을 얻지 못함
+
+    Author: agent
+
+    History:
+        2026-10-18(agent): 초기생성
+    """
+    def __init__(self, error_message):
+        status_code = 503
+        message = "database_connection_timeout"
+        error_message = error_message
+        super().__init__(status_code, message, error_message)
+
+
 class DestinationNotExist(CustomUserError):
     """ 배송지 조회 불가
 
@@ -368,6 +383,14 @@ class FileScaleException(CustomUserError):
         super().__init__(status_code, message, error_message)
 
 
+class FileScaleTooLargeException(CustomUserError):
+    def __init__(self, error_message):
+        status_code = 413
+        message = 'file scale too large, 6000 * 6000 at most'
+        error_message = error_message
+        super().__init__(status_code, message, error_message)
+
+
 class FileExtensionException(CustomUserError):
     def __init__(self, error_message):
         status_code = 400
@@ -817,6 +840,24 @@ class NotExistBookmark(CustomUserError):
         super().__init__(status_code, message, error_message)
 
 
+class InvalidBookmarkRequest(CustomUserError):
+    """ 북마크 일괄 추가/삭제 요청이 잘못됨
+
+        상품 아이디가 없거나, 정수가 아니거나, 한번에 처리할 수 있는 개수를 넘었을 때 발생
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기생성
+    """
+
+    def __init__(self, error_message):
+        status_code = 400
+        message = 'invalid_bookmark_request'
+        error_message = error_message
+        super().__init__(status_code, message, error_message)
+
+
 class OrderHistoryCreateDenied(CustomUserError):
     """ 상품 정보 이력 추가 실패
     
@@ -1261,3 +1302,93 @@ class AnswerCreateFail(CustomUserError):
         message = 'answer create'
         error_message = error_message
         super().__init__(status_code, message, error_message)
+
+
+class InvalidCursor(CustomUserError):
+    """ 페이지네이션 커서 해석 불가
+
+    Author: agent
+
+    History:
+        2026-10-18(agent): 초기생성
+    """
+    def __init__(self, error_message):
+        status_code = 400
+        message = 'invalid_cursor'
+        error_message = error_message
+        super().__init__(status_code, message, error_message)
+
+
+class StockLockTimeout(CustomUserError):
+    """ 재고 행 락 대기 시간 초과 (다른 주문이 같은 재고를 처리 중)
+
+    Author: agent
+
+    History:
+        2026-10-18(agent): 초기생성
+    """
+    def __init__(self, error_message):
+        status_code = 409
+        message = 'stock lock timeout'
+        error_message = error_message
+        super().__init__(status_code, message, error_message)
+
+
+class StockReservationConflict(CustomUserError):
+    """ 재고 차감 중 데드락 발생 (트랜잭션 전체가 롤백되어 다시 주문해야 함)
+
+    Author: agent
+
+    History:
+        2026-10-18(agent): 초기생성
+    """
+    def __init__(self, error_message):
+        status_code = 409
+        message = 'stock reservation conflict'
+        error_message = error_message
+        super().__init__(status_code, message, error_message)
+
+
+class InvalidIdempotencyKey(CustomUserError):
+    """ Idempotency-Key 헤더 형식 오류
+
+    Author: agent
+
+    History:
+        2026-10-18(agent): 초기생성
+    """
+    def __init__(self, error_message):
+        status_code = 400
+        message = 'invalid_idempotency_key'
+        error_message = error_message
+        super().__init__(status_code, message, error_message)
+
+
+class IdempotencyKeyInProgress(CustomUserError):
+    """ 같은 Idempotency-Key 의 요청이 아직 처리 중
+
+    Author: agent
+
+    History:
+        2026-10-18(agent): 초기생성
+    """
+    def __init__(self, error_message):
+        status_code = 409
+        message = 'idempotency_key_in_progress'
+        error_message = error_message
+        super().__init__(status_code, message, error_message)
+
+
+class IdempotencyKeyReused(CustomUserError):
+    """ 같은 Idempotency-Key 로 내용이 다른 요청
+
+    Author: agent
+
+    History:
+        2026-10-18(agent): 초기생성
+    """
+    def __init__(self, error_message):
+        status_code = 422
+        message = 'idempotency_key_reused'
+        error_message = error_message
+        super().__init__(status_code, message, error_message)
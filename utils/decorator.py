@@ -1,10 +1,12 @@
 from functools import wraps
 
-from flask import request, g, current_app
+from flask import request, g, current_app, Response
 
 import jwt
 
-from utils.custom_exceptions import UnauthorizedUser, InvalidToken
+from utils import idempotency, response_cache
+from utils.connection import on_commit
+from utils.custom_exceptions import UnauthorizedUser, InvalidToken, InvalidIdempotencyKey
 
 
 def signin_decorator(required=True):
@@ -61,3 +63,153 @@ def signin_decorator(required=True):
             return func(*args, **kwargs)
         return wrapper
     return real_decorator
+
+
+def read_only_decorator(func):
+    """ 읽기 전용 엔드포인트 데코레이터
+
+        Args:
+            *args, **kwargs : 타겟 함수가 사용할 파라미터
+
+        Author: agent
+
+        Returns:
+            func(*args, **kwargs) : g.read_only 를 True 로 설정한 뒤 타겟 함수 실행
+
+        History:
+            2026-10-18(agent): 초기 생성
+
+        Notes:
+            읽기 전용으로 표시된 요청은 요청이 끝날 때 commit 하지 않고 커넥션만 반납한다. (utils.transaction_handler)
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        g.read_only = True
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def idempotent_decorator(func):
+    """ Idempotency-Key 데코레이터
+
+        Args:
+            *args, **kwargs : 타겟 함수가 사용할 파라미터
+
+        Author: agent
+
+        Returns:
+            Idempotency-Key 헤더가 없으면 func(*args, **kwargs)
+            같은 키로 처리가 끝난 요청이 있으면 타겟 함수를 실행하지 않고 저장된 응답 (Idempotent-Replayed: true)
+
+        Raises:
+            400, {'message': 'invalid_idempotency_key', 'errorMessage': ...}     : 키가 너무 김
+            409, {'message': 'idempotency_key_in_progress', 'errorMessage': ...} : 같은 키의 요청이 처리 중
+            422, {'message': 'idempotency_key_reused', 'errorMessage': ...}      : 같은 키로 다른 요청
+
+        History:
+            2026-10-18(agent): 초기 생성
+
+        Notes:
+            signin_decorator 아래에 사용해야 계정 별로 키를 구분한다.
+            응답은 트랜잭션이 commit 된 뒤에 저장한다. (utils.idempotency)
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        header = request.headers.get(idempotency.IDEMPOTENCY_HEADER)
+        if not header:
+            return func(*args, **kwargs)
+
+        if len(header) > idempotency.MAX_KEY_LENGTH:
+            raise InvalidIdempotencyKey('Idempotency-Key 는 255자 이하여야 합니다.')
+
+        key = (request.method, request.endpoint, g.get('account_id'), header)
+        fingerprint = idempotency.request_fingerprint()
+
+        saved = idempotency.begin(key, fingerprint)
+        if saved is not None:
+            response = Response(saved['body'], status=saved['status'], mimetype=saved['mimetype'])
+            response.headers['Idempotent-Replayed'] = 'true'
+            return response
+
+        # 응답이 저장되기 전에 요청이 끝나면 teardown 에서 처리 중 표시를 지운다.
+        g.idempotency_key = key
+
+        response = current_app.make_response(func(*args, **kwargs))
+        if response.status_code < 400:
+            saved = {
+                'status': response.status_code,
+                'body': response.get_data(),
+                'mimetype': response.mimetype
+            }
+            on_commit(
+                g.get('request_connection'),
+                lambda: idempotency.complete(key, fingerprint, saved)
+            )
+        return response
+    return wrapper
+
+
+def response_cache_decorator(tags=()):
+    """ 비로그인 GET 응답 캐시 데코레이터
+
+        Args:
+            tags : 응답에 항상 붙일 고정 태그 (예: ['events'])
+
+        Author: agent
+
+        Returns:
+            로그인한 요청, GET 이 아닌 요청이면 func(*args, **kwargs)
+            캐시된 응답이 있으면 타겟 함수를 실행하지 않고 저장된 응답 (If-None-Match 가 같으면 304)
+
+        History:
+            2026-10-18(agent): 초기 생성
+
+        Notes:
+            read_only_decorator, signin_decorator 보다 위에 사용해야 캐시에 있을 때 커넥션을 사용하지 않는다.
+            태그, 무효화 규칙은 utils.response_cache 참고
+    """
+
+    def real_decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not response_cache.is_cacheable_request():
+                return func(*args, **kwargs)
+
+            key = response_cache.request_key()
+            entry = response_cache.lookup(key)
+            hit = entry is not None
+
+            if not hit:
+                started_generation = response_cache.generation()
+                response = current_app.make_response(func(*args, **kwargs))
+                if response.status_code != 200 or not response.is_json:
+                    return response
+
+                entry = response_cache.store(
+                    key,
+                    response.get_data(),
+                    response.mimetype,
+                    response_cache.collect_tags(response.get_json(), request.view_args, tags),
+                    started_generation
+                )
+
+            return _cached_response(entry, hit)
+        return wrapper
+    return real_decorator
+
+
+def _cached_response(entry, hit):
+    if request.if_none_match.contains(entry['etag']):
+        response = Response(status=304)
+    elif entry['gzip'] is not None and 'gzip' in request.headers.get('Accept-Encoding', ''):
+        response = Response(entry['gzip'], mimetype=entry['mimetype'])
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(entry['body'], mimetype=entry['mimetype'])
+
+    response.set_etag(entry['etag'])
+    response.headers['Vary'] = 'Accept-Encoding, Authorization'
+    response.headers['X-Response-Cache'] = 'hit' if hit else 'miss'
+    return response
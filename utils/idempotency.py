@@ -0,0 +1,100 @@
+""" Idempotency-Key 처리
+
+모바일에서 응답을 받지 못해 같은 쓰기 요청(주문, 장바구니 담기, 북마크)을 다시 보내도
+서비스를 다시 실행하지 않고 처음 응답을 그대로 돌려준다.
+
+처리 규칙:
+    1. 키는 (메소드, 엔드포인트, 계정, Idempotency-Key 헤더 값) 이다. 헤더가 없으면 평소대로 처리한다.
+    2. 같은 키로 요청 내용(메소드, 경로, 본문)이 다르면 422 를 반환한다.
+    3. 처음 요청이 처리 중이면 409 를 반환한다.
+    4. 처음 요청이 성공(400 미만)하고 트랜잭션이 commit 된 뒤에만 응답을 저장한다.
+       에러, rollback 이면 저장하지 않고 처리 중 표시를 지워서 다시 시도할 수 있게 한다.
+    5. 저장한 응답을 돌려줄 때는 Idempotent-Replayed: true 헤더를 붙인다.
+
+저장소는 프로세스 내 캐시(utils.cache)이며 IDEMPOTENCY_TTL 초 동안 유지한다.
+(워커 프로세스마다 따로 저장되므로 같은 워커로 들어온 재시도만 중복 처리를 막는다)
+
+기본적인 사용 예시:
+    @signin_decorator()
+    @idempotent_decorator
+    def post(self, *args): ...
+
+    idempotency_handle(app)  # create_endpoints 에서 transaction_handle(app) 과 함께 호출
+"""
+import hashlib
+import threading
+
+from flask import g, request
+
+from utils.cache import get_cache
+from utils.custom_exceptions import IdempotencyKeyInProgress, IdempotencyKeyReused
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+IDEMPOTENCY_CACHE_NAME = 'idempotency'
+IDEMPOTENCY_CACHE_SIZE = 10000
+IDEMPOTENCY_TTL = 3600
+MAX_KEY_LENGTH = 255
+
+_lock = threading.Lock()
+
+
+def _cache():
+    return get_cache(IDEMPOTENCY_CACHE_NAME, maxsize=IDEMPOTENCY_CACHE_SIZE, ttl=IDEMPOTENCY_TTL)
+
+
+def request_fingerprint():
+    """ 같은 키로 다른 요청을 보냈는지 확인하기 위한 요청 내용 해시 """
+
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(request.full_path.encode())
+    digest.update(request.get_data())
+    return digest.hexdigest()
+
+
+def begin(key, fingerprint):
+    """ 처음 요청이면 처리 중으로 표시하고 None 을, 저장된 응답이 있으면 응답을 반환한다.
+
+        Raises:
+            409, {'message': 'idempotency_key_in_progress', ...} : 같은 키의 요청이 처리 중
+            422, {'message': 'idempotency_key_reused', ...}      : 같은 키로 다른 요청
+    """
+
+    cache = _cache()
+    with _lock:
+        entry = cache.get(key)
+        if entry is None:
+            cache.set(key, {'fingerprint': fingerprint, 'response': None})
+            return None
+
+    if entry['fingerprint'] != fingerprint:
+        raise IdempotencyKeyReused('같은 Idempotency-Key 로 다른 요청을 보낼 수 없습니다.')
+    if entry['response'] is None:
+        raise IdempotencyKeyInProgress('같은 Idempotency-Key 의 요청을 처리 중입니다.')
+    return entry['response']
+
+
+def complete(key, fingerprint, response):
+    """ 처리가 끝난 요청의 응답(status, body, mimetype)을 저장한다. """
+
+    _cache().set(key, {'fingerprint': fingerprint, 'response': response})
+
+
+def release(key):
+    """ 응답이 저장되지 않은 처리 중 표시를 지운다. """
+
+    cache = _cache()
+    with _lock:
+        entry = cache.get(key)
+        if entry is not None and entry['response'] is None:
+            cache.delete(key)
+
+
+def idempotency_handle(app):
+
+    @app.teardown_request
+    def release_idempotency_key(exception):
+        # commit 뒤에 응답이 저장되지 않았으면(에러, rollback, commit 실패) 다시 시도할 수 있게 한다.
+        key = g.pop('idempotency_key', None)
+        if key is not None:
+            release(key)
@@ -0,0 +1,224 @@
+""" 상품 이미지 검사 및 변환 파이프라인
+
+업로드된 이미지를 디코딩하기 전에 바이트 크기와 이미지 헤더(형식, 가로/세로)만 읽어서 검사하고,
+통과한 이미지만 프로세스 풀에서 한번 디코딩해서 리스트/상세용 축소본을 만든다.
+
+처리 규칙:
+    1. 바이트 크기(IMAGE_MAX_BYTES) -> 헤더의 형식(JPEG), 가로/세로(IMAGE_MIN_WIDTH * IMAGE_MIN_HEIGHT 이상,
+       IMAGE_MAX_WIDTH * IMAGE_MAX_HEIGHT 이하) 순서로 검사한다.
+       Image.open 은 헤더만 읽으므로 검사에 실패한 이미지는 디코딩하지 않는다.
+    2. 원본은 다시 인코딩하지 않고 업로드된 바이트를 그대로 저장한다.
+    3. 축소본은 가로 IMAGE_VARIANT_WIDTHS(utils.image_variants) 별로 WebP, JPEG 두 형식을 만든다.
+       JPEG 의 draft 모드로 가장 큰 축소본에 필요한 해상도까지만 한번 디코딩하고 모든 축소본을 그 결과에서 만든다.
+    4. 변환은 프로세스 풀(IMAGE_PROCESS_WORKERS)에서 이미지 별로 동시에 실행하므로 요청 스레드가 CPU 작업을 하지 않는다.
+       풀을 만들 때는 이미 outbox, 카운터, 업로드 스레드가 떠 있으므로 fork 대신 spawn 으로 워커를 시작한다.
+       (fork 는 다른 스레드가 잡고 있던 락을 복사하므로 자식 프로세스가 멈출 수 있다)
+
+축소본의 저장 경로 규칙과 리스트에서의 선택은 utils.image_variants 를 참고한다.
+
+검사와 변환을 나눠 두었으므로 저장소에 이미 있는 이미지(같은 내용 해시)는 변환하지 않을 수 있다.
+
+기본적인 사용 예시:
+    originals = validate_images(request.files.getlist('image_files'))  # [bytes, ...]
+    missing = [data for data in originals if ...]                      # 저장소에 없는 이미지만
+    for variants in transcode_images(missing):                         # [[('_360w.webp', bytes), ...], ...]
+        ...
+"""
+import io
+import multiprocessing
+import os
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from PIL import Image
+
+from utils.image_variants import IMAGE_VARIANT_WIDTHS, IMAGE_VARIANT_FORMATS, variant_suffix
+from utils.custom_exceptions import (
+    NotValidFileException,
+    FileSizeException,
+    FileScaleException,
+    FileScaleTooLargeException,
+    FileExtensionException
+)
+
+IMAGE_MAX_BYTES = 4 * 1024 * 1024
+IMAGE_MIN_WIDTH = 640
+IMAGE_MIN_HEIGHT = 720
+IMAGE_MAX_WIDTH = 6000
+IMAGE_MAX_HEIGHT = 6000
+IMAGE_ALLOWED_FORMATS = ('JPEG',)
+
+IMAGE_VARIANT_QUALITY = 80
+
+IMAGE_PROCESS_WORKERS = max((os.cpu_count() or 2) - 1, 1)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def validate_image(file):
+    """ 이미지를 디코딩하지 않고 바이트 크기와 헤더만 검사한 뒤 업로드된 바이트를 반환한다.
+
+        Args:
+            file : View 에서 받은 이미지 파일 (FileStorage)
+
+        Author: agent
+
+        Returns:
+            업로드된 이미지 바이트
+
+        Raises:
+            400, {'message': 'invalid file',
+                  'errorMessage': 'invalid_file'}: 파일 이름이 공백, 혹은 이미지가 아님
+
+            413, {'message': 'file size too large',
+                  'errorMessage': 'file_size_too_large'}: 파일 사이즈 정책 위반 (4메가 초과)
+
+            413, {'message': 'file scale too small, 640 * 720 at least',
+                  'errorMessage': 'file_scale_at_least_640*720'}: 파일 스케일 정책 위반 (640*720 미만)
+
+            413, {'message': 'file scale too large, 6000 * 6000 at most',
+                  'errorMessage': 'file_scale_at_most_6000*6000'}: 파일 스케일 정책 위반 (6000*6000 초과)
+
+            400, {'message': 'only allowed jpg type',
+                  'errorMessage': 'only_allowed_jpg_type'}: 파일 확장자 정책 위반 (JPG, JPEG 아닌 경우)
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    if not file or not file.filename:
+        raise NotValidFileException('invalid_file')
+
+    file.seek(0, 2)
+    size = file.tell()
+    file.seek(0)
+
+    if not size:
+        raise NotValidFileException('invalid_file')
+
+    if size > IMAGE_MAX_BYTES:
+        raise FileSizeException('file_size_too_large')
+
+    data = file.read()
+
+    try:
+        # 헤더만 읽고 픽셀은 디코딩하지 않는다.
+        with Image.open(io.BytesIO(data)) as image:
+            image_format = image.format
+            width, height = image.size
+
+    except Exception:
+        raise NotValidFileException('invalid_file')
+
+    if image_format not in IMAGE_ALLOWED_FORMATS:
+        raise FileExtensionException('only_allowed_jpg_type')
+
+    if width < IMAGE_MIN_WIDTH or height < IMAGE_MIN_HEIGHT:
+        raise FileScaleException('file_scale_at_least_640*720')
+
+    # 압축률이 높은 파일은 작은 바이트로도 디코딩할 때 큰 메모리를 사용하므로 가로/세로도 제한한다.
+    if width > IMAGE_MAX_WIDTH or height > IMAGE_MAX_HEIGHT:
+        raise FileScaleTooLargeException('file_scale_at_most_6000*6000')
+
+    return data
+
+
+def transcode_image(data, widths=IMAGE_VARIANT_WIDTHS):
+    """ 이미지를 한번 디코딩해서 가로 widths 별 축소본을 만든다. (프로세스 풀에서 실행)
+
+        Returns:
+            [(variant_suffix, 인코딩된 바이트), ...]
+    """
+
+    with Image.open(io.BytesIO(data)) as image:
+        width, height = image.size
+        largest = min(max(widths), width)
+
+        # JPEG 는 필요한 해상도(1/2, 1/4, 1/8)까지만 디코딩한다.
+        image.draft('RGB', (largest, max(height * largest // width, 1)))
+        image.load()
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+
+        variants = []
+        for variant_width in sorted(widths, reverse=True):
+            target = (min(variant_width, width), max(height * min(variant_width, width) // width, 1))
+            resized = image if image.size == target else image.resize(target, Image.LANCZOS, reducing_gap=3.0)
+
+            for image_format, extension in IMAGE_VARIANT_FORMATS:
+                buffer = io.BytesIO()
+                resized.save(buffer, image_format, quality=IMAGE_VARIANT_QUALITY, optimize=True)
+                variants.append((variant_suffix(variant_width, extension), buffer.getvalue()))
+
+        return variants
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=IMAGE_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _executor
+
+
+def _reset_executor():
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def validate_images(files):
+    """ 이미지들을 모두 검사하고 업로드된 바이트 리스트를 반환한다. (files 와 같은 순서)
+
+        Raises:
+            validate_image 와 같음
+    """
+
+    return [validate_image(file) for file in files]
+
+
+def transcode_images(originals):
+    """ 검사를 통과한 이미지 바이트들의 축소본을 프로세스 풀에서 동시에 만든다.
+
+        Args:
+            originals : validate_images 가 반환한 이미지 바이트 리스트
+
+        Author: agent
+
+        Returns:
+            [[('_720w.webp', bytes), ('_720w.jpg', bytes), ...], ...] (originals 와 같은 순서)
+
+        Raises:
+            400, {'message': 'invalid file',
+                  'errorMessage': 'invalid_file'}: 디코딩 실패 (손상된 파일)
+
+        History:
+            2026-10-18(agent): 초기 생성 (ingest_images)
+            2026-10-18(agent): 검사(validate_images)와 변환을 분리, 저장소에 없는 이미지만 변환하도록 변경
+    """
+
+    if not originals:
+        return []
+
+    try:
+        executor = _get_executor()
+        return list(executor.map(transcode_image, originals))
+
+    except BrokenProcessPool:
+        # 워커 프로세스가 죽었으면 풀을 새로 만들도록 버리고 이번 요청은 현재 스레드에서 변환한다.
+        _reset_executor()
+        try:
+            return [transcode_image(data) for data in originals]
+        except Exception:
+            raise NotValidFileException('invalid_file')
+
+    except Exception:
+        raise NotValidFileException('invalid_file')
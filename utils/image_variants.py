@@ -0,0 +1,80 @@
+""" 상품 이미지 축소본 경로 규칙과 리스트 이미지 선택
+
+상품 이미지를 등록할 때 utils.image_pipeline 이 가로 IMAGE_VARIANT_WIDTHS 별 축소본을 만들고,
+product_images.variant_widths 에 만든 가로 크기를 '180,360,720' 처럼 기록한다.
+축소본의 경로는 원본 경로(내용 해시 경로, utils.amazon_s3.GenerateFilePath.generate_content_key) + variant_suffix(가로, 확장자) 이다.
+    productImages/3f/3f1c...e2           : 원본
+    productImages/3f/3f1c...e2_360w.webp : 가로 360 WebP 축소본
+
+리스트 DAO 는 원본 이미지 경로와 함께 variant_widths 를 image_variant_widths 로 조회하고,
+서비스는 캐시에서 꺼낸 리스트를 내려주기 전에 select_image_variants 로 요청한 크기의 경로로 바꿔준다.
+(캐시에는 크기와 상관없는 원본 행이 들어가므로 크기 별로 따로 캐시하지 않는다)
+
+처리 규칙:
+    1. size 가 'original' 이거나 축소본이 기록되지 않은 이미지(축소본 도입 전 이미지)는 원본 경로를 그대로 내려준다.
+    2. image_variant_widths 는 응답에서 뺀다.
+    3. 캐시된 리스트를 수정하지 않도록 상품 dict 를 복사해서 반환한다.
+
+기본적인 사용 예시:
+    product_list = select_image_variants(product_list, data['image_size'], data['image_format'])
+"""
+
+IMAGE_VARIANT_WIDTHS = (180, 360, 720)
+
+# (Pillow 저장 형식, 확장자)
+IMAGE_VARIANT_FORMATS = (('WEBP', 'webp'), ('JPEG', 'jpg'))
+
+IMAGE_SIZES = {
+    'small': 180,
+    'medium': 360,
+    'large': 720,
+    'original': None
+}
+IMAGE_FORMATS = [extension for _, extension in IMAGE_VARIANT_FORMATS]
+
+DEFAULT_IMAGE_SIZE = 'medium'
+DEFAULT_IMAGE_FORMAT = 'jpg'
+
+# 리스트 DAO 마다 대표 이미지 컬럼 이름이 다르다.
+IMAGE_FIELDS = ('image', 'image_url')
+
+
+def variant_suffix(width, extension):
+    return '_{}w.{}'.format(width, extension)
+
+
+def format_variant_widths(widths=IMAGE_VARIANT_WIDTHS):
+    """ product_images.variant_widths 에 기록할 값 """
+
+    return ','.join(str(width) for width in sorted(widths))
+
+
+def select_image_variants(products, size=DEFAULT_IMAGE_SIZE, image_format=DEFAULT_IMAGE_FORMAT):
+    """ 상품 리스트의 대표 이미지를 요청한 크기의 축소본 경로로 바꾼 새 리스트를 반환한다.
+
+        Args:
+            products     : 대표 이미지(image 또는 image_url)와 image_variant_widths 를 가진 상품 dict 리스트
+            size         : 'small', 'medium', 'large', 'original' (None 이면 DEFAULT_IMAGE_SIZE)
+            image_format : 'webp', 'jpg' (None 이면 DEFAULT_IMAGE_FORMAT)
+
+        Returns: [{'product_id': 1, 'image': 'productImages/3f/3f1c...e2_360w.jpg', ...}, ...]
+    """
+
+    if not isinstance(products, (list, tuple)):
+        return products
+
+    width = IMAGE_SIZES.get(size or DEFAULT_IMAGE_SIZE)
+    suffix = variant_suffix(width, image_format or DEFAULT_IMAGE_FORMAT) if width else None
+
+    result = []
+    for product in products:
+        product = dict(product)
+        widths = product.pop('image_variant_widths', None)
+
+        if suffix and widths and str(width) in widths.split(','):
+            for field in IMAGE_FIELDS:
+                if product.get(field):
+                    product[field] += suffix
+
+        result.append(product)
+    return result
@@ -0,0 +1,148 @@
+""" 비로그인 GET 응답 캐시
+
+로그인하지 않은(Authorization 헤더가 없는) 스토어 조회 요청은 계정과 상관없이 응답이 같으므로
+JSON 으로 인코딩된 응답 바이트(와 gzip 으로 압축한 바이트)를 경로+쿼리스트링 별로 저장해 두고 그대로 내려준다.
+캐시에 있으면 데이터베이스 커넥션, 서비스 실행, JSON 인코딩(CustomJSONEncoder)을 모두 건너뛴다.
+
+처리 규칙:
+    1. GET 이고 Authorization 헤더가 없는 요청만 캐시한다. 상태 코드 200 인 JSON 응답만 저장한다.
+    2. 응답에는 내용 해시로 만든 ETag 를 붙이고 If-None-Match 가 같으면 304 를 반환한다.
+    3. 응답이 RESPONSE_GZIP_MIN_BYTES 이상이면 gzip 으로 한번만 압축해서 저장하고,
+       Accept-Encoding 에 gzip 이 있는 요청에는 압축된 바이트를 내려준다.
+    4. 응답마다 태그를 붙여서 태그 단위로 무효화한다.
+        - URL 변수: ('product', 1), ('event', 3), ('seller', 4)
+        - 응답 본문에 들어있는 product_id, event_id, seller_id
+        - 데코레이터에 넘겨준 고정 태그 (예: 'events')
+    5. 응답을 만드는 동안 무효화가 일어나면 그 응답은 저장하지 않는다.
+
+저장소는 프로세스 내 캐시(utils.cache)이며 RESPONSE_CACHE_TTL 초 동안 유지한다.
+(다른 워커 프로세스에서 일어난 변경은 태그 무효화가 전달되지 않으므로 TTL 이 지나야 반영된다)
+
+기본적인 사용 예시:
+    @response_cache_decorator(tags=['events'])
+    @read_only_decorator
+    @signin_decorator(False)
+    def get(self, *args): ...
+
+    on_commit(connection, lambda: invalidate_response_tags([('product', product_id)]))
+"""
+import gzip
+import hashlib
+import threading
+
+from flask import request
+
+from utils.cache import get_cache
+
+RESPONSE_CACHE_NAME = 'response'
+RESPONSE_CACHE_TTL = 30
+RESPONSE_CACHE_BYTES = 32 * 1024 * 1024
+RESPONSE_GZIP_MIN_BYTES = 1024
+
+# 태그 -> 응답 키 인덱스가 이 크기를 넘으면 캐시에서 이미 빠진 키를 정리한다.
+TAG_INDEX_LIMIT = 50000
+
+TAG_FIELDS = {
+    'product_id': 'product',
+    'event_id': 'event',
+    'seller_id': 'seller'
+}
+
+_lock = threading.Lock()
+_tag_index = dict()
+_generation = 0
+
+
+def _cache():
+    return get_cache(
+        RESPONSE_CACHE_NAME,
+        maxsize=RESPONSE_CACHE_BYTES,
+        ttl=RESPONSE_CACHE_TTL,
+        getsizeof=lambda entry: len(entry['body']) + len(entry['gzip'] or b'')
+    )
+
+
+def is_cacheable_request():
+    return request.method == 'GET' and not request.headers.get('Authorization')
+
+
+def request_key():
+    return request.full_path
+
+
+def generation():
+    """ 응답을 만들기 전에 저장해 두고 store() 에 넘겨서 그 사이에 무효화가 있었는지 확인한다. """
+
+    return _generation
+
+
+def lookup(key):
+    return _cache().get(key)
+
+
+def store(key, body, mimetype, tags, started_generation):
+    """ 인코딩된 응답을 저장하고 저장한 항목을 반환한다. (그 사이 무효화가 있었으면 저장하지 않는다) """
+
+    compressed = gzip.compress(body, 6) if len(body) >= RESPONSE_GZIP_MIN_BYTES else None
+    entry = {
+        'body': body,
+        'gzip': compressed if compressed is not None and len(compressed) < len(body) else None,
+        'mimetype': mimetype,
+        'etag': hashlib.sha1(body).hexdigest()
+    }
+
+    cache = _cache()
+    with _lock:
+        if started_generation != _generation:
+            return entry
+        cache.set(key, entry)
+        for tag in tags:
+            _tag_index.setdefault(tag, set()).add(key)
+        if len(_tag_index) > TAG_INDEX_LIMIT:
+            _prune(cache)
+    return entry
+
+
+def invalidate_response_tags(tags):
+    """ 태그가 붙은 응답을 모두 지운다. """
+
+    global _generation
+    cache = _cache()
+    with _lock:
+        _generation += 1
+        keys = set()
+        for tag in tags:
+            keys |= _tag_index.pop(tag, set())
+        cache.delete_many(keys)
+
+
+def collect_tags(payload, view_args, static_tags=()):
+    """ URL 변수, 응답 본문의 아이디, 고정 태그로 응답의 태그 집합을 만든다. """
+
+    tags = set(static_tags)
+    for name, value in (view_args or {}).items():
+        if name in TAG_FIELDS:
+            # /products/<product_id> 처럼 변환기가 없는 URL 변수는 문자열이다.
+            tags.add((TAG_FIELDS[name], int(value) if str(value).isdigit() else value))
+
+    stack = [payload]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for name, item in value.items():
+                if name in TAG_FIELDS and isinstance(item, int):
+                    tags.add((TAG_FIELDS[name], item))
+                elif isinstance(item, (dict, list)):
+                    stack.append(item)
+        elif isinstance(value, list):
+            stack.extend(value)
+    return tags
+
+
+def _prune(cache):
+    for tag in list(_tag_index):
+        keys = {key for key in _tag_index[tag] if cache.contains(key)}
+        if keys:
+            _tag_index[tag] = keys
+        else:
+            del _tag_index[tag]
@@ -10,6 +10,8 @@ class CustomRule(AbstractRule):
 import re
 from flask_request_validator import AbstractRule
 
+from utils.image_variants import IMAGE_SIZES, IMAGE_FORMATS
+
 
 class NumberRule(AbstractRule):
     def validate(self, value):
@@ -404,3 +406,72 @@ class PageRule(AbstractRule):
         if value <= 0:
             errors.append('page cannot be less than 1')
         return value, errors
+
+
+class ExportFormatRule(AbstractRule):
+    """ 파일 다운로드 형식은 xlsx, csv 만 허용한다.
+
+        Author: agent
+
+        History:
+            2026-10-18(agent)
+    """
+    def validate(self, value):
+        format_set = ['xlsx', 'csv']
+        errors = []
+        if value not in format_set:
+            errors.append('format must be one of xlsx, csv')
+        return value, errors
+
+
+class ImageSizeRule(AbstractRule):
+    """ 리스트 대표 이미지 크기 (utils.image_variants.IMAGE_SIZES) 만 허용한다.
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+    def validate(self, value):
+        errors = []
+        if value not in IMAGE_SIZES:
+            errors.append('small, medium, large, original 값만 받습니다.')
+        return value, errors
+
+
+class ImageFormatRule(AbstractRule):
+    """ 리스트 대표 이미지 형식 (utils.image_variants.IMAGE_FORMATS) 만 허용한다.
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+    def validate(self, value):
+        errors = []
+        if value not in IMAGE_FORMATS:
+            errors.append('webp, jpg 값만 받습니다.')
+        return value, errors
+
+
+class NonNegativeInteger(AbstractRule):
+    """ 0 이상의 정수만 허용한다. (offset 등) """
+
+    def validate(self, value):
+        errors = []
+        if value < 0:
+            errors.append('must_be_0_or_bigger')
+        return value, errors
+
+
+class MaxInteger(AbstractRule):
+    """ maximum 이하의 정수만 허용한다. (limit 등) """
+
+    def __init__(self, maximum):
+        self.maximum = maximum
+
+    def validate(self, value):
+        errors = []
+        if value > self.maximum:
+            errors.append('must_be_{}_or_less'.format(self.maximum))
+        return value, errors
@@ -0,0 +1,230 @@
+""" 프로세스 내 n-gram 역색인과 자동완성 트라이
+
+한글은 띄어쓰기 단위로 단어를 나누기 어렵기 때문에 공백을 제외한 글자 단위 1-gram, 2-gram 으로 색인한다.
+검색어의 모든 토큰을 가진 문서를 posting 교집합으로 찾고, 원문에 검색어가 실제로 포함되어 있는지 한번 더 확인한다.
+(기존 LIKE '%검색어%' 와 같은 결과를 인덱스로 찾는다)
+
+기본적인 사용 예시:
+    index = InvertedIndex()
+    index.add(1, ['성보의 하루', '나는셀러1'], {'sales_count': 30})
+    index.search('하루')  # {1}
+
+문서는 여러개의 텍스트(예: 상품명, 셀러명)를 가질 수 있고 검색어는 그 중 하나에만 포함되면 된다.
+
+    trie = PrefixTrie()
+    trie.add('성보의 하루', 31)  # 가중치 증감
+    trie.suggest('성보')         # ['성보의 하루']
+"""
+import threading
+import unicodedata
+
+
+def normalize(text):
+    """ 검색용 정규화: 유니코드 NFC, 소문자, 연속 공백 하나로 """
+
+    text = unicodedata.normalize('NFC', text or '').lower()
+    return ' '.join(text.split())
+
+
+def tokenize(text):
+    """ 정규화된 문자열의 1-gram, 2-gram 집합. 2-gram 은 공백을 넘지 않는다. """
+
+    tokens = set()
+    for word in text.split():
+        tokens.update(word)
+        tokens.update(word[index:index + 2] for index in range(len(word) - 1))
+    return tokens
+
+
+def _normalize_texts(texts):
+    if isinstance(texts, str):
+        texts = [texts]
+    return tuple(normalize(text) for text in texts)
+
+
+def _tokenize_texts(texts):
+    tokens = set()
+    for text in texts:
+        tokens |= tokenize(text)
+    return tokens
+
+
+def query_tokens(text):
+    """ 검색어 토큰: 두 글자 이상인 단어는 2-gram 만, 한 글자 단어는 1-gram 을 사용한다. """
+
+    tokens = set()
+    for word in text.split():
+        if len(word) == 1:
+            tokens.add(word)
+        else:
+            tokens.update(word[index:index + 2] for index in range(len(word) - 1))
+    return tokens
+
+
+class InvertedIndex:
+    """ 스레드 안전한 n-gram 역색인
+
+        Attributes:
+            documents : {doc_id: {'texts': 정규화된 색인 문자열들, 'fields': 정렬 등에 사용할 값}}
+            postings  : {token: set(doc_id)}
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self):
+        self.documents = dict()
+        self.postings = dict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.documents)
+
+    def add(self, doc_id, texts, fields=None):
+        """ 문서를 색인한다. 이미 있는 문서면 교체한다. texts: 문자열 또는 문자열 리스트 """
+
+        texts = _normalize_texts(texts)
+        with self._lock:
+            self._remove(doc_id)
+            self.documents[doc_id] = {'texts': texts, 'fields': fields or dict()}
+            for token in _tokenize_texts(texts):
+                self.postings.setdefault(token, set()).add(doc_id)
+
+    def remove(self, doc_id):
+        with self._lock:
+            self._remove(doc_id)
+
+    def replace_all(self, documents):
+        """ 전체 문서를 새로 색인한다. documents: [(doc_id, texts, fields)] """
+
+        new_documents = dict()
+        new_postings = dict()
+        for doc_id, texts, fields in documents:
+            texts = _normalize_texts(texts)
+            new_documents[doc_id] = {'texts': texts, 'fields': fields or dict()}
+            for token in _tokenize_texts(texts):
+                new_postings.setdefault(token, set()).add(doc_id)
+
+        with self._lock:
+            self.documents = new_documents
+            self.postings = new_postings
+
+    def search(self, query):
+        """ 검색어가 포함된 문서 아이디 집합을 반환한다. """
+
+        query = normalize(query)
+        tokens = query_tokens(query)
+        if not tokens:
+            return set()
+
+        with self._lock:
+            postings = sorted((self.postings.get(token, set()) for token in tokens), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates &= posting
+                if not candidates:
+                    return candidates
+
+            return {
+                doc_id for doc_id in candidates
+                if any(query in text for text in self.documents[doc_id]['texts'])
+            }
+
+    def fields(self, doc_id):
+        with self._lock:
+            document = self.documents.get(doc_id)
+            return document['fields'] if document else None
+
+    def _remove(self, doc_id):
+        document = self.documents.pop(doc_id, None)
+        if not document:
+            return
+
+        for token in _tokenize_texts(document['texts']):
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            posting.discard(doc_id)
+            if not posting:
+                del self.postings[token]
+
+
+class _TrieNode:
+    __slots__ = ('children', 'weight', 'display', 'top')
+
+    def __init__(self):
+        self.children = dict()
+        self.weight = 0
+        self.display = None
+        self.top = []
+
+
+class PrefixTrie:
+    """ 자동완성용 접두어 트라이
+
+        노드마다 하위 단어 중 가중치가 높은 top_k 개를 미리 계산해 두므로
+        suggest 는 접두어 길이만큼만 내려가면 된다.
+
+        Attributes:
+            top_k : 노드마다 미리 계산해 두는 추천어 개수
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+
+        Notes:
+            단어는 normalize 한 값으로 찾고, 추천어는 마지막으로 추가된 원래 표기(display)로 반환한다.
+            add 의 weight 는 증감값이며 가중치가 0 이하가 되면 추천어에서 빠진다.
+    """
+
+    def __init__(self, top_k=10):
+        self.top_k = top_k
+        self._root = _TrieNode()
+        self._lock = threading.RLock()
+
+    def add(self, term, weight, display=None):
+        key = normalize(term)
+        if not key:
+            return
+
+        with self._lock:
+            path = [self._root]
+            for char in key:
+                path.append(path[-1].children.setdefault(char, _TrieNode()))
+
+            node = path[-1]
+            node.weight += weight
+            if display is not None and weight > 0:
+                node.display = display
+            if node.display is None:
+                node.display = term
+
+            # 리프부터 루트까지 top 을 다시 계산하고, 비어있는 노드는 정리한다.
+            for depth in range(len(path) - 1, -1, -1):
+                current = path[depth]
+                self._update_top(current)
+                if depth and not current.top and not current.children:
+                    del path[depth - 1].children[key[depth - 1]]
+
+    def suggest(self, prefix, limit=10):
+        key = normalize(prefix)
+        if not key:
+            return []
+
+        with self._lock:
+            node = self._root
+            for char in key:
+                node = node.children.get(char)
+                if node is None:
+                    return []
+            return [display for weight, display in node.top[:limit]]
+
+    def _update_top(self, node):
+        candidates = [] if node.weight <= 0 else [(node.weight, node.display)]
+        for child in node.children.values():
+            candidates.extend(child.top)
+        candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+        node.top = candidates[:self.top_k]
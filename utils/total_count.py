@@ -0,0 +1,102 @@
+""" 어드민 리스트 화면의 전체 개수(COUNT) 조회
+
+같은 필터로 페이지만 넘기는 요청이 매번 같은 COUNT(*) 를 다시 실행하지 않도록
+정규화한 (COUNT 쿼리, 쿼리에서 사용하는 파라미터) 별로 결과를 짧게 캐싱한다.
+
+처리 규칙:
+    1. 캐시에 있으면 그대로 반환한다.
+    2. load=False 이면(예: 2페이지 이후) 캐시에 없을 때 조회하지 않고 None 을 반환한다.
+    3. EXPLAIN 으로 예상 행 수를 먼저 확인해서 estimate_over 이상이면 정확한 COUNT 대신 예상값을 반환한다.
+    4. 그 외에는 COUNT 를 실행하고 캐싱한다.
+
+기본적인 사용 예시:
+    count = get_total_count(connection, total_count_sql, data, load=data['page'] == 0)
+    count['total_count']   # 전체 개수 또는 None
+    count['is_estimated']  # 예상값이면 True
+"""
+import re
+
+import pymysql
+
+from utils.cache import get_cache
+
+TOTAL_COUNT_CACHE_NAME = 'total_count'
+TOTAL_COUNT_CACHE_TTL = 30
+TOTAL_COUNT_CACHE_SIZE = 4096
+ESTIMATE_OVER = 100000
+
+_PARAM_PATTERN = re.compile(r'%\((\w+)\)s')
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _cache_key(sql, params):
+    """ 공백을 정리한 쿼리와 쿼리에서 실제로 사용하는 파라미터만으로 키를 만든다.
+        (page, length, cursor 처럼 COUNT 와 상관없는 값은 키에서 빠진다)
+    """
+
+    names = sorted(set(_PARAM_PATTERN.findall(sql)))
+    return ' '.join(sql.split()), tuple((name, _freeze(params.get(name))) for name in names)
+
+
+def estimate_count(connection, sql, params):
+    """ EXPLAIN 의 테이블 별 예상 행 수(rows * filtered) 중 가장 큰 값을 예상 개수로 사용한다. """
+
+    with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        cursor.execute('EXPLAIN ' + sql, params)
+        plans = cursor.fetchall()
+
+    estimate = 0
+    for plan in plans:
+        rows = plan.get('rows') or 0
+        filtered = plan.get('filtered')
+        if filtered is not None:
+            rows = rows * float(filtered) / 100
+        estimate = max(estimate, int(rows))
+    return estimate
+
+
+def get_total_count(connection, sql, params, load=True, estimate_over=ESTIMATE_OVER):
+    """ COUNT 쿼리 결과를 캐시 또는 데이터베이스에서 조회한다.
+
+        Args:
+            connection    : 데이터베이스 연결 객체
+            sql           : SELECT COUNT(*) AS total_count ... 쿼리
+            params        : 쿼리 파라미터 dict
+            load          : 캐시에 없을 때 조회할지 여부
+            estimate_over : 예상 행 수가 이 값 이상이면 예상값을 반환한다. (None 이면 항상 정확한 값)
+
+        Author: agent
+
+        Returns:
+            {'total_count': 951, 'is_estimated': False}
+            {'total_count': None, 'is_estimated': False} : load=False 이고 캐시에 없는 경우
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    cache = get_cache(TOTAL_COUNT_CACHE_NAME, maxsize=TOTAL_COUNT_CACHE_SIZE, ttl=TOTAL_COUNT_CACHE_TTL)
+    key = _cache_key(sql, params)
+
+    count = cache.get(key)
+    if count is not None or not load:
+        return dict(count) if count else {'total_count': None, 'is_estimated': False}
+
+    if estimate_over is not None:
+        estimate = estimate_count(connection, sql, params)
+        if estimate >= estimate_over:
+            count = {'total_count': estimate, 'is_estimated': True}
+            cache.set(key, count)
+            return dict(count)
+
+    with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+        cursor.execute(sql, params)
+        count = {'total_count': cursor.fetchone()['total_count'], 'is_estimated': False}
+
+    cache.set(key, count)
+    return dict(count)
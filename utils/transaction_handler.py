@@ -0,0 +1,97 @@
+""" 요청 단위 트랜잭션 통합 관리
+
+뷰에서 get_request_connection() 으로 받은 커넥션의 commit, rollback, 풀 반납을 요청이 끝날 때 한번만 처리한다.
+커넥션은 DAO 가 처음 사용할 때 빌려오므로 DB 를 쓰지 않는 요청은 커넥션을 잡지 않는다.
+
+처리 규칙:
+    1. 응답 코드가 400 미만이고 읽기 전용(read_only_decorator) 이 아니면 commit.
+    2. 그 외(에러 응답, 읽기 전용)에는 rollback 후 반납.
+    3. 처리되지 않은 예외로 after_request 가 실행되지 못한 경우 teardown 에서 rollback 후 반납.
+    4. commit 한 요청의 계정은 잠시 동안 읽기도 primary 를 사용한다. (utils.connection.record_write)
+    5. commit 이 끝나면 utils.connection.on_commit 으로 등록된 함수들을 실행한다.
+
+엔드포인트 별로 커넥션을 잡고 있던 시간을 집계하며 get_endpoint_db_stats() 로 확인할 수 있다.
+
+기본적인 사용 예시:
+    transaction_handle(app)  # create_endpoints 에서 error_handle(app) 과 함께 호출
+"""
+import threading
+import traceback
+
+from flask import g, request
+
+from utils.connection import record_write
+
+_endpoint_stats = dict()
+_endpoint_stats_lock = threading.Lock()
+
+
+def _record(endpoint, held, replica):
+    with _endpoint_stats_lock:
+        stats = _endpoint_stats.setdefault(endpoint, {
+            'connections': 0,
+            'replica_connections': 0,
+            'db_seconds': 0.0,
+            'max_db_seconds': 0.0
+        })
+        stats['connections'] += 1
+        stats['replica_connections'] += int(replica)
+        stats['db_seconds'] += held
+        stats['max_db_seconds'] = max(stats['max_db_seconds'], held)
+
+
+def _release(connection):
+    replica = connection.replica
+    held = connection.release()
+    _record(request.endpoint, held, replica)
+
+
+def get_endpoint_db_stats():
+    """ 엔드포인트 별 커넥션 사용 횟수, 누적/최대 커넥션 점유 시간(초)을 반환한다. """
+
+    with _endpoint_stats_lock:
+        return {endpoint: dict(stats) for endpoint, stats in _endpoint_stats.items()}
+
+
+def transaction_handle(app):
+
+    @app.after_request
+    def finish_request_connection(response):
+        connection = g.pop('request_connection', None)
+        if connection is None:
+            return response
+
+        succeeded = response.status_code < 400
+
+        if connection.acquired:
+            try:
+                if succeeded and not connection.read_only:
+                    connection.commit()
+                    record_write(connection.database, connection.account_id)
+                else:
+                    connection.rollback()
+            finally:
+                _release(connection)
+
+        callbacks = connection.pop_after_commit()
+        if succeeded:
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception:
+                    traceback.print_exc()
+
+        return response
+
+    @app.teardown_request
+    def teardown_request_connection(exception):
+        connection = g.pop('request_connection', None)
+        if connection is None or not connection.acquired:
+            return
+
+        try:
+            connection.rollback()
+        except Exception:
+            traceback.print_exc()
+        finally:
+            _release(connection)
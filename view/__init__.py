@@ -1,7 +1,8 @@
 """ 엔드 포인트의 시작 및 URL 관리
 
 create_endpoints 함수가 정의되어 있는 곳. 함수 안에 사용할 url endpoint 를 정의한다.
-파일 끝에 error_handle()함수를 호출 한다.
+파일 끝에 transaction_handle(), idempotency_handle(), error_handle()함수를 호출 한다.
+뷰에서는 utils.connection.get_request_connection 으로 커넥션을 받고 commit/rollback/close 는 직접 하지 않는다.
 
 기본적인 사용 예시:
     app.add_url_rule('/test', view_func=TestUserView.as_view('test_user_view', test_user_service, database))
@@ -11,13 +12,14 @@ create_endpoints 함수가 정의되어 있는 곳. 함수 안에 사용할 url
 # service
 from .sample_user_view         import SampleUserView
 from .store.user_view          import SignUpView, SignInView, GoogleSocialSignInView
-from .store.product_list_view  import ProductListView, ProductSearchView, ProductDetailView
+from .store.product_list_view  import ProductListView, ProductSearchView, ProductAutocompleteView, ProductDetailView
 from .store.category_list_view import CategoryListView
+from .store.home_feed_view import HomeFeedView
 from .store.destination_view import DestinationView, DestinationDetailView
-from .store.cart_item_view import CartItemView, CartItemAddView
+from .store.cart_item_view import CartItemView, CartItemAddView, CartSummaryView
 from .store.sender_view import SenderView
-from .store.store_order_view import StoreOrderView, StoreOrderAddView
-from .store.bookmark_view import BookmarkView
+from .store.store_order_view import StoreOrderView, StoreOrderAddView, StoreCartOrderView
+from .store.bookmark_view import BookmarkView, BookmarkListView
 from .store.event_list_view import EventBannerListView, EventDetailInformationView, EventDetailProductListView, EventDetailButtonListView
 from .store.product_enquiry_view import ProductEnquiryListView, MyPageEnquiryListView
 from .store.seller_shop_view import SellerShopView, SellerShopSearchView, SellerShopCategoryView, SellerShopProductListView
@@ -33,9 +35,12 @@ from .admin.seller_view import SellerSignupView, SellerSigninView, SellerInfoVie
     SellerPasswordView, SellerSearchView, SellerListView
 from .admin.product_create_view import MainCategoriesListView, CreateProductView
 from .admin.product_manage_view import ProductManageSearchView, ProductManageDetailView
+from .admin.stats_view import StatsView
 
 
 from utils.error_handler import error_handle
+from utils.transaction_handler import transaction_handle
+from utils.idempotency import idempotency_handle
 
 
 def create_endpoints(app, services, database):
@@ -58,6 +63,8 @@ def create_endpoints(app, services, database):
                 2020-12-29(김기용): 1차 수정
                 2020-12-31(강두연): 2차 수정
                 2020-12-31(심원두): 3차 수정
+                2026-10-18(agent): 요청 단위 커넥션(트랜잭션) 관리 등록
+                2026-10-18(agent): 상품 자동완성, 통계 엔드포인트 추가
     """
 
     # service
@@ -111,6 +118,14 @@ def create_endpoints(app, services, database):
                          database
                      ))
 
+    # product_autocomplete
+    app.add_url_rule('/products/autocomplete',
+                     view_func=ProductAutocompleteView.as_view(
+                         'product_autocomplete',
+                         product_list_service,
+                         database
+                     ))
+
     # destination 상세 정보 불러오기
     app.add_url_rule('/destination/<destination_id>',
                      view_func=DestinationDetailView.as_view(
@@ -165,6 +180,13 @@ def create_endpoints(app, services, database):
                          database
                      ))
 
+    app.add_url_rule('/home',
+                     view_func=HomeFeedView.as_view(
+                         'home_feed_view',
+                         services,
+                         database
+                     ))
+
     app.add_url_rule('/products/<int:product_id>/bookmarks',
                      view_func=BookmarkView.as_view(
                          'bookmark_view',
@@ -172,6 +194,13 @@ def create_endpoints(app, services, database):
                          database
                      ))
 
+    app.add_url_rule('/bookmarks',
+                     view_func=BookmarkListView.as_view(
+                         'bookmark_list_view',
+                         services,
+                         database
+                     ))
+
     app.add_url_rule('/event-list',
                      view_func=EventBannerListView.as_view(
                         'event_banner_list_view',
@@ -225,6 +254,14 @@ def create_endpoints(app, services, database):
                          database
                      ))
 
+    # 장바구니 전체 요약 조회 엔드포인트
+    app.add_url_rule('/checkout/cart/summary',
+                     view_func=CartSummaryView.as_view(
+                         'cart_summary_view',
+                         cart_item_service,
+                         database
+                     ))
+
     # 장바구니 상품 조회 엔드포인트
     app.add_url_rule('/checkout/cart/<int:cart_id>',
                      view_func=CartItemView.as_view(
@@ -249,6 +286,14 @@ def create_endpoints(app, services, database):
                         database
                     ))
 
+    # 장바구니 여러 상품 결제 엔드포인트
+    app.add_url_rule('/checkout/cart/orders',
+                     view_func=StoreCartOrderView.as_view(
+                        'store_cart_order_view',
+                        store_order_service,
+                        database
+                    ))
+
     # 상품 결제 조회 엔드포인트
     app.add_url_rule('/checkout/<int:order_id>',
                     view_func=StoreOrderView.as_view(
@@ -446,6 +491,10 @@ def create_endpoints(app, services, database):
                          database
                      ))
 
+    # 캐시, 커넥션 풀, 검색 색인 통계 (마스터 전용)
+    app.add_url_rule('/admin/stats',
+                     view_func=StatsView.as_view('stats_view'))
+
 # ----------------------------------------------------------------------------------------------------------------------
 # 이영주 ◟( ˘ ³˘)◞ ♡
 # ----------------------------------------------------------------------------------------------------------------------
@@ -483,5 +532,7 @@ def create_endpoints(app, services, database):
 
 # ----------------------------------------------------------------------------------------------------------------------
     # don't touch this
+    transaction_handle(app)
+    idempotency_handle(app)
     error_handle(app)
 # ----------------------------------------------------------------------------------------------------------------------
@@ -2,8 +2,9 @@ import json
 
 from flask import jsonify, request
 from flask.views import MethodView
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail, DateMissingOne, EventSearchTwoInput
+from utils.connection import get_request_connection
+from utils.decorator import read_only_decorator
+from utils.custom_exceptions import DateMissingOne, EventSearchTwoInput
 
 from utils.rules import NumberRule, EventStatusRule, DateRule, PageRule
 from flask_request_validator import (
@@ -21,6 +22,7 @@ class EnquiryView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @validate_params(
         Param('product_name', JSON, str, required=False),
         Param('id', JSON, str, required=False),
@@ -30,9 +32,10 @@ class EnquiryView(MethodView):
         Param('type', JSON, str, required=False),
         Param('start_date', JSON, str, required=False),
         Param('end_date', JSON, str, required=False),
-        Param('page', JSON, int, required=True, rules=[PageRule()]),
+        Param('page', JSON, int, required=False, default=1, rules=[PageRule()]),
         Param('length', JSON, int, required=True),
-        Param('response_date', JSON, int, required=False)
+        Param('response_date', JSON, int, required=False),
+        Param('cursor', JSON, str, required=False)
     )
     def get(self, *args):
         data = {
@@ -46,23 +49,13 @@ class EnquiryView(MethodView):
             'end_date': args[7],
             'page': args[8],
             'length': args[9],
-            'response_date': args[10]
+            'response_date': args[10],
+            'cursor': args[11]
         }
 
-        try:
-            connection = get_connection(self.database)
-            enquiries = self.service.get_enquiry_service(connection, data)
-            return jsonify({'message': 'success', 'result': enquiries})
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        enquiries = self.service.get_enquiry_service(connection, data)
+        return jsonify({'message': 'success', 'result': enquiries})
 
     @validate_params(
         Param('enquiry_id', JSON, int, required=True)
@@ -72,21 +65,9 @@ class EnquiryView(MethodView):
             'enquiry_id': args[0]
         }
 
-        try:
-            connection = get_connection(self.database)
-            self.service.delete_enquiry_service(connection, data)
-            connection.commit()
-            return {'message': 'success'}
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        self.service.delete_enquiry_service(connection, data)
+        return {'message': 'success'}
 
 
 class AnswerView(MethodView):
@@ -95,6 +76,7 @@ class AnswerView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @validate_params(
         Param('enquiry_id', PATH, int, required=True)
     )
@@ -103,20 +85,9 @@ class AnswerView(MethodView):
             'enquiry_id': args[0]
         }
 
-        try:
-            connection = get_connection(self.database)
-            result = self.service.get_answer_service(connection, data)
-            return jsonify({'message': 'success', 'result': result})
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        result = self.service.get_answer_service(connection, data)
+        return jsonify({'message': 'success', 'result': result})
 
     @validate_params(
         Param('enquiry_id', PATH, int),
@@ -127,19 +98,9 @@ class AnswerView(MethodView):
             'enquiry_id': args[0],
             'answer': args[1]
         }
-        try:
-            connection = get_connection(self.database)
-            self.service.post_answer_service(connection, data)
-            connection.commit()
-            return {'message': 'success'}
-        except Exception as e:
-            raise e
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        self.service.post_answer_service(connection, data)
+        return {'message': 'success'}
 
     @validate_params(
         Param('enquiry_id', PATH, int),
@@ -151,19 +112,9 @@ class AnswerView(MethodView):
             'answer': args[1]
         }
 
-        try:
-            connection = get_connection(self.database)
-            self.service.put_answer_service(connection, data)
-            connection.commit()
-            return {'message': 'success'}
-        except Exception as e:
-            raise e
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        self.service.put_answer_service(connection, data)
+        return {'message': 'success'}
 
     @validate_params(
         Param('enquiry_id', PATH, int),
@@ -173,16 +124,6 @@ class AnswerView(MethodView):
             'enquiry_id': args[0]
         }
 
-        try:
-            connection = get_connection(self.database)
-            self.service.delete_answer_service(connection, data)
-            connection.commit()
-            return {'message': 'success'}
-        except Exception as e:
-            raise e
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        self.service.delete_answer_service(connection, data)
+        return {'message': 'success'}
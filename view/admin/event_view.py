@@ -1,5 +1,4 @@
 import json
-import traceback
 from datetime import datetime
 
 from flask import jsonify, request, g
@@ -13,10 +12,9 @@ from flask_request_validator import (
     validate_params
 )
 
-from utils.connection import get_connection
-from utils.decorator import signin_decorator
+from utils.connection import get_request_connection
+from utils.decorator import signin_decorator, read_only_decorator
 from utils.custom_exceptions import (
-    DatabaseCloseFail,
     DateMissingOne,
     SearchTwoInput,
     FilterDoesNotMatch,
@@ -59,6 +57,7 @@ class EventView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @signin_decorator()
     @validate_params(
         Param('name', GET, str, required=False),
@@ -147,21 +146,9 @@ class EventView(MethodView):
         if data['name'] and data['number']:
             raise SearchTwoInput('search value accept only one of name or number')
 
-        try:
-            connection = get_connection(self.database)
-            events = self.service.get_events_service(connection, data)
-            return jsonify({'message': 'success', 'result': events})
-
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        events = self.service.get_events_service(connection, data)
+        return jsonify({'message': 'success', 'result': events})
 
     @signin_decorator()
     @validate_params(
@@ -274,25 +261,11 @@ class EventView(MethodView):
         if start >= end:
             raise StartAndEndDateContext('start and end datetime context error')
 
-        try:
-            connection = get_connection(self.database)
-            result = self.service.create_event_service(connection, data, buttons, products)
-
-            connection.commit()
-
-            return jsonify({'message': 'success', 'event_id': result}), 201
+        connection = get_request_connection(self.database)
+        result = self.service.create_event_service(connection, data, buttons, products)
 
-        except Exception as e:
-            connection.rollback()
-            traceback.print_exc()
-            raise e
 
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        return jsonify({'message': 'success', 'event_id': result}), 201
 
 
 class EventDetailView(MethodView):
@@ -312,6 +285,7 @@ class EventDetailView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @signin_decorator()
     @validate_params(
         Param('event_id', PATH, int, required=True)
@@ -476,21 +450,9 @@ class EventDetailView(MethodView):
         if g.permission_type_id != 1:
             raise NoPermission('마스터 이용자만 사용 가능합니다')
 
-        try:
-            connection = get_connection(self.database)
-            result = self.service.get_event_detail_service(connection, data)
-            return jsonify({"message": "success", "result": result})
-
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        result = self.service.get_event_detail_service(connection, data)
+        return jsonify({"message": "success", "result": result})
 
     @signin_decorator()
     @validate_params(
@@ -521,23 +483,9 @@ class EventDetailView(MethodView):
             'event_id': args[0]
         }
 
-        try:
-            connection = get_connection(self.database)
-            self.service.event_delete_service(connection, data)
-            connection.commit()
-            return jsonify({'message': 'success', 'deleted_event_id': data['event_id']})
-
-        except Exception as e:
-            connection.rollback()
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        self.service.event_delete_service(connection, data)
+        return jsonify({'message': 'success', 'deleted_event_id': data['event_id']})
 
     @signin_decorator()
     @validate_params(
@@ -642,50 +590,36 @@ class EventDetailView(MethodView):
         if start >= end:
             raise StartAndEndDateContext('start and end datetime context error')
 
-        try:
-            connection = get_connection(self.database)
-
-            # 기획전 종류 체크
-            data['event_kind_id'] = self.service.get_event_kind_id_service(connection, data['event_id'])
-            if data['event_kind_id'] == 2:
-                # 기획전 종류가 버튼인데 버튼이 없을 때
-                if not buttons:
-                    raise ButtonsMinimumCount('button is required')
-
-                buttons = json.loads(buttons)
+        connection = get_request_connection(self.database)
 
-                # 기획전 종류가 버튼인데 2개 미만의 버튼이 들어왔을 때
-                if len(buttons) < 2:
-                    raise ButtonsMinimumCount('at least two buttons are required')
+        # 기획전 종류 체크
+        data['event_kind_id'] = self.service.get_event_kind_id_service(connection, data['event_id'])
+        if data['event_kind_id'] == 2:
+            # 기획전 종류가 버튼인데 버튼이 없을 때
+            if not buttons:
+                raise ButtonsMinimumCount('button is required')
 
-                # 기획전 종류가 버튼인데 상품에 버튼이름 키,값이 없을 때
-                if products:
-                    for product in products:
-                        if 'button_name' not in product or not product['button_name']:
-                            raise ProductButtonNameRequired('button name is required in each product')
+            buttons = json.loads(buttons)
 
-            # 기획전 종류가 버튼형이 아닌데 버튼들에 대한 정보가 들어왔을 때
-            elif data['event_kind_id'] != 2 and buttons:
-                print(data['event_kind_id'])
-                raise EventKindDoesNotMatch('event kind is not buttons')
+            # 기획전 종류가 버튼인데 2개 미만의 버튼이 들어왔을 때
+            if len(buttons) < 2:
+                raise ButtonsMinimumCount('at least two buttons are required')
 
-            self.service.modify_event_service(connection, data, buttons, products)
+            # 기획전 종류가 버튼인데 상품에 버튼이름 키,값이 없을 때
+            if products:
+                for product in products:
+                    if 'button_name' not in product or not product['button_name']:
+                        raise ProductButtonNameRequired('button name is required in each product')
 
-            connection.commit()
+        # 기획전 종류가 버튼형이 아닌데 버튼들에 대한 정보가 들어왔을 때
+        elif data['event_kind_id'] != 2 and buttons:
+            print(data['event_kind_id'])
+            raise EventKindDoesNotMatch('event kind is not buttons')
 
-            return jsonify({'message': 'success', 'event_id': data['event_id']}), 200
+        self.service.modify_event_service(connection, data, buttons, products)
 
-        except Exception as e:
-            traceback.print_exc()
-            connection.rollback()
-            raise e
 
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        return jsonify({'message': 'success', 'event_id': data['event_id']}), 200
 
 
 class EventProductsCategoryView(MethodView):
@@ -704,6 +638,7 @@ class EventProductsCategoryView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @signin_decorator()
     @validate_params(
         Param('filter', JSON, str, required=True, rules=[CategoryFilterRule()]),
@@ -849,21 +784,9 @@ class EventProductsCategoryView(MethodView):
             if not data['menu_id'] or not data['first_category_id']:
                 raise FilterDoesNotMatch('error: filter does not match')
 
-        try:
-            connection = get_connection(self.database)
-            result = self.service.get_products_category_service(connection, data)
-            return jsonify({'message': 'success', 'result': result})
-
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        result = self.service.get_products_category_service(connection, data)
+        return jsonify({'message': 'success', 'result': result})
 
 
 class EventProductsToAddView(MethodView):
@@ -883,6 +806,7 @@ class EventProductsToAddView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @signin_decorator()
     @validate_params(
         Param('product_name', GET, str, required=False),
@@ -1000,18 +924,6 @@ class EventProductsToAddView(MethodView):
         if (data['start_date'] and not data['end_date']) or (not data['start_date'] and data['end_date']):
             raise DateMissingOne('start_date or end_date is missing')
 
-        try:
-            connection = get_connection(self.database)
-            products = self.service.get_products_to_post_service(connection, data)
-            return jsonify({'message': 'success', 'result': products})
-
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        products = self.service.get_products_to_post_service(connection, data)
+        return jsonify({'message': 'success', 'result': products})
@@ -1,10 +1,10 @@
-from flask import jsonify, g
+from flask import jsonify, g, Response
 from flask.views import MethodView
 
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
-from utils.rules import SecondDateTimeRule, NumberRule, PhoneRule, PageRule, DateRule
-from utils.decorator import signin_decorator
+from utils.connection import get_request_connection, get_replica_connection
+from utils.export import ExportStream, attachment_headers, CSV_MIMETYPE, XLSX_MIMETYPE
+from utils.rules import SecondDateTimeRule, NumberRule, PhoneRule, PageRule, DateRule, ExportFormatRule
+from utils.decorator import signin_decorator, read_only_decorator
 
 from flask_request_validator import (
     Param,
@@ -21,6 +21,7 @@ class OrderView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @signin_decorator()
     @validate_params(
         Param('status', GET, int),
@@ -34,8 +35,9 @@ class OrderView(MethodView):
         Param('end_date', GET, str, required=False, rules=[DateRule()]),
         Param('attributes', GET, list, required=False),
         Param('order_by', GET, str, required=False),
-        Param('page', GET, int, rules=[PageRule()]),
-        Param('length', GET, str, rules=[NumberRule()])
+        Param('page', GET, int, required=False, default=1, rules=[PageRule()]),
+        Param('length', GET, str, rules=[NumberRule()]),
+        Param('cursor', GET, str, required=False)
     )
     def get(self, *args):
         data = {
@@ -53,14 +55,18 @@ class OrderView(MethodView):
             'attributes': args[9],
             'order_by': args[10],
             'page': args[11],
-            'length': args[12]
+            'length': args[12],
+            'cursor': args[13]
         }
 
         """GET 메소드: 주문 정보 조회
         
         Args: 
             args = ('status', 'number', 'detail_number', 'sender_name', 'sender_phone', 'seller_name', 
-                'product_name', 'start_date', 'end_date', 'seller_attributes', 'order_by', 'page', 'length')
+                'product_name', 'start_date', 'end_date', 'seller_attributes', 'order_by', 'page', 'length', 'cursor')
+            cursor 를 보내면 page 대신 이전 응답의 nextCursor 이후의 주문을 조회한다.
+            totalCount 는 첫 페이지에서만 조회한다. 이후 페이지는 캐시에 남아있을 때만 내려가고 없으면 null 이다.
+            isEstimatedCount 가 true 이면 totalCount 는 실행 계획으로 계산한 예상값이다.
 
         Author: 김민서
 
@@ -101,7 +107,9 @@ class OrderView(MethodView):
                         "updated_at_date": "2020-12-30 10:05:19"
                     }
                 ],
-                "totalCount": 2
+                "totalCount": 2,
+                "isEstimatedCount": false,
+                "nextCursor": "WzRd"
             }
 
         Raises:
@@ -133,20 +141,18 @@ class OrderView(MethodView):
         History:
             2020-12-29(김민서): 초기 생성
             2020-01-03(김민서): 1차 수정
+            2026-10-18(agent): 커서 페이지네이션 추가
         """
 
-        try:
-            connection = get_connection(self.database)
-            result = self.service.get_orders_service(connection, data)
-            return jsonify({'message': 'success', 'totalCount': result['total_count'], 'results': result['order_lists']}), 200
-        except Exception as e:
-            raise e
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        result = self.service.get_orders_service(connection, data)
+        return jsonify({
+            'message': 'success',
+            'totalCount': result['total_count'],
+            'isEstimatedCount': result['is_estimated_count'],
+            'results': result['order_lists'],
+            'nextCursor': result['next_cursor']
+        }), 200
 
     @signin_decorator()
     @validate_params(
@@ -194,21 +200,9 @@ class OrderView(MethodView):
             2021-01-12(김민서): 1차 수정    
         """
 
-        try:
-            connection = get_connection(self.database)
-            self.service.update_order_status_service(connection, data)
-            connection.commit()
-            return jsonify({'message': '주문 상태가 업데이트 되었습니다.'}), 200
-
-        except Exception as e:
-            connection.rollback()
-            raise e
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        self.service.update_order_status_service(connection, data)
+        return jsonify({'message': '주문 상태가 업데이트 되었습니다.'}), 200
 
 
 class OrderDetailView(MethodView):
@@ -216,6 +210,7 @@ class OrderDetailView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @signin_decorator()
     @validate_params(
         Param('order_item_id', PATH, int)
@@ -318,17 +313,9 @@ class OrderDetailView(MethodView):
             2021-01-01(김민서): 초기 생성    
         """
 
-        try:
-            connection = get_connection(self.database)
-            result = self.service.get_order_detail_service(connection, data)
-            return jsonify({"message": "success", "result": result}), 200
-        except Exception as e:
-            raise e
-        finally:
-            try:
-                connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        result = self.service.get_order_detail_service(connection, data)
+        return jsonify({"message": "success", "result": result}), 200
             
 
     @signin_decorator()
@@ -391,19 +378,9 @@ class OrderDetailView(MethodView):
             2021-01-12(김민서): 1차 수정    
         """
 
-        try:
-            connection = get_connection(self.database)
-            self.service.update_order_detail_service(connection, data)
-            connection.commit()
-            return jsonify({"message": "success"}), 200
-        except Exception as e:
-            connection.rollback()
-            raise e
-        finally:
-            try:
-                connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        self.service.update_order_detail_service(connection, data)
+        return jsonify({"message": "success"}), 200
 
 
 class OrderExcelView(MethodView):
@@ -412,6 +389,7 @@ class OrderExcelView(MethodView):
         self.database = database
 
     #@signin_decorator()
+    @read_only_decorator
     @validate_params(
         Param('status', GET, int),
         Param('ids', GET, list, required=False),
@@ -424,7 +402,8 @@ class OrderExcelView(MethodView):
         Param('start_date', GET, str, required=False, rules=[DateRule()]),
         Param('end_date', GET, str, required=False, rules=[DateRule()]),
         Param('attributes', GET, list, required=False),
-        Param('order_by', GET, str, required=False)
+        Param('order_by', GET, str, required=False),
+        Param('format', GET, str, required=False, default='xlsx', rules=[ExportFormatRule()])
     )
     def get(self, *args):
         data = {
@@ -443,18 +422,19 @@ class OrderExcelView(MethodView):
             'start_date': args[8],
             'end_date': args[9],
             'attributes': args[10],
-            'order_by': args[11]
+            'order_by': args[11],
+            'format': args[12]
         }
 
         """GET 메소드: 주문 리스트 엑셀 다운로드     
             
             Args:
                 args = ('status', 'ids', 'number', 'detail_number', 'sender_name', 'sender_phone', 'seller_name', 
-                'product_name', 'start_date', 'end_date', 'seller_attributes', 'order_by')
+                'product_name', 'start_date', 'end_date', 'seller_attributes', 'order_by', 'format')
 
             Author: 김민서
 
-            Returns: {'message': 'success'}
+            Returns: 주문 리스트 파일 (format=xlsx: 엑셀, format=csv: CSV)
 
             Raises:
                 400, {'message': 'key_error', 
@@ -468,32 +448,38 @@ class OrderExcelView(MethodView):
 
             History:
                     2021-01-13(김민서): 초기 생성
+                    2026-10-18(agent): 행 수 제한 없이 스트리밍으로 다운로드, csv 형식 추가
+
+            Notes:
+                응답을 보내는 동안 서버 사이드 커서로 계속 읽어야 하므로 요청 단위 커넥션 대신 전용 커넥션을 사용한다.
+                전용 커넥션은 ExportStream 이 응답을 다 보낸 뒤 반납한다. (중간에 끊기면 커넥션을 끊는다)
         """
 
+        status = data['status']
+        today = date.today().strftime('%Y%m%d')
+
+        if status == 1:
+            status = '상품준비'
+        if status == 2:
+            status = '배송중'
+        if data['ids']:
+            choice = '선택'
+        if not data['ids']:
+            choice = '전체'
+
+        # 파일 및 시트 이름 생성
+        data['file_name'] = f"{today}_{choice}주문엑셀다운로드_{status}_브랜디.{data['format']}"
+        data['sheet_name'] = today
+
+        connection = get_replica_connection(self.database)
         try:
-            status = data['status']
-            today = date.today().strftime('%Y%m%d')
-
-            if status == 1:
-                status = '상품준비'
-            if status == 2:
-                status = '배송중'
-            if data['ids']:
-                choice = '선택'
-            if not data['ids']:
-                choice = '전체'
-
-            # 파일 및 시트 이름 생성
-            data['file_name'] = f"{today}_{choice}주문엑셀다운로드_{status}_브랜디.xlsx"
-            data['sheet_name'] = today
-
-            connection = get_connection(self.database)
-            return self.service.create_excel_service(connection, data)
-        except Exception as e:
-            raise e
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+            body = self.service.create_excel_service(connection, data)
+        except Exception:
+            connection.close()
+            raise
+
+        return Response(
+            ExportStream(body, connection),
+            mimetype=CSV_MIMETYPE if data['format'] == 'csv' else XLSX_MIMETYPE,
+            headers=attachment_headers(data['file_name'])
+        )
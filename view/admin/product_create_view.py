@@ -1,12 +1,9 @@
-import traceback
-
 from flask                          import jsonify, request, json, g
 from flask.views                    import MethodView
 from flask_request_validator.rules  import NotEmpty
 
-from utils.connection               import get_connection
-from utils.decorator                import signin_decorator
-from utils.custom_exceptions        import DatabaseCloseFail
+from utils.connection               import get_request_connection
+from utils.decorator                import signin_decorator, read_only_decorator
 from utils.rules                    import NumberRule
 
 from flask_request_validator import (
@@ -35,6 +32,7 @@ class MainCategoriesListView(MethodView):
         self.service = service
         self.database = database
     
+    @read_only_decorator
     @signin_decorator()
     def get(self, *args):
         """GET 메소드: 상품 정보 등록에 필요한 메인 카테고리 리스트 취득
@@ -53,26 +51,10 @@ class MainCategoriesListView(MethodView):
             History:
                 2020-12-30(심원두): 초기생성
         """
-        try:
-            connection = get_connection(self.database)
-            result     = self.service.main_category_list_service(connection)
-            
-            return jsonify({'message': 'success', 'result': result})
+        connection = get_request_connection(self.database)
+        result     = self.service.main_category_list_service(connection)
         
-        except KeyError as e:
-            traceback.print_exc()
-            raise e
-        
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        return jsonify({'message': 'success', 'result': result})
 
 
 class CreateProductView(MethodView):
@@ -94,6 +76,7 @@ class CreateProductView(MethodView):
         self.service = service
         self.database = database
     
+    @read_only_decorator
     @signin_decorator()
     @validate_params(
         Param('seller_name',      GET, str, required=False, rules=[MaxLength(20)]),
@@ -132,63 +115,47 @@ class CreateProductView(MethodView):
                 2021-01-06(심원두): 로그인 데코레이터 처리 추가. 관리자일 경우에만 셀러 검색 허용하도록 수정
         """
         
-        try:
-            data = {
-                'seller_name'      : request.args.get('seller_name', None),
-                'main_category_id' : request.args.get('main_category_id', None)
-            }
-            
-            connection = get_connection(self.database)
-            
-            if data['seller_name'] and g.permission_type_id == 1:
-                sellers = self.service.search_seller_list_service(
-                    connection,
-                    data
-                )
-            
-                return jsonify({'message': 'success', 'result': sellers})
-            
-            if data['main_category_id']:
-                sub_categories = self.service.get_sub_category_list_service(
-                    connection,
-                    data
-                )
-                
-                return jsonify({'message': 'success', 'result': sub_categories})
-            
-            result = dict()
-            
-            result['product_origin_types'] = \
-                self.service.get_product_origin_types_service(
-                    connection
+        data = {
+            'seller_name'      : request.args.get('seller_name', None),
+            'main_category_id' : request.args.get('main_category_id', None)
+        }
+        
+        connection = get_request_connection(self.database)
+        
+        if data['seller_name'] and g.permission_type_id == 1:
+            sellers = self.service.search_seller_list_service(
+                connection,
+                data
+            )
+        
+            return jsonify({'message': 'success', 'result': sellers})
+        
+        if data['main_category_id']:
+            sub_categories = self.service.get_sub_category_list_service(
+                connection,
+                data
             )
             
-            result['color_list'] = \
-                self.service.get_color_list_service(
-                    connection
-                )
-            
-            result['size_list'] =  \
-                self.service.get_size_list_service(
-                    connection
-                )
-            
-            return jsonify({'message': 'success', 'result': result})
+            return jsonify({'message': 'success', 'result': sub_categories})
+        
+        result = dict()
+        
+        result['product_origin_types'] = \
+            self.service.get_product_origin_types_service(
+                connection
+        )
         
-        except KeyError as e:
-            traceback.print_exc()
-            raise e
+        result['color_list'] = \
+            self.service.get_color_list_service(
+                connection
+            )
         
-        except Exception as e:
-            traceback.print_exc()
-            raise e
+        result['size_list'] =  \
+            self.service.get_size_list_service(
+                connection
+            )
         
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        return jsonify({'message': 'success', 'result': result})
     
     @signin_decorator()
     @validate_params(
@@ -328,94 +295,76 @@ class CreateProductView(MethodView):
                 2021-01-05(심원두): -이미지 저장 처리 순서를 3번째에서 가장 마지막으로 내림. 테이블 인서트 처리에 문제가 있을 경우,
                                     S3에 올라간 이미지는 롤백을 할 수 없는 이슈 반영.
                                    -북마크 테이블 초기 등록 처리 추가.
+                2026-10-18(agent): 이미지를 트랜잭션 시작 전에 내용 해시 경로로 업로드
         """
         
-        try:
-            data = {
-                'seller_id'              : request.form.get('seller_id'),
-                'account_id'             : g.account_id,
-                'is_sale'                : request.form.get('is_sale'),
-                'is_display'             : request.form.get('is_display'),
-                'main_category_id'       : request.form.get('main_category_id'),
-                'sub_category_id'        : request.form.get('sub_category_id'),
-                'is_product_notice'      : request.form.get('is_product_notice'),
-                'manufacturer'           : request.form.get('manufacturer', None),
-                'manufacturing_date'     : request.form.get('manufacturing_date', None),
-                'product_origin_type_id' : request.form.get('product_origin_type_id', None),
-                'product_name'           : request.form.get('product_name'),
-                'description'            : request.form.get('description'),
-                'detail_information'     : request.form.get('detail_information'),
-                'minimum_quantity'       : request.form.get('minimum_quantity'),
-                'maximum_quantity'       : request.form.get('maximum_quantity'),
-                'origin_price'           : request.form.get('origin_price'),
-                'discount_rate'          : request.form.get('discount_rate'),
-                'discounted_price'       : request.form.get('discounted_price'),
-                'discount_start_date'    : request.form.get('discount_start_date', None),
-                'discount_end_date'      : request.form.get('discount_end_date', None)
-            }
-            
-            product_images = request.files.getlist("image_files")
-            stocks         = json.loads(request.form.get('options'))
-            connection     = get_connection(self.database)
-            
-            product_id = self.service.create_product_service(
-                connection,
-                data
-            )
-            
-            product_code = self.service.update_product_code_service(
-                connection,
-                product_id
-            )
-            
-            self.service.create_stock_service(
-                connection,
-                product_id,
-                stocks
-            )
-            
-            self.service.create_product_history_service(
-                connection,
-                product_id,
-                data
-            )
-            
-            self.service.create_product_sales_volumes_service(
-                connection,
-                product_id
-            )
-            
-            self.service.create_bookmark_volumes_service(
-                connection,
-                product_id
-            )
-            
-            self.service.create_product_images_service(
-                connection,
-                data['seller_id'],
-                product_id,
-                product_code,
-                product_images
-            )
-            
-            connection.commit()
-            
-            return jsonify({'message': 'success'}), 200
-            
-        except KeyError as e:
-            traceback.print_exc()
-            connection.rollback()
-            raise e
-            
-        except Exception as e:
-            traceback.print_exc()
-            connection.rollback()
-            raise e
+        data = {
+            'seller_id'              : request.form.get('seller_id'),
+            'account_id'             : g.account_id,
+            'is_sale'                : request.form.get('is_sale'),
+            'is_display'             : request.form.get('is_display'),
+            'main_category_id'       : request.form.get('main_category_id'),
+            'sub_category_id'        : request.form.get('sub_category_id'),
+            'is_product_notice'      : request.form.get('is_product_notice'),
+            'manufacturer'           : request.form.get('manufacturer', None),
+            'manufacturing_date'     : request.form.get('manufacturing_date', None),
+            'product_origin_type_id' : request.form.get('product_origin_type_id', None),
+            'product_name'           : request.form.get('product_name'),
+            'description'            : request.form.get('description'),
+            'detail_information'     : request.form.get('detail_information'),
+            'minimum_quantity'       : request.form.get('minimum_quantity'),
+            'maximum_quantity'       : request.form.get('maximum_quantity'),
+            'origin_price'           : request.form.get('origin_price'),
+            'discount_rate'          : request.form.get('discount_rate'),
+            'discounted_price'       : request.form.get('discounted_price'),
+            'discount_start_date'    : request.form.get('discount_start_date', None),
+            'discount_end_date'      : request.form.get('discount_end_date', None)
+        }
+        
+        product_images = request.files.getlist("image_files")
+        stocks         = json.loads(request.form.get('options'))
+        connection     = get_request_connection(self.database)
+        
+        # 트랜잭션 시작 전에 이미지 검사 및 업로드
+        image_keys = self.service.upload_product_images_service(product_images)
+        
+        product_id = self.service.create_product_service(
+            connection,
+            data
+        )
+        
+        self.service.update_product_code_service(
+            connection,
+            product_id
+        )
+        
+        self.service.create_stock_service(
+            connection,
+            product_id,
+            stocks
+        )
+        
+        self.service.create_product_history_service(
+            connection,
+            product_id,
+            data
+        )
+        
+        self.service.create_product_sales_volumes_service(
+            connection,
+            product_id
+        )
+        
+        self.service.create_bookmark_volumes_service(
+            connection,
+            product_id
+        )
+        
+        self.service.create_product_images_service(
+            connection,
+            product_id,
+            image_keys
+        )
+        
         
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                traceback.print_exc()
-                raise DatabaseCloseFail('database close fail')
+        return jsonify({'message': 'success'}), 200
@@ -1,12 +1,9 @@
-import traceback
-
 from flask                          import jsonify, request, json, g
 from flask.views                    import MethodView
 from flask_request_validator.rules  import NotEmpty
 
-from utils.connection        import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
-from utils.decorator         import signin_decorator
+from utils.connection        import get_request_connection
+from utils.decorator         import signin_decorator, read_only_decorator
 from utils.rules             import NumberRule, PageRule, DateRule, DefaultRule
 from flask_request_validator import (
     Param,
@@ -34,6 +31,7 @@ class ProductManageSearchView(MethodView):
         self.service = service
         self.database = database
     
+    @read_only_decorator
     @signin_decorator()
     @validate_params(
         Param('lookup_start_date', GET, str,  required=False, rules=[DateRule(), NotEmpty()]),
@@ -45,8 +43,9 @@ class ProductManageSearchView(MethodView):
         Param('is_sale',           GET, int,  required=False, rules=[Enum(1, 2)]),
         Param('is_display',        GET, int,  required=False, rules=[Enum(1, 2)]),
         Param('is_discount',       GET, int,  required=False, rules=[Enum(1, 2)]),
-        Param('page_number',       GET, int,  required=True,  rules=[PageRule()]),
-        Param('limit',             GET, int,  required=True,  rules=[Enum(10, 20, 50)])
+        Param('page_number',       GET, int,  required=False, default=1, rules=[PageRule()]),
+        Param('limit',             GET, int,  required=True,  rules=[Enum(10, 20, 50)]),
+        Param('cursor',            GET, str,  required=False)
     )
     def get(self, *args):
         """GET 메소드: 특정 조건에 해당하는 상품 리스트를 조회한다.
@@ -64,6 +63,7 @@ class ProductManageSearchView(MethodView):
                 'is_discount'             : 할인 여부
                 'page_number'             : 페이지 번호
                 'limit'                   : 한 화면에 보여줄 상품의 갯수
+                'cursor'                  : 이전 응답의 next_cursor (있으면 page_number 대신 사용)
                 
             Author: 심원두
             
@@ -86,65 +86,51 @@ class ProductManageSearchView(MethodView):
             History:
                 2020-12-31(심원두): 초기생성
                 2021-01-03(심원두): 상품 리스트 검색 기능 구현, Login Decorator 구현 예정
+                2026-10-18(agent): 커서 페이지네이션 추가
         """
         
-        try:
-            search_condition = {
-                'seller_id'                 : g.account_id if g.permission_type_id == 2 else None,
-                'lookup_start_date'         : request.args.get('lookup_start_date', None),
-                'lookup_end_date'           : request.args.get('lookup_end_date', None),
-                'seller_name'               : request.args.get('seller_name', None),
-                'product_name'              : request.args.get('product_name', None),
-                'product_id'                : request.args.get('product_id', None),
-                'product_code'              : request.args.get('product_code', None),
-                'seller_attribute_type_ids' : json.loads(request.args.get('seller_attribute_type_id'))
-                                              if request.args.get('seller_attribute_type_id')
-                                              else None,
-                'is_sale'                   : request.args.get('is_sale', None),
-                'is_display'                : request.args.get('is_display', None),
-                'is_discount'               : request.args.get('is_discount', None),
-                'page_number'               : request.args.get('page_number'),
-                'limit'                     : request.args.get('limit')
-            }
-            
-            search_condition_back_to_front = {
-                'lookup_start_date'     : search_condition['lookup_start_date'],
-                'lookup_end_date'       : search_condition['lookup_end_date'],
-                'seller_name'           : search_condition['seller_name'],
-                'product_name'          : search_condition['product_name'],
-                'product_id'            : search_condition['product_id'],
-                'product_code'          : search_condition['product_code'],
-                'seller_attribute_type' : search_condition['seller_attribute_type_ids'],
-                'is_sale'               : 0 if search_condition['is_sale'] is None
-                                          else int(search_condition['is_sale']),
-                'is_display'            : 0 if search_condition['is_display'] is None
-                                          else int(search_condition['is_display']),
-                'is_discount'           : 0 if search_condition['is_discount'] is None
-                                          else int(search_condition['is_discount']),
-                'page_number'           : int(search_condition['page_number']),
-                'limit'                 : int(search_condition['limit'])
-            }
-            
-            connection = get_connection(self.database)
-            result     = self.service.search_product_service(connection, search_condition)
-            result['search_condition'] = search_condition_back_to_front
-            
-            return jsonify({'message': 'success', 'result': result})
+        search_condition = {
+            'seller_id'                 : g.account_id if g.permission_type_id == 2 else None,
+            'lookup_start_date'         : request.args.get('lookup_start_date', None),
+            'lookup_end_date'           : request.args.get('lookup_end_date', None),
+            'seller_name'               : request.args.get('seller_name', None),
+            'product_name'              : request.args.get('product_name', None),
+            'product_id'                : request.args.get('product_id', None),
+            'product_code'              : request.args.get('product_code', None),
+            'seller_attribute_type_ids' : json.loads(request.args.get('seller_attribute_type_id'))
+                                          if request.args.get('seller_attribute_type_id')
+                                          else None,
+            'is_sale'                   : request.args.get('is_sale', None),
+            'is_display'                : request.args.get('is_display', None),
+            'is_discount'               : request.args.get('is_discount', None),
+            'page_number'               : request.args.get('page_number', 1),
+            'limit'                     : request.args.get('limit'),
+            'cursor'                    : request.args.get('cursor', None)
+        }
         
-        except KeyError as e:
-            traceback.print_exc()
-            raise e
+        search_condition_back_to_front = {
+            'lookup_start_date'     : search_condition['lookup_start_date'],
+            'lookup_end_date'       : search_condition['lookup_end_date'],
+            'seller_name'           : search_condition['seller_name'],
+            'product_name'          : search_condition['product_name'],
+            'product_id'            : search_condition['product_id'],
+            'product_code'          : search_condition['product_code'],
+            'seller_attribute_type' : search_condition['seller_attribute_type_ids'],
+            'is_sale'               : 0 if search_condition['is_sale'] is None
+                                      else int(search_condition['is_sale']),
+            'is_display'            : 0 if search_condition['is_display'] is None
+                                      else int(search_condition['is_display']),
+            'is_discount'           : 0 if search_condition['is_discount'] is None
+                                      else int(search_condition['is_discount']),
+            'page_number'           : int(search_condition['page_number']),
+            'limit'                 : int(search_condition['limit'])
+        }
         
-        except Exception as e:
-            traceback.print_exc()
-            raise e
+        connection = get_request_connection(self.database)
+        result     = self.service.search_product_service(connection, search_condition)
+        result['search_condition'] = search_condition_back_to_front
         
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        return jsonify({'message': 'success', 'result': result})
 
 
 class ProductManageDetailView(MethodView):
@@ -163,6 +149,7 @@ class ProductManageDetailView(MethodView):
         self.service = service
         self.database = database
     
+    @read_only_decorator
     @signin_decorator()
     @validate_params(
         Param('product_code', PATH, str, required=True, rules=[NotEmpty(), MaxLength(20)]),
@@ -192,22 +179,11 @@ class ProductManageDetailView(MethodView):
                 2021-01-02(심원두): 초기 작성
         """
         
-        try:
-            data = {
-                'product_code' : request.view_args['product_code']
-            }
-            
-            connection = get_connection(self.database)
-            result     = self.service.detail_product_service(connection, data)
-            
-            return jsonify({'message': 'success', 'result': result})
+        data = {
+            'product_code' : request.view_args['product_code']
+        }
         
-        except Exception as e:
-            raise e
+        connection = get_request_connection(self.database)
+        result     = self.service.detail_product_service(connection, data)
         
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        return jsonify({'message': 'success', 'result': result})
@@ -3,10 +3,8 @@ import json
 from flask                   import jsonify, request
 from flask.views             import MethodView
 
-from utils.connection        import get_connection
-from utils.custom_exceptions import (
-    DatabaseCloseFail
-)
+from utils.connection        import get_request_connection
+from utils.decorator        import read_only_decorator
 from utils.rules             import (
     NumberRule,
     PasswordRule,
@@ -33,28 +31,17 @@ class SellerListView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @validate_params(
         Param('offset', GET, int)
     )
 
     def get(self, *args):
 
-        connection = None
-        try:
-            offset = args[0]
-            connection = get_connection(self.database)
-            result = self.service.seller_list_service(connection, offset)
-            return jsonify({'message': 'success', 'result': result})
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
+        offset = args[0]
+        connection = get_request_connection(self.database)
+        result = self.service.seller_list_service(connection, offset)
+        return jsonify({'message': 'success', 'result': result})
 
 class SellerSearchView(MethodView):
   
@@ -62,8 +49,9 @@ class SellerSearchView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @validate_params(
-        Param('page', GET, int, required=True, rules=[PageRule()]),
+        Param('page', GET, int, required=False, default=1, rules=[PageRule()]),
         Param('page_view', GET, int, required=True),
         Param('account_id', GET, int, required=False, rules=[PositiveInteger()]),
         Param('username', GET, str, required=False),
@@ -76,41 +64,33 @@ class SellerSearchView(MethodView):
         Param('seller_status_type_name', GET, str, required=False),
         Param('updated_at', JSON, str, required=False),
         Param('start_date',JSON, str, required=False),
-        Param('end_date', JSON, str, required=False)
+        Param('end_date', JSON, str, required=False),
+        Param('cursor', GET, str, required=False)
     )
 
     def get(self, *args):
-        try:
-            data = {
-                'account_id' : args[2],
-                'username' : args[3],
-                'seller_english_name' : args[4],
-                'seller_name': args[5],
-                'contact_name': args[6],
-                'contact_phone': args[7],
-                'contact_email': args[8],
-                'seller_attribute_type_name': args[9],
-                'seller_status_type_name': args[10],
-                'updated_at': args[11],
-                'start_date': args[12],
-                'end_date' : args[13]
-            }
-
-            page = request.args.get('page')
-            page_view = request.args.get('page_view')
-
-            connection = get_connection(self.database)
-            result = self.service.seller_search_service(connection, data, page, page_view)
-            return jsonify({'message':'success', 'seller_list': result}),200
-
-        except Exception as e:
-            raise e
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail in seller_list_view')
+        data = {
+            'account_id' : args[2],
+            'username' : args[3],
+            'seller_english_name' : args[4],
+            'seller_name': args[5],
+            'contact_name': args[6],
+            'contact_phone': args[7],
+            'contact_email': args[8],
+            'seller_attribute_type_name': args[9],
+            'seller_status_type_name': args[10],
+            'updated_at': args[11],
+            'start_date': args[12],
+            'end_date' : args[13],
+            'cursor' : args[14]
+        }
+
+        page = args[0]
+        page_view = args[1]
+
+        connection = get_request_connection(self.database)
+        result = self.service.seller_search_service(connection, data, page, page_view)
+        return jsonify({'message':'success', 'seller_list': result}),200
 
 class SellerSignupView(MethodView):
 
@@ -139,23 +119,9 @@ class SellerSignupView(MethodView):
             'service_center_number': args[6],
         }
 
-        try:
-            connection = get_connection(self.database)
-            self.service.seller_signup_service(connection,data)
-            connection.commit()
-            return jsonify({'message': 'success'}), 200
-
-
-        except Exception as e:
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        self.service.seller_signup_service(connection,data)
+        return jsonify({'message': 'success'}), 200
 
 class SellerSigninView(MethodView):
 
@@ -174,21 +140,9 @@ class SellerSigninView(MethodView):
             'username': args[0],
             'password': args[1]
         }
-        connection = None
-        try:
-            connection = get_connection(self.database)
-            token = self.service.seller_signin_service(connection, data)
-            return jsonify({'message': 'success', 'token': token}), 200
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
+        connection = get_request_connection(self.database)
+        token = self.service.seller_signin_service(connection, data)
+        return jsonify({'message': 'success', 'token': token}), 200
 
 class SellerInfoView(MethodView):
     """ Presentation Layer
@@ -207,6 +161,7 @@ class SellerInfoView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @validate_params(
         Param('account_id', PATH, str, required=True, rules=[NumberRule()]),
     )
@@ -236,20 +191,9 @@ class SellerInfoView(MethodView):
         data = {
             'account_id': args[0],
         }
-        try:
-            connection          = get_connection(self.database)
-            result              = self.service.get_seller_info(connection, data)
-            return jsonify({'message': 'success', 'result': result}), 200
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection          = get_request_connection(self.database)
+        result              = self.service.get_seller_info(connection, data)
+        return jsonify({'message': 'success', 'result': result}), 200
 
     @validate_params(
         # required True
@@ -301,63 +245,50 @@ class SellerInfoView(MethodView):
             History:
                 2020-12-29(이영주): 초기 생성
         """
-        try:
-            add_contact = json.loads(request.form.get("add_contact", "1"))
-            data = {
-                'profile_image_url': request.form.get('profile_image_url'),
-                'background_image_url': request.form.get('background_image_url'),
-                'seller_title': request.form.get('seller_title'),
-                'seller_discription': request.form.get('seller_discription'),
-                'contact_name': request.form.get('contact_name'),
-                'contact_phone': request.form.get('contact_phone'),
-                'contact_email': request.form.get('contact_email'),
-                'post_number': request.form.get('post_number'),
-                'service_center_number': request.form.get('service_center_number'),
-                'address1': request.form.get('address1'),
-                'address2': request.form.get('address2'),
-                'operation_start_time': request.form.get('operation_start_time'),
-                'operation_end_time': request.form.get('operation_end_time'),
-                'is_weekend': request.form.get('is_weekend'),
-                'weekend_operation_start_time': request.form.get('weekend_operation_start_time'),
-                'weekend_operation_end_time': request.form.get('weekend_operation_end_time'),
-                'shipping_information': request.form.get('shipping_information'),
-                'exchange_information': request.form.get('exchange_information'),
-                'name': request.form.get('name'),
-                'english_name': request.form.get('english_name'),
-                'account_id': request.form.get('account_id'),
-                'permission_types': request.form.get('permission_types'),
-                'seller_status_type_id': request.form.get('seller_status_type_id'),
-                'seller_id': request.form.get('account_id'),
-                'updater_id': request.form.get('permission_types'),
-                'add_contact': add_contact
-            }
-            connection = get_connection(self.database)
-
-            # master - update seller table
-            self.service.patch_master_info(connection, data)
-
-            # update sellers table
-            self.service.patch_seller_info(connection, data)
-
-            # update additional_contacts table
-            self.service.patch_add_contact(connection, data)
-
-            # update seller_histories
-            self.service.patch_seller_history(connection, data)
-
-            connection.commit()
-            return jsonify({'message': 'success', 'result': data}), 200
-
-        except Exception as e:
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        add_contact = json.loads(request.form.get("add_contact", "1"))
+        data = {
+            'profile_image_url': request.form.get('profile_image_url'),
+            'background_image_url': request.form.get('background_image_url'),
+            'seller_title': request.form.get('seller_title'),
+            'seller_discription': request.form.get('seller_discription'),
+            'contact_name': request.form.get('contact_name'),
+            'contact_phone': request.form.get('contact_phone'),
+            'contact_email': request.form.get('contact_email'),
+            'post_number': request.form.get('post_number'),
+            'service_center_number': request.form.get('service_center_number'),
+            'address1': request.form.get('address1'),
+            'address2': request.form.get('address2'),
+            'operation_start_time': request.form.get('operation_start_time'),
+            'operation_end_time': request.form.get('operation_end_time'),
+            'is_weekend': request.form.get('is_weekend'),
+            'weekend_operation_start_time': request.form.get('weekend_operation_start_time'),
+            'weekend_operation_end_time': request.form.get('weekend_operation_end_time'),
+            'shipping_information': request.form.get('shipping_information'),
+            'exchange_information': request.form.get('exchange_information'),
+            'name': request.form.get('name'),
+            'english_name': request.form.get('english_name'),
+            'account_id': request.form.get('account_id'),
+            'permission_types': request.form.get('permission_types'),
+            'seller_status_type_id': request.form.get('seller_status_type_id'),
+            'seller_id': request.form.get('account_id'),
+            'updater_id': request.form.get('permission_types'),
+            'add_contact': add_contact
+        }
+        connection = get_request_connection(self.database)
+
+        # master - update seller table
+        self.service.patch_master_info(connection, data)
+
+        # update sellers table
+        self.service.patch_seller_info(connection, data)
+
+        # update additional_contacts table
+        self.service.patch_add_contact(connection, data)
+
+        # update seller_histories
+        self.service.patch_seller_history(connection, data)
+
+        return jsonify({'message': 'success', 'result': data}), 200
 
 
 class SellerStatusView(MethodView):
@@ -402,29 +333,16 @@ class SellerStatusView(MethodView):
         History:
             2021-01-03(이영주): 초기 생성
         """
-        try:
-            data = {
-                'account_id': args[0],
-                'seller_status_type_id': args[1],
-                'seller_id': args[2],
-                'updater_id': args[3]
-            }
-            connection = get_connection(self.database)
-            self.service.patch_seller_status(connection, data)
-            self.service.patch_seller_history(connection, data)
-            connection.commit()
-            return {'message': 'success'}
-
-        except Exception as e:
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        data = {
+            'account_id': args[0],
+            'seller_status_type_id': args[1],
+            'seller_id': args[2],
+            'updater_id': args[3]
+        }
+        connection = get_request_connection(self.database)
+        self.service.patch_seller_status(connection, data)
+        self.service.patch_seller_history(connection, data)
+        return {'message': 'success'}
 
 
 class SellerHistoryView(MethodView):
@@ -433,6 +351,7 @@ class SellerHistoryView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @validate_params(
         Param('account_id', PATH, int, required=False)
     )
@@ -462,24 +381,9 @@ class SellerHistoryView(MethodView):
         data = {
             'account_id': args[0]
         }
-        try:
-            connection = get_connection(self.database)
-            seller_history = self.service.get_seller_history(connection, data)
-            return jsonify({'message' : 'success', 'result' : seller_history}), 200
-
-        except Exception as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        seller_history = self.service.get_seller_history(connection, data)
+        return jsonify({'message' : 'success', 'result' : seller_history}), 200
 
 
 class SellerPasswordView(MethodView):
@@ -523,22 +427,10 @@ class SellerPasswordView(MethodView):
         History:
             2021-01-04(이영주): 초기 생성
         """
-        try:
-            data = {
-                'account_id': args[0],
-                'password': args[1]
-            }
-            connection = get_connection(self.database)
-            self.service.patch_seller_password(connection, data)
-            return jsonify({'message': 'success', 'result': 'PasswordChange'}), 200
-
-        except Exception as e:
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        data = {
+            'account_id': args[0],
+            'password': args[1]
+        }
+        connection = get_request_connection(self.database)
+        self.service.patch_seller_password(connection, data)
+        return jsonify({'message': 'success', 'result': 'PasswordChange'}), 200
@@ -0,0 +1,74 @@
+from flask import jsonify, g
+from flask.views import MethodView
+
+from service.store.outbox_worker import get_outbox_stats
+from service.store.product_counter import get_product_counters
+from service.store.product_search_engine import get_product_search_engine
+from service.store.stock_reservation import get_stock_reservation
+from utils.cache import get_cache_stats
+from utils.connection import get_pool_status
+from utils.custom_exceptions import NoPermission
+from utils.decorator import signin_decorator, read_only_decorator
+from utils.transaction_handler import get_endpoint_db_stats
+
+
+class StatsView(MethodView):
+    """ Presentation Layer
+
+        캐시, 커넥션 풀, 검색 색인 크기와 재고 경합을 확인할 때 참고할 프로세스 내 통계를 보여준다.
+
+        Attributes: None
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    @read_only_decorator
+    @signin_decorator()
+    def get(self):
+        """ GET 메소드: 프로세스 내 통계 조회
+
+            Author: agent
+
+            Returns:
+                200, {
+                    'message': 'success',
+                    'result': {
+                        'caches': [{'name': 'product_search', 'hits': 10, 'misses': 2, ...}],
+                        'connection_pools': [...],
+                        'endpoints': {'product_search': {'connections': 12, ...}},
+                        'search_engine': {'documents': 1000, 'autocomplete_requests': 30, ...},
+                        'stock_reservation': {'requests': 40, 'not_enough': 3, 'lock_wait_retries': 1, ...},
+                        'outbox': {'processed': 120, 'retried': 1, 'failed': 0, 'errors': 0, ...},
+                        'product_counters': {'added': 300, 'flushes': 20, 'pending_products': 4, ...}
+                    }
+                }
+
+            Raises:
+                403, {'message': 'no_permission', 'error_message': '마스터 이용자만 사용 가능합니다'} : 마스터가 아님
+
+            History:
+                2026-10-18(agent): 초기 생성
+                2026-10-18(agent): 재고 차감 통계 추가
+                2026-10-18(agent): outbox 워커 통계 추가
+                2026-10-18(agent): 상품 카운터 통계 추가
+
+            Notes:
+                통계는 워커 프로세스마다 따로 집계된다.
+        """
+
+        if g.permission_type_id != 1:
+            raise NoPermission('마스터 이용자만 사용 가능합니다')
+
+        result = {
+            'caches': get_cache_stats(),
+            'connection_pools': get_pool_status(),
+            'endpoints': get_endpoint_db_stats(),
+            'search_engine': get_product_search_engine().stats(),
+            'stock_reservation': get_stock_reservation().stats(),
+            'outbox': get_outbox_stats(),
+            'product_counters': get_product_counters().stats()
+        }
+        return jsonify({'message': 'success', 'result': result})
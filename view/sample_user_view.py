@@ -1,7 +1,7 @@
 from flask import jsonify
 from flask.views import MethodView
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
+from utils.connection import get_request_connection
+from utils.decorator import read_only_decorator
 from utils.rules import NumberRule, GenderRule, AlphabeticRule
 from flask_request_validator import (
     Param,
@@ -29,6 +29,7 @@ class SampleUserView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @validate_params(
         Param('user_id', JSON, str, rules=[NumberRule()]),
     )
@@ -59,19 +60,9 @@ class SampleUserView(MethodView):
             2020-20-22(홍길동): 2차 수정
         """
         
-        try:
-            connection = get_connection(self.database)
-            user = self.service.get_sample_user_service(connection, data)
-            return jsonify({'message': 'success', 'result': user}), 200
-
-        except Exception as e:
-            raise e
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        user = self.service.get_sample_user_service(connection, data)
+        return jsonify({'message': 'success', 'result': user}), 200
 
     @validate_params(
         Param('name', JSON, str, rules=[AlphabeticRule()]),
@@ -106,22 +97,9 @@ class SampleUserView(MethodView):
             2020-20-22(홍길동): 2차 수정
         """
 
-        try:
-            connection = get_connection(self.database)
-            self.service.post_sample_user_service(connection, data)
-            connection.commit()
-            return {'message': 'success'}
-
-        except Exception as e:
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        self.service.post_sample_user_service(connection, data)
+        return {'message': 'success'}
 
     @validate_params(
         Param('user_id', JSON, str),
@@ -153,19 +131,6 @@ class SampleUserView(MethodView):
             2020-20-22(홍길동): 2차 수정
         """
 
-        try:
-            connection = get_connection(self.database)
-            self.service.patch_sample_user_service(connection, data)
-            connection.commit()
-            return {'message': 'success'}
-
-        except Exception as e:
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        self.service.patch_sample_user_service(connection, data)
+        return {'message': 'success'}
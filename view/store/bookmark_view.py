@@ -1,17 +1,17 @@
-import traceback
-
 from flask.views import MethodView
 from flask import jsonify, g
 
 from flask_request_validator import (
     validate_params,
     Param,
-    PATH
+    PATH,
+    JSON,
+    GET
 )
 
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
-from utils.decorator import signin_decorator
+from utils.connection import get_request_connection
+from utils.decorator import signin_decorator, idempotent_decorator, read_only_decorator
+from utils.rules import PositiveInteger, ImageSizeRule, ImageFormatRule
 
 
 class BookmarkView(MethodView):
@@ -33,6 +33,7 @@ class BookmarkView(MethodView):
         self.database = database
 
     @signin_decorator()
+    @idempotent_decorator
     @validate_params(
         Param('product_id', PATH, int)
     )
@@ -63,30 +64,16 @@ class BookmarkView(MethodView):
             2020-01-07(김민구): 상품 존재 유무 체크 추가
         """
 
-        connection = None
-        try:
-            data = {
-                'product_id': args[0],
-                'account_id': g.account_id
-            }
-            connection = get_connection(self.database)
-            self.bookmark_service.post_bookmark_logic(connection, data)
-            connection.commit()
-            return jsonify({'message': 'success'}), 200
-
-        except Exception as e:
-            traceback.print_exc()
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
+        data = {
+            'product_id': args[0],
+            'account_id': g.account_id
+        }
+        connection = get_request_connection(self.database)
+        self.bookmark_service.post_bookmark_logic(connection, data)
+        return jsonify({'message': 'success'}), 200
 
     @signin_decorator()
+    @idempotent_decorator
     @validate_params(
         Param('product_id', PATH, int)
     )
@@ -117,25 +104,139 @@ class BookmarkView(MethodView):
             2020-01-07(김민구): 상품 존재 유무 체크 추가
         """
 
-        connection = None
-        try:
-            data = {
-                'product_id': args[0],
-                'account_id': g.account_id
-            }
-            connection = get_connection(self.database)
-            self.bookmark_service.delete_bookmark_logic(connection, data)
-            connection.commit()
-            return jsonify({'message': 'success'}), 200
-
-        except Exception as e:
-            traceback.print_exc()
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
+        data = {
+            'product_id': args[0],
+            'account_id': g.account_id
+        }
+        connection = get_request_connection(self.database)
+        self.bookmark_service.delete_bookmark_logic(connection, data)
+        return jsonify({'message': 'success'}), 200
+
+
+class BookmarkListView(MethodView):
+    """ Presentation Layer
+
+        내 북마크 목록 조회, 여러 상품 북마크 일괄 추가/삭제
+
+        Attributes:
+            bookmark_service   : BookmarkService 클래스
+            database           : app.config['DB']에 담겨있는 정보(데이터베이스 관련 정보)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self, services, database):
+        self.bookmark_service = services.bookmark_service
+        self.database = database
+
+    @read_only_decorator
+    @signin_decorator()
+    @validate_params(
+        Param('limit', GET, int, required=False, default=30, rules=[PositiveInteger()]),
+        Param('cursor', GET, str, required=False),
+        Param('size', GET, str, required=False, default='medium', rules=[ImageSizeRule()]),
+        Param('image_format', GET, str, required=False, default='jpg', rules=[ImageFormatRule()])
+    )
+    def get(self, *args):
+        """ GET 메소드: 내 북마크 상품 목록 (최근에 북마크 한 순서)
+
+        Args:
+            limit        = 표시할 상품 개수 (최대 100)
+            cursor       = 이전 응답의 next_cursor (첫 페이지는 생략)
+            size         = 대표 이미지 크기 (small: 180, medium: 360(기본), large: 720, original: 원본)
+            image_format = 대표 이미지 형식 (jpg(기본), webp)
+
+        Author: agent
+
+        Returns:
+            200, {'message': 'success', 'result': 상품정보들, 'next_cursor': 다음 페이지 커서(마지막 페이지면 null)}
+
+        Raises:
+            400, {'message': 'invalid_cursor', 'error_message': '잘못된 커서입니다.'}              : 잘못된 커서
+            500, {'message': 'database_error', 'error_message': '서버에 알 수 없는 에러가 발생했습니다.'} : 데이터베이스 에러
+
+        History:
+            2026-10-18(agent): 초기 생성
+            2026-10-18(agent): 대표 이미지 크기(size), 형식(image_format) 파라미터 추가
+        """
+
+        data = {
+            'account_id': g.account_id,
+            'limit': min(args[0], 100),
+            'cursor': args[1],
+            'image_size': args[2],
+            'image_format': args[3]
+        }
+        connection = get_request_connection(self.database)
+        result = self.bookmark_service.get_bookmark_list_service(connection, data)
+        return jsonify({'message': 'success', 'result': result['result'], 'next_cursor': result['next_cursor']})
+
+    @signin_decorator()
+    @idempotent_decorator
+    @validate_params(
+        Param('productIds', JSON, list)
+    )
+    def post(self, *args):
+        """ POST 메소드: 여러 상품 북마크 일괄 추가
+
+        Args:
+            productIds = 상품 아이디 리스트 (최대 100개)
+
+        Author: agent
+
+        Returns:
+            200, {'message': 'success', 'result': {'product_ids': [새로 북마크 한 상품 아이디]}}
+
+        Raises:
+            400, {'message': 'invalid_bookmark_request', 'error_message': '...'}               : 잘못된 상품 아이디 목록
+            400, {'message': 'product does not exist', 'error_message': '해당 상품이 존재하지 않습니다.'} : 존재하지 않는 상품 포함
+            500, {'message': 'database_error', 'error_message': '서버에 알 수 없는 에러가 발생했습니다.'}  : 데이터베이스 에러
+            500, {'message': 'data_manipulation_fail', 'error_message': '북마크 추가를 실패하였습니다.'} : 데이터 조작 에러
+
+        History:
+            2026-10-18(agent): 초기 생성
+        """
+
+        data = {
+            'product_ids': args[0],
+            'account_id': g.account_id
+        }
+        connection = get_request_connection(self.database)
+        result = self.bookmark_service.post_bookmarks_service(connection, data)
+        return jsonify({'message': 'success', 'result': result}), 200
+
+    @signin_decorator()
+    @idempotent_decorator
+    @validate_params(
+        Param('productIds', JSON, list)
+    )
+    def delete(self, *args):
+        """ DELETE 메소드: 여러 상품 북마크 일괄 삭제
+
+        Args:
+            productIds = 상품 아이디 리스트 (최대 100개)
+
+        Author: agent
+
+        Returns:
+            200, {'message': 'success', 'result': {'product_ids': [북마크를 삭제한 상품 아이디]}}
+
+        Raises:
+            400, {'message': 'invalid_bookmark_request', 'error_message': '...'}               : 잘못된 상품 아이디 목록
+            500, {'message': 'database_error', 'error_message': '서버에 알 수 없는 에러가 발생했습니다.'}  : 데이터베이스 에러
+            500, {'message': 'data_manipulation_fail', 'error_message': '북마크 삭제를 실패하였습니다.'} : 데이터 조작 에러
+
+        History:
+            2026-10-18(agent): 초기 생성
+        """
+
+        data = {
+            'product_ids': args[0],
+            'account_id': g.account_id
+        }
+        connection = get_request_connection(self.database)
+        result = self.bookmark_service.delete_bookmarks_service(connection, data)
+        return jsonify({'message': 'success', 'result': result}), 200
@@ -7,10 +7,9 @@ from flask_request_validator import (
     validate_params
 )
 
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
+from utils.connection import get_request_connection
 from utils.rules import DecimalRule
-from utils.decorator import signin_decorator
+from utils.decorator import signin_decorator, read_only_decorator, idempotent_decorator
 
 
 class CartItemView(MethodView):
@@ -32,6 +31,7 @@ class CartItemView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @signin_decorator(True)
     @validate_params(
         Param('cart_id', PATH, int)
@@ -90,19 +90,9 @@ class CartItemView(MethodView):
             "user_permission": g.permission_type_id
         }
 
-        try:
-            connection = get_connection(self.database)
-            cart_items = self.service.get_cart_item_service(connection, data)
-            return jsonify({'message': 'success', 'result': cart_items})
-
-        except Exception as e:
-            raise e
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        cart_items = self.service.get_cart_item_service(connection, data)
+        return jsonify({'message': 'success', 'result': cart_items})
 
 
 class CartItemAddView(MethodView):
@@ -124,6 +114,7 @@ class CartItemAddView(MethodView):
         self.database = database
 
     @signin_decorator(True)
+    @idempotent_decorator
     @validate_params(
         Param('productId', JSON, int),
         Param('stockId', JSON, int),
@@ -169,19 +160,81 @@ class CartItemAddView(MethodView):
             'discounted_price': args[5]
         }
 
-        try:
-            connection = get_connection(self.database)
-            cart_id = self.service.post_cart_item_service(connection, data)
-            connection.commit()
-            return {'message': 'success', 'result': {"cart_id": cart_id}}, 201
-
-        except Exception as e:
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        cart_id = self.service.post_cart_item_service(connection, data)
+        return {'message': 'success', 'result': {"cart_id": cart_id}}, 201
+
+
+class CartSummaryView(MethodView):
+    """ Presentation Layer
+
+    Attributes:
+        database: app.config['DB']에 담겨있는 정보(데이터베이스 관련 정보)
+        service : CartItemService 클래스
+
+    Author: agent
+
+    History:
+        2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self, service, database):
+        self.service = service
+        self.database = database
+
+    @read_only_decorator
+    @signin_decorator(True)
+    def get(self):
+        """ GET 메소드: 해당 유저의 장바구니 상품 전체와 결제 예정 금액 조회
+
+        Author: agent
+
+        Returns:
+            {
+                "message": "success",
+                "result": {
+                    "cart_items": [
+                        {
+                            "cart_id": 23,
+                            "color": "Black",
+                            "current_price": 8000.0,
+                            "discount_rate": 0.1,
+                            "image_url": "https://...",
+                            "original_price": 10000.0,
+                            "price": 9000.0,
+                            "price_changed": true,
+                            "product_id": 1,
+                            "product_name": "성보의하루1",
+                            "quantity": 2,
+                            "seller_name": "나는셀러9",
+                            "size": "Free",
+                            "soldout": false,
+                            "stock_id": 1,
+                            "total_price": 18000.0
+                        }
+                    ],
+                    "price_changed_count": 1,
+                    "soldout_count": 0,
+                    "total_count": 1,
+                    "total_price": 18000.0
+                }
+            }
+
+        Raises:
+            403, {'message': 'customer permission denied',
+            'errorMessage': 'customer_permission_denied'} : 사용자 권한이 없음
+            500, {'message': 'internal server error',
+            'errorMessage': format(e)}) : 서버 에러
+
+        History:
+            2026-10-18(agent): 초기 생성
+            2026-10-18(agent): 장바구니 가격 기준 금액, 현재 가격(current_price), 가격 변경 여부 추가
+        """
+        data = {
+            "user_id": g.account_id,
+            "user_permission": g.permission_type_id
+        }
+
+        connection = get_request_connection(self.database)
+        cart_summary = self.service.get_cart_summary_service(connection, data)
+        return jsonify({'message': 'success', 'result': cart_summary})
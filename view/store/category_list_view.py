@@ -1,10 +1,8 @@
-import traceback
-
 from flask.views import MethodView
-from flask import jsonify
+from flask import jsonify, request
 
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
+from utils.connection import get_request_connection
+from utils.decorator import read_only_decorator, response_cache_decorator
 
 
 class CategoryListView(MethodView):
@@ -24,12 +22,14 @@ class CategoryListView(MethodView):
         self.category_list_service = services.category_list_service
         self.database = database
 
+    @response_cache_decorator(tags=['categories'])
+    @read_only_decorator
     def get(self):
         """ GET 메소드: 전체 카테고리 리스트 조회
 
             Author: 김민구
 
-            Returns: 카테고리 리스트 조회 성공
+            Returns: 카테고리 리스트 조회 성공 (변경이 없으면 304)
                 200, {
                         'message': 'success',
                         'result': {
@@ -68,24 +68,17 @@ class CategoryListView(MethodView):
             History:
                 2020-12-30(김민구): 초기 생성
                 2020-12-31(김민구): 에러 문구 변경
+                2026-10-18(agent): 캐시된 카테고리 트리 사용, ETag 추가
+                2026-10-18(agent): 비로그인 요청 응답 캐시 추가
 
             Notes:
                 menus, main_category, sub_category 총 3가지의 카테고리가 result 키의 값으로 반환
+                If-None-Match 헤더의 ETag 가 현재 카테고리 트리와 같으면 304 를 반환
         """
 
-        connection = None
-        try:
-            connection = get_connection(self.database)
-            result = self.category_list_service.category_list_logic(connection)
-            return jsonify({'message': 'success', 'result': result})
-
-        except Exception as e:
-            traceback.print_exc()
-            raise e
+        connection = get_request_connection(self.database)
+        category_tree = self.category_list_service.cached_category_list_logic(connection)
 
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
+        response = jsonify({'message': 'success', 'result': category_tree['result']})
+        response.set_etag(category_tree['etag'])
+        return response.make_conditional(request)
@@ -1,7 +1,6 @@
 from flask.globals import g
 from utils.rules import NumberRule, PhoneRule, PostalCodeRule, IsDeleteRule
-from utils.custom_exceptions import DatabaseCloseFail
-from utils.connection import get_connection
+from utils.connection import get_request_connection
 from flask.views import MethodView
 from flask_request_validator import(
         Param,
@@ -9,7 +8,7 @@ from flask_request_validator import(
         validate_params
 )
 
-from utils.decorator import signin_decorator
+from utils.decorator import signin_decorator, read_only_decorator
 
 
 class DestinationDetailView(MethodView):
@@ -18,6 +17,7 @@ class DestinationDetailView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     def get(self, destination_id):
         """GET 메소드: 배송지 상세정보 조회
 
@@ -46,25 +46,12 @@ class DestinationDetailView(MethodView):
             2020-12-29(김기용): 초기 생성
         """
 
-        connection = None
+        data = dict()
+        data['destination_id'] = destination_id
 
-        try:
-            data = dict()
-            data['destination_id'] = destination_id
-
-            connection = get_connection(self.database)
-            destination_detail = self.service.get_destination_detail_service(connection, data)
-            return {'message': 'success', 'result': destination_detail[0]}
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에서 알 수 없는 에러가 발생했습니다.')
+        connection = get_request_connection(self.database)
+        destination_detail = self.service.get_destination_detail_service(connection, data)
+        return {'message': 'success', 'result': destination_detail[0]}
 
 
 class DestinationView(MethodView):
@@ -73,6 +60,7 @@ class DestinationView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @signin_decorator(False)
     def get(self):
         """GET 메소드:   해당 유저에 대한 배송지 정보 받아오기
@@ -97,27 +85,14 @@ class DestinationView(MethodView):
             2021-01-02(김기용): 데코레이터 수정
         """
 
-        connection = None
-
-        try:
-            data = dict()
-            if 'account_id' in g:
-                data['account_id'] = g.account_id
-            if 'permission_type_id' in g:
-                data['permission_type_id'] = g.permission_type_id
-            connection = get_connection(self.database)
-            destination_detail = self.service.get_destination_detail_by_user_service(connection, data)
-            return {'message': 'success', 'result': destination_detail}
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에서 알 수 없는 에러가 발생했습니다.')
+        data = dict()
+        if 'account_id' in g:
+            data['account_id'] = g.account_id
+        if 'permission_type_id' in g:
+            data['permission_type_id'] = g.permission_type_id
+        connection = get_request_connection(self.database)
+        destination_detail = self.service.get_destination_detail_by_user_service(connection, data)
+        return {'message': 'success', 'result': destination_detail}
 
     @signin_decorator(True)
     @validate_params(
@@ -159,34 +134,20 @@ class DestinationView(MethodView):
             2020-12-30(김기용): 수정된 데코레이터반영: 데코레이터에서 permission_type 을 받음
             2021-01-02(김기용): 수정된 데코레이터 반영: signin_decorator(True)
         """
-        connection = None
-
-        try:
-            data = {
-                'user_id': g.account_id,
-                'permission_type_id': g.permission_type_id,
-                'recipient': args[0],
-                'phone': args[1],
-                'address1': args[2],
-                'address2': args[3],
-                'post_number': args[4],
-            }
-
-            connection = get_connection(self.database)
-            self.service.create_destination_service(connection, data)
-            connection.commit()
-            return {'message': 'success'}
-
-        except Exception as e:
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에서 알 수 없는 에러가 발생했습니다.')
+
+        data = {
+            'user_id': g.account_id,
+            'permission_type_id': g.permission_type_id,
+            'recipient': args[0],
+            'phone': args[1],
+            'address1': args[2],
+            'address2': args[3],
+            'post_number': args[4],
+        }
+
+        connection = get_request_connection(self.database)
+        self.service.create_destination_service(connection, data)
+        return {'message': 'success'}
 
     @signin_decorator(True)
     @validate_params(
@@ -223,35 +184,21 @@ class DestinationView(MethodView):
                 500, {'message': 'unable to close database', 'errorMessage': '커넥션 종료 실패'}
                 500, {'message': 'internal server error', 'errorMessage': format(e)})
         """
-        connection = None
-
-        try:
-            data = dict()
-            data['destination_id'] = args[0]
-            data['recipient'] = args[1]
-            data['phone'] = args[2]
-            data['address1'] = args[3]
-            data['address2'] = args[4]
-            data['post_number'] = args[5]
-            data['default_location'] = args[6]
-            data['account_id'] = g.account_id
-            data['permission_type_id'] = g.permission_type_id
-
-            connection = get_connection(self.database)
-            self.service.update_destination_info_service(connection, data)
-            connection.commit()
-            return {'message': 'success'}
 
-        except Exception as e:
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에서 알 수 없는 에러가 발생했습니다')
+        data = dict()
+        data['destination_id'] = args[0]
+        data['recipient'] = args[1]
+        data['phone'] = args[2]
+        data['address1'] = args[3]
+        data['address2'] = args[4]
+        data['post_number'] = args[5]
+        data['default_location'] = args[6]
+        data['account_id'] = g.account_id
+        data['permission_type_id'] = g.permission_type_id
+
+        connection = get_request_connection(self.database)
+        self.service.update_destination_info_service(connection, data)
+        return {'message': 'success'}
 
     @signin_decorator(True)
     @validate_params(
@@ -278,26 +225,12 @@ class DestinationView(MethodView):
             2020-12-30(김기용): 데코레이터 추가
         """
 
-        connection = None
         
-        try:
-            data = dict()
-            data['destination_id'] = args[0]
-            data['account_id'] = g.account_id
-            data['permission_type_id'] = g.permission_type_id
-
-            connection = get_connection(self.database)
-            self.service.delete_destination_service(connection, data)
-            connection.commit()
-            return {'message': 'success'}
-
-        except Exception as e:
-            connection.rollback()
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에서 알 수 없는 에러가 발생했습니다')
+        data = dict()
+        data['destination_id'] = args[0]
+        data['account_id'] = g.account_id
+        data['permission_type_id'] = g.permission_type_id
+
+        connection = get_request_connection(self.database)
+        self.service.delete_destination_service(connection, data)
+        return {'message': 'success'}
@@ -1,7 +1,5 @@
-import traceback
-
 from flask.views import MethodView
-from flask import jsonify
+from flask import jsonify, g
 
 from flask_request_validator import (
     validate_params,
@@ -10,9 +8,9 @@ from flask_request_validator import (
     PATH
 )
 
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
-from utils.rules import PositiveInteger
+from utils.connection import get_request_connection
+from utils.decorator import read_only_decorator, signin_decorator, response_cache_decorator
+from utils.rules import PositiveInteger, ImageSizeRule, ImageFormatRule
 
 
 class EventBannerListView(MethodView):
@@ -32,6 +30,8 @@ class EventBannerListView(MethodView):
         self.event_list_service = services.event_list_service
         self.database = database
 
+    @response_cache_decorator(tags=['events'])
+    @read_only_decorator
     @validate_params(
         Param('offset', GET, int, required=False, default=0),
         Param('limit', GET, int, required=False, default=30),
@@ -72,32 +72,20 @@ class EventBannerListView(MethodView):
 
             History:
                 2020-01-01(김민구): 초기 생성
+                2026-10-18(agent): 비로그인 요청 응답 캐시 추가
 
             Notes:
                 is_proceeding이 0이면 종료된 기획전 배너 리스트르 반환, 1이면 진행중인 기획전 배너 리스트를 반환
         """
 
-        connection = None
-        try:
-            data = {
-                'offset': args[0],
-                'limit': args[1],
-                'is_proceeding': args[2]
-            }
-            connection = get_connection(self.database)
-            result = self.event_list_service.event_banner_list_logic(connection, data)
-            return jsonify({'message': 'success', 'result': result})
-
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
+        data = {
+            'offset': args[0],
+            'limit': args[1],
+            'is_proceeding': args[2]
+        }
+        connection = get_request_connection(self.database)
+        result = self.event_list_service.event_banner_list_logic(connection, data)
+        return jsonify({'message': 'success', 'result': result})
 
 
 class EventDetailInformationView(MethodView):
@@ -117,6 +105,8 @@ class EventDetailInformationView(MethodView):
         self.event_list_service = services.event_list_service
         self.database = database
 
+    @response_cache_decorator(tags=['events'])
+    @read_only_decorator
     @validate_params(
         Param('event_id', PATH, int, rules=[PositiveInteger()])
     )
@@ -154,25 +144,13 @@ class EventDetailInformationView(MethodView):
 
             History:
                 2020-01-01(김민구): 초기 생성
+                2026-10-18(agent): 비로그인 요청 응답 캐시 추가
         """
 
-        connection = None
-        try:
-            event_id = args[0]
-            connection = get_connection(self.database)
-            result = self.event_list_service.event_detail_information_logic(connection, event_id)
-            return jsonify({'message': 'success', 'result': result})
-
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
+        event_id = args[0]
+        connection = get_request_connection(self.database)
+        result = self.event_list_service.event_detail_information_logic(connection, event_id)
+        return jsonify({'message': 'success', 'result': result})
 
 
 class EventDetailButtonListView(MethodView):
@@ -192,6 +170,8 @@ class EventDetailButtonListView(MethodView):
         self.event_list_service = services.event_list_service
         self.database = database
 
+    @response_cache_decorator(tags=['events'])
+    @read_only_decorator
     @validate_params(
         Param('event_id', PATH, int, rules=[PositiveInteger()])
     )
@@ -228,25 +208,13 @@ class EventDetailButtonListView(MethodView):
 
             History:
                 2020-01-01(김민구): 초기 생성
+                2026-10-18(agent): 비로그인 요청 응답 캐시 추가
         """
 
-        connection = None
-        try:
-            event_id = args[0]
-            connection = get_connection(self.database)
-            result = self.event_list_service.event_detail_button_list_logic(connection, event_id)
-            return jsonify({'message': 'success', 'result': result})
-
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
+        event_id = args[0]
+        connection = get_request_connection(self.database)
+        result = self.event_list_service.event_detail_button_list_logic(connection, event_id)
+        return jsonify({'message': 'success', 'result': result})
 
 
 class EventDetailProductListView(MethodView):
@@ -266,10 +234,15 @@ class EventDetailProductListView(MethodView):
         self.event_list_service = services.event_list_service
         self.database = database
 
+    @response_cache_decorator(tags=['events'])
+    @read_only_decorator
+    @signin_decorator(False)
     @validate_params(
         Param('offset', GET, int, required=False, default=0),
         Param('limit', GET, int, required=False, default=30),
-        Param('event_id', PATH, int, rules=[PositiveInteger()])
+        Param('event_id', PATH, int, rules=[PositiveInteger()]),
+        Param('size', GET, str, required=False, default='medium', rules=[ImageSizeRule()]),
+        Param('image_format', GET, str, required=False, default='jpg', rules=[ImageFormatRule()])
     )
     def get(self, *args):
         """ GET 메소드: 기획전 상품 리스트 조회
@@ -293,7 +266,8 @@ class EventDetailProductListView(MethodView):
                                 "product_id": 249,
                                 "product_name": "성보의하루249",
                                 "sales_count": 94,
-                                "seller_name": "나는셀러2"
+                                "seller_name": "나는셀러2",
+                                "is_bookmarked": 0
                             }
                         ]
                     }
@@ -310,30 +284,23 @@ class EventDetailProductListView(MethodView):
 
             History:
                 2020-01-01(김민구): 초기 생성
+                2026-10-18(agent): 로그인한 경우 상품 별 북마크 여부(is_bookmarked) 추가
+                2026-10-18(agent): 비로그인 요청 응답 캐시 추가
+                2026-10-18(agent): 대표 이미지 크기(size), 형식(image_format) 파라미터 추가
 
             Notes:
                 해당 기획전에 버튼이 존재한다면 button_id 컬럼이 포함된 기획전 리스트
                 아니라면 button_id 컬럼이 없는 기획전 리스트
         """
 
-        connection = None
-        try:
-            data = {
-                'offset': args[0],
-                'limit': args[1],
-                'event_id': args[2]
-            }
-            connection = get_connection(self.database)
-            result = self.event_list_service.event_detail_list_logic(connection, data)
-            return jsonify({'message': 'success', 'result': result})
-
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
\ No newline at end of file
+        data = {
+            'offset': args[0],
+            'limit': args[1],
+            'event_id': args[2],
+            'account_id': g.get('account_id'),
+            'image_size': args[3],
+            'image_format': args[4]
+        }
+        connection = get_request_connection(self.database)
+        result = self.event_list_service.event_detail_list_logic(connection, data)
+        return jsonify({'message': 'success', 'result': result})
\ No newline at end of file
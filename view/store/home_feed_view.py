@@ -0,0 +1,96 @@
+from flask.views import MethodView
+from flask import jsonify, g
+
+from flask_request_validator import (
+    validate_params,
+    Param,
+    GET
+)
+
+from utils.connection import get_request_connection
+from utils.decorator import signin_decorator, read_only_decorator, response_cache_decorator
+from utils.rules import PositiveInteger, NonNegativeInteger, MaxInteger, ImageSizeRule, ImageFormatRule
+
+
+class HomeFeedView(MethodView):
+    """ Presentation Layer
+
+        Attributes:
+            home_feed_service : HomeFeedService 클래스
+            database          : app.config['DB']에 담겨있는 정보(데이터베이스 관련 정보)
+
+        Author: agent
+
+        History:
+            2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self, services, database):
+        self.home_feed_service = services.home_feed_service
+        self.database = database
+
+    @response_cache_decorator(tags=['events', 'categories'])
+    @read_only_decorator
+    @signin_decorator(False)
+    @validate_params(
+        Param('offset', GET, int, required=False, default=0, rules=[NonNegativeInteger()]),
+        Param('limit', GET, int, required=False, default=30, rules=[PositiveInteger(), MaxInteger(100)]),
+        Param('size', GET, str, required=False, default='medium', rules=[ImageSizeRule()]),
+        Param('image_format', GET, str, required=False, default='jpg', rules=[ImageFormatRule()])
+    )
+    def get(self, *args):
+        """ GET 메소드: 홈 화면 조회 (기획전 배너, 기획전 상품, 카테고리)
+
+            상품 리스트, 카테고리, 이벤트 배너를 따로 호출하지 않고 한번에 조회한다.
+
+            Args:
+                offset       = 기획전 순서 (0부터 시작, 스크롤 할 때마다 1씩 증가)
+                limit        = 기획전 상품 개수 (기본 30, 최대 100)
+                size         = 대표 이미지 크기 (small: 180, medium: 360(기본), large: 720, original: 원본)
+                image_format = 대표 이미지 형식 (jpg(기본), webp)
+
+            Author: agent
+
+            Returns:
+                200, {
+                        'message': 'success',
+                        'result': {
+                            'event': {'event_id': 1, 'event_banner_image': 'url'},
+                            'product_list': [
+                                {
+                                    'image_url': 'url',
+                                    'seller_id': 1,
+                                    'seller_name': '둘리',
+                                    'product_id': 1,
+                                    'product_name': '성보의 하루',
+                                    'origin_price': 10000.0,
+                                    'discount_rate': 0.1,
+                                    'discounted_price': 9000.0,
+                                    'sales_count': 30,
+                                    'is_bookmarked': 0
+                                }
+                            ],
+                            'has_next': true,
+                            'categories': [...] (offset 이 0 일 때만)
+                        }
+                    }
+
+            Raises:
+                400, {'message': 'invalid_parameter', 'error_message': '[데이터]가(이) 유효하지 않습니다.'}  : 잘못된 요청값
+                500, {'message': 'database_error', 'error_message': '서버에 알 수 없는 에러가 발생했습니다.'}  : 데이터베이스 에러
+
+            History:
+                2026-10-18(agent): 초기 생성
+                2026-10-18(agent): 대표 이미지 크기(size), 형식(image_format) 파라미터 추가
+        """
+
+        data = {
+            'offset': args[0],
+            'limit': args[1],
+            'account_id': g.get('account_id'),
+            'image_size': args[2],
+            'image_format': args[3]
+        }
+        connection = get_request_connection(self.database)
+        result = self.home_feed_service.home_feed_service(connection, data)
+        return jsonify({'message': 'success', 'result': result})
@@ -1,5 +1,3 @@
-import traceback
-
 from flask.views import MethodView
 from flask import jsonify, g
 
@@ -10,9 +8,9 @@ from flask_request_validator import (
     PATH
 )
 
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail, InvalidUser
-from utils.decorator import signin_decorator
+from utils.connection import get_request_connection
+from utils.custom_exceptions import InvalidUser
+from utils.decorator import signin_decorator, read_only_decorator
 from utils.rules import EnquiryUserTypeRule, PositiveInteger, EnquiryAnswerTypeRule
 
 
@@ -33,6 +31,7 @@ class ProductEnquiryListView(MethodView):
         self.product_enquiry_list_service = services.product_enquiry_list_service
         self.database = database
 
+    @read_only_decorator
     @signin_decorator(False)
     @validate_params(
         Param('product_id', PATH, int, rules=[PositiveInteger()]),
@@ -102,35 +101,22 @@ class ProductEnquiryListView(MethodView):
                 로그인 후 type이 self라면 해당 상품에서 해당 유저의 Q&A만 보여주고 all이라면 로그인 유무 상관 없이 해당 상품의 모든 Q&A를 보여준다.
         """
 
-        connection = None
-        try:
-            data = {
-                'product_id': args[0],
-                'offset': args[1],
-                'limit': args[2],
-                'type': args[3]
-            }
-
-            if data['type'] == 'self':
-                if 'account_id' in g:
-                    data['user_id'] = g.account_id
-                elif 'account_id' not in g:
-                    raise InvalidUser('로그인이 필요합니다.')
-
-            connection = get_connection(self.database)
-            result = self.product_enquiry_list_service.product_enquiry_list_logic(connection, data)
-            return jsonify({'message': 'success', 'result': result})
-
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
+        data = {
+            'product_id': args[0],
+            'offset': args[1],
+            'limit': args[2],
+            'type': args[3]
+        }
+
+        if data['type'] == 'self':
+            if 'account_id' in g:
+                data['user_id'] = g.account_id
+            elif 'account_id' not in g:
+                raise InvalidUser('로그인이 필요합니다.')
+
+        connection = get_request_connection(self.database)
+        result = self.product_enquiry_list_service.product_enquiry_list_logic(connection, data)
+        return jsonify({'message': 'success', 'result': result})
 
 
 class MyPageEnquiryListView(MethodView):
@@ -150,6 +136,7 @@ class MyPageEnquiryListView(MethodView):
         self.product_enquiry_list_service = services.product_enquiry_list_service
         self.database = database
 
+    @read_only_decorator
     @signin_decorator()
     @validate_params(
         Param('type', GET, str, required=False, default='all', rules=[EnquiryAnswerTypeRule()]),
@@ -211,26 +198,13 @@ class MyPageEnquiryListView(MethodView):
                 type이 wait라면 미답변 Q&A만 보여주고 complete라면 답변 완료된 Q&A, all이라면 모든 Q&A를 보여준다.
         """
 
-        connection = None
-        try:
-            data = {
-                'type': args[0],
-                'offset': args[1],
-                'limit': args[2],
-                'user_id': g.account_id
-            }
-
-            connection = get_connection(self.database)
-            result = self.product_enquiry_list_service.my_page_enquiry_list_logic(connection, data)
-            return jsonify({'message': 'success', 'result': result})
-
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
\ No newline at end of file
+        data = {
+            'type': args[0],
+            'offset': args[1],
+            'limit': args[2],
+            'user_id': g.account_id
+        }
+
+        connection = get_request_connection(self.database)
+        result = self.product_enquiry_list_service.my_page_enquiry_list_logic(connection, data)
+        return jsonify({'message': 'success', 'result': result})
\ No newline at end of file
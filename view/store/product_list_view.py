@@ -1,9 +1,8 @@
-import traceback
 import json
 
 from flask import g
-from utils.decorator import signin_decorator
-from utils.rules import SortTypeRule, NumberRule
+from utils.decorator import signin_decorator, read_only_decorator, response_cache_decorator
+from utils.rules import SortTypeRule, NumberRule, ImageSizeRule, ImageFormatRule, PositiveInteger
 
 from flask.views import MethodView
 from flask import jsonify
@@ -14,8 +13,7 @@ from flask_request_validator import (
     GET
 )
 
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
+from utils.connection import get_request_connection
 
 
 class ProductDetailView(MethodView):
@@ -23,6 +21,8 @@ class ProductDetailView(MethodView):
         self.service = service
         self.database = database
     
+    @response_cache_decorator()
+    @read_only_decorator
     @signin_decorator(False)
     def get(self, product_id):
         """ GET 메소드: 상품 상세정보 조회
@@ -46,28 +46,18 @@ class ProductDetailView(MethodView):
                 2020-12-31(김기용): 초기 생성
                 2021-01-01(김기용): 1차 구현
                 2021-01-02(김기용): 북마크에대한 정보를 추가해주었다.
+                2026-10-18(agent): 비로그인 요청 응답 캐시 추가
         """
-        connection = None
 
-        try:
-            data = dict()
-            data['product_id'] = product_id
+        data = dict()
+        data['product_id'] = product_id
 
-            if 'account_id' in g:
-                data['account_id'] = g.account_id
+        if 'account_id' in g:
+            data['account_id'] = g.account_id
 
-            connection = get_connection(self.database)
-            result = self.service.product_detail_service(connection, data)
-            return jsonify({'message': 'success', 'result': result})
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
+        connection = get_request_connection(self.database)
+        result = self.service.product_detail_service(connection, data)
+        return jsonify({'message': 'success', 'result': result})
 
 
 class ProductSearchView(MethodView):
@@ -75,10 +65,15 @@ class ProductSearchView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
+    @signin_decorator(False)
     @validate_params(
             Param('q', GET, str, required=True),
             Param('limit', GET, str, required=True, rules=[NumberRule()]),
-            Param('sort_type', GET, str, required=True, rules=[SortTypeRule()])
+            Param('sort_type', GET, str, required=True, rules=[SortTypeRule()]),
+            Param('cursor', GET, str, required=False),
+            Param('size', GET, str, required=False, default='medium', rules=[ImageSizeRule()]),
+            Param('image_format', GET, str, required=False, default='jpg', rules=[ImageFormatRule()])
             )
     def get(self, *args):
         """ GET 메소드: 상품 검색 
@@ -90,14 +85,16 @@ class ProductSearchView(MethodView):
             search   : 검색키워드
             limit    : 표시할 상품 개수
             sort_type: 정렬 종류(최신순, 판매순, 추천순)
+            cursor   : 이전 응답의 next_cursor (첫 페이지는 생략)
 
         Author: 김기용
 
         Returns:
-            200, {'message': 'success', 'result': 상품정보들}   
+            200, {'message': 'success', 'result': 상품정보들, 'next_cursor': 다음 페이지 커서(마지막 페이지면 null)}   
         
         Raises:
             400, {'message': 'key error', 'errorMessage': '키 값이 일치하지 않습니다.'}
+            400, {'message': 'invalid_cursor', 'error_message': '잘못된 커서입니다.'}
             400, {'message': 'invalid_parameter', 'error_message': '[데이터]가(이) 유효하지 않습니다.'}
             500, {'message': 'unable to close database', 'errorMessage': '커넥션 종료 실패'}: 커넥션 종료 실패
             500, {'message': 'internal server error', 'errorMessage': format(e)}): 서버 에러
@@ -106,26 +103,67 @@ class ProductSearchView(MethodView):
                 2020-12-31(김기용): 초기 생성
                 2021-01-01(김기용): 북마크에 대한 정보 추가
                 2021-01-02(김기용): Param 값에대한 Rule 을 정의해주었다.
+                2026-10-18(agent): 커서 페이지네이션 추가
+                2026-10-18(agent): 로그인한 경우 상품 별 북마크 여부(is_bookmarked) 추가
+                2026-10-18(agent): 대표 이미지 크기(size), 형식(image_format) 파라미터 추가
         """
 
-        connection = None
+        data = {
+                'search': args[0],
+                'limit': int(args[1]),
+                'sort_type': args[2],
+                'cursor': args[3],
+                'account_id': g.get('account_id'),
+                'image_size': args[4],
+                'image_format': args[5]
+                }
 
-        try:
-            data = {
-                    'search': args[0],
-                    'limit': int(args[1]),
-                    'sort_type': args[2] 
-                    }
+        connection = get_request_connection(self.database)
+        result = self.service.product_search_service(connection, data)
+        return jsonify({'message': 'success', 'result': result['result'], 'next_cursor': result['next_cursor']})
+
+
+class ProductAutocompleteView(MethodView):
+    def __init__(self, service, database):
+        self.service = service
+        self.database = database
 
-            connection = get_connection(self.database)
-            result = self.service.product_search_service(connection, data)
-            return jsonify({'message': 'success', 'result': result})
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
+    @read_only_decorator
+    @validate_params(
+            Param('q', GET, str, required=True),
+            Param('limit', GET, int, required=False, default=10, rules=[PositiveInteger()])
+            )
+    def get(self, *args):
+        """ GET 메소드: 상품 검색어 자동완성
+
+        입력한 접두어로 시작하는 상품이름, 셀러이름을 판매량이 많은 순서로 반환해준다.
+        검색 색인과 함께 관리되는 트라이에서 찾으므로 색인을 갱신할 때만 데이터베이스를 사용한다.
+
+        Args:
+            q    : 입력중인 검색어
+            limit: 추천어 개수 (최대 10)
+
+        Author: agent
+
+        Returns:
+            200, {'message': 'success', 'result': ['성보의 하루', '성보셀러']}
+
+        Raises:
+            400, {'message': 'invalid_parameter', 'error_message': '[데이터]가(이) 유효하지 않습니다.'}
+            500, {'message': 'internal server error', 'errorMessage': format(e)}): 서버 에러
+
+        History:
+                2026-10-18(agent): 초기 생성
+        """
+
+        data = {
+                'q': args[0],
+                'limit': min(args[1], 10)
+                }
+
+        connection = get_request_connection(self.database)
+        result = self.service.product_autocomplete_service(connection, data)
+        return jsonify({'message': 'success', 'result': result})
 
 
 class ProductListView(MethodView):
@@ -146,9 +184,14 @@ class ProductListView(MethodView):
         self.product_list_service = services.product_list_service
         self.database = database
 
+    @response_cache_decorator(tags=['events'])
+    @read_only_decorator
+    @signin_decorator(False)
     @validate_params(
         Param('offset', GET, int, required=False, default=0),
-        Param('limit', GET, int, required=False, default=30)
+        Param('limit', GET, int, required=False, default=30),
+        Param('size', GET, str, required=False, default='medium', rules=[ImageSizeRule()]),
+        Param('image_format', GET, str, required=False, default='jpg', rules=[ImageFormatRule()])
     )
     def get(self, *args):
         """ GET 메소드: 전체 상품 리스트 조회
@@ -177,7 +220,8 @@ class ProductListView(MethodView):
                                     'origin_price': 10000.0,
                                     'discount_rate': 0.1,
                                     'discounted_price': 9000.0,
-                                    'sales_count': 30
+                                    'sales_count': 30,
+                                    'is_bookmarked': 0
                                 },
                             ]
                         }
@@ -196,29 +240,23 @@ class ProductListView(MethodView):
             History:
                 2020-12-30(김민구): 초기 생성
                 2020-12-31(김민구): 에러 문구 변경 / 이벤트에 해당하는 상품 리스트 반환으로 수정
+                2026-10-18(agent): 로그인한 경우 상품 별 북마크 여부(is_bookmarked) 추가
+                2026-10-18(agent): 비로그인 요청 응답 캐시 추가
+                2026-10-18(agent): 대표 이미지 크기(size), 형식(image_format) 파라미터 추가
+                2026-10-18(agent): 기획전이 추가, 수정, 삭제되면 캐시 무효화 (events 태그)
 
             Notes:
                 offset을 받아서 한 페이지당 하나의 이벤트만 출력
                 이벤트가 없을 시 빈 리스트 반환
         """
 
-        connection = None
-        try:
-            data = {
-                'offset': args[0],
-                'limit': args[1]
-            }
-            connection = get_connection(self.database)
-            result = self.product_list_service.product_list_logic(connection, data)
-            return jsonify({'message': 'success', 'result': result})
-
-        except Exception as e:
-            traceback.print_exc()
-            raise e
-
-        finally:
-            try:
-                if connection is not None:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('서버에 알 수 없는 에러가 발생했습니다.')
+        data = {
+            'offset': args[0],
+            'limit': args[1],
+            'account_id': g.get('account_id'),
+            'image_size': args[2],
+            'image_format': args[3]
+        }
+        connection = get_request_connection(self.database)
+        result = self.product_list_service.product_list_logic(connection, data)
+        return jsonify({'message': 'success', 'result': result})
@@ -1,4 +1,4 @@
-from flask import jsonify
+from flask import jsonify, g
 from flask.views import MethodView
 from flask_request_validator import (
     GET,
@@ -8,9 +8,9 @@ from flask_request_validator import (
     validate_params
 )
 
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
-from utils.decorator import signin_decorator
+from utils.connection import get_request_connection
+from utils.decorator import signin_decorator, read_only_decorator, response_cache_decorator
+from utils.rules import ImageSizeRule, ImageFormatRule
 
 
 class SellerShopView(MethodView):
@@ -30,6 +30,8 @@ class SellerShopView(MethodView):
         self.service = service
         self.database = database
 
+    @response_cache_decorator()
+    @read_only_decorator
     @signin_decorator(False)
     @validate_params(
         Param('seller_id', PATH, int)
@@ -67,24 +69,14 @@ class SellerShopView(MethodView):
 
         History:
             2021-01-01(고수희): 초기 생성
+            2026-10-18(agent): 비로그인 요청 응답 캐시 추가
         """
 
         account_id = args[0]
 
-        try:
-            connection = get_connection(self.database)
-            seller_info = self.service.get_seller_info_service(connection, account_id)
-            return jsonify({'message': 'success', 'result': seller_info})
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        seller_info = self.service.get_seller_info_service(connection, account_id)
+        return jsonify({'message': 'success', 'result': seller_info})
 
 class SellerShopSearchView(MethodView):
     """ Presentation Layer
@@ -103,12 +95,16 @@ class SellerShopSearchView(MethodView):
         self.service = service
         self.database = database
 
+    @response_cache_decorator()
+    @read_only_decorator
     @signin_decorator(False)
     @validate_params(
         Param('seller_id', PATH, int),
         Param('keyword', GET, str),
         Param('offset', GET, int, required=False, default=0),
-        Param('limit', GET, int, required=False, default=100)
+        Param('limit', GET, int, required=False, default=100),
+        Param('size', GET, str, required=False, default='medium', rules=[ImageSizeRule()]),
+        Param('image_format', GET, str, required=False, default='jpg', rules=[ImageFormatRule()])
     )
     def get(self, *args):
         """ GET 메소드: 해당 셀러의 상품 검색 결과 출력
@@ -154,29 +150,24 @@ class SellerShopSearchView(MethodView):
 
         History:
             2021-01-02(고수희): 초기 생성
+            2026-10-18(agent): 로그인한 경우 상품 별 북마크 여부(is_bookmarked) 추가
+            2026-10-18(agent): 비로그인 요청 응답 캐시 추가
+            2026-10-18(agent): 대표 이미지 크기(size), 형식(image_format) 파라미터 추가
         """
 
         data = {
             "seller_id": args[0],
             "keyword": args[1],
             "offset": args[2],
-            "limit": args[3]
+            "limit": args[3],
+            "account_id": g.get('account_id'),
+            "image_size": args[4],
+            "image_format": args[5]
         }
 
-        try:
-            connection = get_connection(self.database)
-            search_product_list = self.service.get_seller_product_search_service(connection, data)
-            return jsonify({'message': 'success', 'result': search_product_list})
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        search_product_list = self.service.get_seller_product_search_service(connection, data)
+        return jsonify({'message': 'success', 'result': search_product_list})
 
 
 class SellerShopCategoryView(MethodView):
@@ -196,6 +187,8 @@ class SellerShopCategoryView(MethodView):
         self.service = service
         self.database = database
 
+    @response_cache_decorator()
+    @read_only_decorator
     @signin_decorator(False)
     @validate_params(
         Param('seller_id', PATH, int)
@@ -232,26 +225,16 @@ class SellerShopCategoryView(MethodView):
 
         History:
             2021-01-02(고수희): 초기 생성
+            2026-10-18(agent): 비로그인 요청 응답 캐시 추가
         """
 
         data = {
             "seller_id": args[0]
         }
 
-        try:
-            connection = get_connection(self.database)
-            category_list = self.service.get_seller_category_service(connection, data)
-            return jsonify({'message': 'success', 'result': category_list})
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        category_list = self.service.get_seller_category_service(connection, data)
+        return jsonify({'message': 'success', 'result': category_list})
 
 
 class SellerShopProductListView(MethodView):
@@ -271,20 +254,26 @@ class SellerShopProductListView(MethodView):
         self.service = service
         self.database = database
 
+    @response_cache_decorator()
+    @read_only_decorator
     @signin_decorator(False)
     @validate_params(
         Param('seller_id', PATH, int),
         Param('category', GET, int, required=False, default=None),
         Param('offset', GET, int, required=False, default=0),
         Param('limit', GET, int, required=False, default=100),
-        Param('type', GET, str, required=False, default="latest")
+        Param('type', GET, str, required=False, default="latest"),
+        Param('cursor', GET, str, required=False),
+        Param('size', GET, str, required=False, default='medium', rules=[ImageSizeRule()]),
+        Param('image_format', GET, str, required=False, default='jpg', rules=[ImageFormatRule()])
     )
     def get(self, *args):
         """ GET 메소드: 해당 셀러의 상품 검색 결과 출력
 
         seller_id와 ,category, type에 해당되는 셀러 정보를 테이블에서 조회 후 가져옴
 
-        Args: args = ('seller_id', 'keyword', 'offset', 'limit', 'type')
+        Args: args = ('seller_id', 'category', 'offset', 'limit', 'type', 'cursor')
+            cursor 를 보내면 offset 대신 이전 응답의 next_cursor 이후의 상품을 조회한다.
 
         Author: 고수희
 
@@ -312,17 +301,24 @@ class SellerShopProductListView(MethodView):
                     "seller_id": 4,
                     "seller_name": "나는셀러4"
                 }
-            ]
+            ],
+            "next_cursor": "WzVd"
         }
 
         Raises:
             400, {'message': 'key error',
             'errorMessage': 'key_error'} : 잘못 입력된 키값
+            400, {'message': 'invalid_cursor',
+            'error_message': '잘못된 커서입니다.'} : 잘못된 커서
             500, {'message': 'server error',
             'errorMessage': 'server_error'}': 서버 에러
 
         History:
             2021-01-03(고수희): 초기 생성
+            2026-10-18(agent): 커서 페이지네이션 추가
+            2026-10-18(agent): 로그인한 경우 상품 별 북마크 여부(is_bookmarked) 추가
+            2026-10-18(agent): 비로그인 요청 응답 캐시 추가
+            2026-10-18(agent): 대표 이미지 크기(size), 형식(image_format) 파라미터 추가
         """
 
         data = {
@@ -330,20 +326,13 @@ class SellerShopProductListView(MethodView):
             "category": args[1],
             "offset": args[2],
             "limit": args[3],
-            "type": args[4]
+            "type": args[4],
+            "cursor": args[5],
+            "account_id": g.get('account_id'),
+            "image_size": args[6],
+            "image_format": args[7]
         }
 
-        try:
-            connection = get_connection(self.database)
-            product_list = self.service.get_seller_product_list_service(connection, data)
-            return jsonify({'message': 'success', 'result': product_list})
-
-        except Exception as e:
-            raise e
-
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        result = self.service.get_seller_product_list_service(connection, data)
+        return jsonify({'message': 'success', 'result': result['product_list'], 'next_cursor': result['next_cursor']})
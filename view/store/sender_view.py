@@ -1,9 +1,8 @@
 from flask import jsonify, g
 from flask.views import MethodView
 
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
-from utils.decorator import signin_decorator
+from utils.connection import get_request_connection
+from utils.decorator import signin_decorator, read_only_decorator
 
 
 class SenderView(MethodView):
@@ -22,6 +21,7 @@ class SenderView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @signin_decorator(True)
     def get(self):
         """ GET 메소드: 해당 유저가 사용한 가장 최신의 주문자 정보 조회
@@ -57,16 +57,6 @@ class SenderView(MethodView):
             "user_permission": g.permission_type_id
         }
 
-        try:
-            connection = get_connection(self.database)
-            sender_info = self.service.get_sender_info_service(connection, data)
-            return jsonify({'message': 'success', 'result': sender_info})
-
-        except Exception as e:
-            raise e
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        sender_info = self.service.get_sender_info_service(connection, data)
+        return jsonify({'message': 'success', 'result': sender_info})
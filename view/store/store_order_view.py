@@ -7,10 +7,9 @@ from flask_request_validator import (
     validate_params
 )
 
-from utils.connection import get_connection
-from utils.custom_exceptions import DatabaseCloseFail
+from utils.connection import get_request_connection
 from utils.rules import DecimalRule, EmailRule, PostalCodeRule, PhoneRule
-from utils.decorator import signin_decorator
+from utils.decorator import signin_decorator, read_only_decorator, idempotent_decorator
 
 
 class StoreOrderView(MethodView):
@@ -30,6 +29,7 @@ class StoreOrderView(MethodView):
         self.service = service
         self.database = database
 
+    @read_only_decorator
     @signin_decorator(True)
     @validate_params(
         Param('order_id', PATH, int)
@@ -75,19 +75,9 @@ class StoreOrderView(MethodView):
             "user_permission": g.permission_type_id
         }
         
-        try:
-            connection = get_connection(self.database)
-            store_order_info = self.service.get_store_order_service(connection, data)
-            return jsonify({'message': 'success', 'result': store_order_info})
-
-        except Exception as e:
-            raise e
-        finally:
-            try:
-                if connection:
-                    connection.close()
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        store_order_info = self.service.get_store_order_service(connection, data)
+        return jsonify({'message': 'success', 'result': store_order_info})
 
 
 class StoreOrderAddView(MethodView):
@@ -108,6 +98,7 @@ class StoreOrderAddView(MethodView):
         self.database = database
 
     @signin_decorator(True)
+    @idempotent_decorator
     @validate_params(
         Param('cartId', JSON, int),
         Param('productId', JSON, int),
@@ -201,20 +192,96 @@ class StoreOrderAddView(MethodView):
             'delivery_content': args[18],
         }
 
-        try:
-            connection = get_connection(self.database)
-            order_id = self.service.post_order_service(connection, data)
-            connection.commit()
-            return {'message': 'success', 'result': {"order_id": order_id}}, 201
+        connection = get_request_connection(self.database)
+        order_id = self.service.post_order_service(connection, data)
+        return {'message': 'success', 'result': {"order_id": order_id}}, 201
+
+
+class StoreCartOrderView(MethodView):
+    """ Presentation Layer
+
+    Attributes:
+        database: app.config['DB']에 담겨있는 정보(데이터베이스 관련 정보)
+        service : StoreOrderService 클래스
+
+    Author: agent
+
+    History:
+        2026-10-18(agent): 초기 생성
+    """
+
+    def __init__(self, service, database):
+        self.service = service
+        self.database = database
+
+    @signin_decorator(True)
+    @idempotent_decorator
+    @validate_params(
+        Param('cartIds', JSON, list),
+        Param('senderName', JSON, str),
+        Param('senderPhone', JSON, str, rules=[PhoneRule()]),
+        Param('senderEmail', JSON, str, rules=[EmailRule()]),
+        Param('recipientName', JSON, str),
+        Param('recipientPhone', JSON, str, rules=[PhoneRule()]),
+        Param('address1', JSON, str),
+        Param('address2', JSON, str),
+        Param('postNumber', JSON, str, rules=[PostalCodeRule()]),
+        Param('deliveryId', JSON, int),
+        Param('deliveryMemo', JSON, str, required=False),
+    )
+    def post(self, *args):
+        """POST 메소드: 장바구니 여러 상품 결제
+
+        Args: args = (
+        'cart_ids',
+        'sender_name',
+        'sender_phone',
+        'sender_email',
+        'recipient_name',
+        'recipient_phone',
+        'address1',
+        'address2',
+        'post_number',
+        'delivery_memo_type_id',
+        'delivery_content'
+        )
+
+        Author: agent
 
-        except Exception as e:
-            connection.rollback()
-            raise e
+        Returns:
+            201, {'message': 'success', 'result': {'order_id': 12}} : 결제 성공
 
-        finally:
-            try:
-                if connection:
-                    connection.close()
+        Raises:
+            400, {'message': 'key error',
+            'errorMessage': 'key_error'} : 잘못 입력된 키값
+            400, {'message': 'cart items not exist',
+            'errorMessage': 'cart_item_does_not_exist'} : 결제할 수 없는 장바구니 상품이 있음
+            400, {'message': 'Not Enough Product',
+            'errorMessage': 'Not as many in stock as quantity'} : 재고 부족
+            403, {'message': 'customer permission denied',
+            'errorMessage': 'customer_permission_denied'} : 사용자 권한이 아님
+            500, {'message': 'internal server error',
+            'errorMessage': format(e)}) : 서버 에러
+
+        History:
+            2026-10-18(agent): 초기 생성
+        """
+        data = {
+            'user_id': g.account_id,
+            'user_permission': g.permission_type_id,
+            'cart_ids': args[0],
+            'sender_name': args[1],
+            'sender_phone': args[2],
+            'sender_email': args[3],
+            'recipient_name': args[4],
+            'recipient_phone': args[5],
+            'address1': args[6],
+            'address2': args[7],
+            'post_number': args[8],
+            'delivery_memo_type_id': args[9],
+            'delivery_content': args[10],
+        }
 
-            except Exception:
-                raise DatabaseCloseFail('database close fail')
+        connection = get_request_connection(self.database)
+        order_id = self.service.post_cart_order_service(connection, data)
+        return {'message': 'success', 'result': {"order_id": order_id}}, 201